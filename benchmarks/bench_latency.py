@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""End-to-end latency benchmark of the live dashboard against SimulatedIB.
+
+Runs the real ``ib_worker()`` and Dash server from run_dashboard_FINAL_FREEZE.py
+with the simulator as market data source, connects N push viewers to the SSE
+channel and reports:
+- tick-to-state: simulated tick time -> StateStore publish containing it
+- tick-to-browser: simulated tick time -> SSE frame received by a viewer
+- CPU milliseconds per 1k ticks (whole process)
+
+Usage:
+    python benchmarks/bench_latency.py --duration 30 --viewers 3 --es-rate 50
+"""
+
+import argparse
+import bisect
+import importlib.util
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from es_trading_dashboard.collector.simulator import (  # noqa: E402
+    SimConfig,
+    SimulatedIB,
+)
+
+
+def load_dashboard():
+    """Import the dashboard script as a module (without running main)."""
+    spec = importlib.util.spec_from_file_location(
+        "dashboard", ROOT / "run_dashboard_FINAL_FREEZE.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def percentiles(values, points=(50, 90, 99)):
+    """Percentiles (ms) of latencies in seconds."""
+    if not values:
+        return {f"p{p}": None for p in points} | {"max": None, "n": 0}
+    values = sorted(values)
+    out = {
+        f"p{p}": round(
+            values[min(len(values) - 1, int(len(values) * p / 100))] * 1000, 2
+        )
+        for p in points
+    }
+    out["max"] = round(values[-1] * 1000, 2)
+    out["n"] = len(values)
+    return out
+
+
+def watch_store(store, published, stop):
+    """Record (version, publish time) of every retained snapshot."""
+    last = store.version
+    while not stop.is_set():
+        store.wait(last, timeout=0.5)
+        current = store.version
+        for v in range(last + 1, current + 1):
+            snap = store.get(v)
+            if snap is not None:
+                published.append((v, snap.published))
+        last = current
+
+
+def viewer(url, frames, stop):
+    """Consume the SSE stream, recording (version, receive time) per frame."""
+    with urllib.request.urlopen(url, timeout=30) as resp:
+        for raw in resp:
+            if stop.is_set():
+                return
+            line = raw.decode().strip()
+            if line.startswith("id: "):
+                frames.append((int(line[4:]), time.time()))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=float, default=30.0, help="measured seconds")
+    parser.add_argument(
+        "--warmup", type=float, default=8.0, help="seconds ignored after start"
+    )
+    parser.add_argument("--viewers", type=int, default=3)
+    parser.add_argument(
+        "--es-rate", type=float, default=20.0, help="ES ticks per second"
+    )
+    parser.add_argument("--spx-rate", type=float, default=4.0)
+    parser.add_argument("--fop-rate", type=float, default=5.0, help="per option leg")
+    parser.add_argument(
+        "--min-interval",
+        type=float,
+        default=None,
+        help="TickPipeline coalescing interval (default RECALC_MIN_SEC)",
+    )
+    parser.add_argument(
+        "--gap",
+        type=float,
+        nargs=2,
+        action="append",
+        default=[],
+        metavar=("START", "SECONDS"),
+        help="silent period after connect",
+    )
+    parser.add_argument("--disconnect-after", type=float, default=None)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.WARNING)
+    workdir = tempfile.mkdtemp(prefix="bench-")
+    os.chdir(workdir)
+    dash_mod = load_dashboard()
+
+    config = SimConfig(
+        tick_rates={"FUT": args.es_rate, "IND": args.spx_rate, "FOP": args.fop_rate},
+        gaps=[tuple(g) for g in args.gap],
+        disconnect_after=args.disconnect_after,
+    )
+    sims = []
+    connects = []
+
+    def factory():
+        sim = SimulatedIB(config)
+        sim.connectedEvent += lambda: connects.append(time.time())
+        sims.append(sim)
+        return sim
+
+    dash_mod.MARKET_DATA = factory
+    if args.min_interval is not None:
+        dash_mod.RECALC_MIN_SEC = args.min_interval
+
+    from werkzeug.serving import make_server
+
+    server = make_server("127.0.0.1", 0, dash_mod.app.server, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}{dash_mod.PUSH_PATH}"
+
+    stop = threading.Event()
+    published: list = []
+    frames = [[] for _ in range(args.viewers)]
+    threading.Thread(
+        target=watch_store, args=(dash_mod.STORE, published, stop), daemon=True
+    ).start()
+    threading.Thread(target=dash_mod.ib_worker, daemon=True).start()
+    for f in frames:
+        threading.Thread(target=viewer, args=(url, f, stop), daemon=True).start()
+
+    time.sleep(args.warmup)
+    t_start, cpu_start = time.time(), time.process_time()
+    time.sleep(args.duration)
+    t_end, cpu_end = time.time(), time.process_time()
+    stop.set()
+    time.sleep(0.5)
+
+    # Ticks measured: scheduled inside the window
+    ticks = sorted(
+        (applied, due)
+        for sim in sims
+        for due, applied in list(sim.tick_log)
+        if t_start <= due < t_end
+    )
+    pub = sorted(published, key=lambda x: x[1])
+    pub_times = [t for _, t in pub]
+
+    to_state, to_browser = [], []
+    version_of = []
+    for applied, due in ticks:
+        i = bisect.bisect_left(pub_times, applied)
+        if i == len(pub):
+            continue
+        version, t_pub = pub[i]
+        to_state.append(t_pub - due)
+        version_of.append((version, due))
+
+    for f in frames:
+        versions = [v for v, _ in f]
+        for version, due in version_of:
+            j = bisect.bisect_left(versions, version)
+            if j < len(f):
+                to_browser.append(f[j][1] - due)
+
+    n_ticks = len(ticks)
+    report = {
+        "duration_s": round(t_end - t_start, 2),
+        "ticks": n_ticks,
+        "ticks_per_s": round(n_ticks / (t_end - t_start), 1),
+        "publishes": sum(1 for _, t in pub if t_start <= t < t_end),
+        "viewers": args.viewers,
+        "frames_per_viewer": [
+            sum(1 for _, t in f if t_start <= t < t_end) for f in frames
+        ],
+        "connects": len(connects),
+        "tick_to_state_ms": percentiles(to_state),
+        "tick_to_browser_ms": percentiles(to_browser),
+        "cpu_ms_per_1k_ticks": (
+            round((cpu_end - cpu_start) * 1e6 / n_ticks, 1) if n_ticks else None
+        ),
+    }
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for key, value in report.items():
+            print(f"{key:22s} {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,14 +8,46 @@ Premium dark UI with glass-morphism design.
 # ============================================================================
 # IMPORTS
 # ============================================================================
-from ib_insync import IB, util, Future, Index, FuturesOption
+from ib_insync import IB, util, Future, Index, OptionChain
 import dash
 from dash import html, dcc
-from dash.dependencies import Input, Output
+from dash.dependencies import Input, Output, State
+from dash.exceptions import PreventUpdate
+import flask
 import pandas as pd
-import math, csv, os, threading, datetime, logging, time
+import math, threading, datetime, logging, time
 from collections import OrderedDict
 
+from es_trading_dashboard.collector import DailyWriter, RangeEventEngine, TickPipeline
+from es_trading_dashboard.collector.chain_manager import ChainManager
+from es_trading_dashboard.collector.contract_cache import (
+    ContractCache,
+    contract_from_dict,
+    contract_to_dict,
+)
+from es_trading_dashboard.collector.log_buffer import LogRingBuffer
+from es_trading_dashboard.collector.parquet_store import ParquetSink, ParquetStore
+from es_trading_dashboard.collector.push import PushHub
+from es_trading_dashboard.collector.replay import sample_row
+from es_trading_dashboard.collector.sample_engine import (
+    Sample,
+    SampleEngine,
+    iv_daily_from_ib,
+    straddle_quotes,
+)
+from es_trading_dashboard.collector.snapshot_cache import SnapshotCache
+from es_trading_dashboard.collector.schema import (
+    LOG_COLUMNS,
+    SAMPLE_COLUMNS,
+    SNAP_COLUMNS,
+)
+from es_trading_dashboard.collector.state_store import StateStore
+from es_trading_dashboard.core.calendar import local_now, zero_dte_expiry
+from es_trading_dashboard.core.config import Config, IBSettings, Settings
+from es_trading_dashboard.core.connection import IBConnection
+from es_trading_dashboard.core.spec import ORDER_KEYS, SESSION_END, SESSION_START
+from es_trading_dashboard.core.supervisor import ConnectionSupervisor
+
 # ============================================================================
 # LOGGING
 # ============================================================================
@@ -29,55 +61,73 @@ log = logging.getLogger("dashboard")
 # ============================================================================
 # COSTANTI E CONFIG
 # ============================================================================
+MARKET_DATA = IB  # market data source factory (SimulatedIB for offline runs)
 IB_HOST = "127.0.0.1"
 IB_PORT = 7496
 CLIENT_ID = 30
 DASH_HOST = "127.0.0.1"
 DASH_PORT = 8050
 UPDATE_SEC = 10
-UPDATE_MS = 10000
+UPDATE_MS = 10000  # fallback polling when the push channel is unavailable
+PUSH_PATH = "/_push"  # Server-Sent Events stream of state deltas
+RECALC_MIN_SEC = 0.25
 RESELECT_POINTS = 10
-SQRT_252 = 252 ** 0.5
-FIB_UP = 1.618
-FIB_DN = 0.618
-T_1000 = (10, 0)
-T_1530 = (15, 30)
-T_1545 = (15, 45)
-
-ORDER_KEYS = [
-    "FIBO EST R1 UP",
-    "FIBO EST R2 UP",
-    "R1 UP",
-    "R2 UP",
-    "CENTER",
-    "R2 DOWN",
-    "R1 DOWN",
-    "FIBO EST R2 DOWN",
-    "FIBO EST R1 DOWN"
-]
+OPTION_LINES = 20  # market data lines for the sliding option window (2 per strike)
+ES_WAIT_SEC = 7  # max wait for the first ES price before picking the ATM strike
+STALL_SEC = 30  # in-session seconds without ticks before forcing a reconnect
+EXPIRY_RETRY_SEC = 60  # retry delay while the next 0DTE expiry is not listed
+LOG_CAPACITY = 8192  # rows kept in memory (02:15-22:00 at 10s ~ 7,100)
 
 # ============================================================================
 # GLOBAL STATE
 # ============================================================================
-STATE = {
-    "es_last": None, "spx_last": None, "es_vwap_live": None,
-    "spx_open_official": None, "spread_live": None,
-    "iv_daily_pct_live": None, "iv_straddle_pct_live": None,
-    "str_bid": None, "str_mid": None, "str_ask": None,
-    "str_spread": None, "dvs": None, "pcr": None,
-    "mode": "MORNING_ES_VWAP", "base_label_live": "VWAP",
-    "base_live": None, "strike": None, "exchange": None,
-    "expiry": None, "trading_class": None,
-    "call_contract": None, "put_contract": None,
-    "snap_1000": None, "snap_1530_spx": None, "snap_1530_es": None,
-    "snap_1545_spx": None, "snap_1545_es": None,
-    "live_panels": {},
-    "log_rows": [],
-    "connected": False, "last_update": None,
-}
+STORE = StateStore(
+    {
+        "es_last": None,
+        "spx_last": None,
+        "es_vwap_live": None,
+        "spx_open_official": None,
+        "spread_live": None,
+        "iv_daily_pct_live": None,
+        "iv_straddle_pct_live": None,
+        "str_bid": None,
+        "str_mid": None,
+        "str_ask": None,
+        "str_spread": None,
+        "dvs": None,
+        "pcr": None,
+        "mode": "MORNING_ES_VWAP",
+        "base_label_live": "VWAP",
+        "base_live": None,
+        "strike": None,
+        "exchange": None,
+        "expiry": None,
+        "trading_class": None,
+        "call_contract": None,
+        "put_contract": None,
+        "snap_1000": None,
+        "snap_1530_spx": None,
+        "snap_1530_es": None,
+        "snap_1545_spx": None,
+        "snap_1545_es": None,
+        "live_panels": {},
+        "range_events": [],
+        "connected": False,
+        "last_update": None,
+        "writer": {},
+        "log_count": 0,
+    }
+)
+
+LOG_BUFFER = LogRingBuffer(capacity=LOG_CAPACITY)
 
 CSV_LOG = "live_log_10s.csv"
 CSV_SNAP = "snapshots_fixed.csv"
+PARQUET_ROOT = None  # e.g. "parquet" to also write market_10s / range_snapshots
+RECORD_SAMPLES = None  # e.g. "samples.csv" to record engine inputs for replay
+CONTRACT_CACHE = (
+    "contracts_cache.json"  # resolved contracts per trade_date (None disables)
+)
 
 # ============================================================================
 # UTILITY FUNCTIONS
@@ -98,304 +148,374 @@ def fmt(v, decimals=2):
         return "---"
     return f"{v:,.{decimals}f}"
 
+
+def fmt_text(v):
+    """Format a text value for display."""
+    if v is None:
+        return "---"
+    return str(v)
+
+
 def fmt_pct(v):
     """Format percentage."""
     if v is None:
         return "---"
     return f"{v:.4f}%"
 
-def time_ge(t_tuple):
-    """Check if current CET time >= (hour, minute)."""
-    now = datetime.datetime.now()
-    return (now.hour, now.minute) >= t_tuple
-
-def calc_ranges(base, iv_daily_frac, iv_straddle_frac):
-    """Calculate R1, R2, FIBO ranges from base."""
-    if base is None or iv_daily_frac is None or iv_straddle_frac is None:
-        return {}
-    r1_pts = base * iv_daily_frac
-    r2_pts = base * iv_straddle_frac
-    return OrderedDict([
-        ("FIBO EST R1 UP", base + r1_pts * FIB_UP),
-        ("FIBO EST R2 UP", base + r2_pts * FIB_UP),
-        ("R1 UP", base + r1_pts),
-        ("R2 UP", base + r2_pts),
-        ("CENTER", base),
-        ("R2 DOWN", base - r2_pts),
-        ("R1 DOWN", base - r1_pts),
-        ("FIBO EST R2 DOWN", base - r2_pts * FIB_DN),
-        ("FIBO EST R1 DOWN", base - r1_pts * FIB_DN),
-    ])
-
-def to_es(x, spread):
-    """Convert SPX level to ES level."""
-    if x is None or spread is None:
-        return None
-    return x + spread
+
+def wait_for_price(ib, ticker, timeout):
+    """First price of a new subscription, returning as soon as it arrives."""
+    deadline = time.monotonic() + timeout
+    price = nn(ticker.last) or nn(ticker.close)
+    while price is None and time.monotonic() < deadline and ib.isConnected():
+        ib.waitOnUpdate(timeout=deadline - time.monotonic())
+        price = nn(ticker.last) or nn(ticker.close)
+    return price
+
+
+def find_0dte_chain(ib, es, expiry):
+    """E2B option chain listing ``expiry``, or None if it is not listed (yet)."""
+    chains = ib.reqSecDefOptParams("ES", "CME", "FUT", es.conId)
+    return next(
+        (c for c in chains if c.tradingClass == "E2B" and expiry in c.expirations),
+        None,
+    )
+
+
+def in_session(now):
+    """Whether ``now`` (Zurich) falls in the ES trade-date session, Mon-Fri."""
+    return now.weekday() < 5 and SESSION_START <= (now.hour, now.minute) < SESSION_END
+
+
+def cache_options(day, options):
+    """Persist the qualified option window to the contract cache."""
+    CONTRACTS.save(
+        day,
+        options={
+            "exchange": options.exchange,
+            "strikes": {
+                str(k): [contract_to_dict(c), contract_to_dict(p)]
+                for k, (c, p) in options.contracts.items()
+            },
+        },
+    )
+
 
 # ============================================================================
 # CSV FUNCTIONS
 # ============================================================================
+WRITER = DailyWriter()
+CONTRACTS = ContractCache(CONTRACT_CACHE) if CONTRACT_CACHE else None
+
 def init_csv():
-    """Initialize CSV files with headers if they don't exist."""
-    if not os.path.exists(CSV_LOG):
-        with open(CSV_LOG, "w", newline="") as f:
-            w = csv.writer(f)
-            w.writerow(["timestamp","mode","es_last","es_vwap_live","spx_last",
-                         "spx_open_official","spread_live","iv_daily_pct_live",
-                         "iv_straddle_pct_live","str_bid","str_mid","str_ask",
-                         "str_spread","dvs","pcr"])
-    if not os.path.exists(CSV_SNAP):
-        with open(CSV_SNAP, "w", newline="") as f:
-            w = csv.writer(f)
-            w.writerow(["timestamp","slot","date","base_label","base_value",
-                         "spx_open_official","spread_fixed",
-                         "iv_daily_pct_fixed","iv_straddle_pct_fixed",
-                         "R1_UP","R2_UP","CENTER","R2_DN","R1_DN",
-                         "FIB_R1_UP","FIB_R2_UP","FIB_R2_DN","FIB_R1_DN"])
+    """Register CSV files with the writer (headers written if missing)."""
+    WRITER.register("log", CSV_LOG, LOG_COLUMNS)
+    WRITER.register("snap", CSV_SNAP, SNAP_COLUMNS)
+    if PARQUET_ROOT:
+        store = ParquetStore(PARQUET_ROOT)
+        WRITER.add_sink("log", ParquetSink(store, "market_10s"))
+        WRITER.add_sink("snap", ParquetSink(store, "range_snapshots", part_rows=1))
+    if RECORD_SAMPLES:
+        WRITER.register("samples", RECORD_SAMPLES, SAMPLE_COLUMNS)
+    WRITER.start()
 
 def append_log_csv(row):
-    """Append a row to the live log CSV."""
-    with open(CSV_LOG, "a", newline="") as f:
-        csv.writer(f).writerow(row)
+    """Queue a row for the live log CSV."""
+    WRITER.write("log", row)
 
 def append_snap_csv(row):
-    """Append a row to the snapshot CSV."""
-    with open(CSV_SNAP, "a", newline="") as f:
-        csv.writer(f).writerow(row)
+    """Queue a row for the snapshot CSV."""
+    WRITER.write("snap", row)
 
   # ============================================================================
 # IB WORKER (Thread 1)
 # ============================================================================
 def ib_worker():
-    """Main IB data collection loop. Runs in a separate thread."""
-    global STATE
+    """Main IB data collection loop. Runs in a separate thread.
+
+    Contracts, strike, option window and engine state survive reconnects:
+    the supervisor reconnects with backoff and replays the subscriptions.
+    """
     init_csv()
-    today = datetime.date.today().strftime("%Y%m%d")
-    snap_done = {"1000": False, "1530": False, "1545": False}
     anchor = None
+    expiry = None
+    es = spx = None  # session contracts, reused on reconnect
+    engine = SampleEngine(RangeEventEngine(), log_interval=UPDATE_SEC)
+    config = Config(Settings(ib=IBSettings(host=IB_HOST, port=IB_PORT)))
+    ib = ConnectionSupervisor(
+        IBConnection(config, ib=MARKET_DATA()),
+        client_id=CLIENT_ID,
+        stall_timeout=STALL_SEC,
+    )
+    options = None
+    switch_retry = None  # next attempt of a pending 0DTE expiry switch
 
     while True:
         try:
-            ib = IB()
-            ib.connect(IB_HOST, IB_PORT, clientId=CLIENT_ID, readonly=True)
+            ib.connect()
             log.info("Connected to IB")
-            STATE["connected"] = True
-
-            # --- ES Future (front month) ---
-            cds = ib.reqContractDetails(Future("ES", "", "CME"))
-            cds = sorted(cds, key=lambda x: x.contract.lastTradeDateOrContractMonth)
-            es = cds[0].contract
-            ib.qualifyContracts(es)
-            log.info(f"ES contract: {es.localSymbol}")
-
-            # --- ES Market Data (VWAP + IV) ---
-            t_es = ib.reqMktData(es, genericTickList="233,106", snapshot=False)
-
-            # --- SPX Index ---
-            spx = Index("SPX", "CBOE")
-            ib.qualifyContracts(spx)
-            t_spx = ib.reqMktData(spx, snapshot=False)
-
-            # --- Options Chain 0DTE ---
-            chains = ib.reqSecDefOptParams("ES", "CME", "FUT", es.conId)
-            chain = next(c for c in chains if c.tradingClass == "E2B" and today in c.expirations)
-            expiry = today
-            STATE["expiry"] = expiry
-            STATE["trading_class"] = chain.tradingClass
-            log.info(f"0DTE chain: {chain.tradingClass} exp={expiry}")
-
-            ib.sleep(2)
-
-            # --- ATM Strike ---
-            es_last = nn(t_es.last) or nn(t_es.close)
-            if es_last is None:
-                ib.sleep(5)
-                es_last = nn(t_es.last) or nn(t_es.close)
-            strike = min(chain.strikes, key=lambda k: abs(k - (es_last or 0)))
-            anchor = es_last
-            STATE["strike"] = strike
-
-            # --- Options ATM ---
-            tc, tp = None, None
-            for exch in ("CME", "GLOBEX"):
-                call = FuturesOption("ES", expiry, strike, "C", exch, tradingClass=chain.tradingClass)
-                put = FuturesOption("ES", expiry, strike, "P", exch, tradingClass=chain.tradingClass)
-                qc = ib.qualifyContracts(call, put)
-                if qc:
-                    tc = ib.reqMktData(call, genericTickList="101,106", snapshot=False)
-                    tp = ib.reqMktData(put, genericTickList="101,106", snapshot=False)
-                    STATE["exchange"] = exch
-                    STATE["call_contract"] = str(call.localSymbol)
-                    STATE["put_contract"] = str(put.localSymbol)
-                    log.info(f"Options qualified on {exch}: strike={strike}")
-                    break
-
-            ib.sleep(3)
-
-            # === MAIN DATA LOOP ===
+            STORE.publish(connected=True)
+
+            if options is not None and es is not None:
+                # --- Reconnect: subscriptions replayed, same session ---
+                t_es, t_spx = ib.ticker(es), ib.ticker(spx)
+                options.rebind(ib.ticker)
+                tc, tp = options.call, options.put
+            else:
+                # --- Contracts: cache of the 0DTE session, else discovery ---
+                # (Zurich clock; from 22:01 the next business day's expiry)
+                day = zero_dte_expiry(local_now())
+                expiry = day.strftime("%Y%m%d")
+                cached = CONTRACTS.load(day, expiry=expiry) if CONTRACTS else None
+                if cached:
+                    es = contract_from_dict(cached["es"])
+                    spx = contract_from_dict(cached["spx"])
+                    chain = OptionChain(**cached["chain"])
+                    log.info("Contracts loaded from cache")
+                else:
+                    # --- ES Future (front month) ---
+                    cds = ib.reqContractDetails(Future("ES", "", "CME"))
+                    cds = sorted(
+                        cds, key=lambda x: x.contract.lastTradeDateOrContractMonth
+                    )
+                    es = cds[0].contract
+                    ib.qualifyContracts(es)
+
+                    # --- SPX Index ---
+                    spx = Index("SPX", "CBOE")
+                    ib.qualifyContracts(spx)
+
+                    # --- Options Chain 0DTE ---
+                    chain = find_0dte_chain(ib, es, expiry)
+                    if chain is None:
+                        raise RuntimeError(f"No E2B option chain lists {expiry}")
+                    if CONTRACTS:
+                        CONTRACTS.save(
+                            day,
+                            es=contract_to_dict(es),
+                            spx=contract_to_dict(spx),
+                            chain=chain._asdict(),
+                        )
+                STORE.publish(expiry=expiry, trading_class=chain.tradingClass)
+                log.info(f"ES contract: {es.localSymbol}")
+                log.info(f"0DTE chain: {chain.tradingClass} exp={expiry}")
+
+                # --- ES Market Data (VWAP + IV) / SPX ---
+                t_es = ib.reqMktData(es, genericTickList="233,106", snapshot=False)
+                t_spx = ib.reqMktData(spx, snapshot=False)
+
+                # --- ATM Strike (first ES price) ---
+                es_last = wait_for_price(ib, t_es, ES_WAIT_SEC)
+                strike = min(chain.strikes, key=lambda k: abs(k - (es_last or 0)))
+                anchor = es_last
+                STORE.publish(strike=strike)
+
+                # --- Options chain: ±100pt window qualified in one batch ---
+                chain_options = ChainManager(
+                    ib,
+                    expiry,
+                    chain.tradingClass,
+                    chain.strikes,
+                    max_lines=OPTION_LINES,
+                )
+                if cached and cached.get("options"):
+                    chain_options.preload(
+                        {
+                            float(k): tuple(contract_from_dict(c) for c in pair)
+                            for k, pair in cached["options"]["strikes"].items()
+                        },
+                        cached["options"]["exchange"],
+                    )
+                n_qualified = len(chain_options.contracts)
+                tc = tp = None
+                if chain_options.set_atm(strike):
+                    tc, tp = chain_options.call, chain_options.put
+                    STORE.publish(
+                        exchange=chain_options.exchange,
+                        call_contract=str(tc.contract.localSymbol),
+                        put_contract=str(tp.contract.localSymbol),
+                    )
+                    log.info(
+                        f"Options qualified on {chain_options.exchange}: "
+                        f"strike={strike}"
+                    )
+                if CONTRACTS and len(chain_options.contracts) != n_qualified:
+                    cache_options(day, chain_options)
+                options = chain_options
+
+            # === MAIN DATA LOOP (event-driven) ===
+            pipe = TickPipeline(ib, min_interval=RECALC_MIN_SEC)
+            pipe.watch(t_es, "es")
+            pipe.watch(t_spx, "spx")
+            pipe.watch(tc, "options")
+            pipe.watch(tp, "options")
+            sample = Sample(local_now())
+
             while ib.isConnected():
-                ib.sleep(UPDATE_SEC)
-                now = datetime.datetime.now()
-                now_str = now.strftime("%Y-%m-%d %H:%M:%S")
-
-                # --- Collect live data ---
-                es_last = nn(t_es.last) or nn(t_es.close)
-                es_vwap_live = nn(getattr(t_es, "vwap", None))
-                spx_last = nn(t_spx.last)
-                spread_live = (es_last - spx_last) if (es_last and spx_last) else None
-
-                # --- SPX OPEN official (once after 15:30) ---
-                spx_open_off = STATE["spx_open_official"]
-                if spx_open_off is None and time_ge(T_1530):
-                    spx_open_off = nn(t_spx.open)
-                    if spx_open_off is None:
+                timeout = (
+                    (engine.next_log - local_now()).total_seconds()
+                    if engine.next_log
+                    else UPDATE_SEC
+                )
+                dirty = pipe.poll(timeout)
+                now = local_now()
+                sample.timestamp = now
+
+                # --- ES last / VWAP / IV% Daily (tick 233, 106) ---
+                if "es" in dirty:
+                    sample.es_last = nn(t_es.last) or nn(t_es.close)
+                    sample.es_vwap = nn(getattr(t_es, "vwap", None))
+                    sample.iv_daily_pct = iv_daily_from_ib(
+                        nn(getattr(t_es, "impliedVolatility", None))
+                    )
+
+                # --- SPX last / OPEN official (fallback: daily bar, on log cycles) ---
+                if "spx" in dirty:
+                    sample.spx_last = nn(t_spx.last)
+                if engine.wants_spx_open(now):
+                    sample.spx_open = nn(t_spx.open)
+                    if sample.spx_open is None and engine.log_due(now):
                         try:
                             bars = ib.reqHistoricalData(spx, endDateTime="",
                                 durationStr="1 D", barSizeSetting="1 day",
                                 whatToShow="TRADES", useRTH=True)
                             if bars:
-                                spx_open_off = nn(bars[-1].open)
+                                sample.spx_open = nn(bars[-1].open)
                         except Exception:
                             pass
-                    if spx_open_off:
-                        STATE["spx_open_official"] = spx_open_off
-                        log.info(f"SPX OPEN official: {spx_open_off}")
-
-                # --- IV% Daily (tick 106) ---
-                iv_raw = nn(getattr(t_es, "impliedVolatility", None))
-                iv_annual_pct = (iv_raw * 100.0) if (iv_raw and iv_raw < 1.0) else iv_raw
-                iv_daily_pct = (iv_annual_pct / SQRT_252) if iv_annual_pct else None
-                iv_daily_frac = (iv_daily_pct / 100.0) if iv_daily_pct else None
 
                 # --- Straddle ATM ---
-                call_bid = nn(tc.bid) if tc else None
-                call_ask = nn(tc.ask) if tc else None
-                put_bid = nn(tp.bid) if tp else None
-                put_ask = nn(tp.ask) if tp else None
-                call_mid = ((call_bid + call_ask) / 2.0) if (call_bid and call_ask) else None
-                put_mid = ((put_bid + put_ask) / 2.0) if (put_bid and put_ask) else None
-                str_bid = (call_bid + put_bid) if (call_bid and put_bid) else None
-                str_ask = (call_ask + put_ask) if (call_ask and put_ask) else None
-                str_mid = ((str_bid + str_ask) / 2.0) if (str_bid and str_ask) else None
-                str_spread = (str_ask - str_bid) if (str_ask and str_bid) else None
-                pcr = (put_mid / call_mid) if (put_mid and call_mid and call_mid != 0) else None
-
-                # --- MODE ---
-                mode = "MORNING_ES_VWAP"
-                base_live = es_vwap_live
-                base_label_live = "VWAP"
-                if time_ge(T_1530) and spx_open_off not in (None, 0) and spread_live is not None:
-                    mode = "AFTERNOON_SPX_OPEN"
-                    base_live = spx_open_off
-                    base_label_live = "OPEN"
-
-                # --- IV% Straddle ---
-                iv_straddle_pct = ((str_ask / base_live) * 100.0) if (str_ask and base_live) else None
-                iv_straddle_frac = (iv_straddle_pct / 100.0) if iv_straddle_pct else None
-
-                # --- DVS ---
-                r1_pts_live = (base_live * iv_daily_frac) if (base_live and iv_daily_frac) else None
-                dvs = ((str_mid / r1_pts_live) * 100.0) if (str_mid and r1_pts_live and r1_pts_live != 0) else None
-
-                # --- RESELECT strike ---
-                if es_last and anchor and abs(es_last - anchor) >= RESELECT_POINTS:
-                    new_strike = min(chain.strikes, key=lambda k: abs(k - es_last))
-                    if new_strike != strike:
+                if "options" in dirty:
+                    sample.str_bid, sample.str_ask, sample.pcr = straddle_quotes(
+                        nn(tc.bid) if tc else None,
+                        nn(tc.ask) if tc else None,
+                        nn(tp.bid) if tp else None,
+                        nn(tp.ask) if tp else None,
+                    )
+
+                step = engine.step(sample)
+                changes = step.state
+                if "spx_open_official" in changes and changes["spx_open_official"]:
+                    log.info(f"SPX OPEN official: {changes['spx_open_official']}")
+
+                # --- RESELECT strike (pointer switch to live tickers) ---
+                es_last = sample.es_last
+                if (
+                    "es" in dirty
+                    and es_last
+                    and anchor
+                    and abs(es_last - anchor) >= RESELECT_POINTS
+                ):
+                    new_strike = options.nearest(es_last)
+                    if new_strike != strike and options.set_atm(new_strike):
                         strike = new_strike
                         anchor = es_last
-                        STATE["strike"] = strike
-                        ib.cancelMktData(tc.contract)
-                        ib.cancelMktData(tp.contract)
-                        for exch in ("CME", "GLOBEX"):
-                            call = FuturesOption("ES", expiry, strike, "C", exch, tradingClass=chain.tradingClass)
-                            put = FuturesOption("ES", expiry, strike, "P", exch, tradingClass=chain.tradingClass)
-                            qc = ib.qualifyContracts(call, put)
-                            if qc:
-                                tc = ib.reqMktData(call, genericTickList="101,106", snapshot=False)
-                                tp = ib.reqMktData(put, genericTickList="101,106", snapshot=False)
-                                STATE["exchange"] = exch
-                                log.info(f"Reselected ATM strike={strike}")
-                                break
-
-                # --- Live ranges ---
-                live_ranges = calc_ranges(base_live, iv_daily_frac, iv_straddle_frac) if base_live else {}
-
-                # --- Update STATE ---
-                STATE.update({
-                    "es_last": es_last, "spx_last": spx_last,
-                    "es_vwap_live": es_vwap_live, "spread_live": spread_live,
-                    "iv_daily_pct_live": iv_daily_pct, "iv_straddle_pct_live": iv_straddle_pct,
-                    "str_bid": str_bid, "str_mid": str_mid, "str_ask": str_ask,
-                    "str_spread": str_spread, "dvs": dvs, "pcr": pcr,
-                    "mode": mode, "base_label_live": base_label_live,
-                    "base_live": base_live, "last_update": now_str,
-                    "live_panels": live_ranges,
-                })
-
-                # --- SNAPSHOT 10:00 ---
-                if time_ge(T_1000) and not snap_done["1000"]:
-                    if base_live and iv_daily_frac and iv_straddle_frac:
-                        ranges = calc_ranges(base_live, iv_daily_frac, iv_straddle_frac)
-                        STATE["snap_1000"] = {"base": base_live, "label": "VWAP",
-                            "iv_daily": iv_daily_pct, "iv_straddle": iv_straddle_pct, "ranges": ranges}
-                        append_snap_csv([now_str, "ES_10:00", today, "VWAP", base_live,
-                            spx_open_off, spread_live, iv_daily_pct, iv_straddle_pct] +
-                            [ranges.get(k) for k in ORDER_KEYS])
-                        snap_done["1000"] = True
-                        log.info("Snapshot 10:00 saved")
-
-                # --- SNAPSHOT 15:30 ---
-                if time_ge(T_1530) and not snap_done["1530"]:
-                    if spx_open_off and spread_live and iv_daily_frac and iv_straddle_frac:
-                        spx_ranges = calc_ranges(spx_open_off, iv_daily_frac, iv_straddle_frac)
-                        STATE["snap_1530_spx"] = {"base": spx_open_off, "label": "OPEN",
-                            "iv_daily": iv_daily_pct, "iv_straddle": iv_straddle_pct, "ranges": spx_ranges}
-                        append_snap_csv([now_str, "SPX_15:30", today, "OPEN", spx_open_off,
-                            spx_open_off, spread_live, iv_daily_pct, iv_straddle_pct] +
-                            [spx_ranges.get(k) for k in ORDER_KEYS])
-                        es_ranges = OrderedDict([(k, to_es(v, spread_live)) for k, v in spx_ranges.items()])
-                        STATE["snap_1530_es"] = {"base": to_es(spx_open_off, spread_live), "label": "OPEN+SPR",
-                            "iv_daily": iv_daily_pct, "iv_straddle": iv_straddle_pct, "ranges": es_ranges,
-                            "spread": spread_live}
-                        append_snap_csv([now_str, "ES_15:30", today, "OPEN+SPR",
-                            to_es(spx_open_off, spread_live), spx_open_off, spread_live,
-                            iv_daily_pct, iv_straddle_pct] + [es_ranges.get(k) for k in ORDER_KEYS])
-                        snap_done["1530"] = True
-                        log.info("Snapshot 15:30 saved")
-
-                # --- SNAPSHOT 15:45 ---
-                if time_ge(T_1545) and not snap_done["1545"]:
-                    if spx_open_off and spread_live and iv_daily_frac and iv_straddle_frac:
-                        spx_ranges = calc_ranges(spx_open_off, iv_daily_frac, iv_straddle_frac)
-                        STATE["snap_1545_spx"] = {"base": spx_open_off, "label": "OPEN",
-                            "iv_daily": iv_daily_pct, "iv_straddle": iv_straddle_pct, "ranges": spx_ranges}
-                        append_snap_csv([now_str, "SPX_15:45", today, "OPEN", spx_open_off,
-                            spx_open_off, spread_live, iv_daily_pct, iv_straddle_pct] +
-                            [spx_ranges.get(k) for k in ORDER_KEYS])
-                        es_ranges = OrderedDict([(k, to_es(v, spread_live)) for k, v in spx_ranges.items()])
-                        STATE["snap_1545_es"] = {"base": to_es(spx_open_off, spread_live), "label": "OPEN+SPR",
-                            "iv_daily": iv_daily_pct, "iv_straddle": iv_straddle_pct, "ranges": es_ranges,
-                            "spread": spread_live}
-                        append_snap_csv([now_str, "ES_15:45", today, "OPEN+SPR",
-                            to_es(spx_open_off, spread_live), spx_open_off, spread_live,
-                            iv_daily_pct, iv_straddle_pct] + [es_ranges.get(k) for k in ORDER_KEYS])
-                        snap_done["1545"] = True
-                        log.info("Snapshot 15:45 saved")
-
-                # --- CSV Log ---
-                log_row = [now_str, mode, es_last, es_vwap_live, spx_last,
-                           spx_open_off, spread_live, iv_daily_pct, iv_straddle_pct,
-                           str_bid, str_mid, str_ask, str_spread, dvs, pcr]
-                append_log_csv(log_row)
-                STATE["log_rows"].append(log_row)
-                if len(STATE["log_rows"]) > 300:
-                    STATE["log_rows"] = STATE["log_rows"][-300:]
+                        pipe.unwatch(tc)
+                        pipe.unwatch(tp)
+                        tc, tp = options.call, options.put
+                        pipe.watch(tc, "options")
+                        pipe.watch(tp, "options")
+                        changes.update(
+                            strike=strike,
+                            exchange=options.exchange,
+                            call_contract=str(tc.contract.localSymbol),
+                            put_contract=str(tp.contract.localSymbol),
+                        )
+                        log.info(f"Reselected ATM strike={strike}")
+                    if CONTRACTS and len(options.contracts) != n_qualified:
+                        n_qualified = len(options.contracts)
+                        cache_options(day, options)
+
+                if RECORD_SAMPLES:
+                    WRITER.write("samples", sample_row(sample))
+                if step.events_changed:
+                    changes["range_events"] = engine.events.rows()
+
+                # --- Snapshots 10:00 / 15:30 / 15:45 ---
+                for row in step.snapshots:
+                    append_snap_csv(row)
+                    log.info(f"Snapshot {row[1]} saved")
+
+                # --- CSV Log (every UPDATE_SEC) ---
+                if step.log_row is not None:
+                    append_log_csv(step.log_row)
+                    LOG_BUFFER.append(step.log_row)
+                    changes["log_count"] = LOG_BUFFER.count
+                    changes["writer"] = WRITER.stats()
+
+                # --- FINALIZE 22:01 (flush + fsync, off the IB thread) ---
+                if step.finalize:
+                    threading.Thread(
+                        target=WRITER.finalize, name="writer-finalize", daemon=True
+                    ).start()
+                    FOTO_CACHE.roll()
+
+                # --- Publish one consistent snapshot per cycle ---
+                STORE.publish(changes)
+
+                # --- 0DTE switch (22:01): next expiry on the live connection ---
+                # (ES/SPX stay subscribed; retried until the chain lists it)
+                next_day = zero_dte_expiry(now)
+                next_expiry = next_day.strftime("%Y%m%d")
+                if next_expiry != expiry and (
+                    switch_retry is None or now >= switch_retry
+                ):
+                    chain = find_0dte_chain(ib, es, next_expiry)
+                    if chain is None:
+                        switch_retry = now + datetime.timedelta(
+                            seconds=EXPIRY_RETRY_SEC
+                        )
+                        log.warning(
+                            f"0DTE expiry {next_expiry} not listed yet, "
+                            f"retrying in {EXPIRY_RETRY_SEC}s"
+                        )
+                    else:
+                        switch_retry = None
+                        log.info(
+                            f"0DTE expiry {expiry} over, switching to {next_expiry}"
+                        )
+                        pipe.unwatch(tc)
+                        pipe.unwatch(tp)
+                        options.switch_expiry(
+                            next_expiry, chain.strikes, chain.tradingClass
+                        )
+                        day, expiry = next_day, next_expiry
+                        anchor = sample.es_last or anchor
+                        strike = options.nearest(anchor or 0)
+                        tc = tp = None
+                        if options.set_atm(strike):
+                            tc, tp = options.call, options.put
+                            pipe.watch(tc, "options")
+                            pipe.watch(tp, "options")
+                        STORE.publish(
+                            expiry=expiry,
+                            trading_class=chain.tradingClass,
+                            strike=strike,
+                            exchange=options.exchange,
+                            call_contract=str(tc.contract.localSymbol) if tc else None,
+                            put_contract=str(tp.contract.localSymbol) if tp else None,
+                        )
+                        n_qualified = len(options.contracts)
+                        if CONTRACTS:
+                            CONTRACTS.save(
+                                day,
+                                es=contract_to_dict(es),
+                                spx=contract_to_dict(spx),
+                                chain=chain._asdict(),
+                            )
+                            cache_options(day, options)
+
+                # --- Heartbeat: no ticks during the session -> reconnect ---
+                if in_session(now) and ib.stalled():
+                    ib.drop(f"no market data for {STALL_SEC}s")
+
+            pipe.close()
+            STORE.publish(connected=False)
 
         except Exception as e:
             log.error(f"IB Worker error: {e}")
-            STATE["connected"] = False
-            time.sleep(30)
+            STORE.publish(connected=False)
+            ib.drop("worker error")
 
 # ============================================================================
 # PREMIUM CSS STYLES
@@ -770,18 +890,30 @@ body::before {
 }
 """
 
+
 # ============================================================================
 # DASH LAYOUT HELPERS
 # ============================================================================
-def make_metric(label, value, cls=""):
+def make_metric(label, value, cls="", id=None):
     """Create a metric row for sidebar cards."""
-    return html.Div(className="metric-row", children=[
-        html.Span(label, className="metric-label"),
-        html.Span(str(value), className=f"metric-value {cls}")
-    ])
-
-def make_panel(title, panel_type, snap_data, base_label=""):
-    """Create a range panel column (LIVE or FOTO)."""
+    value_kwargs = {"id": id} if id else {}
+    return html.Div(
+        className="metric-row",
+        children=[
+            html.Span(label, className="metric-label"),
+            html.Span(str(value), className=f"metric-value {cls}", **value_kwargs),
+        ],
+    )
+
+
+def make_panel(
+    title, panel_type, snap_data, base_label="", live_iv=(None, None), id=None
+):
+    """Create a range panel column (LIVE or FOTO).
+
+    With an id, level values and footer spans get ids "<id>-lv-<i>",
+    "<id>-iv" and "<id>-str" so LIVE panels can be patched in place.
+    """
     is_live = (panel_type == "LIVE")
     header_cls = "panel-header live" if is_live else "panel-header foto"
     tag = html.Span("LIVE" if is_live else "FOTO", className="tag-live" if is_live else "tag-foto")
@@ -792,15 +924,17 @@ def make_panel(title, panel_type, snap_data, base_label=""):
         iv_s = snap_data.get("iv_straddle")
     elif isinstance(snap_data, OrderedDict):
         ranges = snap_data
-        iv_d = STATE.get("iv_daily_pct_live")
-        iv_s = STATE.get("iv_straddle_pct_live")
+        iv_d, iv_s = live_iv
     else:
         ranges = {}
         iv_d = None
         iv_s = None
 
+    def _id(suffix):
+        return {"id": f"{id}-{suffix}"} if id else {}
+
     level_rows = []
-    for key in ORDER_KEYS:
+    for i, key in enumerate(ORDER_KEYS):
         val = ranges.get(key)
         if "UP" in key:
             cls = "level-up"
@@ -809,32 +943,50 @@ def make_panel(title, panel_type, snap_data, base_label=""):
         else:
             cls = "level-center"
         short = key.replace("FIBO EST ", "F.").replace(" UP", "").replace(" DOWN", "")
-        level_rows.append(html.Div(className="level-row", children=[
-            html.Span(short, className="level-label"),
-            html.Span(fmt(val), className=f"level-value {cls}")
-        ]))
-
-    return html.Div(className="panel-col", children=[
-        html.Div(className="panel-card", children=[
-            html.Div(className=header_cls, children=[title, " ", tag]),
-            html.Div(className="panel-body", children=level_rows),
-            html.Div(className="panel-footer", children=[
-                html.Span(f"IV% {fmt_pct(iv_d)}"),
-                html.Span(f"STR {fmt_pct(iv_s)}")
-            ])
-        ])
-    ])
-
-def make_log_table(rows):
-    """Create the log table from recent rows."""
+        level_rows.append(
+            html.Div(
+                className="level-row",
+                children=[
+                    html.Span(short, className="level-label"),
+                    html.Span(
+                        fmt(val), className=f"level-value {cls}", **_id(f"lv-{i}")
+                    ),
+                ],
+            )
+        )
+
+    outer_kwargs = {"id": id} if id else {}
+    return html.Div(
+        className="panel-col",
+        **outer_kwargs,
+        children=[
+            html.Div(
+                className="panel-card",
+                children=[
+                    html.Div(className=header_cls, children=[title, " ", tag]),
+                    html.Div(className="panel-body", children=level_rows),
+                    html.Div(
+                        className="panel-footer",
+                        children=[
+                            html.Span(f"IV% {fmt_pct(iv_d)}", **_id("iv")),
+                            html.Span(f"STR {fmt_pct(iv_s)}", **_id("str")),
+                        ],
+                    ),
+                ],
+            )
+        ],
+    )
+
+
+def make_log_table(buffer, n=40):
+    """Create the log table from the last n rows of the log buffer."""
     headers = ["TIME", "VWAP", "IV%", "IV% STR", "DVS", "STR ASK", "STR BID", "STR SPR", "P/C", "MODE"]
     thead = html.Thead(html.Tr([html.Th(h) for h in headers]))
     tbody_rows = []
-    display_rows = list(reversed(rows[-40:])) if rows else []
-    for r in display_rows:
+    for r in buffer.rows(n):
         if len(r) >= 15:
             cells = [
-                html.Td(r[0][-8:] if r[0] else "---"),
+                html.Td(r[0].strftime("%H:%M:%S") if r[0] else "---"),
                 html.Td(fmt(r[3])),
                 html.Td(fmt_pct(r[7])),
                 html.Td(fmt_pct(r[8])),
@@ -843,125 +995,413 @@ def make_log_table(rows):
                 html.Td(fmt(r[9])),
                 html.Td(fmt(r[12])),
                 html.Td(fmt(r[14])),
-                html.Td(r[1] if r[1] else "---")
+                html.Td(r[1] if r[1] else "---"),
             ]
             tbody_rows.append(html.Tr(cells))
     tbody = html.Tbody(tbody_rows)
     return html.Table(className="log-table", children=[thead, tbody])
 
+
+# ============================================================================
+# RENDER MAP (state key -> component property)
+# ============================================================================
+# (state key, label, formatter, css class)
+MARKET_METRICS = [
+    ("es_vwap_live", "VWAP (ES)", fmt, "green"),
+    ("spx_open_official", "OPEN (SPX)", fmt, "amber"),
+    ("spread_live", "SPREAD", fmt, "purple"),
+    ("strike", "ATM Strike", lambda v: fmt(v, 0), "cyan"),
+    ("exchange", "Exchange", fmt_text, ""),
+    ("expiry", "Expiry", fmt_text, ""),
+    ("trading_class", "TradingClass", fmt_text, ""),
+]
+VOL_METRICS = [
+    ("iv_daily_pct_live", "IV% Daily", fmt_pct, "amber"),
+    ("iv_straddle_pct_live", "IV% Straddle", fmt_pct, "purple"),
+    ("str_ask", "STR ASK", fmt, "red"),
+    ("str_bid", "STR BID", fmt, "green"),
+    ("str_mid", "STR MID", fmt, "cyan"),
+    ("str_spread", "STR Spread", fmt, ""),
+    ("dvs", "DVS", fmt, "amber"),
+    ("pcr", "P/C Ratio", fmt, ""),
+    ("mode", "MODE", fmt_text, "blue"),
+]
+BIG_METRICS = [("es_last", fmt), ("spx_last", fmt)]
+METRIC_FIELDS = BIG_METRICS + [(k, f) for k, _, f, _ in MARKET_METRICS + VOL_METRICS]
+
+# (id suffix, label, value from writer stats, css class)
+HEALTH_METRICS = [
+    ("queue", "Writer Queue", lambda w: fmt_text(w.get("queue_depth")), "cyan"),
+    (
+        "flush",
+        "Last Flush",
+        lambda w: (
+            datetime.datetime.fromtimestamp(w["last_flush"]).strftime("%H:%M:%S")
+            if w.get("last_flush")
+            else "---"
+        ),
+        "",
+    ),
+    ("lag", "Writer Lag", lambda w: fmt(w.get("lag_sec"), 1), "amber"),
+    ("dropped", "Dropped Rows", lambda w: fmt_text(w.get("dropped")), "red"),
+]
+
+# (panel id, title, type, snapshot key)
+PANELS = [
+    ("es-1000", "ES 10:00", "FOTO", "snap_1000"),
+    ("es-live-am", "ES LIVE AM", "LIVE", None),
+    ("spx-live", "SPX LIVE", "LIVE", None),
+    ("spx-1530", "SPX 15:30", "FOTO", "snap_1530_spx"),
+    ("es-1530", "ES 15:30", "FOTO", "snap_1530_es"),
+    ("spx-1545", "SPX 15:45", "FOTO", "snap_1545_spx"),
+    ("es-1545", "ES 15:45", "FOTO", "snap_1545_es"),
+    ("es-live-pm", "ES LIVE PM", "LIVE", None),
+]
+
+
+def live_panel_ranges(s, panel_id):
+    """Ranges shown by a LIVE panel in the current mode."""
+    mode = s.get("mode") or ""
+    live_ranges = s.get("live_panels") or {}
+    if panel_id == "es-live-am":
+        return live_ranges if "MORNING" in mode else {}
+    if panel_id == "spx-live":
+        return live_ranges if "AFTERNOON" in mode else {}
+    return live_ranges
+
+
+def resolve_versions(ver):
+    """(previous, current) snapshots for a state-version payload.
+
+    previous is None when the client has not rendered anything yet or its
+    version is no longer retained, meaning "render everything".
+    """
+    s = STORE.get(ver["v"]) or STORE.current
+    return STORE.get(ver["prev"]), s
+
+
+def render_props(s):
+    """Render a snapshot to {(component id, property): value}.
+
+    Covers everything patched by property (header, metrics, health, LIVE
+    panels); FOTO panels and the log table are rendered by their callbacks.
+    """
+    mode = s.get("mode") or "---"
+    morning = "MORNING" in mode
+    props = {
+        ("conn-dot", "className"): (
+            "status-dot connected" if s["connected"] else "status-dot disconnected"
+        ),
+        ("conn-text", "children"): "Connected" if s["connected"] else "Disconnected",
+        ("mode-badge", "className"): (
+            "mode-badge mode-morning" if morning else "mode-badge mode-afternoon"
+        ),
+        ("mode-badge", "children"): "AM - VWAP" if morning else "PM - OPEN",
+        ("last-update", "children"): f"Updated: {s.get('last_update') or '---'}",
+    }
+    for key, f in METRIC_FIELDS:
+        props[(f"m-{key}", "children")] = f(s.get(key))
+    w = s.get("writer") or {}
+    for key, _, f, _ in HEALTH_METRICS:
+        props[(f"h-{key}", "children")] = f(w)
+    for pid, _, ptype, _ in PANELS:
+        if ptype != "LIVE":
+            continue
+        ranges = live_panel_ranges(s, pid)
+        for i, key in enumerate(ORDER_KEYS):
+            props[(f"{pid}-lv-{i}", "children")] = fmt(ranges.get(key))
+        props[(f"{pid}-iv", "children")] = (
+            f"IV% {fmt_pct(s.get('iv_daily_pct_live') if ranges else None)}"
+        )
+        props[(f"{pid}-str", "children")] = (
+            f"STR {fmt_pct(s.get('iv_straddle_pct_live') if ranges else None)}"
+        )
+    return props
+
+
+# Fallback callbacks, one per group of properties (mirrors render_props)
+PATCH_GROUPS = [
+    [
+        ("conn-dot", "className"),
+        ("conn-text", "children"),
+        ("mode-badge", "className"),
+        ("mode-badge", "children"),
+        ("last-update", "children"),
+    ],
+    [(f"m-{key}", "children") for key, _ in METRIC_FIELDS],
+    [(f"h-{key}", "children") for key, _, _, _ in HEALTH_METRICS],
+] + [
+    [(f"{pid}-lv-{i}", "children") for i in range(len(ORDER_KEYS))]
+    + [(f"{pid}-iv", "children"), (f"{pid}-str", "children")]
+    for pid, _, ptype, _ in PANELS
+    if ptype == "LIVE"
+]
+
+# State keys that need a callback round-trip (FOTO panels, log table)
+SYNC_KEYS = [key for _, _, _, key in PANELS if key] + ["log_count"]
+
+HUB = PushHub(STORE, render_props, sync_keys=SYNC_KEYS)
+
+# FOTO panels are immutable once taken: rendered once per (slot, trade date),
+# dropped at the 22:01 roll
+FOTO_CACHE = SnapshotCache(
+    lambda slot, snap: make_panel(slot.replace("_", " "), "FOTO", snap).children
+)
+
 # ============================================================================
 # DASH APP
 # ============================================================================
+# Push client: applies property deltas as they arrive and disables the
+# interval while the stream is open; heavy components sync via callbacks.
+PUSH_JS = """
+(function () {
+  if (!window.EventSource) { return; }
+  var synced = null;
+  function ready() {
+    return window.dash_clientside && window.dash_clientside.set_props &&
+      document.getElementById("state-version") !== null;
+  }
+  function set(id, props) { window.dash_clientside.set_props(id, props); }
+  function start() {
+    if (!ready()) { setTimeout(start, 250); return; }
+    var source = new EventSource("%s");
+    source.onopen = function () { set("interval", {disabled: true}); };
+    source.onerror = function () { set("interval", {disabled: false}); };
+    source.addEventListener("delta", function (e) {
+      var msg = JSON.parse(e.data);
+      for (var id in msg.patch) { set(id, msg.patch[id]); }
+      if (msg.sync) {
+        set("state-version", {data: {prev: synced, v: msg.v}});
+        synced = msg.v;
+      }
+    });
+  }
+  start();
+})();
+""" % PUSH_PATH
+
 app = dash.Dash(__name__, title="ES Trading Dashboard")
-app.index_string = '''<!DOCTYPE html>
+app.index_string = (
+    """<!DOCTYPE html>
 <html><head>{%metas%}<title>{%title%}</title>{%favicon%}{%css%}
-<style>''' + CSS + '''</style></head>
-<body>{%app_entry%}{%config%}{%scripts%}{%renderer%}</body></html>'''
-
-app.layout = html.Div([
-    # --- HEADER ---
-    html.Div(className="header", children=[
-        html.Div("ES / SPX Trading Dashboard", className="header-title"),
-        html.Div(className="header-status", id="header-status")
-    ]),
-    # --- MAIN ---
-    html.Div(className="main-container", children=[
-        # --- SIDEBAR ---
-        html.Div(className="sidebar", id="sidebar"),
-        # --- PANELS ---
-        html.Div(className="panels-area", id="panels-area")
-    ]),
-    # --- INTERVAL ---
-    dcc.Interval(id="interval", interval=UPDATE_MS, n_intervals=0)
-])
+<style>"""
+    + CSS
+    + """</style></head>
+<body>{%app_entry%}{%config%}{%scripts%}{%renderer%}
+<script>"""
+    + PUSH_JS
+    + """</script></body></html>"""
+)
+
+
+@app.server.route(PUSH_PATH)
+def push_stream():
+    """Server-Sent Events stream of rendered state deltas."""
+    return flask.Response(
+        HUB.stream(flask.request.headers.get("Last-Event-ID")),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def make_sidebar():
+    """Static sidebar skeleton; values are patched by id."""
+    market_card = html.Div(
+        className="card",
+        children=[
+            html.Div("Mercato Live", className="card-title"),
+            html.Div(
+                style={"display": "flex", "gap": "20px", "marginBottom": "10px"},
+                children=[
+                    html.Div(
+                        [
+                            html.Div(
+                                "ES",
+                                style={
+                                    "fontSize": "10px",
+                                    "color": "#64748b",
+                                    "marginBottom": "2px",
+                                },
+                            ),
+                            html.Div(
+                                "---", id="m-es_last", className="metric-value big cyan"
+                            ),
+                        ]
+                    ),
+                    html.Div(
+                        [
+                            html.Div(
+                                "SPX",
+                                style={
+                                    "fontSize": "10px",
+                                    "color": "#64748b",
+                                    "marginBottom": "2px",
+                                },
+                            ),
+                            html.Div(
+                                "---",
+                                id="m-spx_last",
+                                className="metric-value big blue",
+                            ),
+                        ]
+                    ),
+                ],
+            ),
+            *[
+                make_metric(label, "---", cls, id=f"m-{key}")
+                for key, label, _, cls in MARKET_METRICS
+            ],
+        ],
+    )
+    vol_card = html.Div(
+        className="card",
+        children=[
+            html.Div("Volatilita Live", className="card-title"),
+            *[
+                make_metric(label, "---", cls, id=f"m-{key}")
+                for key, label, _, cls in VOL_METRICS
+            ],
+        ],
+    )
+    health_card = html.Div(
+        className="card",
+        children=[
+            html.Div("Health", className="card-title"),
+            *[
+                make_metric(label, "---", cls, id=f"h-{key}")
+                for key, label, _, cls in HEALTH_METRICS
+            ],
+        ],
+    )
+    log_card = html.Div(
+        className="card",
+        style={"flex": "1", "overflow": "hidden"},
+        children=[
+            html.Div("Log (10s)", className="card-title"),
+            html.Div(className="log-scroll", id="log-table"),
+        ],
+    )
+    return [market_card, vol_card, health_card, log_card]
+
+
+app.layout = html.Div(
+    [
+        # --- HEADER ---
+        html.Div(
+            className="header",
+            children=[
+                html.Div("ES / SPX Trading Dashboard", className="header-title"),
+                html.Div(
+                    className="header-status",
+                    children=[
+                        html.Span(
+                            [
+                                html.Span(
+                                    id="conn-dot", className="status-dot disconnected"
+                                ),
+                                html.Span("Disconnected", id="conn-text"),
+                            ]
+                        ),
+                        html.Span(
+                            "AM - VWAP",
+                            id="mode-badge",
+                            className="mode-badge mode-morning",
+                        ),
+                        html.Span("Updated: ---", id="last-update"),
+                    ],
+                ),
+            ],
+        ),
+        # --- MAIN ---
+        html.Div(
+            className="main-container",
+            children=[
+                # --- SIDEBAR ---
+                html.Div(className="sidebar", id="sidebar", children=make_sidebar()),
+                # --- PANELS ---
+                html.Div(
+                    className="panels-area",
+                    id="panels-area",
+                    children=[
+                        make_panel(title, ptype, None, id=pid)
+                        for pid, title, ptype, _ in PANELS
+                    ],
+                ),
+            ],
+        ),
+        # --- INTERVAL ---
+        dcc.Interval(id="interval", interval=UPDATE_MS, n_intervals=0),
+        dcc.Store(id="state-version", data=None),
+    ]
+)
 
 
 @app.callback(
-    [Output("header-status", "children"),
-     Output("sidebar", "children"),
-     Output("panels-area", "children")],
-    [Input("interval", "n_intervals")]
+    Output("state-version", "data"),
+    [Input("interval", "n_intervals")],
+    [State("state-version", "data")],
 )
-def update_ui(n):
-    s = STATE
-
-    # === HEADER STATUS ===
-    conn_cls = "status-dot connected" if s["connected"] else "status-dot disconnected"
-    conn_txt = "Connected" if s["connected"] else "Disconnected"
-    mode = s.get("mode", "---")
-    mode_cls = "mode-badge mode-morning" if "MORNING" in mode else "mode-badge mode-afternoon"
-    mode_short = "AM - VWAP" if "MORNING" in mode else "PM - OPEN"
-
-    header = [
-        html.Span([html.Span(className=conn_cls), conn_txt]),
-        html.Span(mode_short, className=mode_cls),
-        html.Span(f"Updated: {s.get('last_update', '---')}")
-    ]
+def sync_version(n, seen):
+    """Advance the client's state version; downstream callbacks fire only on change."""
+    version = STORE.version
+    if seen and seen["v"] == version:
+        raise PreventUpdate
+    return {"prev": seen["v"] if seen else None, "v": version}
+
+
+def patch_outputs(ver, outputs):
+    """Values for (id, property) outputs from the rendered delta of a version.
+
+    Rendering is shared with the push channel, so polling viewers do not
+    multiply render work either.
+    """
+    prev, s = resolve_versions(ver)
+    delta = HUB.delta(prev, s)
+    if not any(o in delta for o in outputs):
+        raise PreventUpdate
+    return [delta.get(o, dash.no_update) for o in outputs]
+
+
+def register_patch_callback(outputs):
+    """Fallback (interval) callback patching a group of component properties."""
+
+    @app.callback(
+        [Output(cid, prop) for cid, prop in outputs], [Input("state-version", "data")]
+    )
+    def update_props(ver):
+        return patch_outputs(ver, outputs)
+
+
+for _outputs in PATCH_GROUPS:
+    register_patch_callback(_outputs)
+
+
+@app.callback(Output("log-table", "children"), [Input("state-version", "data")])
+def update_log(ver):
+    prev, s = resolve_versions(ver)
+    if prev is not None and prev.get("log_count") == s.get("log_count"):
+        raise PreventUpdate
+    return [make_log_table(LOG_BUFFER)]
+
+
+def register_foto_panel(panel_id, title, snap_key):
+    """Send a FOTO panel once per snapshot, rendered once for all viewers."""
+    slot = title.replace(" ", "_")
+
+    @app.callback(Output(panel_id, "children"), [Input("state-version", "data")])
+    def update_foto_panel(ver):
+        prev, s = resolve_versions(ver)
+        snap = s.get(snap_key)
+        if prev is not None and prev.get(snap_key) is snap:
+            raise PreventUpdate
+        if prev is None and snap is None:
+            raise PreventUpdate
+        return FOTO_CACHE.get(slot, snap)
 
-    # === SIDEBAR ===
-    # Card 1: MERCATO LIVE
-    market_card = html.Div(className="card", children=[
-        html.Div("Mercato Live", className="card-title"),
-        html.Div(style={"display": "flex", "gap": "20px", "marginBottom": "10px"}, children=[
-            html.Div([
-                html.Div("ES", style={"fontSize": "10px", "color": "#64748b", "marginBottom": "2px"}),
-                html.Div(fmt(s["es_last"]), className="metric-value big cyan")
-            ]),
-            html.Div([
-                html.Div("SPX", style={"fontSize": "10px", "color": "#64748b", "marginBottom": "2px"}),
-                html.Div(fmt(s["spx_last"]), className="metric-value big blue")
-            ])
-        ]),
-        make_metric("VWAP (ES)", fmt(s["es_vwap_live"]), "green"),
-        make_metric("OPEN (SPX)", fmt(s["spx_open_official"]), "amber"),
-        make_metric("SPREAD", fmt(s["spread_live"]), "purple"),
-        make_metric("ATM Strike", fmt(s["strike"], 0), "cyan"),
-        make_metric("Exchange", s.get("exchange", "---")),
-        make_metric("Expiry", s.get("expiry", "---")),
-        make_metric("TradingClass", s.get("trading_class", "---")),
-    ])
-
-    # Card 2: VOLATILITA LIVE
-    vol_card = html.Div(className="card", children=[
-        html.Div("Volatilita Live", className="card-title"),
-        make_metric("IV% Daily", fmt_pct(s["iv_daily_pct_live"]), "amber"),
-        make_metric("IV% Straddle", fmt_pct(s["iv_straddle_pct_live"]), "purple"),
-        make_metric("STR ASK", fmt(s["str_ask"]), "red"),
-        make_metric("STR BID", fmt(s["str_bid"]), "green"),
-        make_metric("STR MID", fmt(s["str_mid"]), "cyan"),
-        make_metric("STR Spread", fmt(s["str_spread"])),
-        make_metric("DVS", fmt(s["dvs"]), "amber"),
-        make_metric("P/C Ratio", fmt(s["pcr"])),
-        make_metric("MODE", s.get("mode", "---"), "blue"),
-    ])
-
-    # Card 3: LOG
-    log_card = html.Div(className="card", style={"flex": "1", "overflow": "hidden"}, children=[
-        html.Div("Log (10s)", className="card-title"),
-        html.Div(className="log-scroll", children=[make_log_table(s["log_rows"])])
-    ])
-
-    sidebar = [market_card, vol_card, log_card]
-
-    # === 8 PANELS ===
-    live_ranges = s.get("live_panels", {})
-    es_live_pm_ranges = OrderedDict()
-    if live_ranges and s.get("spread_live") and s.get("mode") == "AFTERNOON_SPX_OPEN":
-        for k, v in live_ranges.items():
-            es_live_pm_ranges[k] = v
-
-    panels = [
-        make_panel("ES 10:00", "FOTO", s.get("snap_1000")),
-        make_panel("ES LIVE AM", "LIVE", live_ranges if "MORNING" in s.get("mode","") else {}),
-        make_panel("SPX LIVE", "LIVE", live_ranges if "AFTERNOON" in s.get("mode","") else {}),
-        make_panel("SPX 15:30", "FOTO", s.get("snap_1530_spx")),
-        make_panel("ES 15:30", "FOTO", s.get("snap_1530_es")),
-        make_panel("SPX 15:45", "FOTO", s.get("snap_1545_spx")),
-        make_panel("ES 15:45", "FOTO", s.get("snap_1545_es")),
-        make_panel("ES LIVE PM", "LIVE", es_live_pm_ranges if es_live_pm_ranges else live_ranges),
-    ]
 
-    return header, sidebar, panels
+for _pid, _title, _ptype, _snap_key in PANELS:
+    if _ptype == "FOTO":
+        register_foto_panel(_pid, _title, _snap_key)
 
 
 # ============================================================================
@@ -4,6 +4,6 @@ __version__ = "0.1.0"
 __author__ = "Your Name"
 
 from es_trading_dashboard.core.config import Settings
-from es_trading_dashboard.core.ib_client import IBClient
+from es_trading_dashboard.core.connection import IBConnection
 
-__all__ = ["Settings", "IBClient", "__version__"]
+__all__ = ["Settings", "IBConnection", "__version__"]
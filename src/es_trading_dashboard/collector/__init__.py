@@ -0,0 +1,32 @@
+"""Live collector module for ES Trading Dashboard."""
+
+from .chain_manager import ChainManager
+from .contract_cache import ContractCache
+from .daily_writer import DailyWriter
+from .log_buffer import LogRingBuffer
+from .push import PushHub
+from .range_engine import RangeEventEngine
+from .replay import Replayer
+from .sample_engine import Sample, SampleEngine
+from .simulator import SimConfig, SimulatedIB
+from .snapshot_cache import SnapshotCache
+from .state_store import StateSnapshot, StateStore
+from .tick_pipeline import TickPipeline
+
+__all__ = [
+    "ChainManager",
+    "ContractCache",
+    "DailyWriter",
+    "LogRingBuffer",
+    "PushHub",
+    "RangeEventEngine",
+    "Replayer",
+    "Sample",
+    "SampleEngine",
+    "SimConfig",
+    "SimulatedIB",
+    "SnapshotCache",
+    "StateSnapshot",
+    "StateStore",
+    "TickPipeline",
+]
@@ -0,0 +1,257 @@
+"""0DTE option chain manager for the ATM straddle.
+
+Replaces per-reselect qualification of a single call/put pair:
+- The ±``STRIKE_WINDOW`` points of the chain are qualified up front in one
+  batched ``qualifyContracts`` call (exchanges tried in order, per batch)
+- A sliding set of strikes around the ATM is kept subscribed, sized to the
+  market data line budget, so the next strikes already stream before ES
+  gets there
+- Moving the ATM is a pointer change to tickers that are already live;
+  subscriptions then slide (new wing subscribed, far wing cancelled) and the
+  window is re-qualified only when the ATM nears its edge
+"""
+
+import bisect
+import logging
+from typing import Callable, Iterator, Optional, Sequence
+
+from ib_insync import FuturesOption, Ticker
+
+from ..core.market_data import MarketDataSource
+from ..core.spec import STRIKE_WINDOW
+
+logger = logging.getLogger(__name__)
+
+
+class ChainManager:
+    """Qualified strike window and sliding ATM subscriptions of one expiry.
+
+    Attributes:
+        expiry: Option expiry (YYYYMMDD)
+        trading_class: Chain trading class (e.g. "E2B")
+        exchange: Exchange the window qualified on
+        atm: Current ATM strike
+        max_lines: Market data lines available to the chain
+    """
+
+    def __init__(
+        self,
+        ib: MarketDataSource,
+        expiry: str,
+        trading_class: str,
+        strikes: Sequence[float],
+        max_lines: int = 20,
+        window: float = STRIKE_WINDOW,
+        exchanges: Sequence[str] = ("CME", "GLOBEX"),
+        generic_ticks: str = "101,106",
+    ):
+        """Initialize the manager (nothing is requested until :meth:`set_atm`).
+
+        Args:
+            ib: Connected market data source
+            expiry: Option expiry (YYYYMMDD)
+            trading_class: Chain trading class
+            strikes: Strikes listed by ``reqSecDefOptParams``
+            max_lines: Market data lines for options (two per strike)
+            window: Qualified points on each side of the ATM
+            exchanges: Exchanges to try, in order
+            generic_ticks: Generic tick list of the option subscriptions
+        """
+        self.ib = ib
+        self.expiry = expiry
+        self.trading_class = trading_class
+        self.max_lines = max_lines
+        self.window = window
+        self.exchanges = list(exchanges)
+        self.generic_ticks = generic_ticks
+        self.exchange: Optional[str] = None
+        self.atm: Optional[float] = None
+        self._strikes = sorted(set(strikes))
+        self._contracts: dict[float, tuple[FuturesOption, FuturesOption]] = {}
+        self._tickers: dict[float, tuple[Ticker, Ticker]] = {}
+
+    @property
+    def live_strikes(self) -> int:
+        """Strikes kept subscribed around the ATM."""
+        return max(1, self.max_lines // 2)
+
+    @property
+    def call(self) -> Optional[Ticker]:
+        """ATM call ticker."""
+        pair = self._tickers.get(self.atm)
+        return pair[0] if pair else None
+
+    @property
+    def put(self) -> Optional[Ticker]:
+        """ATM put ticker."""
+        pair = self._tickers.get(self.atm)
+        return pair[1] if pair else None
+
+    @property
+    def contracts(self) -> dict[float, tuple[FuturesOption, FuturesOption]]:
+        """Qualified (call, put) contracts by strike."""
+        return self._contracts
+
+    def preload(
+        self, contracts: dict[float, tuple[FuturesOption, FuturesOption]], exchange: str
+    ):
+        """Seed the qualified window (e.g. from the contract cache).
+
+        Args:
+            contracts: Qualified (call, put) contracts by strike
+            exchange: Exchange they qualified on
+        """
+        self._contracts.update(contracts)
+        self.exchange = exchange
+
+    def nearest(self, price: float) -> float:
+        """Listed strike nearest to ``price``."""
+        strikes = self._strikes
+        i = bisect.bisect_left(strikes, price)
+        candidates = strikes[max(0, i - 1) : i + 1]
+        return min(candidates, key=lambda k: abs(k - price))
+
+    def tickers(self) -> Iterator[Ticker]:
+        """All live option tickers."""
+        for pair in self._tickers.values():
+            yield from pair
+
+    def qualify(self, center: float) -> int:
+        """Qualify the strikes within ``window`` of ``center`` in one batch.
+
+        Strikes already qualified are skipped.
+
+        Args:
+            center: Window center (ES price or strike)
+
+        Returns:
+            Number of strikes newly qualified
+        """
+        lo = bisect.bisect_left(self._strikes, center - self.window)
+        hi = bisect.bisect_right(self._strikes, center + self.window)
+        missing = [k for k in self._strikes[lo:hi] if k not in self._contracts]
+        if not missing:
+            return 0
+        exchanges = [self.exchange] if self.exchange else self.exchanges
+        for exch in exchanges:
+            contracts = []
+            for k in missing:
+                for right in ("C", "P"):
+                    contracts.append(
+                        FuturesOption(
+                            "ES",
+                            self.expiry,
+                            k,
+                            right,
+                            exch,
+                            tradingClass=self.trading_class,
+                        )
+                    )
+            qualified = {
+                (c.strike, c.right): c
+                for c in self.ib.qualifyContracts(*contracts)
+                if c.conId
+            }
+            added = 0
+            for k in missing:
+                call, put = qualified.get((k, "C")), qualified.get((k, "P"))
+                if call is not None and put is not None:
+                    self._contracts[k] = (call, put)
+                    added += 1
+            if added:
+                self.exchange = exch
+                logger.info(f"Qualified {added} strikes on {exch} around {center:g}")
+                return added
+        logger.warning(f"No strikes qualified around {center:g}")
+        return 0
+
+    def set_atm(self, strike: float) -> bool:
+        """Point the straddle at ``strike`` and slide the subscriptions.
+
+        Args:
+            strike: New ATM strike
+
+        Returns:
+            True if the ATM pair is qualified and subscribed
+        """
+        if strike not in self._contracts or self._near_edge(strike):
+            self.qualify(strike)
+        if strike not in self._contracts:
+            return False
+        self.atm = strike
+        self._slide(strike)
+        return True
+
+    def _near_edge(self, strike: float) -> bool:
+        """Whether the live set around ``strike`` leaves the qualified window."""
+        half = self.live_strikes // 2 + 1
+        i = bisect.bisect_left(self._strikes, strike)
+        lo = self._strikes[max(0, i - half)]
+        hi = self._strikes[min(len(self._strikes) - 1, i + half)]
+        return lo not in self._contracts or hi not in self._contracts
+
+    def _slide(self, center: float):
+        """Subscribe the ``live_strikes`` qualified strikes nearest ``center``."""
+        wanted = sorted(self._contracts, key=lambda k: (abs(k - center), k))[
+            : self.live_strikes
+        ]
+        wanted_set = set(wanted)
+        for k in [k for k in self._tickers if k not in wanted_set]:
+            call, put = self._contracts[k]
+            self.ib.cancelMktData(call)
+            self.ib.cancelMktData(put)
+            del self._tickers[k]
+        for k in wanted:
+            if k not in self._tickers:
+                call, put = self._contracts[k]
+                self._tickers[k] = (
+                    self.ib.reqMktData(call, self.generic_ticks, snapshot=False),
+                    self.ib.reqMktData(put, self.generic_ticks, snapshot=False),
+                )
+
+    def rebind(self, lookup: Callable[[FuturesOption], Optional[Ticker]]):
+        """Swap in the tickers of subscriptions restored after a reconnect.
+
+        Args:
+            lookup: Current ticker of a contract (e.g. ``ConnectionSupervisor.ticker``)
+        """
+        for k, (call, put) in [(k, self._contracts[k]) for k in self._tickers]:
+            c, p = lookup(call), lookup(put)
+            if c is None or p is None:
+                del self._tickers[k]
+            else:
+                self._tickers[k] = (c, p)
+        if self.atm is not None:
+            self._slide(self.atm)
+
+    def switch_expiry(
+        self,
+        expiry: str,
+        strikes: Sequence[float],
+        trading_class: Optional[str] = None,
+    ):
+        """Move to another expiry on the same connection.
+
+        Option subscriptions are cancelled and the qualified window is
+        dropped; nothing is requested until the next :meth:`set_atm`.
+
+        Args:
+            expiry: New option expiry (YYYYMMDD)
+            strikes: Strikes listed for the new expiry
+            trading_class: New chain trading class. Unchanged if None.
+        """
+        self.close()
+        self.expiry = expiry
+        if trading_class is not None:
+            self.trading_class = trading_class
+        self.exchange = None
+        self._strikes = sorted(set(strikes))
+        self._contracts.clear()
+
+    def close(self):
+        """Cancel all option subscriptions."""
+        for call, put in (self._contracts[k] for k in self._tickers):
+            self.ib.cancelMktData(call)
+            self.ib.cancelMktData(put)
+        self._tickers.clear()
+        self.atm = None
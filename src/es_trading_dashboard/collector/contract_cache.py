@@ -0,0 +1,138 @@
+"""On-disk cache of resolved contracts, keyed by trade_date.
+
+Lets a restart or reconnect skip contract discovery:
+- Front-month ES future and SPX index (qualified, with conIds)
+- The E2B option chain (expirations, strikes) from ``reqSecDefOptParams``
+- The qualified option strikes of the ±100pt window (see ``chain_manager.py``)
+
+An entry is valid only for its trade_date and for ``ttl`` seconds. It is
+dropped when the cached ES future has expired (roll) or the chain no longer
+lists the expiry being traded. Writes are atomic (temp file + rename).
+"""
+
+import datetime
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from ib_insync import Contract, util
+
+logger = logging.getLogger(__name__)
+
+
+def contract_to_dict(contract: Contract) -> dict:
+    """JSON-serializable form of a contract (non-default fields)."""
+    return util.dataclassNonDefaults(contract)
+
+
+def contract_from_dict(data: dict) -> Contract:
+    """Rebuild a contract of the right subclass (Future, Index, ...)."""
+    return Contract.create(**data)
+
+
+class ContractCache:
+    """JSON file of per-trade_date contract resolutions.
+
+    Entry layout::
+
+        {"saved": epoch, "es": {...}, "spx": {...},
+         "chain": {"tradingClass", "exchange", "underlyingConId",
+                   "multiplier", "expirations", "strikes"},
+         "options": {"exchange": "CME", "strikes": {"4985.0": [call, put]}}}
+
+    Attributes:
+        path: Cache file
+        ttl: Seconds an entry stays valid
+    """
+
+    def __init__(self, path: str, ttl: float = 24 * 3600):
+        """Open the cache (the file is created on the first save).
+
+        Args:
+            path: Cache file
+            ttl: Seconds an entry stays valid
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self._entries: dict[str, dict] = self._read()
+
+    def _read(self) -> dict:
+        """Load the file, ignoring a missing or corrupt one."""
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable contract cache {self.path}: {e}")
+            return {}
+
+    def _write(self):
+        """Write the file atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(self._entries, f, indent=1)
+        os.replace(tmp, self.path)
+
+    def load(
+        self, trade_date: datetime.date, expiry: Optional[str] = None
+    ) -> Optional[dict]:
+        """Valid entry of a trade_date.
+
+        Args:
+            trade_date: Trade date being collected
+            expiry: Option expiry in use (YYYYMMDD); the entry is invalid if
+                the cached chain does not list it
+
+        Returns:
+            Entry (contracts still as dicts), or None if missing or stale
+        """
+        key = trade_date.isoformat()
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        reason = None
+        if time.time() - entry.get("saved", 0) > self.ttl:
+            reason = "ttl expired"
+        elif entry.get("es", {}).get("lastTradeDateOrContractMonth", "99999999")[
+            :8
+        ] < trade_date.strftime("%Y%m%d"):
+            reason = "ES future expired (roll)"
+        elif expiry is not None and expiry not in entry.get("chain", {}).get(
+            "expirations", []
+        ):
+            reason = f"expiry {expiry} not in cached chain"
+        if reason:
+            logger.info(f"Contract cache {key} invalidated: {reason}")
+            self.invalidate(trade_date)
+            return None
+        return entry
+
+    def save(self, trade_date: datetime.date, **fields: Any):
+        """Merge fields into a trade_date entry and persist it.
+
+        Entries of other trade dates are dropped.
+
+        Args:
+            trade_date: Trade date being collected
+            **fields: Entry fields (``es``, ``spx``, ``chain``, ``options``)
+        """
+        key = trade_date.isoformat()
+        entry = self._entries.get(key, {})
+        entry.update(fields)
+        entry["saved"] = time.time()
+        self._entries = {key: entry}
+        self._write()
+
+    def invalidate(self, trade_date: Optional[datetime.date] = None):
+        """Drop one trade_date entry, or all entries if None."""
+        if trade_date is None:
+            self._entries = {}
+        else:
+            self._entries.pop(trade_date.isoformat(), None)
+        self._write()
@@ -0,0 +1,301 @@
+"""Buffered, batched writer for the collector CSV files.
+
+Moves file I/O off the IB thread:
+- Producers enqueue rows into a bounded queue without blocking; rows that
+  do not fit are dropped and counted
+- A background thread batches rows per target and hands them to its sinks
+  (CSV files kept open, optional Parquet store)
+- Batches are flushed when ``batch_size`` rows are pending or ``flush_interval``
+  seconds have passed since the last flush
+- Rows a sink fails to write stay pending for that sink and are retried
+  on the next flush (up to ``retry_limit`` rows per target, older ones are
+  then dropped and counted as failed)
+- :meth:`DailyWriter.finalize` flushes and fsyncs everything (22:01); it
+  waits for the disk, so callers run it off the IB thread
+"""
+
+import csv
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Optional, Protocol, Sequence
+
+logger = logging.getLogger(__name__)
+
+_FLUSH = object()
+_STOP = object()
+
+
+class Sink(Protocol):
+    """Destination for batches of rows of one target."""
+
+    def write_rows(self, rows: list) -> None: ...
+
+    def flush(self, fsync: bool = False) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class CsvSink:
+    """Append-only CSV file kept open between batches."""
+
+    def __init__(self, path: str, header: Sequence[str]):
+        """Create the file with its header if it does not exist.
+
+        Args:
+            path: CSV file path
+            header: Column names
+        """
+        self.path = path
+        if not os.path.exists(path):
+            with open(path, "w", newline="") as f:
+                csv.writer(f).writerow(header)
+        self._file = None
+
+    def write_rows(self, rows: list):
+        """Append rows to the file."""
+        if self._file is None:
+            self._file = open(self.path, "a", newline="")
+        csv.writer(self._file).writerows(rows)
+
+    def flush(self, fsync: bool = False):
+        """Flush buffered data, optionally to disk."""
+        if self._file is None:
+            return
+        self._file.flush()
+        if fsync:
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        """Close the file handle."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class DailyWriter:
+    """Background row writer with a bounded queue.
+
+    Attributes:
+        batch_size: Pending rows that trigger a flush
+        flush_interval: Maximum seconds a row waits before being flushed
+        retry_limit: Rows kept per target while a sink keeps failing
+        rows_written: Total rows written to disk (by every sink of their
+            target)
+        dropped: Rows dropped because the queue was full
+        failed_rows: Rows dropped after sink errors (beyond ``retry_limit``)
+        last_flush: Epoch timestamp of the last completed flush
+    """
+
+    def __init__(
+        self,
+        max_queue: int = 10000,
+        batch_size: int = 100,
+        flush_interval: float = 2.0,
+        retry_limit: int = 10000,
+    ):
+        """Initialize the writer (call :meth:`start` to run it).
+
+        Args:
+            max_queue: Queue capacity in rows
+            batch_size: Pending rows that trigger a flush
+            flush_interval: Maximum seconds between flushes
+            retry_limit: Rows kept per target while a sink keeps failing
+        """
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.retry_limit = retry_limit
+        self.rows_written = 0
+        self.dropped = 0
+        self.failed_rows = 0
+        self.last_flush: Optional[float] = None
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._sinks: dict[str, list[Sink]] = {}
+        self._pending: dict[str, list] = {}
+        # Rows of _pending already accepted by each sink of the target
+        self._sent: dict[str, list[int]] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    def register(self, name: str, path: str, header: Sequence[str]):
+        """Register a CSV target, writing the header if the file is new.
+
+        Args:
+            name: Target name used by :meth:`write`
+            path: CSV file path
+            header: Column names
+        """
+        self.add_sink(name, CsvSink(path, header))
+
+    def add_sink(self, name: str, sink: Sink):
+        """Attach an additional sink to a target.
+
+        Every row written to ``name`` is delivered to all of its sinks.
+        Register sinks before calling :meth:`start`.
+
+        Args:
+            name: Target name used by :meth:`write`
+            sink: Sink receiving the batches
+        """
+        self._sinks.setdefault(name, []).append(sink)
+        self._pending.setdefault(name, [])
+        self._sent.setdefault(name, []).append(0)
+
+    def start(self):
+        """Start the background thread."""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="daily-writer", daemon=True
+            )
+            self._thread.start()
+
+    def write(self, name: str, row: Sequence) -> bool:
+        """Enqueue a row for a registered target without blocking.
+
+        Args:
+            name: Target name
+            row: Row values
+
+        Returns:
+            False if the row was dropped (unregistered target, or the queue
+            was full)
+        """
+        if name not in self._sinks:
+            self.dropped += 1
+            logger.error(f"Writer target {name!r} is not registered, dropped row")
+            return False
+        try:
+            self._queue.put_nowait((name, row))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            logger.error(f"Writer queue full, dropped row for {name}")
+            return False
+
+    def flush(self, fsync: bool = False, timeout: Optional[float] = 10.0) -> bool:
+        """Flush all queued rows and wait for completion.
+
+        Args:
+            fsync: Also fsync the files to disk
+            timeout: Seconds to wait for the writer thread, including the
+                wait for room in a full queue
+
+        Returns:
+            True if the flush completed within the timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        done = threading.Event()
+        try:
+            self._queue.put((_FLUSH, (fsync, done)), timeout=timeout)
+        except queue.Full:
+            logger.error("Writer queue full, flush not queued")
+            return False
+        if deadline is None:
+            return done.wait()
+        return done.wait(max(0.0, deadline - time.monotonic()))
+
+    def finalize(self, timeout: Optional[float] = 30.0) -> bool:
+        """Flush and fsync all files (session finalize at 22:01).
+
+        Blocks until the files are on disk: run it off the IB thread.
+        """
+        ok = self.flush(fsync=True, timeout=timeout)
+        logger.info(f"Writer finalized ({self.rows_written} rows written)")
+        return ok
+
+    def stop(self, timeout: Optional[float] = 10.0):
+        """Flush, fsync and close all files, then stop the thread."""
+        if self._thread is None:
+            return
+        self._queue.put((_STOP, None))
+        self._thread.join(timeout)
+        self._thread = None
+
+    def stats(self) -> dict:
+        """Writer health metrics for the Health Panel."""
+        return {
+            "queue_depth": self._queue.qsize(),
+            "pending_rows": sum(len(rows) for rows in self._pending.values()),
+            "rows_written": self.rows_written,
+            "dropped": self.dropped,
+            "failed_rows": self.failed_rows,
+            "last_flush": self.last_flush,
+            "lag_sec": (time.time() - self.last_flush) if self.last_flush else None,
+        }
+
+    def _run(self):
+        """Writer thread main loop."""
+        n_pending = 0
+        next_flush = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                name, payload = self._queue.get(
+                    timeout=max(0.0, next_flush - time.monotonic())
+                )
+            except queue.Empty:
+                name = None
+
+            if name is _STOP:
+                self._write_pending(fsync=True)
+                self._close_sinks()
+                return
+            if name is _FLUSH:
+                fsync, done = payload
+                self._write_pending(fsync=fsync)
+                n_pending = 0
+                next_flush = time.monotonic() + self.flush_interval
+                done.set()
+                continue
+            if name is not None:
+                self._pending[name].append(payload)
+                n_pending += 1
+
+            if n_pending >= self.batch_size or time.monotonic() >= next_flush:
+                if n_pending or any(self._pending.values()):
+                    self._write_pending()
+                    n_pending = 0
+                next_flush = time.monotonic() + self.flush_interval
+
+    def _write_pending(self, fsync: bool = False):
+        """Hand pending rows to their sinks, one batch per target and sink.
+
+        Each sink receives the rows it has not accepted yet; rows leave the
+        pending list once every sink of the target accepted them.
+        """
+        for name, rows in self._pending.items():
+            if not rows and not fsync:
+                continue
+            sent = self._sent[name]
+            for i, sink in enumerate(self._sinks[name]):
+                try:
+                    if len(rows) > sent[i]:
+                        sink.write_rows(rows[sent[i] :])
+                        sent[i] = len(rows)
+                    sink.flush(fsync=fsync)
+                except Exception as e:
+                    logger.error(
+                        f"Writer error on {name} ({type(sink).__name__}), "
+                        f"{len(rows) - sent[i]} rows kept for retry: {e}"
+                    )
+            done = min(sent)
+            self.rows_written += done
+            excess = max(0, len(rows) - done - self.retry_limit)
+            if excess:
+                self.failed_rows += excess
+                logger.error(
+                    f"Writer retry limit reached on {name}, dropped {excess} rows"
+                )
+            cut = done + excess
+            del rows[:cut]
+            sent[:] = [max(0, n - cut) for n in sent]
+        self.last_flush = time.time()
+
+    def _close_sinks(self):
+        """Close all sinks."""
+        for sinks in self._sinks.values():
+            for sink in sinks:
+                try:
+                    sink.close()
+                except Exception as e:
+                    logger.error(f"Writer close error ({type(sink).__name__}): {e}")
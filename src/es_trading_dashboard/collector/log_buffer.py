@@ -0,0 +1,162 @@
+"""Fixed-capacity, NumPy-backed ring buffer for the live log.
+
+Replaces list append + ``rows[-300:]`` slicing:
+- One preallocated typed array per log field (float64 for numbers,
+  datetime64 for the timestamp, int16 codes for text fields)
+- Appends write scalars in place, nothing is copied or reallocated
+- Every row is written twice (at ``i`` and ``i + capacity``), so the last
+  ``n`` rows are always one contiguous slice and :meth:`LogRingBuffer.last`
+  returns zero-copy views
+
+A view of the last ``n`` rows stays valid for the next ``capacity - n``
+appends, so readers on other threads never observe a torn window as long as
+they request fewer rows than the capacity.
+"""
+
+import datetime
+from typing import Optional, Sequence
+
+import numpy as np
+
+from .schema import LOG_COLUMNS
+
+TEXT_COLUMNS = ("mode",)
+_MISSING = -1
+
+
+class LogRingBuffer:
+    """Typed columnar ring buffer of log rows.
+
+    Attributes:
+        capacity: Maximum number of rows retained
+        columns: Field names in row order
+        count: Total rows appended since creation
+    """
+
+    def __init__(
+        self,
+        capacity: int = 8192,
+        columns: Sequence[str] = LOG_COLUMNS,
+        text_columns: Sequence[str] = TEXT_COLUMNS,
+    ):
+        """Preallocate the buffer.
+
+        Args:
+            capacity: Rows retained (a 02:15-22:00 session at 10s is ~7,100)
+            columns: Field names; the first one is the timestamp
+            text_columns: Fields stored as integer codes
+        """
+        self.capacity = capacity
+        self.columns = list(columns)
+        self.count = 0
+        self._text = set(text_columns)
+        self._labels: dict[str, list[str]] = {c: [] for c in self._text}
+        self._codes: dict[str, dict[str, int]] = {c: {} for c in self._text}
+
+        size = 2 * capacity
+        self._data: dict[str, np.ndarray] = {}
+        for i, name in enumerate(self.columns):
+            if i == 0:
+                self._data[name] = np.full(
+                    size, np.datetime64("NaT"), dtype="datetime64[ms]"
+                )
+            elif name in self._text:
+                self._data[name] = np.full(size, _MISSING, dtype=np.int16)
+            else:
+                self._data[name] = np.full(size, np.nan)
+        self._arrays = [self._data[name] for name in self.columns]
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    def _code(self, column: str, value: Optional[str]) -> int:
+        """Integer code of a text value (assigned on first sight)."""
+        if value is None:
+            return _MISSING
+        codes = self._codes[column]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(codes)
+            self._labels[column].append(value)
+        return code
+
+    def append(self, row: Sequence):
+        """Append one row in ``columns`` order.
+
+        Args:
+            row: Timestamp (``datetime`` or ISO string) followed by the fields;
+                None is stored as NaN / missing code
+        """
+        i = self.count % self.capacity
+        j = i + self.capacity
+        for name, arr, value in zip(self.columns, self._arrays, row):
+            if arr.dtype.kind == "M":
+                value = (
+                    np.datetime64(value, "ms")
+                    if value is not None
+                    else np.datetime64("NaT")
+                )
+            elif name in self._text:
+                value = self._code(name, value)
+            elif value is None:
+                value = np.nan
+            arr[i] = value
+            arr[j] = value
+        self.count += 1
+
+    def last(self, n: Optional[int] = None) -> dict[str, np.ndarray]:
+        """Zero-copy views of the last ``n`` rows, oldest first.
+
+        Args:
+            n: Number of rows (capped at the rows available). All if None.
+
+        Returns:
+            Mapping of column name to a read-only array view
+        """
+        size = len(self)
+        n = size if n is None else max(0, min(n, size))
+        end = (self.count % self.capacity) + self.capacity if self.count else 0
+        out = {}
+        for name, arr in self._data.items():
+            view = arr[end - n : end]
+            view.flags.writeable = False
+            out[name] = view
+        return out
+
+    def labels(self, column: str) -> list[str]:
+        """Decode table of a text column (index = stored code)."""
+        return self._labels[column]
+
+    def decode(self, column: str, codes: np.ndarray) -> list[Optional[str]]:
+        """Decode an array of text codes."""
+        labels = self._labels[column]
+        return [labels[c] if c >= 0 else None for c in codes.tolist()]
+
+    def rows(self, n: int, newest_first: bool = True) -> list[list]:
+        """Materialize the last ``n`` rows in the original list layout.
+
+        Meant for small displays; use :meth:`last` for bulk consumers.
+
+        Args:
+            n: Number of rows
+            newest_first: Reverse chronological order
+
+        Returns:
+            Rows with None for missing values and ``datetime`` timestamps
+        """
+        view = self.last(n)
+        cols = []
+        for name in self.columns:
+            arr = view[name]
+            if arr.dtype.kind == "M":
+                cols.append(
+                    [None if np.isnat(v) else v.astype(datetime.datetime) for v in arr]
+                )
+            elif name in self._text:
+                cols.append(self.decode(name, arr))
+            else:
+                cols.append([None if v != v else v for v in arr.tolist()])
+        rows = [list(r) for r in zip(*cols)]
+        if newest_first:
+            rows.reverse()
+        return rows
@@ -0,0 +1,337 @@
+"""Columnar Parquet storage for the live collector tables.
+
+Optional backend (requires ``pyarrow``) for the README Phase 3 outputs:
+- ``market_10s``: the live log (``LOG_COLUMNS``)
+- ``range_snapshots``: the FOTO snapshots (``SNAP_STORE_COLUMNS``, the
+  ``SNAP_COLUMNS`` CSV layout with the levels named after their values)
+
+Tables are partitioned by trade_date (``<root>/<table>/trade_date=YYYY-MM-DD/``)
+with typed float64 columns (nulls, not stringified ``None``) and the
+MODEL_VERSION / CONFIG_HASH / ENGINE_START_TIME triple stored as Parquet
+schema metadata. :meth:`ParquetStore.export_csv` writes the original CSV
+layout back for compatibility with existing tools.
+"""
+
+import csv
+import datetime
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Mapping, Optional, Sequence
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+
+from ..core.calendar import trade_date as _trade_date
+from ..core.exceptions import ConfigurationError
+from ..core.spec import TIMEZONE
+from ..core.versioning import version_metadata
+from .schema import LOG_COLUMNS, SNAP_COLUMNS, SNAP_STORE_COLUMNS
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:  # optional dependency
+    pa = None
+
+logger = logging.getLogger(__name__)
+
+TS_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# table -> (columns, string columns, CSV header); everything else is float64.
+# Columns and CSV header match by position.
+TABLES = {
+    "market_10s": (LOG_COLUMNS, ("mode",), LOG_COLUMNS),
+    "range_snapshots": (
+        SNAP_STORE_COLUMNS,
+        ("slot", "date", "base_label"),
+        SNAP_COLUMNS,
+    ),
+}
+
+
+class ParquetStore:
+    """Daily-partitioned Parquet dataset for the collector tables.
+
+    Attributes:
+        root: Dataset root directory
+        metadata: Versioning fields written into every file
+    """
+
+    def __init__(
+        self,
+        root: str,
+        config: Optional[Mapping[str, Any]] = None,
+        start_time: Optional[datetime.datetime] = None,
+    ):
+        """Open (or create) a store.
+
+        Args:
+            root: Dataset root directory
+            config: Configuration hashed into CONFIG_HASH
+            start_time: Engine start time for ENGINE_START_TIME
+
+        Raises:
+            ConfigurationError: If pyarrow is not installed
+        """
+        if pa is None:
+            raise ConfigurationError(
+                "pyarrow is required for the Parquet store "
+                "(pip install es-trading-dashboard[storage])"
+            )
+        self.root = Path(root)
+        self.metadata = version_metadata(config, start_time)
+        self._tz = ZoneInfo(TIMEZONE)
+        self._schemas = {name: self._schema(name) for name in TABLES}
+
+    def _schema(self, table: str) -> "pa.Schema":
+        """Arrow schema of a table, with versioning metadata."""
+        columns, strings, _ = TABLES[table]
+        fields = [pa.field("timestamp", pa.timestamp("ms", tz=TIMEZONE))]
+        for name in columns[1:]:
+            fields.append(
+                pa.field(name, pa.string() if name in strings else pa.float64())
+            )
+        meta = {k.encode(): v.encode() for k, v in self.metadata.items()}
+        return pa.schema(fields, metadata=meta)
+
+    def _partition(self, table: str, trade_date: datetime.date) -> Path:
+        """Directory of one trade_date partition."""
+        return self.root / table / f"trade_date={trade_date.isoformat()}"
+
+    def append(self, table: str, rows: Sequence[Sequence]) -> set[datetime.date]:
+        """Write rows (CSV layout, timestamp string first) as new part files.
+
+        One part file is written per trade_date touched by ``rows``. Parts
+        are written under hidden temporary names and renamed once all of
+        them succeeded, so a failed append leaves no rows behind.
+
+        Args:
+            table: Table name ("market_10s" or "range_snapshots")
+            rows: Rows in the table's CSV column order
+
+        Returns:
+            Trade dates written
+        """
+        if not rows:
+            return set()
+        by_day: dict[datetime.date, list] = {}
+        for row in rows:
+            ts = row[0]
+            if isinstance(ts, str):
+                ts = datetime.datetime.strptime(ts, TS_FORMAT)
+            if ts.tzinfo is None:
+                ts = ts.replace(tzinfo=self._tz)
+            by_day.setdefault(_trade_date(ts), []).append((ts, row))
+
+        written: list[tuple[Path, Path]] = []
+        try:
+            for trade_date, items in by_day.items():
+                written.append(self._write_part(table, trade_date, items))
+        except Exception:
+            for tmp, _ in written:
+                tmp.unlink(missing_ok=True)
+            raise
+        for tmp, path in written:
+            os.replace(tmp, path)
+        return set(by_day)
+
+    def _write_part(
+        self, table: str, trade_date: datetime.date, items: list
+    ) -> tuple[Path, Path]:
+        """Write one partition's ``(timestamp, row)`` items to a hidden file.
+
+        Returns:
+            Tuple (temporary file, final part path)
+        """
+        schema = self._schemas[table]
+        data = {schema.names[0]: [ts for ts, _ in items]}
+        for j, field in enumerate(list(schema)[1:], start=1):
+            if pa.types.is_string(field.type):
+                data[field.name] = [
+                    None if r[j] is None else str(r[j]) for _, r in items
+                ]
+            else:
+                data[field.name] = [
+                    None if r[j] is None else float(r[j]) for _, r in items
+                ]
+        part_dir = self._partition(table, trade_date)
+        part_dir.mkdir(parents=True, exist_ok=True)
+        path = part_dir / f"part-{time.time_ns()}.parquet"
+        tmp = part_dir / f".{path.name}.tmp"
+        pq.write_table(pa.table(data, schema=schema), tmp)
+        return tmp, path
+
+    def compact(self, table: str, trade_date: datetime.date):
+        """Merge all part files of a partition into a single file.
+
+        The merged file replaces ``data.parquet`` before the other parts are
+        deleted, so an interrupted compaction can leave duplicate rows but
+        never loses any.
+
+        Args:
+            table: Table name
+            trade_date: Partition to compact
+        """
+        part_dir = self._partition(table, trade_date)
+        parts = sorted(part_dir.glob("*.parquet"))
+        if len(parts) <= 1:
+            return
+        merged = pa.concat_tables([pq.read_table(p) for p in parts])
+        merged = merged.sort_by("timestamp").replace_schema_metadata(
+            self._schemas[table].metadata
+        )
+        target = part_dir / "data.parquet"
+        tmp = part_dir / f".{target.name}.tmp"
+        pq.write_table(merged, tmp)
+        os.replace(tmp, target)
+        for p in parts:
+            if p != target:
+                p.unlink()
+        logger.info(f"Compacted {table} {trade_date}: {len(parts)} parts")
+
+    def read(
+        self,
+        table: str,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        """Load a trade_date range.
+
+        Only the matching partitions are opened (partition pruning).
+
+        Args:
+            table: Table name
+            start: First trade_date (inclusive)
+            end: Last trade_date (inclusive)
+            columns: Columns to load. All columns if None.
+
+        Returns:
+            DataFrame sorted by timestamp, with a ``trade_date`` column
+        """
+        base = self.root / table
+        if not base.exists():
+            return pd.DataFrame(
+                columns=list(self._schemas[table].names) + ["trade_date"]
+            )
+        partition = pa.schema([("trade_date", pa.string())])
+        dataset = ds.dataset(
+            base,
+            format="parquet",
+            schema=self._schemas[table].append(partition.field(0)),
+            partitioning=ds.partitioning(partition, flavor="hive"),
+        )
+        expr = None
+        if start is not None:
+            expr = ds.field("trade_date") >= start.isoformat()
+        if end is not None:
+            cond = ds.field("trade_date") <= end.isoformat()
+            expr = cond if expr is None else expr & cond
+        cols = None if columns is None else list(dict.fromkeys(["timestamp", *columns]))
+        result = dataset.to_table(columns=cols, filter=expr).sort_by("timestamp")
+        return result.to_pandas()
+
+    def trade_dates(self, table: str) -> list[datetime.date]:
+        """List the trade_date partitions of a table."""
+        base = self.root / table
+        if not base.exists():
+            return []
+        return sorted(
+            datetime.date.fromisoformat(p.name.split("=", 1)[1])
+            for p in base.glob("trade_date=*")
+        )
+
+    def export_csv(
+        self,
+        table: str,
+        path: str,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+    ) -> int:
+        """Export a table in the original CSV layout of ``init_csv()``.
+
+        Args:
+            table: Table name
+            path: Output CSV path
+            start: First trade_date (inclusive)
+            end: Last trade_date (inclusive)
+
+        Returns:
+            Number of rows written
+        """
+        columns, _, header = TABLES[table]
+        df = self.read(table, start, end)
+        stamps = df["timestamp"].dt.strftime(TS_FORMAT).tolist() if len(df) else []
+        values = df[columns[1:]].astype(object).where(df[columns[1:]].notna(), None)
+        with open(path, "w", newline="") as f:
+            w = csv.writer(f)
+            w.writerow(header)
+            for ts, row in zip(stamps, values.itertuples(index=False, name=None)):
+                w.writerow([ts, *row])
+        return len(df)
+
+
+class ParquetSink:
+    """Writer sink buffering rows into part files of a store table.
+
+    Rows are held in memory until ``part_rows`` accumulate (the CSV sink stays
+    the durable record in between); ``fsync`` flushes write the remainder and
+    compact the partitions touched.
+    """
+
+    def __init__(self, store: ParquetStore, table: str, part_rows: int = 360):
+        """Initialize the sink.
+
+        Args:
+            store: Target store
+            table: Table name
+            part_rows: Rows per part file
+        """
+        self.store = store
+        self.table = table
+        self.part_rows = part_rows
+        self._rows: list = []
+        self._dates: set[datetime.date] = set()
+
+    def write_rows(self, rows: list):
+        """Buffer rows, writing a part file when enough accumulate.
+
+        If the part file cannot be written, ``rows`` are taken back out of
+        the buffer before the error propagates: the writer keeps them
+        pending and sends them again, while rows accepted by earlier calls
+        stay buffered for the next attempt.
+        """
+        n = len(self._rows)
+        self._rows.extend(rows)
+        if len(self._rows) >= self.part_rows:
+            try:
+                self._write_part()
+            except Exception:
+                del self._rows[n:]
+                raise
+
+    def flush(self, fsync: bool = False):
+        """On fsync, write buffered rows and compact touched partitions."""
+        if not fsync:
+            return
+        self._write_part()
+        for trade_date in sorted(self._dates):
+            self.store.compact(self.table, trade_date)
+        self._dates.clear()
+
+    def close(self):
+        """Write buffered rows."""
+        self._write_part()
+
+    def _write_part(self):
+        """Write the buffered rows as part files.
+
+        The buffer is cleared only once the store accepted the rows.
+        """
+        if not self._rows:
+            return
+        self._dates.update(self.store.append(self.table, self._rows))
+        self._rows = []
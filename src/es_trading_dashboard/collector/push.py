@@ -0,0 +1,175 @@
+"""Server-push channel from the state store to dashboard viewers.
+
+Streams compact property deltas as Server-Sent Events as soon as the worker
+publishes, instead of every viewer polling on a fixed interval:
+- Each published version is rendered to component properties once
+  (``render(snapshot)``), however many viewers are connected
+- Viewers receive only the properties that changed since the version they
+  last received; frames for the same (since, version) pair are encoded once
+  and shared
+- Viewers that fall behind (or reconnect with ``Last-Event-ID``) get a single
+  catch-up frame; a full frame is sent when their version is no longer
+  retained by the store
+- Comment frames are sent while idle so proxies keep the connection open
+
+Components that are too heavy to ship as properties (FOTO panels, log table)
+are flagged with ``sync`` so the browser runs its regular Dash callbacks.
+"""
+
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Iterator, Optional, Sequence
+
+from .state_store import StateSnapshot, StateStore
+
+logger = logging.getLogger(__name__)
+
+# {(component id, property): value}
+Props = dict[tuple[str, str], Any]
+
+
+class PushHub:
+    """Renders store versions once and fans deltas out to many viewers.
+
+    Attributes:
+        keepalive: Seconds between comment frames on an idle stream
+        viewers: Number of connected streams
+    """
+
+    def __init__(
+        self,
+        store: StateStore,
+        render: Callable[[StateSnapshot], Props],
+        sync_keys: Sequence[str] = (),
+        keepalive: float = 15.0,
+        cache_size: int = 128,
+    ):
+        """Initialize the hub.
+
+        Args:
+            store: State store to follow
+            render: Maps a snapshot to its component properties
+            sync_keys: State keys whose changes require a Dash callback
+                round-trip on the client
+            keepalive: Seconds between comment frames on an idle stream
+            cache_size: Rendered versions and encoded frames retained
+        """
+        self.store = store
+        self.render = render
+        self.sync_keys = list(sync_keys)
+        self.keepalive = keepalive
+        self.viewers = 0
+        self._cache_size = cache_size
+        self._props: OrderedDict = OrderedDict()
+        self._frames: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def props(self, snapshot: StateSnapshot) -> Props:
+        """Rendered properties of a snapshot (computed once per version)."""
+        with self._lock:
+            props = self._props.get(snapshot.version)
+            if props is None:
+                props = self._props[snapshot.version] = self.render(snapshot)
+                if len(self._props) > self._cache_size:
+                    self._props.popitem(last=False)
+            return props
+
+    def delta(self, prev: Optional[StateSnapshot], snapshot: StateSnapshot) -> Props:
+        """Properties that differ between two snapshots.
+
+        Args:
+            prev: Snapshot the viewer has rendered. None renders everything.
+            snapshot: Target snapshot
+
+        Returns:
+            Changed properties
+        """
+        new = self.props(snapshot)
+        if prev is None:
+            return dict(new)
+        if prev.version == snapshot.version:
+            return {}
+        old = self.props(prev)
+        return {k: v for k, v in new.items() if k not in old or old[k] != v}
+
+    def frame(self, since: Optional[int], snapshot: StateSnapshot) -> str:
+        """Encoded SSE frame bringing a viewer from ``since`` to ``snapshot``.
+
+        Args:
+            since: Version the viewer last received. None for a full frame.
+            snapshot: Target snapshot
+
+        Returns:
+            ``event: delta`` frame with the version as event id
+        """
+        key = (since, snapshot.version)
+        with self._lock:
+            cached = self._frames.get(key)
+        if cached is not None:
+            return cached
+
+        prev = self.store.get(since)
+        patch: dict[str, dict[str, Any]] = {}
+        for (cid, prop), value in self.delta(prev, snapshot).items():
+            patch.setdefault(cid, {})[prop] = value
+        if prev is None:
+            sync = True
+        else:
+            sync = bool(self.store.changed(since, self.sync_keys, current=snapshot))
+        body = json.dumps(
+            {
+                "v": snapshot.version,
+                "prev": prev.version if prev else None,
+                "patch": patch,
+                "sync": sync,
+            },
+            separators=(",", ":"),
+            default=str,
+        )
+        encoded = f"id: {snapshot.version}\nevent: delta\ndata: {body}\n\n"
+        with self._lock:
+            self._frames[key] = encoded
+            if len(self._frames) > self._cache_size:
+                self._frames.popitem(last=False)
+        return encoded
+
+    def stream(
+        self,
+        last_event_id: Optional[str] = None,
+        stop: Optional[threading.Event] = None,
+    ) -> Iterator[str]:
+        """SSE stream for one viewer.
+
+        Args:
+            last_event_id: ``Last-Event-ID`` header of a reconnecting viewer
+            stop: Ends the stream when set
+
+        Yields:
+            Encoded SSE frames
+        """
+        try:
+            since = int(last_event_id) if last_event_id else None
+        except ValueError:
+            since = None
+        with self._lock:
+            self.viewers += 1
+        logger.info(f"Push viewer connected ({self.viewers} total)")
+        try:
+            yield "retry: 3000\n\n"
+            snapshot = self.store.current
+            if since != snapshot.version:
+                yield self.frame(since, snapshot)
+            since = snapshot.version
+            while stop is None or not stop.is_set():
+                snapshot = self.store.wait(since, timeout=self.keepalive)
+                if snapshot.version == since:
+                    yield ": keepalive\n\n"
+                    continue
+                yield self.frame(since, snapshot)
+                since = snapshot.version
+        finally:
+            with self._lock:
+                self.viewers -= 1
+            logger.info(f"Push viewer disconnected ({self.viewers} total)")
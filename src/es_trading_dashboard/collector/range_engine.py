@@ -0,0 +1,304 @@
+"""Incremental range-event engine (TOUCH / REJECT / BREAKOUT).
+
+Implements SPEC_LOCK §7 for every ``ORDER_KEYS`` level of every dashboard
+panel with one compact state machine per (panel, level):
+- Touch UP: ``last >= level + buffer`` coming from below the level
+- Touch DOWN: ``last <= level - buffer`` coming from above the level
+- Reject: back beyond the opposite buffer within the breakout window
+- Breakout: price stays beyond the level for the whole breakout window
+- Touches on the same level are counted only after the cooldown
+
+All state lives in preallocated NumPy arrays (one row per panel level) and
+:meth:`RangeEventEngine.update` is O(1) per level, with every intermediate
+written into scratch buffers, so a tick allocates no arrays.
+"""
+
+import datetime
+import logging
+import math
+from typing import Mapping, Optional, Sequence, Tuple, Union
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+from ..core.ranges import N_LEVELS
+from ..core.spec import (
+    BREAKOUT_WINDOW_SEC,
+    LEVEL_CODES,
+    ORDER_KEYS,
+    TIMEZONE,
+    TOUCH_BUFFER,
+    TOUCH_COOLDOWN_SEC,
+)
+
+logger = logging.getLogger(__name__)
+
+# (panel, instrument) in dashboard column order
+PANELS: Tuple[Tuple[str, str], ...] = (
+    ("ES_10:00", "ES"),
+    ("ES_LIVE_AM", "ES"),
+    ("SPX_LIVE", "SPX"),
+    ("SPX_15:30", "SPX"),
+    ("ES_15:30", "ES"),
+    ("SPX_15:45", "SPX"),
+    ("ES_15:45", "ES"),
+    ("ES_LIVE_PM", "ES"),
+)
+
+_NAN = float("nan")
+
+
+def _fmt_ts(ts: float, tz) -> Optional[str]:
+    """Format an epoch timestamp, or None if unset."""
+    if math.isnan(ts):
+        return None
+    return datetime.datetime.fromtimestamp(ts, tz).strftime("%Y-%m-%d %H:%M:%S")
+
+
+class RangeEventEngine:
+    """Per-level touch/reject/breakout state machines for all panels.
+
+    Attributes:
+        panels: Panel names in row-block order
+        buffer: Touch buffer in index points
+        cooldown: Seconds before a new touch on the same level is counted
+        window: Breakout/reject window in seconds
+    """
+
+    def __init__(
+        self,
+        panels: Sequence[Tuple[str, str]] = PANELS,
+        buffer: float = TOUCH_BUFFER,
+        cooldown: float = TOUCH_COOLDOWN_SEC,
+        window: float = BREAKOUT_WINDOW_SEC,
+    ):
+        """Allocate state for ``len(panels) * 9`` levels.
+
+        Args:
+            panels: (panel name, instrument) pairs; instrument is "ES" or "SPX"
+            buffer: Touch buffer in points
+            cooldown: Touch cooldown in seconds
+            window: Breakout/reject window in seconds
+        """
+        self.panels = [name for name, _ in panels]
+        self.buffer = buffer
+        self.cooldown = cooldown
+        self.window = window
+        self._offset = {name: i * N_LEVELS for i, name in enumerate(self.panels)}
+        self._tz = ZoneInfo(TIMEZONE)
+
+        n = len(self.panels) * N_LEVELS
+        self._is_spx = np.repeat(
+            np.array([inst == "SPX" for _, inst in panels], dtype=bool), N_LEVELS
+        )
+
+        # Level state
+        self.level = np.full(n, np.nan)
+        self._hi = np.full(n, np.nan)
+        self._lo = np.full(n, np.nan)
+        self.birth = np.full(n, np.nan)
+        self.side = np.zeros(n, dtype=np.int8)
+
+        # Touch / pending resolution state
+        self.touch_count = np.zeros(n, dtype=np.int32)
+        self.first_touch = np.full(n, np.nan)
+        self.last_touch = np.full(n, np.nan)
+        self._pending = np.zeros(n, dtype=np.int8)
+        self._deadline = np.full(n, np.nan)
+        self._beyond_since = np.full(n, np.nan)
+        self.reject_time = np.full(n, np.nan)
+        self.breakout_time = np.full(n, np.nan)
+
+        # Scratch buffers reused on every tick
+        self._price = np.empty(n)
+        self._up = np.empty(n, dtype=bool)
+        self._dn = np.empty(n, dtype=bool)
+        self._pos = np.empty(n, dtype=bool)
+        self._neg = np.empty(n, dtype=bool)
+        self._a = np.empty(n, dtype=bool)
+        self._b = np.empty(n, dtype=bool)
+        self._event = np.empty(n, dtype=bool)
+
+    def reset(self):
+        """Clear all levels and events (day roll)."""
+        for arr in (
+            self.level,
+            self._hi,
+            self._lo,
+            self.birth,
+            self.first_touch,
+            self.last_touch,
+            self._deadline,
+            self._beyond_since,
+            self.reject_time,
+            self.breakout_time,
+        ):
+            arr.fill(np.nan)
+        self.side.fill(0)
+        self.touch_count.fill(0)
+        self._pending.fill(0)
+
+    def set_levels(
+        self,
+        panel: str,
+        ranges: Union[np.ndarray, Mapping[str, Optional[float]]],
+        ts: float,
+        offset: float = 0.0,
+    ):
+        """Set (or move) the levels of a panel.
+
+        The first call with valid levels marks the birth of the range. Live
+        panels call this on every recompute; FOTO panels once.
+
+        Args:
+            panel: Panel name
+            ranges: Level row in ``ORDER_KEYS`` order (``range_levels``), or
+                level values keyed by ``ORDER_KEYS``
+            ts: Epoch timestamp of the update
+            offset: Added to every level (SPX -> ES projection via spread)
+        """
+        start = self._offset[panel]
+        level = self.level
+        rows = slice(start, start + N_LEVELS)
+        if isinstance(ranges, np.ndarray):
+            np.add(ranges, offset, out=level[rows])
+        else:
+            for i, key in enumerate(ORDER_KEYS):
+                value = ranges.get(key)
+                level[start + i] = _NAN if value is None else value + offset
+        np.add(level[rows], self.buffer, out=self._hi[rows])
+        np.subtract(level[rows], self.buffer, out=self._lo[rows])
+        if math.isnan(self.birth[start + 4]) and not math.isnan(level[start + 4]):
+            self.birth[rows] = ts
+
+    def update(
+        self, ts: float, es_last: Optional[float], spx_last: Optional[float]
+    ) -> bool:
+        """Advance all state machines by one price sample.
+
+        Args:
+            ts: Epoch timestamp of the sample
+            es_last: ES last price (None if unavailable)
+            spx_last: SPX last price (None if unavailable)
+
+        Returns:
+            True if any touch, reject or breakout fired on this sample
+        """
+        price, up, dn = self._price, self._up, self._dn
+        pos, neg, a, b, event = self._pos, self._neg, self._a, self._b, self._event
+        pending = self._pending
+
+        price.fill(_NAN if es_last is None else es_last)
+        np.copyto(price, _NAN if spx_last is None else spx_last, where=self._is_spx)
+        np.greater_equal(price, self._hi, out=up)
+        np.less_equal(price, self._lo, out=dn)
+
+        # --- Reject: opposite buffer crossed while the touch is pending ---
+        np.greater(pending, 0, out=pos)
+        np.less(pending, 0, out=neg)
+        np.logical_and(pos, dn, out=a)
+        np.logical_and(neg, up, out=b)
+        np.logical_or(a, b, out=a)
+        np.greater_equal(self._deadline, ts, out=b)
+        np.logical_and(a, b, out=event)
+        np.isnan(self.reject_time, out=b)
+        np.logical_and(event, b, out=b)
+        np.copyto(self.reject_time, ts, where=b)
+        np.copyto(pending, 0, where=event)
+        np.copyto(self._beyond_since, _NAN, where=event)
+
+        # --- Breakout: beyond the level for the whole window ---
+        np.greater(pending, 0, out=pos)
+        np.less(pending, 0, out=neg)
+        np.greater_equal(price, self.level, out=a)
+        np.logical_and(pos, a, out=a)
+        np.less_equal(price, self.level, out=b)
+        np.logical_and(neg, b, out=b)
+        np.logical_or(a, b, out=a)  # a = beyond
+        np.logical_or(pos, neg, out=pos)  # pos = pending
+        np.logical_not(a, out=b)
+        np.logical_and(pos, b, out=b)  # b = pending, not beyond
+        np.copyto(self._beyond_since, _NAN, where=b)
+        np.less(self._deadline, ts, out=neg)
+        np.logical_and(b, neg, out=b)
+        np.copyto(pending, 0, where=b)  # expired unresolved
+        np.isnan(self._beyond_since, out=b)
+        np.logical_and(a, b, out=b)
+        np.copyto(self._beyond_since, ts, where=b)
+        np.less_equal(self._beyond_since, ts - self.window, out=b)
+        np.logical_and(a, b, out=b)  # b = breakout now
+        np.logical_or(event, b, out=event)
+        np.copyto(pending, 0, where=b)
+        np.isnan(self.breakout_time, out=a)
+        np.logical_and(a, b, out=a)
+        np.copyto(self.breakout_time, ts, where=a)
+
+        # --- Touch: buffer crossed from the other side of the level ---
+        np.less(self.side, 0, out=a)
+        np.logical_and(a, up, out=a)  # a = touch up
+        np.greater(self.side, 0, out=b)
+        np.logical_and(b, dn, out=b)  # b = touch down
+        np.copyto(self.side, 1, where=up)
+        np.copyto(self.side, -1, where=dn)
+        np.logical_or(a, b, out=pos)
+        np.greater(self.last_touch, ts - self.cooldown, out=neg)
+        np.logical_not(neg, out=neg)
+        np.logical_and(pos, neg, out=pos)  # pos = counted touch
+        np.logical_and(a, pos, out=a)
+        np.logical_and(b, pos, out=b)
+        np.logical_or(event, pos, out=event)
+        np.add(self.touch_count, pos, out=self.touch_count, casting="unsafe")
+        np.isnan(self.first_touch, out=neg)
+        np.logical_and(neg, pos, out=neg)
+        np.copyto(self.first_touch, ts, where=neg)
+        np.copyto(self.last_touch, ts, where=pos)
+        np.copyto(pending, 1, where=a)
+        np.copyto(pending, -1, where=b)
+        np.copyto(self._deadline, ts + self.window, where=pos)
+        np.copyto(self._beyond_since, ts, where=pos)
+
+        return bool(event.any())
+
+    def rows(self, panel: Optional[str] = None) -> list[dict]:
+        """Per-level event fields (README "Campi Salvati per Ogni Livello").
+
+        Args:
+            panel: Restrict to one panel. All panels if None.
+
+        Returns:
+            One dict per level, in panel and ``ORDER_KEYS`` order
+        """
+        panels = [panel] if panel is not None else self.panels
+        utc = datetime.timezone.utc
+        out = []
+        for name in panels:
+            start = self._offset[name]
+            for i, key in enumerate(ORDER_KEYS):
+                j = start + i
+                first, last = self.first_touch[j], self.last_touch[j]
+                birth = self.birth[j]
+                out.append(
+                    {
+                        "panel": name,
+                        "level": LEVEL_CODES[key],
+                        "level_value": (
+                            None if math.isnan(self.level[j]) else float(self.level[j])
+                        ),
+                        "touch_flag": int(self.touch_count[j] > 0),
+                        "touch_count": int(self.touch_count[j]),
+                        "first_touch_time_local": _fmt_ts(first, self._tz),
+                        "first_touch_time_utc": _fmt_ts(first, utc),
+                        "last_touch_time_local": _fmt_ts(last, self._tz),
+                        "last_touch_time_utc": _fmt_ts(last, utc),
+                        "has_reject": int(not math.isnan(self.reject_time[j])),
+                        "reject_time": _fmt_ts(self.reject_time[j], self._tz),
+                        "has_breakout": int(not math.isnan(self.breakout_time[j])),
+                        "breakout_time": _fmt_ts(self.breakout_time[j], self._tz),
+                        "time_from_range_birth_to_first_touch": (
+                            None
+                            if math.isnan(first) or math.isnan(birth)
+                            else round(float(first - birth) / 60.0, 2)
+                        ),
+                    }
+                )
+        return out
@@ -0,0 +1,312 @@
+"""Offline replay of recorded data through the sample engine.
+
+Drives :class:`SampleEngine` without a broker connection, to rebuild a day's
+snapshots and range events, regression-test the SPEC_LOCK rules and
+benchmark the pipeline. Sources:
+- :func:`log_samples`: ``live_log_10s.csv`` (one sample per 10s row)
+- :func:`parquet_samples`: the ``market_10s`` table of a :class:`ParquetStore`
+- :func:`recorded_samples`: a sample stream recorded by the live worker
+  (``SAMPLE_COLUMNS``, one row per recompute)
+
+Usage:
+    python -m es_trading_dashboard.collector.replay live_log_10s.csv --out replay/
+"""
+
+import argparse
+import csv
+import datetime
+import logging
+import math
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Iterator, Optional
+
+from .range_engine import RangeEventEngine
+from .sample_engine import TS_FORMAT, Sample, SampleEngine, Step, trade_date
+from .schema import LOG_COLUMNS, SAMPLE_COLUMNS, SNAP_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+# live log column -> sample field
+_LOG_FIELDS = {
+    "es_last": "es_last",
+    "es_vwap_live": "es_vwap",
+    "iv_daily_pct_live": "iv_daily_pct",
+    "spx_last": "spx_last",
+    "spx_open_official": "spx_open",
+    "str_bid": "str_bid",
+    "str_ask": "str_ask",
+    "pcr": "pcr",
+}
+
+
+def _num(value) -> Optional[float]:
+    """Parse a recorded number (empty, "None" and NaN -> None)."""
+    if value is None or value == "" or value == "None":
+        return None
+    try:
+        f = float(value)
+    except (TypeError, ValueError):
+        return None
+    return f if math.isfinite(f) else None
+
+
+def _rows_to_samples(rows: Iterable[dict], fields: dict[str, str]) -> Iterator[Sample]:
+    """Map dict rows (timestamp + recorded columns) to samples."""
+    for row in rows:
+        ts = row["timestamp"]
+        if isinstance(ts, str):
+            ts = datetime.datetime.strptime(ts, TS_FORMAT)
+        yield Sample(ts, **{dst: _num(row.get(src)) for src, dst in fields.items()})
+
+
+def log_samples(path: str) -> Iterator[Sample]:
+    """Samples from a live log CSV (``LOG_COLUMNS``).
+
+    Args:
+        path: CSV path
+
+    Yields:
+        One sample per log row
+    """
+    with open(path, newline="") as f:
+        yield from _rows_to_samples(csv.DictReader(f), _LOG_FIELDS)
+
+
+def recorded_samples(path: str) -> Iterator[Sample]:
+    """Samples from a recorded sample stream CSV (``SAMPLE_COLUMNS``).
+
+    Args:
+        path: CSV path
+
+    Yields:
+        One sample per recorded recompute
+    """
+    fields = {name: name for name in SAMPLE_COLUMNS[1:]}
+    with open(path, newline="") as f:
+        yield from _rows_to_samples(csv.DictReader(f), fields)
+
+
+def parquet_samples(
+    store,
+    start: Optional[datetime.date] = None,
+    end: Optional[datetime.date] = None,
+) -> Iterator[Sample]:
+    """Samples from the ``market_10s`` table of a Parquet store.
+
+    Args:
+        store: :class:`~.parquet_store.ParquetStore`
+        start: First trade_date (inclusive)
+        end: Last trade_date (inclusive)
+
+    Yields:
+        One sample per row, with local naive timestamps
+    """
+    df = store.read("market_10s", start, end, columns=list(_LOG_FIELDS))
+    if not len(df):
+        return
+    stamps = df["timestamp"].dt.tz_localize(None).dt.to_pydatetime()
+    columns = [df[c].tolist() for c in _LOG_FIELDS]
+    names = list(_LOG_FIELDS.values())
+    for i, ts in enumerate(stamps):
+        yield Sample(ts, **{n: _num(col[i]) for n, col in zip(names, columns)})
+
+
+def in_range(
+    samples: Iterable[Sample],
+    start: Optional[datetime.date] = None,
+    end: Optional[datetime.date] = None,
+) -> Iterator[Sample]:
+    """Samples whose trade_date is within ``[start, end]``.
+
+    Args:
+        samples: Samples of any source
+        start: First trade_date (inclusive). No lower bound if None.
+        end: Last trade_date (inclusive). No upper bound if None.
+
+    Yields:
+        Samples of the range, in input order
+    """
+    for sample in samples:
+        day = trade_date(sample.timestamp)
+        if (start is None or day >= start) and (end is None or day <= end):
+            yield sample
+
+
+def sample_row(sample: Sample) -> list:
+    """Row of a sample in ``SAMPLE_COLUMNS`` order, for recording."""
+    return [sample.timestamp.strftime(TS_FORMAT)] + [
+        getattr(sample, name) for name in SAMPLE_COLUMNS[1:]
+    ]
+
+
+@dataclass
+class ReplayResult:
+    """Outputs of a replay.
+
+    Attributes:
+        samples: Samples processed
+        log_rows: Live log rows (``LOG_COLUMNS``)
+        snapshot_rows: Snapshot rows (``SNAP_COLUMNS``)
+        event_rows: Final range event fields per trade_date and level
+        elapsed: Wall-clock seconds spent
+    """
+
+    samples: int = 0
+    log_rows: list = field(default_factory=list)
+    snapshot_rows: list = field(default_factory=list)
+    event_rows: list = field(default_factory=list)
+    elapsed: float = 0.0
+
+
+class Replayer:
+    """Feeds a sample source through a :class:`SampleEngine`.
+
+    Attributes:
+        engine: Engine being driven
+        speed: Playback speed relative to the sample timestamps
+            (1.0 = wall-clock, N = N times faster, None = as fast as possible)
+    """
+
+    def __init__(
+        self,
+        engine: Optional[SampleEngine] = None,
+        speed: Optional[float] = None,
+        on_step: Optional[Callable[[Sample, Step], None]] = None,
+    ):
+        """Initialize the replayer.
+
+        Args:
+            engine: Engine to drive. A fresh one if None.
+            speed: Playback speed (None or 0 for maximum speed)
+            on_step: Called with every sample and its step (e.g. to publish
+                to a StateStore)
+        """
+        self.engine = engine or SampleEngine(RangeEventEngine())
+        self.speed = speed or None
+        self.on_step = on_step
+
+    def run(self, samples: Iterable[Sample]) -> ReplayResult:
+        """Replay samples in order.
+
+        Args:
+            samples: Sample source, sorted by timestamp
+
+        Returns:
+            Collected outputs
+        """
+        result = ReplayResult()
+        engine = self.engine
+        started = time.perf_counter()
+        first_ts = None
+        for sample in samples:
+            if self.speed is not None:
+                if first_ts is None:
+                    first_ts = sample.timestamp
+                target = (sample.timestamp - first_ts).total_seconds() / self.speed
+                delay = target - (time.perf_counter() - started)
+                if delay > 0:
+                    time.sleep(delay)
+
+            if (
+                engine.trade_date is not None
+                and trade_date(sample.timestamp) != engine.trade_date
+            ):
+                self._close_day(result)
+            step = engine.step(sample)
+            result.samples += 1
+            if step.log_row is not None:
+                result.log_rows.append(step.log_row)
+            result.snapshot_rows.extend(step.snapshots)
+            if self.on_step is not None:
+                self.on_step(sample, step)
+
+        if engine.trade_date is not None:
+            self._close_day(result)
+        result.elapsed = time.perf_counter() - started
+        logger.info(
+            f"Replayed {result.samples} samples in {result.elapsed:.2f}s "
+            f"({len(result.snapshot_rows)} snapshots)"
+        )
+        return result
+
+    def _close_day(self, result: ReplayResult):
+        """Collect the range event fields of the current trade_date."""
+        day = self.engine.trade_date.isoformat()
+        for row in self.engine.events.rows():
+            if row["level_value"] is not None:
+                result.event_rows.append({"trade_date": day, **row})
+
+
+def _write_csv(path: str, header: list, rows: Iterable):
+    """Write rows (lists or dicts) with a header."""
+    with open(path, "w", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(header)
+        for row in rows:
+            w.writerow([row.get(h) for h in header] if isinstance(row, dict) else row)
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Replay recorded collector data")
+    parser.add_argument(
+        "source", help="live log CSV, recorded sample CSV or Parquet root"
+    )
+    parser.add_argument(
+        "--format", choices=["log", "samples", "parquet"], default="log"
+    )
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=0.0,
+        help="1 = wall-clock, N = N times faster, 0 = max speed",
+    )
+    parser.add_argument(
+        "--start",
+        type=datetime.date.fromisoformat,
+        default=None,
+        help="first trade_date (YYYY-MM-DD)",
+    )
+    parser.add_argument(
+        "--end",
+        type=datetime.date.fromisoformat,
+        default=None,
+        help="last trade_date (YYYY-MM-DD)",
+    )
+    parser.add_argument("--out", default="replay", help="output directory")
+    args = parser.parse_args(argv)
+
+    if args.format == "parquet":
+        from .parquet_store import ParquetStore
+
+        samples = parquet_samples(ParquetStore(args.source), args.start, args.end)
+    elif args.format == "samples":
+        samples = in_range(recorded_samples(args.source), args.start, args.end)
+    else:
+        samples = in_range(log_samples(args.source), args.start, args.end)
+
+    result = Replayer(speed=args.speed).run(samples)
+    os.makedirs(args.out, exist_ok=True)
+    _write_csv(os.path.join(args.out, "live_log_10s.csv"), LOG_COLUMNS, result.log_rows)
+    _write_csv(
+        os.path.join(args.out, "snapshots_fixed.csv"),
+        SNAP_COLUMNS,
+        result.snapshot_rows,
+    )
+    if result.event_rows:
+        _write_csv(
+            os.path.join(args.out, "range_events.csv"),
+            list(result.event_rows[0]),
+            result.event_rows,
+        )
+    print(
+        f"{result.samples} samples, {len(result.log_rows)} log rows, "
+        f"{len(result.snapshot_rows)} snapshots, {len(result.event_rows)} levels "
+        f"in {result.elapsed:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,442 @@
+"""Per-sample computation of the live collector, independent of IB.
+
+The worker turns ticker updates into :class:`Sample` records and hands them to
+:class:`SampleEngine`, which derives everything else (mode, IV straddle, DVS,
+live ranges, fixed snapshots, range events, log rows, finalize). The engine
+performs no I/O, so the same code runs live, in replay (see ``replay.py``)
+and in benchmarks.
+
+Time comes from the samples only: pass timestamps in Europe/Zurich local
+time, as the live worker does.
+"""
+
+import datetime
+import math
+from dataclasses import dataclass, field, fields
+from typing import Any, Optional
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+from ..core.calendar import trade_date
+from ..core.ranges import N_LEVELS, level_dict, range_levels
+from ..core.spec import (
+    FINALIZE_TIME,
+    LOG_INTERVAL_SEC,
+    SNAP_1000,
+    SNAP_1530,
+    SNAP_1545,
+    SQRT_252,
+    TIMEZONE,
+)
+from .range_engine import RangeEventEngine
+
+MODE_MORNING = "MORNING_ES_VWAP"
+MODE_AFTERNOON = "AFTERNOON_SPX_OPEN"
+
+TS_FORMAT = "%Y-%m-%d %H:%M:%S"
+SNAP_KEYS = [
+    "snap_1000",
+    "snap_1530_spx",
+    "snap_1530_es",
+    "snap_1545_spx",
+    "snap_1545_es",
+]
+
+
+def calc_ranges(base, iv_daily_frac, iv_straddle_frac):
+    """Calculate R1, R2, FIBO ranges from base (see ``range_levels``)."""
+    if base is None or iv_daily_frac is None or iv_straddle_frac is None:
+        return {}
+    return level_dict(range_levels(base, iv_daily_frac, iv_straddle_frac))
+
+
+def to_es(x, spread):
+    """Convert SPX level to ES level."""
+    if x is None or spread is None:
+        return None
+    return x + spread
+
+
+def iv_daily_from_ib(iv_raw: Optional[float]) -> Optional[float]:
+    """Daily IV% from IB ``impliedVolatility`` (tick 106, SPEC_LOCK §9)."""
+    iv_annual_pct = (iv_raw * 100.0) if (iv_raw and iv_raw < 1.0) else iv_raw
+    return (iv_annual_pct / SQRT_252) if iv_annual_pct else None
+
+
+def straddle_quotes(call_bid, call_ask, put_bid, put_ask):
+    """Straddle bid/ask and put/call mid ratio from the ATM legs.
+
+    Returns:
+        Tuple (str_bid, str_ask, pcr)
+    """
+    call_mid = ((call_bid + call_ask) / 2.0) if (call_bid and call_ask) else None
+    put_mid = ((put_bid + put_ask) / 2.0) if (put_bid and put_ask) else None
+    str_bid = (call_bid + put_bid) if (call_bid and put_bid) else None
+    str_ask = (call_ask + put_ask) if (call_ask and put_ask) else None
+    pcr = (put_mid / call_mid) if (put_mid and call_mid and call_mid != 0) else None
+    return str_bid, str_ask, pcr
+
+
+@dataclass(slots=True)
+class Sample:
+    """Market inputs of one worker cycle (fields follow ``SAMPLE_COLUMNS``)."""
+
+    timestamp: datetime.datetime
+    es_last: Optional[float] = None
+    es_vwap: Optional[float] = None
+    iv_daily_pct: Optional[float] = None
+    spx_last: Optional[float] = None
+    spx_open: Optional[float] = None
+    str_bid: Optional[float] = None
+    str_ask: Optional[float] = None
+    pcr: Optional[float] = None
+
+
+SAMPLE_FIELDS = [f.name for f in fields(Sample)]
+
+
+@dataclass(slots=True)
+class Step:
+    """Outputs of one :meth:`SampleEngine.step`.
+
+    Attributes:
+        state: State changes to publish (StateStore keys); live groups whose
+            inputs did not change are left out
+        log_row: Live log row (``LOG_COLUMNS``) when the log is due
+        snapshots: Snapshot rows (``SNAP_COLUMNS``) taken on this step
+        events_changed: Range event state changed
+        finalize: Session finalize (22:01) reached on this step
+    """
+
+    state: dict[str, Any] = field(default_factory=dict)
+    log_row: Optional[list] = None
+    snapshots: list = field(default_factory=list)
+    events_changed: bool = False
+    finalize: bool = False
+
+
+class SampleEngine:
+    """Deterministic state machine driven by :class:`Sample` records.
+
+    State (fixed snapshots, official SPX open, finalize, range events) is
+    reset when a sample belongs to a new trade_date.
+
+    Attributes:
+        events: Range event engine fed on every step
+        trade_date: Trade date of the last sample
+        next_log: Sample time of the next live log row
+    """
+
+    def __init__(
+        self,
+        events: Optional[RangeEventEngine] = None,
+        log_interval: float = LOG_INTERVAL_SEC,
+    ):
+        """Initialize the engine.
+
+        Args:
+            events: Range event engine. A default one if None.
+            log_interval: Seconds between live log rows
+        """
+        self.events = events or RangeEventEngine()
+        self.log_interval = log_interval
+        self.trade_date: Optional[datetime.date] = None
+        self.next_log: Optional[datetime.datetime] = None
+        self._tz = ZoneInfo(TIMEZONE)
+        self._live_levels = np.empty(N_LEVELS)
+        self._live_ranges: dict = {}
+        self._roll(None)
+
+    def _roll(self, trade_date: Optional[datetime.date]):
+        """Start a new trade date."""
+        self.trade_date = trade_date
+        self.spx_open_official: Optional[float] = None
+        self.snap_done = {"1000": False, "1530": False, "1545": False}
+        self.finalized = False
+        self.events.reset()
+        # Inputs of the last published live groups (see step)
+        self._quotes_key: Optional[tuple] = None
+        self._live_key: Optional[tuple] = None
+
+    def log_due(self, now: datetime.datetime) -> bool:
+        """Whether a sample at ``now`` writes a live log row."""
+        return self.next_log is not None and now >= self.next_log
+
+    def wants_spx_open(self, now: datetime.datetime) -> bool:
+        """Whether the official SPX open is still missing after 15:30."""
+        return self.spx_open_official is None and (now.hour, now.minute) >= SNAP_1530
+
+    def step(self, sample: Sample) -> Step:
+        """Process one sample.
+
+        Args:
+            sample: Market inputs; naive timestamps are Europe/Zurich local
+
+        Returns:
+            State changes and rows produced by the sample
+        """
+        now = sample.timestamp
+        if now.tzinfo is not None:
+            now = now.astimezone(self._tz).replace(tzinfo=None)
+        hm = (now.hour, now.minute)
+        out = Step()
+        state = out.state
+        day = trade_date(now)
+        if day != self.trade_date:
+            if self.trade_date is not None:
+                state.update(dict.fromkeys(SNAP_KEYS), spx_open_official=None)
+            self._roll(day)
+        today = day.strftime("%Y%m%d")
+        now_str = now.strftime(TS_FORMAT)
+
+        if self.next_log is None:
+            self.next_log = now + datetime.timedelta(seconds=self.log_interval)
+            log_due = False
+        else:
+            log_due = now >= self.next_log
+
+        es_last = sample.es_last
+        spx_last = sample.spx_last
+        es_vwap_live = sample.es_vwap
+        iv_daily_pct = sample.iv_daily_pct
+        iv_daily_frac = (iv_daily_pct / 100.0) if iv_daily_pct else None
+        spread_live = (es_last - spx_last) if (es_last and spx_last) else None
+
+        # --- SPX OPEN official (once after 15:30, then frozen) ---
+        spx_open_off = self.spx_open_official
+        if spx_open_off is None and hm >= SNAP_1530 and sample.spx_open:
+            spx_open_off = self.spx_open_official = sample.spx_open
+            state["spx_open_official"] = spx_open_off
+
+        # --- Straddle ATM ---
+        str_bid, str_ask = sample.str_bid, sample.str_ask
+        str_mid = ((str_bid + str_ask) / 2.0) if (str_bid and str_ask) else None
+        str_spread = (str_ask - str_bid) if (str_ask and str_bid) else None
+
+        # --- MODE ---
+        mode = MODE_MORNING
+        base_live = es_vwap_live
+        base_label_live = "VWAP"
+        if (
+            hm >= SNAP_1530
+            and spx_open_off not in (None, 0)
+            and spread_live is not None
+        ):
+            mode = MODE_AFTERNOON
+            base_live = spx_open_off
+            base_label_live = "OPEN"
+
+        # --- IV% Straddle ---
+        iv_straddle_pct = (
+            ((str_ask / base_live) * 100.0) if (str_ask and base_live) else None
+        )
+        iv_straddle_frac = (iv_straddle_pct / 100.0) if iv_straddle_pct else None
+
+        # --- DVS ---
+        r1_pts_live = (
+            (base_live * iv_daily_frac) if (base_live and iv_daily_frac) else None
+        )
+        dvs = (
+            ((str_mid / r1_pts_live) * 100.0)
+            if (str_mid and r1_pts_live and r1_pts_live != 0)
+            else None
+        )
+
+        # --- Live state: a group is recomputed and published only when its
+        # inputs changed since the previous sample ---
+        quotes = (
+            es_last,
+            spx_last,
+            es_vwap_live,
+            iv_daily_pct,
+            str_bid,
+            str_ask,
+            sample.pcr,
+        )
+        if quotes != self._quotes_key:
+            self._quotes_key = quotes
+            state.update(
+                {
+                    "es_last": es_last,
+                    "spx_last": spx_last,
+                    "es_vwap_live": es_vwap_live,
+                    "spread_live": spread_live,
+                    "iv_daily_pct_live": iv_daily_pct,
+                    "str_bid": str_bid,
+                    "str_mid": str_mid,
+                    "str_ask": str_ask,
+                    "str_spread": str_spread,
+                    "pcr": sample.pcr,
+                }
+            )
+
+        # --- Live ranges (one kernel row; NaN when an input is missing) ---
+        ts = now.replace(tzinfo=self._tz).timestamp()
+        events = self.events
+        live_levels = self._live_levels
+        live = (
+            mode,
+            base_live,
+            iv_daily_pct,
+            str_bid,
+            str_ask,
+            spread_live if mode == MODE_AFTERNOON else None,
+        )
+        if live != self._live_key:
+            self._live_key = live
+            range_levels(
+                base_live or None, iv_daily_frac, iv_straddle_frac, out=live_levels
+            )
+            self._live_ranges = level_dict(live_levels)
+
+            # --- Range events (touch/reject/breakout) ---
+            if self._live_ranges:
+                if mode == MODE_MORNING:
+                    events.set_levels("ES_LIVE_AM", live_levels, ts)
+                else:
+                    events.set_levels("SPX_LIVE", live_levels, ts)
+                    events.set_levels(
+                        "ES_LIVE_PM", live_levels, ts, offset=spread_live
+                    )
+            state.update(
+                {
+                    "iv_straddle_pct_live": iv_straddle_pct,
+                    "dvs": dvs,
+                    "mode": mode,
+                    "base_label_live": base_label_live,
+                    "base_live": base_live,
+                    "live_panels": self._live_ranges,
+                }
+            )
+        live_ranges = self._live_ranges
+        state["last_update"] = now_str
+
+        # --- SNAPSHOT 10:00 ---
+        if hm >= SNAP_1000 and not self.snap_done["1000"]:
+            if base_live and iv_daily_frac and iv_straddle_frac:
+                state["snap_1000"] = {
+                    "slot": "ES_10:00",
+                    "date": today,
+                    "base": base_live,
+                    "label": "VWAP",
+                    "iv_daily": iv_daily_pct,
+                    "iv_straddle": iv_straddle_pct,
+                    "ranges": live_ranges,
+                }
+                out.snapshots.append(
+                    [
+                        now_str,
+                        "ES_10:00",
+                        today,
+                        "VWAP",
+                        base_live,
+                        spx_open_off,
+                        spread_live,
+                        iv_daily_pct,
+                        iv_straddle_pct,
+                    ]
+                    + live_levels.tolist()
+                )
+                events.set_levels("ES_10:00", live_levels, ts)
+                self.snap_done["1000"] = True
+
+        # --- SNAPSHOTS 15:30 / 15:45 (SPX row + ES projection, one kernel call) ---
+        snap_levels = None
+        for key, slot_time in (("1530", SNAP_1530), ("1545", SNAP_1545)):
+            if hm < slot_time or self.snap_done[key]:
+                continue
+            if not (
+                spx_open_off and spread_live and iv_daily_frac and iv_straddle_frac
+            ):
+                continue
+            if snap_levels is None:
+                snap_levels = range_levels(
+                    spx_open_off,
+                    iv_daily_frac,
+                    iv_straddle_frac,
+                    spread=[0.0, spread_live],
+                )
+            spx_levels, es_levels = snap_levels
+            label = f"{key[:2]}:{key[2:]}"
+            state[f"snap_{key}_spx"] = {
+                "slot": f"SPX_{label}",
+                "date": today,
+                "base": spx_open_off,
+                "label": "OPEN",
+                "iv_daily": iv_daily_pct,
+                "iv_straddle": iv_straddle_pct,
+                "ranges": level_dict(spx_levels),
+            }
+            out.snapshots.append(
+                [
+                    now_str,
+                    f"SPX_{label}",
+                    today,
+                    "OPEN",
+                    spx_open_off,
+                    spx_open_off,
+                    spread_live,
+                    iv_daily_pct,
+                    iv_straddle_pct,
+                ]
+                + spx_levels.tolist()
+            )
+            state[f"snap_{key}_es"] = {
+                "slot": f"ES_{label}",
+                "date": today,
+                "base": to_es(spx_open_off, spread_live),
+                "label": "OPEN+SPR",
+                "iv_daily": iv_daily_pct,
+                "iv_straddle": iv_straddle_pct,
+                "ranges": level_dict(es_levels),
+                "spread": spread_live,
+            }
+            out.snapshots.append(
+                [
+                    now_str,
+                    f"ES_{label}",
+                    today,
+                    "OPEN+SPR",
+                    to_es(spx_open_off, spread_live),
+                    spx_open_off,
+                    spread_live,
+                    iv_daily_pct,
+                    iv_straddle_pct,
+                ]
+                + es_levels.tolist()
+            )
+            events.set_levels(f"SPX_{label}", spx_levels, ts)
+            events.set_levels(f"ES_{label}", es_levels, ts)
+            self.snap_done[key] = True
+
+        out.events_changed = events.update(ts, es_last, spx_last)
+
+        # --- Log row (every log_interval) ---
+        if log_due:
+            late = (now - self.next_log).total_seconds()
+            steps = max(1, math.ceil(late / self.log_interval))
+            self.next_log += datetime.timedelta(seconds=self.log_interval * steps)
+            out.log_row = [
+                now_str,
+                mode,
+                es_last,
+                es_vwap_live,
+                spx_last,
+                spx_open_off,
+                spread_live,
+                iv_daily_pct,
+                iv_straddle_pct,
+                str_bid,
+                str_mid,
+                str_ask,
+                str_spread,
+                dvs,
+                sample.pcr,
+            ]
+
+        # --- FINALIZE 22:01 ---
+        if hm >= FINALIZE_TIME and not self.finalized:
+            self.finalized = out.finalize = True
+
+        return out
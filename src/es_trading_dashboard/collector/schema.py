@@ -0,0 +1,62 @@
+"""Column layouts of the live collector outputs."""
+
+from ..core.spec import LEVEL_CODES, ORDER_KEYS
+
+LOG_COLUMNS = [
+    "timestamp",
+    "mode",
+    "es_last",
+    "es_vwap_live",
+    "spx_last",
+    "spx_open_official",
+    "spread_live",
+    "iv_daily_pct_live",
+    "iv_straddle_pct_live",
+    "str_bid",
+    "str_mid",
+    "str_ask",
+    "str_spread",
+    "dvs",
+    "pcr",
+]
+
+# snapshots_fixed.csv header, unchanged since the first release. The nine range
+# values are written in ORDER_KEYS order, so the level names do not match the
+# values (R1_UP holds FIBO EST R1 UP, ...): readers take the levels by position.
+SNAP_COLUMNS = [
+    "timestamp",
+    "slot",
+    "date",
+    "base_label",
+    "base_value",
+    "spx_open_official",
+    "spread_fixed",
+    "iv_daily_pct_fixed",
+    "iv_straddle_pct_fixed",
+    "R1_UP",
+    "R2_UP",
+    "CENTER",
+    "R2_DN",
+    "R1_DN",
+    "FIB_R1_UP",
+    "FIB_R2_UP",
+    "FIB_R2_DN",
+    "FIB_R1_DN",
+]
+
+# The same columns with the levels named after their values (Parquet
+# range_snapshots table); ParquetStore.export_csv maps them back by position
+SNAP_STORE_COLUMNS = SNAP_COLUMNS[:-9] + [LEVEL_CODES[key] for key in ORDER_KEYS]
+
+# Recorded market samples (inputs of the sample engine, see replay.py)
+SAMPLE_COLUMNS = [
+    "timestamp",
+    "es_last",
+    "es_vwap",
+    "iv_daily_pct",
+    "spx_last",
+    "spx_open",
+    "str_bid",
+    "str_ask",
+    "pcr",
+]
@@ -0,0 +1,396 @@
+"""Local stand-in for TWS implementing :class:`MarketDataSource`.
+
+Serves what the collector needs without a broker connection:
+- Contract details for the ES futures and qualification of ES/SPX/FOP
+  contracts (deterministic conIds and local symbols)
+- ``reqSecDefOptParams`` chains (E2B 0DTE plus the monthly ES class) with a
+  configurable strike grid
+- Streaming ``ib_insync.Ticker`` objects for ES, SPX and ES options, driven by
+  a seeded random walk at configurable tick rates per security type
+- Gaps (silent periods), refused connects and scheduled disconnects
+
+Ticks are generated on a fixed schedule and applied on the thread calling
+:meth:`SimulatedIB.sleep` / :meth:`SimulatedIB.waitOnUpdate`, like ib_insync
+does from its event loop. Each applied tick is recorded in
+:attr:`SimulatedIB.tick_log` as ``(scheduled, applied)`` timestamps so
+benchmarks can measure tick-to-state latency.
+"""
+
+import asyncio
+import datetime
+import heapq
+import logging
+import math
+import random
+import time
+import zlib
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Optional
+
+from eventkit import Event
+from ib_insync import BarData, ContractDetails, Future, OptionChain, Ticker
+
+from ..core.calendar import local_now, zero_dte_expiry
+from ..core.spec import SQRT_252
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SimConfig:
+    """Simulator parameters.
+
+    Attributes:
+        es_price: Initial ES price
+        spx_spread: ES minus SPX basis
+        iv_annual: Annualized implied volatility (fraction)
+        volatility: ES random walk, points per sqrt(second)
+        tick_rates: Ticks per second per ticker, by secType (FUT, IND, FOP)
+        strike_step: Option strike grid spacing
+        n_strikes: Strikes listed on each side of the initial price
+        gaps: (start, duration) seconds after connect without any tick
+        disconnect_after: Seconds after connect when the link drops
+        refuse_connects: Connect attempts refused before one succeeds
+        seed: Random seed
+    """
+
+    es_price: float = 5000.0
+    spx_spread: float = 20.0
+    iv_annual: float = 0.15
+    volatility: float = 0.3
+    tick_rates: dict = field(
+        default_factory=lambda: {"FUT": 20.0, "IND": 4.0, "FOP": 5.0}
+    )
+    strike_step: float = 5.0
+    n_strikes: int = 60
+    gaps: list = field(default_factory=list)
+    disconnect_after: Optional[float] = None
+    refuse_connects: int = 0
+    seed: int = 0
+
+
+def _con_id(*parts) -> int:
+    """Deterministic contract id."""
+    return zlib.crc32("|".join(str(p) for p in parts).encode()) & 0x7FFFFFFF
+
+
+def _expiry(days: int = 0) -> str:
+    """Current 0DTE expiry ``days`` business days ahead, as YYYYMMDD."""
+    day = zero_dte_expiry(local_now())
+    while days:
+        day += datetime.timedelta(days=1)
+        if day.weekday() < 5:
+            days -= 1
+    return day.strftime("%Y%m%d")
+
+
+class SimulatedIB:
+    """In-process fake TWS.
+
+    Attributes:
+        config: Simulator parameters
+        tick_log: ``(scheduled, applied)`` epoch times of the applied ticks
+        ticks_applied: Total ticks applied
+    """
+
+    def __init__(
+        self, config: Optional[SimConfig] = None, tick_log_size: int = 1_000_000
+    ):
+        """Create a disconnected simulator.
+
+        Args:
+            config: Simulator parameters. Defaults if None.
+            tick_log_size: Entries retained in :attr:`tick_log`
+        """
+        self.config = config or SimConfig()
+        self.connectedEvent = Event("connectedEvent")
+        self.disconnectedEvent = Event("disconnectedEvent")
+        self.errorEvent = Event("errorEvent")
+        self.pendingTickersEvent = Event("pendingTickersEvent")
+        self.tick_log: deque = deque(maxlen=tick_log_size)
+        self.ticks_applied = 0
+
+        self._rng = random.Random(self.config.seed)
+        self._refusals = self.config.refuse_connects
+        self._connected = False
+        self._t0 = 0.0
+        self._es = self.config.es_price
+        self._vwap_num = 0.0
+        self._vwap_den = 0
+        self._last_move = 0.0
+        self._streams: dict[int, Ticker] = {}
+        self._queue: list = []  # (due, seq, conId)
+        self._seq = 0
+        self._spx_open: Optional[float] = None
+
+    # --- Connection ---
+
+    def connect(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 7497,
+        clientId: int = 1,
+        timeout: float = 4,
+        readonly: bool = False,
+        account: str = "",
+    ):
+        """Connect (refused while ``refuse_connects`` attempts remain).
+
+        Raises:
+            ConnectionRefusedError: On a refused attempt
+        """
+        if self._refusals > 0:
+            self._refusals -= 1
+            raise ConnectionRefusedError(f"Simulated refusal ({host}:{port})")
+        self._connected = True
+        self._t0 = self._last_move = time.time()
+        logger.info(f"Simulated TWS connected (clientId={clientId})")
+        self.connectedEvent.emit()
+        return self
+
+    async def connectAsync(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 7497,
+        clientId: int = 1,
+        timeout: float = 4,
+        readonly: bool = False,
+        account: str = "",
+    ):
+        """Async variant of :meth:`connect`."""
+        await asyncio.sleep(0)
+        return self.connect(host, port, clientId, timeout, readonly, account)
+
+    def disconnect(self):
+        """Drop the connection and all subscriptions."""
+        if not self._connected:
+            return
+        self._connected = False
+        self._streams.clear()
+        self._queue.clear()
+        self.disconnectedEvent.emit()
+
+    def isConnected(self) -> bool:
+        """Connection state (scheduled disconnects take effect here)."""
+        after = self.config.disconnect_after
+        if self._connected and after is not None and time.time() >= self._t0 + after:
+            logger.warning("Simulated TWS disconnect")
+            self.disconnect()
+        return self._connected
+
+    # --- Contracts ---
+
+    def _strikes(self) -> list[float]:
+        step = self.config.strike_step
+        center = round(self.config.es_price / step) * step
+        n = self.config.n_strikes
+        return [center + i * step for i in range(-n, n + 1)]
+
+    def reqContractDetails(self, contract) -> list:
+        """Details of the two nearest ES quarterly futures."""
+        if contract.secType != "FUT" or contract.symbol != "ES":
+            return [
+                ContractDetails(contract=c) for c in self.qualifyContracts(contract)
+            ]
+        today = datetime.date.today()
+        out = []
+        for k in range(2):
+            quarter = (today.month - 1) // 3 + k  # 0-based, from this year
+            month = quarter % 4 * 3 + 3
+            year = today.year + quarter // 4
+            ym = f"{year}{month:02d}"
+            fut = Future(
+                "ES",
+                ym + "19",
+                "CME",
+                localSymbol=f"ES{'FGHJKMNQUVXZ'[month - 1]}{year % 10}",
+                multiplier="50",
+                currency="USD",
+                conId=_con_id("ES", ym),
+            )
+            out.append(ContractDetails(contract=fut))
+        return out
+
+    def qualifyContracts(self, *contracts) -> list:
+        """Fill conId/localSymbol; FOPs qualify on CME at listed strikes only."""
+        out = []
+        for c in contracts:
+            if c.secType == "FOP":
+                if c.exchange != "CME" or c.strike not in self._strikes():
+                    continue
+                expiry = c.lastTradeDateOrContractMonth
+                c.localSymbol = f"{c.tradingClass} {expiry} {c.right}{c.strike:g}"
+            elif not c.localSymbol:
+                c.localSymbol = c.symbol
+            if not c.conId:
+                c.conId = _con_id(
+                    c.secType,
+                    c.symbol,
+                    c.lastTradeDateOrContractMonth,
+                    c.strike,
+                    c.right,
+                    c.tradingClass,
+                )
+            out.append(c)
+        return out
+
+    def reqSecDefOptParams(
+        self,
+        underlyingSymbol: str,
+        futFopExchange: str,
+        underlyingSecType: str,
+        underlyingConId: int,
+    ) -> list:
+        """0DTE (E2B) and monthly (ES) chains with the configured strike grid."""
+        strikes = self._strikes()
+        return [
+            OptionChain(
+                futFopExchange,
+                underlyingConId,
+                "E2B",
+                "50",
+                [_expiry(0), _expiry(1)],
+                strikes,
+            ),
+            OptionChain(
+                futFopExchange, underlyingConId, "ES", "50", [_expiry(30)], strikes
+            ),
+        ]
+
+    def reqHistoricalData(
+        self,
+        contract,
+        endDateTime,
+        durationStr: str,
+        barSizeSetting: str,
+        whatToShow: str,
+        useRTH: bool,
+        formatDate: int = 1,
+        keepUpToDate: bool = False,
+        chartOptions=None,
+        timeout: float = 60,
+    ) -> list:
+        """One daily bar whose open is the simulated SPX open."""
+        px = self._spx_open or (self._es - self.config.spx_spread)
+        return [BarData(date=datetime.date.today(), open=px, high=px, low=px, close=px)]
+
+    # --- Streaming ---
+
+    def reqMktData(
+        self,
+        contract,
+        genericTickList: str = "",
+        snapshot: bool = False,
+        regulatorySnapshot: bool = False,
+        mktDataOptions=None,
+    ) -> Ticker:
+        """Subscribe to a streaming ticker (filled on the first tick)."""
+        if not contract.conId:
+            self.qualifyContracts(contract)
+        ticker = self._streams.get(contract.conId)
+        if ticker is None:
+            ticker = self._streams[contract.conId] = Ticker(contract=contract)
+            self._update(ticker, time.time())
+            self._schedule(contract, time.time())
+        return ticker
+
+    def cancelMktData(self, contract):
+        """Stop a ticker stream."""
+        self._streams.pop(contract.conId, None)
+
+    def _schedule(self, contract, after: float):
+        """Queue the next tick of a stream (exponential inter-arrival)."""
+        rate = self.config.tick_rates.get(contract.secType, 0.0)
+        if rate <= 0:
+            return
+        due = after + self._rng.expovariate(rate)
+        for start, duration in self.config.gaps:
+            if self._t0 + start <= due < self._t0 + start + duration:
+                due = self._t0 + start + duration + self._rng.expovariate(rate)
+        self._seq += 1
+        heapq.heappush(self._queue, (due, self._seq, contract.conId))
+
+    def _move(self, now: float):
+        """Advance the ES random walk to ``now``."""
+        dt = now - self._last_move
+        if dt > 0:
+            self._es += self._rng.gauss(0.0, self.config.volatility * math.sqrt(dt))
+            self._last_move = now
+
+    def _update(self, ticker: Ticker, now: float):
+        """Refresh a ticker's fields from the simulated market."""
+        self._move(now)
+        c = ticker.contract
+        es = round(self._es * 4) / 4
+        iv = self.config.iv_annual * (1 + self._rng.uniform(-0.01, 0.01))
+        ticker.time = datetime.datetime.fromtimestamp(now, datetime.timezone.utc)
+        if c.secType == "FUT":
+            self._vwap_num += es
+            self._vwap_den += 1
+            ticker.last = es
+            ticker.close = self.config.es_price
+            ticker.bid, ticker.ask = es - 0.25, es
+            ticker.vwap = self._vwap_num / self._vwap_den
+            ticker.impliedVolatility = iv
+        elif c.secType == "IND":
+            spx = round((self._es - self.config.spx_spread) * 100) / 100
+            ticker.last = spx
+            if self._spx_open is None and local_now().time() >= datetime.time(15, 30):
+                self._spx_open = spx
+            ticker.open = self._spx_open if self._spx_open is not None else math.nan
+        elif c.secType == "FOP":
+            daily = self._es * iv / SQRT_252
+            intrinsic = (
+                max(0.0, es - c.strike) if c.right == "C" else max(0.0, c.strike - es)
+            )
+            mid = intrinsic + 0.4 * daily * math.exp(
+                -abs(c.strike - es) / max(daily, 1e-9)
+            )
+            half = max(0.125, round(mid * 0.01 * 4) / 4)
+            ticker.bid = max(0.05, round((mid - half) * 20) / 20)
+            ticker.ask = round((mid + half) * 20) / 20
+            ticker.last = round(mid * 20) / 20
+            ticker.impliedVolatility = iv
+
+    def _apply_due(self, now: float) -> int:
+        """Apply every tick due by ``now`` and emit one pending batch."""
+        pending = set()
+        queue = self._queue
+        n = 0
+        while queue and queue[0][0] <= now:
+            due, _, con_id = heapq.heappop(queue)
+            ticker = self._streams.get(con_id)
+            if ticker is None:
+                continue
+            self._update(ticker, due)
+            self.tick_log.append((due, now))
+            pending.add(ticker)
+            self._schedule(ticker.contract, due)
+            n += 1
+        if pending:
+            self.ticks_applied += n
+            self.pendingTickersEvent.emit(pending)
+        return n
+
+    def _run(self, timeout: float, until_update: bool) -> bool:
+        """Apply ticks in real time for up to ``timeout`` seconds."""
+        deadline = time.time() + max(0.0, timeout)
+        while True:
+            now = time.time()
+            if not self.isConnected():
+                return False
+            if self._apply_due(now) and until_update:
+                return True
+            if now >= deadline:
+                return not until_update
+            next_due = self._queue[0][0] if self._queue else deadline
+            time.sleep(max(0.0, min(next_due, deadline) - now))
+
+    def sleep(self, secs: float = 0.02) -> bool:
+        """Wait ``secs`` seconds while streaming ticks."""
+        return self._run(secs, until_update=False)
+
+    def waitOnUpdate(self, timeout: float = 0) -> bool:
+        """Wait for the next ticker update (False on timeout)."""
+        return self._run(timeout if timeout else 3600.0, until_update=True)
@@ -0,0 +1,69 @@
+"""Render-once cache for the fixed snapshots (FOTO 10:00, 15:30, 15:45).
+
+Snapshots are immutable once taken (SPEC_LOCK §6), so their rendered form is
+computed once per (slot, trade_date) and shared by every refresh and every
+connected viewer for the rest of the session. Entries are dropped at the
+22:01 day roll by :meth:`SnapshotCache.roll`.
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Hashable, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotCache:
+    """Rendered snapshots keyed by (slot, trade_date).
+
+    Attributes:
+        hits: Lookups served from the cache
+        misses: Lookups that rendered
+    """
+
+    def __init__(self, render: Callable[[str, Mapping[str, Any]], Any]):
+        """Initialize the cache.
+
+        Args:
+            render: Renders ``(slot, snapshot)``; called once per key
+        """
+        self.render = render
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[tuple[str, Hashable], Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, slot: str, snapshot: Optional[Mapping[str, Any]]) -> Any:
+        """Rendered form of a snapshot, rendering it on first use.
+
+        Args:
+            slot: Snapshot slot (e.g. "ES_10:00")
+            snapshot: Snapshot with a ``date`` field; None renders the empty
+                placeholder (also cached, under trade_date None)
+
+        Returns:
+            Rendered snapshot
+        """
+        key = (slot, snapshot.get("date") if snapshot else None)
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            rendered = self._entries[key] = self.render(slot, snapshot)
+            return rendered
+
+    def roll(self, trade_date: Optional[Hashable] = None):
+        """Drop all entries except those of ``trade_date`` (day roll, 22:01).
+
+        Args:
+            trade_date: Trade date to keep. Drops everything if None.
+        """
+        with self._lock:
+            stale = [
+                k for k in self._entries if k[1] is not None and k[1] != trade_date
+            ]
+            for key in stale:
+                del self._entries[key]
+        if stale:
+            logger.info(f"Snapshot cache rolled ({len(stale)} entries dropped)")
@@ -0,0 +1,158 @@
+"""Versioned, immutable state store shared by the IB worker and the UI.
+
+Replaces the global mutable ``STATE`` dict:
+- The worker publishes one frozen :class:`StateSnapshot` per cycle
+- Publishing swaps a single reference, so readers always see a complete,
+  consistent snapshot without taking a lock
+- Every publish increments ``version``; readers can skip work when the
+  version they rendered is still current, or block until a newer one exists
+- Recent snapshots are retained so readers can diff the version they last
+  rendered against the current one
+
+Values inside a snapshot must be treated as immutable: publish new objects
+instead of mutating ones already published.
+"""
+
+import threading
+import time
+from collections import deque
+from types import MappingProxyType
+from typing import Any, Iterator, Mapping, Optional
+
+
+class StateSnapshot(Mapping):
+    """Frozen, versioned view of the dashboard state.
+
+    Attributes:
+        version: Monotonically increasing publish counter
+        published: Epoch timestamp of the publish
+    """
+
+    __slots__ = ("version", "published", "_data")
+
+    def __init__(self, data: Mapping[str, Any], version: int, published: float):
+        self._data = MappingProxyType(dict(data))
+        self.version = version
+        self.published = published
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"StateSnapshot(version={self.version}, keys={len(self._data)})"
+
+
+class StateStore:
+    """Single-writer, many-reader store of :class:`StateSnapshot` records."""
+
+    def __init__(self, initial: Optional[Mapping[str, Any]] = None, history: int = 64):
+        """Create the store with version 0.
+
+        Args:
+            initial: Initial state values
+            history: Number of recent snapshots retained for :meth:`get`
+        """
+        self._current = StateSnapshot(initial or {}, 0, time.time())
+        self._history: deque = deque([self._current], maxlen=history)
+        self._write_lock = threading.Lock()
+        self._changed = threading.Condition()
+
+    @property
+    def current(self) -> StateSnapshot:
+        """Latest published snapshot (lock-free read)."""
+        return self._current
+
+    @property
+    def version(self) -> int:
+        """Version of the latest snapshot."""
+        return self._current.version
+
+    def publish(
+        self, changes: Optional[Mapping[str, Any]] = None, **kwargs
+    ) -> StateSnapshot:
+        """Publish a new snapshot with ``changes`` applied.
+
+        Args:
+            changes: Keys to update
+            **kwargs: Additional keys to update
+
+        Returns:
+            The newly published snapshot
+        """
+        with self._write_lock:
+            data = dict(self._current)
+            if changes:
+                data.update(changes)
+            data.update(kwargs)
+            snapshot = StateSnapshot(data, self._current.version + 1, time.time())
+            self._history.append(snapshot)
+            self._current = snapshot
+        with self._changed:
+            self._changed.notify_all()
+        return snapshot
+
+    def get(self, version: Optional[int]) -> Optional[StateSnapshot]:
+        """Return a retained snapshot by version, or None if evicted/unknown."""
+        if version is None:
+            return None
+        current = self._current
+        if version == current.version:
+            return current
+        for snapshot in reversed(self._history):
+            if snapshot.version == version:
+                return snapshot
+        return None
+
+    def changed(
+        self,
+        since: Optional[int],
+        keys=None,
+        current: Optional[StateSnapshot] = None,
+    ) -> Optional[set]:
+        """Keys whose values differ between version ``since`` and ``current``.
+
+        Values are compared by identity first, then equality.
+
+        Args:
+            since: Version previously seen by the reader
+            keys: Keys to compare. All keys if None.
+            current: Snapshot to compare against. Latest if None.
+
+        Returns:
+            Set of changed keys, or None if ``since`` is no longer retained
+            (caller should treat everything as changed)
+        """
+        old = self.get(since)
+        if old is None:
+            return None
+        new = current if current is not None else self._current
+        out = set()
+        for key in (keys if keys is not None else new.keys()):
+            a, b = old.get(key), new.get(key)
+            if a is not b and a != b:
+                out.add(key)
+        return out
+
+    def wait(
+        self, after_version: int, timeout: Optional[float] = None
+    ) -> StateSnapshot:
+        """Block until a snapshot newer than ``after_version`` is published.
+
+        Args:
+            after_version: Last version seen by the caller
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Latest snapshot (possibly unchanged if the timeout expired)
+        """
+        with self._changed:
+            self._changed.wait_for(
+                lambda: self._current.version > after_version, timeout
+            )
+        return self._current
@@ -0,0 +1,126 @@
+"""Event-driven tick pipeline for the IB worker.
+
+Replaces fixed-interval polling with push-based updates:
+- Tickers are registered under an input group ("es", "spx", "options", ...)
+- ``IB.pendingTickersEvent`` marks the groups of updated tickers as dirty
+- Bursts of quotes are coalesced into at most one flush per ``min_interval``
+- Callers recompute only the fields whose input groups are dirty
+"""
+
+import logging
+import time
+from typing import Optional, Set
+
+from ib_insync import Ticker
+
+from ..core.market_data import MarketDataSource
+
+logger = logging.getLogger(__name__)
+
+
+class TickPipeline:
+    """Coalescing dispatcher for ib_insync ticker updates.
+
+    Attributes:
+        ib: Market data source the pipeline is attached to
+        min_interval: Minimum seconds between two flushes
+        flush_count: Number of flushes performed
+        last_flush: Monotonic timestamp of the last flush
+    """
+
+    def __init__(self, ib: MarketDataSource, min_interval: float = 0.25):
+        """Attach the pipeline to an IB client.
+
+        Args:
+            ib: Connected ib_insync IB client (or another MarketDataSource)
+            min_interval: Minimum seconds between two flushes. Updates arriving
+                faster are merged into the next flush.
+        """
+        self.ib = ib
+        self.min_interval = min_interval
+        self.flush_count = 0
+        self.last_flush = 0.0
+        self._groups: dict[int, str] = {}
+        self._dirty: Set[str] = set()
+
+        self.ib.pendingTickersEvent += self._on_pending_tickers
+
+    @property
+    def dirty(self) -> Set[str]:
+        """Input groups changed since the last flush."""
+        return set(self._dirty)
+
+    def watch(self, ticker: Optional[Ticker], group: str):
+        """Register a ticker under an input group.
+
+        The group is marked dirty immediately so the first flush picks up
+        whatever the ticker already holds.
+
+        Args:
+            ticker: Ticker returned by ``reqMktData`` (ignored if None)
+            group: Input group name
+        """
+        if ticker is None:
+            return
+        self._groups[id(ticker)] = group
+        self._dirty.add(group)
+
+    def unwatch(self, ticker: Optional[Ticker]):
+        """Stop tracking a ticker (e.g. after ``cancelMktData``)."""
+        if ticker is not None:
+            self._groups.pop(id(ticker), None)
+
+    def mark(self, group: str):
+        """Mark a group dirty without a ticker update (e.g. a clock event)."""
+        self._dirty.add(group)
+
+    def _on_pending_tickers(self, tickers):
+        """Handle a batch of updated tickers from IB."""
+        groups = self._groups
+        for ticker in tickers:
+            group = groups.get(id(ticker))
+            if group is not None:
+                self._dirty.add(group)
+
+    def poll(self, timeout: float) -> Set[str]:
+        """Service IB until a flush is due or ``timeout`` elapses.
+
+        Returns as soon as dirty groups exist and ``min_interval`` has passed
+        since the previous flush. Updates received while waiting for the
+        interval to elapse are coalesced into the same flush.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Set of dirty input groups (empty on timeout without updates)
+        """
+        deadline = time.monotonic() + max(0.0, timeout)
+        while True:
+            now = time.monotonic()
+            remaining = deadline - now
+            if self._dirty:
+                wait = self.last_flush + self.min_interval - now
+                if wait <= 0 or remaining <= 0:
+                    return self.flush()
+                self.ib.sleep(min(wait, remaining))
+            elif remaining <= 0:
+                return set()
+            else:
+                self.ib.waitOnUpdate(timeout=remaining)
+            if not self.ib.isConnected():
+                return self.flush()
+
+    def flush(self) -> Set[str]:
+        """Return and clear the dirty groups."""
+        dirty, self._dirty = self._dirty, set()
+        if dirty:
+            self.flush_count += 1
+            self.last_flush = time.monotonic()
+        return dirty
+
+    def close(self):
+        """Detach from the IB client."""
+        self.ib.pendingTickersEvent -= self._on_pending_tickers
+        self._groups.clear()
+        self._dirty.clear()
@@ -1,12 +1,15 @@
 """Core module for ES Trading Dashboard."""
 
+from .calendar import TradeCalendar
 from .config import Config
+from .connection import IBConnection
 from .exceptions import (
+    ConfigurationError,
     IBConnectionError,
     IBTimeoutError,
-    ConfigurationError,
 )
-from .connection import IBConnection
+from .market_data import MarketDataSource
+from .supervisor import ConnectionSupervisor
 
 __all__ = [
     "Config",
@@ -14,4 +17,7 @@ __all__ = [
     "IBTimeoutError",
     "ConfigurationError",
     "IBConnection",
+    "ConnectionSupervisor",
+    "MarketDataSource",
+    "TradeCalendar",
 ]
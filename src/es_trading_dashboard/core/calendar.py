@@ -0,0 +1,245 @@
+"""Trade date and session-window calendar (SPEC_LOCK §1, §5, §6, §15).
+
+A trade date runs from 02:15 Europe/Zurich to the next day's 02:15; it is
+split into windows named by the local time they start at::
+
+    02:15  session start          15:45  second fixed snapshot
+    10:00  morning snapshot       22:00  session end
+    15:30  SPX open / afternoon   22:01  finalize, 0DTE switch to next expiry
+
+so 00:00-02:14 belongs to the ``22:01`` window of the previous trade date.
+:class:`TradeCalendar` precomputes the UTC instant of every boundary of a
+date range (DST-aware: a boundary in the spring gap moves to 03:00, the
+autumn 02:00-02:59 repeat uses its first 02:15), and maps timestamp arrays
+to (trade_date, window) with a single ``searchsorted``. The scalar helpers
+apply the same rules to the live clock; :func:`path_date` reads the trade
+date of dated raw files (``..._2026-03-11.csv.zst``, ``20260311``).
+"""
+
+import bisect
+import datetime
+import re
+from dataclasses import dataclass
+from typing import Optional
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+
+from .exceptions import ConfigurationError
+from .spec import (
+    FINALIZE_TIME,
+    SESSION_END,
+    SESSION_START,
+    SNAP_1000,
+    SNAP_1530,
+    SNAP_1545,
+    TIMEZONE,
+)
+
+# Window name -> local start time, in session order
+WINDOWS = {
+    "02:15": SESSION_START,
+    "10:00": SNAP_1000,
+    "15:30": SNAP_1530,
+    "15:45": SNAP_1545,
+    "22:00": SESSION_END,
+    "22:01": FINALIZE_TIME,
+}
+WINDOW_NAMES = tuple(WINDOWS)
+_STARTS = tuple(WINDOWS.values())
+
+_TZ = ZoneInfo(TIMEZONE)
+
+_DATE_RE = re.compile(r"(?<!\d)(20\d{2})-?(\d{2})-?(\d{2})(?!\d)")
+
+
+def local_now() -> datetime.datetime:
+    """Current Europe/Zurich wall-clock time (naive), whatever the host timezone."""
+    return datetime.datetime.now(_TZ).replace(tzinfo=None)
+
+
+def path_date(path: str) -> Optional[datetime.date]:
+    """Trade date in a file path (first valid match), or None if undated."""
+    for match in _DATE_RE.finditer(path):
+        try:
+            return datetime.date(*(int(g) for g in match.groups()))
+        except ValueError:
+            continue
+    return None
+
+
+def _local(ts: datetime.datetime) -> datetime.datetime:
+    """Zurich local time of a timestamp (naive timestamps already are)."""
+    return ts if ts.tzinfo is None else ts.astimezone(_TZ)
+
+
+def trade_date(ts: datetime.datetime) -> datetime.date:
+    """Trade date of a timestamp (before 02:15 -> previous session).
+
+    Args:
+        ts: Aware timestamp, or naive Europe/Zurich local time
+
+    Returns:
+        Trade date
+    """
+    ts = _local(ts)
+    # fold=1: second pass of the autumn 02:00-02:59, after the first 02:15
+    if (ts.hour, ts.minute) < SESSION_START and not ts.fold:
+        return ts.date() - datetime.timedelta(days=1)
+    return ts.date()
+
+
+def window(ts: datetime.datetime) -> str:
+    """Name of the window containing a timestamp (aware or naive Zurich local)."""
+    ts = _local(ts)
+    hm = (ts.hour, ts.minute)
+    if hm < SESSION_START:
+        return WINDOW_NAMES[0] if ts.fold else WINDOW_NAMES[-1]
+    return WINDOW_NAMES[bisect.bisect_right(_STARTS, hm) - 1]
+
+
+def zero_dte_expiry(ts: datetime.datetime) -> datetime.date:
+    """0DTE expiry traded at a timestamp.
+
+    The trade date's own expiry until 22:01, the next business day's from
+    22:01 (the finalize switch); weekend trade dates roll forward too.
+
+    Args:
+        ts: Aware timestamp, or naive Europe/Zurich local time
+
+    Returns:
+        Expiry date
+    """
+    day = np.datetime64(trade_date(ts), "D") + int(window(ts) == WINDOW_NAMES[-1])
+    return np.busday_offset(day, 0, roll="forward").astype(datetime.date)
+
+
+@dataclass(frozen=True)
+class TradeCalendar:
+    """UTC boundaries of every window of a range of trade dates.
+
+    Attributes:
+        days: ``datetime64[D]`` calendar days (every day, weekends included)
+        bounds: int64 ns since epoch, ``(days, windows)``; row ``i`` holds
+            the window starts of ``days[i]`` in ``WINDOW_NAMES`` order
+        end: int64 ns of the first instant after the range (02:15 of the
+            day after the last one)
+    """
+
+    days: np.ndarray
+    bounds: np.ndarray
+    end: int
+
+    @classmethod
+    def build(cls, start: datetime.date, end: datetime.date) -> "TradeCalendar":
+        """Calendar of the trade dates ``start`` to ``end`` (inclusive).
+
+        Args:
+            start: First trade date
+            end: Last trade date
+
+        Returns:
+            Calendar with one row per calendar day
+        """
+        days = np.arange(np.datetime64(start, "D"), np.datetime64(end, "D") + 2)
+        midnight = pd.DatetimeIndex(days.astype("datetime64[ns]"))
+        bounds = np.empty((len(days), len(WINDOWS)), dtype=np.int64)
+        for j, (hour, minute) in enumerate(WINDOWS.values()):
+            local = (midnight + pd.Timedelta(hours=hour, minutes=minute)).tz_localize(
+                TIMEZONE,
+                ambiguous=np.ones(len(days), dtype=bool),
+                nonexistent="shift_forward",
+            )
+            bounds[:, j] = local.tz_convert("UTC").as_unit("ns").asi8
+        return cls(days[:-1], bounds[:-1], int(bounds[-1, 0]))
+
+    @classmethod
+    def covering(cls, ts_utc: np.ndarray) -> "TradeCalendar":
+        """Smallest calendar containing every timestamp of ``ts_utc`` (int64 ns).
+
+        Raises:
+            ConfigurationError: If ``ts_utc`` is empty
+        """
+        ts_utc = np.asarray(ts_utc, dtype=np.int64)
+        if not len(ts_utc):
+            raise ConfigurationError("Cannot build a calendar for no timestamps")
+        first = np.datetime64(int(ts_utc.min()), "ns").astype("datetime64[D]") - 1
+        last = np.datetime64(int(ts_utc.max()), "ns").astype("datetime64[D]")
+        return cls.build(first.astype(datetime.date), last.astype(datetime.date))
+
+    def boundary(self, name: str, days: Optional[np.ndarray] = None) -> np.ndarray:
+        """UTC start (int64 ns) of window ``name`` on each day.
+
+        Args:
+            name: Window name (``WINDOW_NAMES``)
+            days: ``datetime64[D]`` days within the calendar. All if None.
+
+        Raises:
+            ConfigurationError: If the window is unknown or a day is outside
+                the calendar
+        """
+        if name not in WINDOWS:
+            raise ConfigurationError(
+                f"Unknown window {name!r}; expected one of {WINDOW_NAMES}"
+            )
+        column = self.bounds[:, WINDOW_NAMES.index(name)]
+        if days is None:
+            return column
+        rows = (np.asarray(days, dtype="datetime64[D]") - self.days[0]).astype(np.int64)
+        if len(rows) and (rows.min() < 0 or rows.max() >= len(self.days)):
+            raise ConfigurationError(
+                f"Days outside the calendar {self.days[0]}..{self.days[-1]}"
+            )
+        return column[rows]
+
+    def locate(self, ts_utc: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Trade date and window of UTC timestamps (one binary search).
+
+        Args:
+            ts_utc: int64 nanoseconds since epoch, any order
+
+        Returns:
+            Tuple (``datetime64[D]`` trade dates, window indexes into
+            ``WINDOW_NAMES``)
+
+        Raises:
+            ConfigurationError: If a timestamp is outside the calendar
+        """
+        ts_utc = np.asarray(ts_utc, dtype=np.int64)
+        flat = self.bounds.ravel()
+        pos = np.searchsorted(flat, ts_utc, "right") - 1
+        if len(ts_utc) and (pos.min() < 0 or ts_utc.max() >= self.end):
+            raise ConfigurationError(
+                f"Timestamps outside the calendar {self.days[0]}..{self.days[-1]}"
+            )
+        n = len(WINDOWS)
+        return self.days[pos // n], pos % n
+
+
+def locate(ts_utc: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Trade date and window of UTC nanosecond timestamps (any range).
+
+    Args:
+        ts_utc: int64 nanoseconds since epoch
+
+    Returns:
+        Tuple (``datetime64[D]`` trade dates, window indexes into
+        ``WINDOW_NAMES``)
+    """
+    ts_utc = np.asarray(ts_utc, dtype=np.int64)
+    if not len(ts_utc):
+        return np.empty(0, dtype="datetime64[D]"), np.empty(0, dtype=np.int64)
+    return TradeCalendar.covering(ts_utc).locate(ts_utc)
+
+
+def trade_dates(ts_utc: np.ndarray) -> np.ndarray:
+    """Trade date of UTC nanosecond timestamps (vectorized :func:`trade_date`).
+
+    Args:
+        ts_utc: int64 nanoseconds since epoch
+
+    Returns:
+        ``datetime64[D]`` array
+    """
+    return locate(ts_utc)[0]
@@ -3,7 +3,7 @@
 import os
 import random
 from functools import lru_cache
-from typing import Literal
+from typing import Literal, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -56,3 +56,25 @@ class Settings(BaseSettings):
 def get_settings() -> Settings:
     """Get cached settings instance."""
     return Settings()
+
+
+class Config:
+    """Flat IB connection parameters consumed by the connection layer.
+
+    Mirrors :class:`IBSettings` using the upper-case attribute names expected
+    by :class:`~es_trading_dashboard.core.connection.IBConnection`.
+    """
+
+    CLIENT_ID_MIN: int = 100
+    CLIENT_ID_MAX: int = 999
+
+    def __init__(self, settings: Optional[Settings] = None):
+        """Initialize from application settings.
+
+        Args:
+            settings: Settings instance. Uses cached settings if not provided.
+        """
+        settings = settings or get_settings()
+        self.IB_HOST: str = settings.ib.host
+        self.IB_PORT: int = settings.ib.port
+        self.IB_TIMEOUT: int = settings.ib.timeout
@@ -2,8 +2,11 @@
 
 Handles connection to Interactive Brokers TWS/Gateway with:
 - Automatic clientId selection to avoid conflicts with ATAS
-- Connection retry logic
+- Connection retry logic with jittered exponential backoff
 - Graceful disconnection
+
+Long-running collectors keep the link up through
+:class:`~es_trading_dashboard.core.supervisor.ConnectionSupervisor`.
 """
 
 import asyncio
@@ -15,49 +18,72 @@ from ib_insync import IB, Contract
 
 from .config import Config
 from .exceptions import (
+    ClientIdConflictError,
     IBConnectionError,
     IBTimeoutError,
-    ClientIdConflictError,
 )
+from .market_data import MarketDataSource
 
 logger = logging.getLogger(__name__)
 
 
+def backoff_delay(
+    failures: int, initial: float = 0.5, maximum: float = 30.0, jitter: float = 0.25
+) -> float:
+    """Jittered exponential backoff delay.
+
+    Args:
+        failures: Consecutive failures so far (0 for the first retry)
+        initial: Delay after the first failure, in seconds
+        maximum: Delay cap, in seconds
+        jitter: Relative random spread (0.25 -> ±25%)
+
+    Returns:
+        Seconds to wait before the next attempt
+    """
+    delay = min(maximum, initial * 2 ** min(failures, 32))
+    return delay * random.uniform(1 - jitter, 1 + jitter)
+
+
 class IBConnection:
     """Manages connection to Interactive Brokers.
-    
+
     Attributes:
         config: Configuration object with IB settings
-        ib: ib_insync IB client instance
+        ib: Market data source (ib_insync IB client by default)
         _connected: Connection state flag
     """
-    
-    def __init__(self, config: Optional[Config] = None):
+
+    def __init__(
+        self, config: Optional[Config] = None, ib: Optional[MarketDataSource] = None
+    ):
         """Initialize IB connection manager.
-        
+
         Args:
             config: Configuration object. Uses default if not provided.
+            ib: Market data source (e.g. ``SimulatedIB``). A new ib_insync
+                IB client if not provided.
         """
         self.config = config or Config()
-        self.ib = IB()
+        self.ib = ib if ib is not None else IB()
         self._connected = False
         self._current_client_id: Optional[int] = None
-        
+
         # Setup event handlers
         self.ib.connectedEvent += self._on_connected
         self.ib.disconnectedEvent += self._on_disconnected
         self.ib.errorEvent += self._on_error
-    
+
     @property
     def connected(self) -> bool:
         """Check if connected to IB."""
         return self._connected and self.ib.isConnected()
-    
+
     @property
     def client_id(self) -> Optional[int]:
         """Get current clientId."""
         return self._current_client_id
-    
+
     def _get_random_client_id(self) -> int:
         """Generate random clientId in configured range.
         
@@ -68,7 +94,7 @@ class IBConnection:
             self.config.CLIENT_ID_MIN,
             self.config.CLIENT_ID_MAX
         )
-    
+
     def _on_connected(self):
         """Handle successful connection."""
         self._connected = True
@@ -76,12 +102,12 @@ class IBConnection:
             f"Connected to IB: {self.config.IB_HOST}:{self.config.IB_PORT} "
             f"(clientId={self._current_client_id})"
         )
-    
+
     def _on_disconnected(self):
         """Handle disconnection."""
         self._connected = False
         logger.warning("Disconnected from IB")
-    
+
     def _on_error(self, reqId: int, errorCode: int, errorString: str, contract: Contract):
         """Handle IB errors.
         
@@ -95,11 +121,46 @@ class IBConnection:
         if errorCode == 326:
             logger.error(f"ClientId conflict: {errorString}")
             raise ClientIdConflictError(self._current_client_id or 0)
-        
+
         # Log other errors
         if errorCode not in (2104, 2106, 2158):  # Info messages
             logger.error(f"IB Error {errorCode}: {errorString}")
-    
+
+    def connect_once(self, client_id: Optional[int] = None) -> bool:
+        """Make a single blocking connection attempt.
+
+        Args:
+            client_id: ClientId to use. Random in the configured range if None.
+
+        Returns:
+            True if connected
+
+        Raises:
+            IBConnectionError: If the attempt fails
+            IBTimeoutError: If the attempt times out
+        """
+        if client_id is None:
+            client_id = self._get_random_client_id()
+        self._current_client_id = client_id
+        try:
+            self.ib.connect(
+                host=self.config.IB_HOST,
+                port=self.config.IB_PORT,
+                clientId=self._current_client_id,
+                timeout=self.config.IB_TIMEOUT,
+                readonly=True,
+            )
+        except (asyncio.TimeoutError, TimeoutError):
+            raise IBTimeoutError("Connection timed out", timeout=self.config.IB_TIMEOUT)
+        except IBConnectionError:
+            raise
+        except Exception as e:
+            raise IBConnectionError(str(e) or type(e).__name__)
+        self._connected = self.ib.isConnected()
+        if not self._connected:
+            raise IBConnectionError("Connection closed during handshake")
+        return True
+
     async def connect(self, max_retries: int = 3) -> bool:
         """Connect to IB with automatic clientId selection.
         
@@ -118,12 +179,12 @@ class IBConnection:
         for attempt in range(max_retries):
             try:
                 self._current_client_id = self._get_random_client_id()
-                
+
                 logger.info(
                     f"Connecting to IB (attempt {attempt + 1}/{max_retries}, "
                     f"clientId={self._current_client_id})..."
                 )
-                
+
                 await asyncio.wait_for(
                     self.ib.connectAsync(
                         host=self.config.IB_HOST,
@@ -133,11 +194,11 @@ class IBConnection:
                     ),
                     timeout=self.config.IB_TIMEOUT
                 )
-                
+
                 if self.ib.isConnected():
                     self._connected = True
                     return True
-                    
+
             except asyncio.TimeoutError:
                 logger.warning(f"Connection attempt {attempt + 1} timed out")
                 if attempt == max_retries - 1:
@@ -145,20 +206,23 @@ class IBConnection:
                         "Connection timed out",
                         timeout=self.config.IB_TIMEOUT
                     )
-                    
+
             except ClientIdConflictError:
                 logger.warning(
                     f"ClientId {self._current_client_id} in use, trying another..."
                 )
                 continue
-                
+
             except Exception as e:
                 logger.error(f"Connection error: {e}")
                 if attempt == max_retries - 1:
                     raise IBConnectionError(str(e))
-        
+
+            if attempt < max_retries - 1:
+                await asyncio.sleep(backoff_delay(attempt))
+
         raise IBConnectionError("All connection attempts failed")
-    
+
     async def disconnect(self):
         """Gracefully disconnect from IB."""
         if self.ib.isConnected():
@@ -166,12 +230,12 @@ class IBConnection:
             self.ib.disconnect()
             self._connected = False
             self._current_client_id = None
-    
+
     async def __aenter__(self):
         """Async context manager entry."""
         await self.connect()
         return self
-    
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
         await self.disconnect()
@@ -0,0 +1,87 @@
+"""Market data source interface.
+
+The subset of ``ib_insync.IB`` used by the collector and ``IBConnection``.
+``ib_insync.IB`` satisfies it as is; ``collector.simulator.SimulatedIB``
+implements it locally for offline runs, load tests and benchmarks.
+
+Ticker updates must be applied, and ``pendingTickersEvent`` emitted, on the
+thread calling :meth:`MarketDataSource.sleep` / ``waitOnUpdate``, as
+ib_insync does from its event loop.
+"""
+
+from typing import Any, Protocol, runtime_checkable
+
+
+@runtime_checkable
+class MarketDataSource(Protocol):
+    """Connection, contract lookup and streaming market data."""
+
+    connectedEvent: Any
+    disconnectedEvent: Any
+    errorEvent: Any
+    pendingTickersEvent: Any
+
+    def connect(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 7497,
+        clientId: int = 1,
+        timeout: float = 4,
+        readonly: bool = False,
+        account: str = "",
+    ) -> Any: ...
+
+    async def connectAsync(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 7497,
+        clientId: int = 1,
+        timeout: float = 4,
+        readonly: bool = False,
+        account: str = "",
+    ) -> Any: ...
+
+    def disconnect(self) -> None: ...
+
+    def isConnected(self) -> bool: ...
+
+    def reqContractDetails(self, contract) -> list: ...
+
+    def qualifyContracts(self, *contracts) -> list: ...
+
+    def reqSecDefOptParams(
+        self,
+        underlyingSymbol: str,
+        futFopExchange: str,
+        underlyingSecType: str,
+        underlyingConId: int,
+    ) -> list: ...
+
+    def reqMktData(
+        self,
+        contract,
+        genericTickList: str = "",
+        snapshot: bool = False,
+        regulatorySnapshot: bool = False,
+        mktDataOptions=None,
+    ) -> Any: ...
+
+    def cancelMktData(self, contract) -> None: ...
+
+    def reqHistoricalData(
+        self,
+        contract,
+        endDateTime,
+        durationStr: str,
+        barSizeSetting: str,
+        whatToShow: str,
+        useRTH: bool,
+        formatDate: int = 1,
+        keepUpToDate: bool = False,
+        chartOptions=None,
+        timeout: float = 60,
+    ) -> list: ...
+
+    def sleep(self, secs: float = 0.02) -> bool: ...
+
+    def waitOnUpdate(self, timeout: float = 0) -> bool: ...
@@ -0,0 +1,88 @@
+"""Vectorized range kernel (SPEC_LOCK §5, §6).
+
+Every range level is a linear combination of the base and the two range
+widths::
+
+    level = base + R1_pts * r1_coef + R2_pts * r2_coef (+ spread)
+    R1_pts = base * iv_daily,  R2_pts = base * iv_straddle
+
+so the nine ``ORDER_KEYS`` levels of any number of (base, iv_daily,
+iv_straddle, spread) tuples are computed in one broadcast call. Results are
+``(..., 9)`` float arrays in ``ORDER_KEYS`` order with NaN where an input is
+missing; they are bit-identical to the scalar formulas.
+
+The same kernel serves the live collector (one row per step), research
+backtests over thousands of days and the MASTER_OUTPUT range engine
+(:func:`~es_trading_dashboard.master_output.range_engine.range_table`).
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from .spec import FIB_DN, FIB_UP, ORDER_KEYS
+
+# (R1 coefficient, R2 coefficient) per level
+_COEFFS = {
+    "FIBO EST R1 UP": (FIB_UP, 0.0),
+    "FIBO EST R2 UP": (0.0, FIB_UP),
+    "R1 UP": (1.0, 0.0),
+    "R2 UP": (0.0, 1.0),
+    "CENTER": (0.0, 0.0),
+    "R2 DOWN": (0.0, -1.0),
+    "R1 DOWN": (-1.0, 0.0),
+    "FIBO EST R2 DOWN": (0.0, -FIB_DN),
+    "FIBO EST R1 DOWN": (-FIB_DN, 0.0),
+}
+
+R1_COEF = np.array([_COEFFS[k][0] for k in ORDER_KEYS])
+R2_COEF = np.array([_COEFFS[k][1] for k in ORDER_KEYS])
+LEVEL_INDEX = {key: i for i, key in enumerate(ORDER_KEYS)}
+N_LEVELS = len(ORDER_KEYS)
+
+
+def range_levels(
+    base,
+    iv_daily,
+    iv_straddle,
+    spread=None,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Compute all range levels for broadcastable inputs.
+
+    Args:
+        base: Range center(s): ES VWAP or SPX official open
+        iv_daily: Daily IV as a fraction (IV% / 100)
+        iv_straddle: Straddle IV as a fraction
+        spread: Added to every level (SPX -> ES projection). None for none.
+        out: Optional preallocated ``(..., 9)`` output array
+
+    Returns:
+        Float array of shape ``broadcast(inputs).shape + (9,)``, columns in
+        ``ORDER_KEYS`` order (see ``LEVEL_INDEX``); NaN rows where any input
+        is missing (None/NaN)
+    """
+    inputs = [base, iv_daily, iv_straddle] + ([] if spread is None else [spread])
+    columns = [np.asarray(x, dtype=float)[..., None] for x in inputs]
+    shape = np.broadcast_shapes(*(c.shape for c in columns))[:-1] + (N_LEVELS,)
+    if out is None:
+        out = np.empty(shape)
+    base, iv_daily, iv_straddle = columns[:3]
+    np.multiply(base * iv_daily, R1_COEF, out=out)
+    out += (base * iv_straddle) * R2_COEF
+    out += base
+    if spread is not None:
+        out += columns[3]
+    return out
+
+
+def level_dict(levels: np.ndarray) -> dict:
+    """One row of levels as ``{ORDER_KEYS: value}`` (NaN -> None).
+
+    Returns:
+        Empty dict if the row is missing (NaN center)
+    """
+    values = levels.tolist()
+    if values[LEVEL_INDEX["CENTER"]] != values[LEVEL_INDEX["CENTER"]]:
+        return {}
+    return {key: (None if v != v else v) for key, v in zip(ORDER_KEYS, values)}
@@ -0,0 +1,57 @@
+"""Locked specification constants (see SPEC_LOCK.md).
+
+Changing any value here requires a MODEL_VERSION bump.
+"""
+
+MODEL_VERSION = "RANGE_ENGINE_v1"
+TIMEZONE = "Europe/Zurich"
+
+# --- Trade date (SPEC_LOCK §1): session 02:15-22:00, earlier belongs to prior day ---
+SESSION_START = (2, 15)
+SESSION_END = (22, 0)
+
+# --- Volatility / ranges (SPEC_LOCK §5, §6, §9) ---
+SQRT_252 = 252**0.5
+FIB_UP = 1.618
+FIB_DN = 0.618
+
+ORDER_KEYS = [
+    "FIBO EST R1 UP",
+    "FIBO EST R2 UP",
+    "R1 UP",
+    "R2 UP",
+    "CENTER",
+    "R2 DOWN",
+    "R1 DOWN",
+    "FIBO EST R2 DOWN",
+    "FIBO EST R1 DOWN",
+]
+
+# Column codes used in CSV/Parquet outputs, aligned with ORDER_KEYS
+LEVEL_CODES = {
+    "FIBO EST R1 UP": "FIB_R1_UP",
+    "FIBO EST R2 UP": "FIB_R2_UP",
+    "R1 UP": "R1_UP",
+    "R2 UP": "R2_UP",
+    "CENTER": "CENTER",
+    "R2 DOWN": "R2_DN",
+    "R1 DOWN": "R1_DN",
+    "FIBO EST R2 DOWN": "FIB_R2_DN",
+    "FIBO EST R1 DOWN": "FIB_R1_DN",
+}
+
+# --- ATM straddle / strike window (SPEC_LOCK §8, §11) ---
+STRIKE_STEP = 5.0
+STRIKE_WINDOW = 100.0
+
+# --- Range events (SPEC_LOCK §7) ---
+TOUCH_BUFFER = 0.25
+TOUCH_COOLDOWN_SEC = 30
+BREAKOUT_WINDOW_SEC = 5 * 60
+
+# --- Fixed snapshots and finalize (SPEC_LOCK §5, §6, §15) ---
+SNAP_1000 = (10, 0)
+SNAP_1530 = (15, 30)
+SNAP_1545 = (15, 45)
+FINALIZE_TIME = (22, 1)
+LOG_INTERVAL_SEC = 10
@@ -0,0 +1,275 @@
+"""Connection supervisor for long-running IB collectors.
+
+Keeps one :class:`~es_trading_dashboard.core.connection.IBConnection` alive:
+- Reconnects with jittered exponential backoff (0.5s, 1s, 2s, ... capped),
+  reset once a connection has stayed up for ``stable_after`` seconds
+- Detects stalled links: no ticker update for ``stall_timeout`` seconds
+  (market data is the heartbeat) lets the caller drop and reconnect
+- Records the active ``reqMktData`` subscriptions and replays them on
+  reconnect, so callers keep their contracts, strike and session state
+
+The supervisor forwards the :class:`MarketDataSource` calls, so
+``ChainManager`` and ``TickPipeline`` run on it unchanged while their
+subscriptions are tracked.
+"""
+
+import logging
+import time
+from typing import Any, Optional
+
+from ib_insync import Contract, Ticker
+
+from .connection import IBConnection, backoff_delay
+from .exceptions import ClientIdConflictError, IBConnectionError, IBTimeoutError
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionSupervisor:
+    """Reconnecting, subscription-restoring wrapper of an IBConnection.
+
+    Attributes:
+        connection: Supervised connection
+        client_id: Preferred clientId (random after a conflict)
+        backoff_initial: First reconnect delay, in seconds
+        backoff_max: Reconnect delay cap, in seconds
+        jitter: Relative random spread of the delays
+        stall_timeout: Seconds without ticker updates before :meth:`stalled`
+        stable_after: Uptime after which the backoff is reset
+        connects: Successful connects so far
+        failures: Consecutive failed attempts or short-lived connections
+        last_update: Monotonic time of the last ticker update
+    """
+
+    def __init__(
+        self,
+        connection: IBConnection,
+        client_id: Optional[int] = None,
+        backoff_initial: float = 0.5,
+        backoff_max: float = 30.0,
+        jitter: float = 0.25,
+        stall_timeout: float = 30.0,
+        stable_after: float = 60.0,
+    ):
+        """Wrap a connection (nothing is connected until :meth:`connect`).
+
+        Args:
+            connection: Connection to supervise
+            client_id: Preferred clientId. Random in the configured range if None.
+            backoff_initial: First reconnect delay, in seconds
+            backoff_max: Reconnect delay cap, in seconds
+            jitter: Relative random spread of the delays
+            stall_timeout: Seconds without ticker updates before :meth:`stalled`
+            stable_after: Uptime after which the backoff is reset
+        """
+        self.connection = connection
+        self.client_id = client_id
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.stall_timeout = stall_timeout
+        self.stable_after = stable_after
+        self.connects = 0
+        self.failures = 0
+        self.last_update = 0.0
+        self._connected_at: Optional[float] = None
+        self._subscriptions: dict[Any, tuple[Contract, str]] = {}
+        self._tickers: dict[Any, Ticker] = {}
+
+        # Events of the underlying source (the same object across reconnects)
+        self.connectedEvent = self.ib.connectedEvent
+        self.disconnectedEvent = self.ib.disconnectedEvent
+        self.errorEvent = self.ib.errorEvent
+        self.pendingTickersEvent = self.ib.pendingTickersEvent
+
+        self.ib.pendingTickersEvent += self._on_pending_tickers
+        self.ib.disconnectedEvent += self._on_disconnected
+
+    @property
+    def ib(self):
+        """Underlying market data source (kept across reconnects)."""
+        return self.connection.ib
+
+    @property
+    def subscriptions(self) -> int:
+        """Active streaming subscriptions."""
+        return len(self._subscriptions)
+
+    @staticmethod
+    def _key(contract: Contract) -> Any:
+        return contract.conId or id(contract)
+
+    # --- Connection ---
+
+    def connect(self, stop=None) -> bool:
+        """Connect, retrying with backoff, and restore the subscriptions.
+
+        Returns immediately if already connected.
+
+        Args:
+            stop: Optional ``threading.Event`` that aborts the retries
+
+        Returns:
+            True once connected, False if ``stop`` was set
+        """
+        while not self.ib.isConnected():
+            if self.failures:
+                delay = backoff_delay(
+                    self.failures - 1,
+                    self.backoff_initial,
+                    self.backoff_max,
+                    self.jitter,
+                )
+                logger.info(f"Reconnecting in {delay:.1f}s (failure {self.failures})")
+                if stop is not None:
+                    if stop.wait(delay):
+                        return False
+                else:
+                    time.sleep(delay)
+            elif stop is not None and stop.is_set():
+                return False
+            try:
+                self.connection.connect_once(self.client_id)
+            except ClientIdConflictError as e:
+                logger.warning(f"{e}, switching to a random clientId")
+                self.client_id = None
+                self.failures += 1
+            except (IBConnectionError, IBTimeoutError) as e:
+                logger.warning(f"Connect failed: {e}")
+                self.failures += 1
+        self.connects += 1
+        self._connected_at = self.last_update = time.monotonic()
+        restored = self.restore()
+        if restored:
+            logger.info(f"Restored {restored} market data subscriptions")
+        return True
+
+    def drop(self, reason: str):
+        """Disconnect so the next :meth:`connect` starts over.
+
+        Args:
+            reason: Logged cause (stall, worker error, ...)
+        """
+        logger.warning(f"Dropping IB connection: {reason}")
+        self._on_disconnected()
+        if self.ib.isConnected():
+            self.ib.disconnect()
+
+    def stalled(self) -> bool:
+        """Whether a connected link delivered no ticker update for ``stall_timeout``."""
+        return (
+            self.ib.isConnected()
+            and bool(self._subscriptions)
+            and time.monotonic() - self.last_update > self.stall_timeout
+        )
+
+    def _on_disconnected(self):
+        """Grow the backoff if the connection was short-lived."""
+        if self._connected_at is None:
+            return
+        uptime = time.monotonic() - self._connected_at
+        self._connected_at = None
+        self.failures = 0 if uptime >= self.stable_after else self.failures + 1
+        self._tickers.clear()
+
+    def _on_pending_tickers(self, tickers):
+        self.last_update = time.monotonic()
+
+    # --- Subscriptions ---
+
+    def restore(self) -> int:
+        """Re-request every recorded subscription.
+
+        Returns:
+            Number of subscriptions replayed
+        """
+        for key, (contract, generic_ticks) in self._subscriptions.items():
+            self._tickers[key] = self.ib.reqMktData(
+                contract, generic_ticks, snapshot=False
+            )
+        return len(self._subscriptions)
+
+    def ticker(self, contract: Contract) -> Optional[Ticker]:
+        """Current ticker of a subscribed contract (new object after a reconnect)."""
+        return self._tickers.get(self._key(contract))
+
+    def reqMktData(
+        self,
+        contract,
+        genericTickList: str = "",
+        snapshot: bool = False,
+        regulatorySnapshot: bool = False,
+        mktDataOptions=None,
+    ) -> Ticker:
+        """Subscribe (streaming requests are recorded for :meth:`restore`)."""
+        if snapshot or regulatorySnapshot:
+            return self.ib.reqMktData(
+                contract, genericTickList, snapshot, regulatorySnapshot, mktDataOptions
+            )
+        key = self._key(contract)
+        ticker = self._tickers.get(key)
+        if ticker is None:
+            ticker = self._tickers[key] = self.ib.reqMktData(
+                contract, genericTickList, False
+            )
+        self._subscriptions[key] = (contract, genericTickList)
+        return ticker
+
+    def cancelMktData(self, contract):
+        """Unsubscribe and forget the subscription."""
+        key = self._key(contract)
+        self._subscriptions.pop(key, None)
+        self._tickers.pop(key, None)
+        if self.ib.isConnected():
+            self.ib.cancelMktData(contract)
+
+    # --- MarketDataSource delegation ---
+
+    def disconnect(self):
+        self.ib.disconnect()
+
+    def isConnected(self) -> bool:
+        return self.ib.isConnected()
+
+    def reqContractDetails(self, contract) -> list:
+        return self.ib.reqContractDetails(contract)
+
+    def qualifyContracts(self, *contracts) -> list:
+        return self.ib.qualifyContracts(*contracts)
+
+    def reqSecDefOptParams(
+        self,
+        underlyingSymbol: str,
+        futFopExchange: str,
+        underlyingSecType: str,
+        underlyingConId: int,
+    ) -> list:
+        return self.ib.reqSecDefOptParams(
+            underlyingSymbol, futFopExchange, underlyingSecType, underlyingConId
+        )
+
+    def reqHistoricalData(
+        self,
+        contract,
+        endDateTime,
+        durationStr: str,
+        barSizeSetting: str,
+        whatToShow: str,
+        useRTH: bool,
+        **kwargs,
+    ) -> list:
+        return self.ib.reqHistoricalData(
+            contract,
+            endDateTime,
+            durationStr,
+            barSizeSetting,
+            whatToShow,
+            useRTH,
+            **kwargs,
+        )
+
+    def sleep(self, secs: float = 0.02) -> bool:
+        return self.ib.sleep(secs)
+
+    def waitOnUpdate(self, timeout: float = 0) -> bool:
+        return self.ib.waitOnUpdate(timeout=timeout)
@@ -0,0 +1,51 @@
+"""Versioning metadata embedded in every output table (SPEC_LOCK §14)."""
+
+import datetime
+import hashlib
+import json
+from typing import Any, Mapping, Optional
+
+from . import spec
+
+
+def spec_config() -> dict:
+    """Return the locked specification values as a plain dict."""
+    return {name: getattr(spec, name) for name in sorted(dir(spec)) if name.isupper()}
+
+
+def config_hash(config: Optional[Mapping[str, Any]] = None) -> str:
+    """SHA256 of a configuration mapping.
+
+    Args:
+        config: Configuration values. Uses :func:`spec_config` if not provided.
+
+    Returns:
+        Hex digest of the canonical (sorted-key) JSON encoding
+    """
+    if config is None:
+        config = spec_config()
+    payload = json.dumps(config, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def version_metadata(
+    config: Optional[Mapping[str, Any]] = None,
+    start_time: Optional[datetime.datetime] = None,
+    model_version: str = spec.MODEL_VERSION,
+) -> dict[str, str]:
+    """Build the MODEL_VERSION / CONFIG_HASH / ENGINE_START_TIME triple.
+
+    Args:
+        config: Configuration hashed into CONFIG_HASH
+        start_time: Engine start time. Uses now (UTC) if not provided.
+        model_version: Model version tag
+
+    Returns:
+        Dict with the three versioning fields as strings
+    """
+    start_time = start_time or datetime.datetime.now(datetime.timezone.utc)
+    return {
+        "MODEL_VERSION": model_version,
+        "CONFIG_HASH": config_hash(config),
+        "ENGINE_START_TIME": start_time.isoformat(timespec="seconds"),
+    }
@@ -0,0 +1,16 @@
+"""Historical data loaders for ES Trading Dashboard (MASTER_OUTPUT inputs)."""
+
+from .databento_loader import BarStore, ingest, read_dbn, trade_dates
+from .gexbot_loader import GexStore
+from .opra_loader import iter_chunks, load_0dte, load_options
+
+__all__ = [
+    "BarStore",
+    "GexStore",
+    "ingest",
+    "iter_chunks",
+    "load_0dte",
+    "load_options",
+    "read_dbn",
+    "trade_dates",
+]
@@ -0,0 +1,447 @@
+"""Databento GLBX ingest into the ``futures_1m_ES`` bar store (README Fase 1).
+
+DBN OHLCV-1m files (``.dbn.zst``, DATA_CATALOG §3.2) are decoded once into
+a fixed-width columnar store that engines memory-map instead of
+re-decoding compressed files::
+
+    <root>/meta.json      rows, dtypes, symbols, ingested files, versioning,
+                          SHA256 of each trade_date's rows
+    <root>/ts_utc.bin     int64   ns since epoch (sorted)
+    <root>/open.bin ...   float64 open, high, low, close
+    <root>/volume.bin     int64
+    <root>/trade_date.bin datetime64[D]  02:15-22:00 Zurich rule (SPEC_LOCK §1)
+    <root>/symbol.bin     int16   index into meta["symbols"]
+
+Only the front month is kept: per trade_date, the outright ES contract with
+the largest volume (volume roll), chosen once the bars of all the files of
+an ingest are together (a trade date can span two files). Columns are raw
+little-endian arrays, so :meth:`BarStore.columns` returns zero-copy
+``np.memmap`` slices of any trade_date range. New bars are appended at the
+end; ``meta.json`` is replaced last, so readers never see a partially
+written tail. The per-day digests let the MASTER_OUTPUT builder fingerprint
+each trade_date from the store itself (:func:`day_digests`,
+:func:`history_digests`): an append only changes the digests of the days it
+touches.
+"""
+
+import argparse
+import datetime
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..core.calendar import trade_dates
+from ..core.exceptions import ConfigurationError
+from ..core.spec import TIMEZONE
+from ..core.versioning import version_metadata
+
+try:
+    import databento
+except ImportError:  # optional dependency
+    databento = None
+
+logger = logging.getLogger(__name__)
+
+# column -> dtype (fixed width, little endian)
+BAR_COLUMNS = {
+    "ts_utc": "<i8",
+    "open": "<f8",
+    "high": "<f8",
+    "low": "<f8",
+    "close": "<f8",
+    "volume": "<i8",
+    "trade_date": "<M8[D]",
+    "symbol": "<i2",
+}
+
+# Outright ES futures (ESH5, ESZ24); spreads (ESH5-ESM5) are excluded
+OUTRIGHT_RE = r"^ES[FGHJKMNQUVXZ]\d{1,2}$"
+
+CHUNK_RECORDS = 1_000_000
+
+
+def front_month(bars: pd.DataFrame, pattern: str = OUTRIGHT_RE) -> pd.DataFrame:
+    """Keep the highest-volume outright contract of each trade_date.
+
+    Args:
+        bars: Bars with ``ts_utc``, OHLCV, ``symbol`` and ``trade_date``
+        pattern: Regex of the outright symbols
+
+    Returns:
+        Front-month bars sorted by ``ts_utc``
+    """
+    bars = bars[bars["symbol"].astype(str).str.match(pattern)]
+    volume = bars.groupby(["trade_date", "symbol"], observed=True)["volume"].sum()
+    front = volume.groupby(level="trade_date").idxmax().map(lambda key: key[1])
+    keep = bars["symbol"].to_numpy() == bars["trade_date"].map(front).to_numpy()
+    return bars[keep].sort_values("ts_utc", kind="stable").reset_index(drop=True)
+
+
+def read_dbn(path: str, chunk: int = CHUNK_RECORDS) -> Iterator[pd.DataFrame]:
+    """Decode a DBN OHLCV file into batches of bars.
+
+    Only ``chunk`` records are decoded at a time; the caller decides what
+    to keep of each batch.
+
+    Args:
+        path: ``.dbn`` or ``.dbn.zst`` file (OHLCV-1m schema)
+        chunk: Records decoded per batch
+
+    Returns:
+        Iterator of bars with ``ts_utc`` (int64 ns), OHLC (float),
+        ``volume``, ``symbol`` and ``trade_date``
+
+    Raises:
+        ConfigurationError: If the databento SDK is not installed
+    """
+    if databento is None:
+        raise ConfigurationError(
+            "databento is required for .dbn files "
+            "(pip install es-trading-dashboard[historical])"
+        )
+    return _dbn_batches(databento.DBNStore.from_file(path), chunk)
+
+
+def _dbn_batches(store, chunk: int) -> Iterator[pd.DataFrame]:
+    """Bars of a ``DBNStore``, ``chunk`` records at a time."""
+    for df in store.to_df(
+        price_type="float", pretty_ts=False, map_symbols=True, count=chunk
+    ):
+        df = df.reset_index()
+        ts = df["ts_event"].to_numpy(dtype=np.int64)
+        yield pd.DataFrame(
+            {
+                "ts_utc": ts,
+                "open": df["open"].to_numpy(dtype=np.float64),
+                "high": df["high"].to_numpy(dtype=np.float64),
+                "low": df["low"].to_numpy(dtype=np.float64),
+                "close": df["close"].to_numpy(dtype=np.float64),
+                "volume": df["volume"].to_numpy(dtype=np.int64),
+                "symbol": df["symbol"].astype(str).to_numpy(),
+                "trade_date": trade_dates(ts),
+            }
+        )
+
+
+class BarStore:
+    """Memory-mapped, append-only columnar store of 1m bars.
+
+    Attributes:
+        root: Store directory
+        rows: Committed rows
+        symbols: Symbol table (``symbol`` column indexes into it)
+        files: Source files already ingested (name -> size)
+        metadata: Versioning fields of the last ingest
+        digests: SHA256 of the rows of each trade_date (ISO date -> hex)
+    """
+
+    def __init__(self, root: str):
+        """Open (or prepare) a store; nothing is mapped until read.
+
+        Args:
+            root: Store directory
+        """
+        self.root = Path(root)
+        self.rows = 0
+        self.symbols: list[str] = []
+        self.files: dict[str, int] = {}
+        self.metadata: dict[str, str] = {}
+        self.digests: dict[str, str] = {}
+        meta = self.root / "meta.json"
+        if meta.exists():
+            with open(meta) as f:
+                data = json.load(f)
+            if data.get("columns") != BAR_COLUMNS:
+                raise ConfigurationError(
+                    f"Bar store {self.root} has an incompatible layout"
+                )
+            self.rows = data["rows"]
+            self.symbols = data["symbols"]
+            self.files = data["files"]
+            self.metadata = data["metadata"]
+            self.digests = data.get("digests", {})
+
+    def _path(self, column: str) -> Path:
+        return self.root / f"{column}.bin"
+
+    def _save_meta(self):
+        meta = {
+            "rows": self.rows,
+            "columns": BAR_COLUMNS,
+            "symbols": self.symbols,
+            "files": self.files,
+            "metadata": self.metadata,
+            "digests": self.digests,
+        }
+        tmp = self.root / "meta.json.tmp"
+        with open(tmp, "w") as f:
+            json.dump(meta, f, indent=1)
+        os.replace(tmp, self.root / "meta.json")
+
+    def _digest_from(self, row: int):
+        """Recompute the digests of the trade dates from the one holding ``row``."""
+        days = self.column("trade_date")
+        lo = int(np.searchsorted(days, days[row], "left"))
+        starts = np.flatnonzero(np.r_[True, days[lo + 1 :] != days[lo:-1]]) + lo
+        columns = {name: self.column(name) for name in BAR_COLUMNS}
+        for a, b in zip(starts, np.r_[starts[1:], len(days)]):
+            h = hashlib.sha256()
+            for name, values in columns.items():
+                h.update(values[a:b].tobytes())
+            self.digests[str(days[a])] = h.hexdigest()
+
+    def day_digests(self) -> dict[datetime.date, str]:
+        """SHA256 of the rows of each stored trade_date.
+
+        Stores written before digests were kept are hashed once and the
+        digests saved.
+
+        Returns:
+            Digest by trade date, in date order
+        """
+        if self.rows and not self.digests:
+            self._digest_from(0)
+            self._save_meta()
+        return {
+            datetime.date.fromisoformat(d): h for d, h in sorted(self.digests.items())
+        }
+
+    @property
+    def last_ts(self) -> Optional[int]:
+        """Timestamp (ns) of the last bar, or None if empty."""
+        return int(self.column("ts_utc")[-1]) if self.rows else None
+
+    def column(self, name: str) -> np.ndarray:
+        """Read-only memory map of a whole column."""
+        if not self.rows:
+            return np.empty(0, dtype=BAR_COLUMNS[name])
+        return np.memmap(
+            self._path(name), dtype=BAR_COLUMNS[name], mode="r", shape=(self.rows,)
+        )
+
+    def bounds(
+        self,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+    ) -> tuple[int, int]:
+        """Row range ``[lo, hi)`` of a trade_date range (binary search)."""
+        days = self.column("trade_date")
+        lo = (
+            0
+            if start is None
+            else int(np.searchsorted(days, np.datetime64(start, "D"), "left"))
+        )
+        hi = (
+            len(days)
+            if end is None
+            else int(np.searchsorted(days, np.datetime64(end, "D"), "right"))
+        )
+        return lo, hi
+
+    def columns(
+        self,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+        names: Iterable[str] = BAR_COLUMNS,
+    ) -> dict[str, np.ndarray]:
+        """Zero-copy column slices of a trade_date range.
+
+        Args:
+            start: First trade_date (inclusive). From the first bar if None.
+            end: Last trade_date (inclusive). To the last bar if None.
+            names: Columns to map
+
+        Returns:
+            Column name -> read-only array view
+        """
+        lo, hi = self.bounds(start, end)
+        return {name: self.column(name)[lo:hi] for name in names}
+
+    def day_index(
+        self,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Trade dates of a range and the row offset where each begins.
+
+        Returns:
+            Tuple (``datetime64[D]`` days, int64 offsets into the range, with
+            a final offset equal to the range length)
+        """
+        days = self.columns(start, end, ["trade_date"])["trade_date"]
+        if not len(days):
+            return days[:0], np.zeros(1, dtype=np.int64)
+        starts = np.flatnonzero(np.r_[True, days[1:] != days[:-1]])
+        return np.asarray(days[starts]), np.r_[starts, len(days)].astype(np.int64)
+
+    def read(
+        self,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+    ) -> pd.DataFrame:
+        """Bars of a trade_date range as a DataFrame (``futures_1m_ES`` schema)."""
+        cols = self.columns(start, end)
+        ts = pd.DatetimeIndex(
+            np.asarray(cols["ts_utc"], dtype="datetime64[ns]"), tz="UTC"
+        )
+        symbols = np.array(self.symbols or [""], dtype=object)
+        return pd.DataFrame(
+            {
+                "ts_utc": ts,
+                "ts_local": ts.tz_convert(TIMEZONE),
+                "trade_date": np.asarray(cols["trade_date"]),
+                "open": np.asarray(cols["open"]),
+                "high": np.asarray(cols["high"]),
+                "low": np.asarray(cols["low"]),
+                "close": np.asarray(cols["close"]),
+                "volume": np.asarray(cols["volume"]),
+                "symbol": symbols[np.asarray(cols["symbol"])],
+            }
+        )
+
+    def append(self, bars: pd.DataFrame, metadata: Optional[dict] = None) -> int:
+        """Append bars newer than the last stored one.
+
+        Args:
+            bars: Bars sorted by ``ts_utc`` (see :func:`front_month`)
+            metadata: Versioning fields to record
+
+        Returns:
+            Rows appended (older or duplicate bars are skipped)
+        """
+        last = self.last_ts
+        if last is not None:
+            older = int((bars["ts_utc"] <= last).sum())
+            if older:
+                logger.warning(
+                    f"Skipping {older} bars not newer than the store "
+                    "(rebuild to correct)"
+                )
+                bars = bars[bars["ts_utc"] > last]
+        if bars.empty:
+            return 0
+        self.root.mkdir(parents=True, exist_ok=True)
+        for symbol in pd.unique(bars["symbol"]):
+            if symbol not in self.symbols:
+                self.symbols.append(str(symbol))
+        codes = {s: i for i, s in enumerate(self.symbols)}
+        data = {
+            "ts_utc": bars["ts_utc"].to_numpy(),
+            "open": bars["open"].to_numpy(),
+            "high": bars["high"].to_numpy(),
+            "low": bars["low"].to_numpy(),
+            "close": bars["close"].to_numpy(),
+            "volume": bars["volume"].to_numpy(),
+            "trade_date": bars["trade_date"].to_numpy(),
+            "symbol": bars["symbol"].map(codes).to_numpy(),
+        }
+        for name, dtype in BAR_COLUMNS.items():
+            path = self._path(name)
+            with open(path, "r+b" if path.exists() else "wb") as f:
+                f.seek(self.rows * np.dtype(dtype).itemsize)
+                f.truncate()
+                f.write(np.ascontiguousarray(data[name], dtype=dtype).tobytes())
+        first = self.rows
+        self.rows += len(bars)
+        self._digest_from(first)
+        if metadata:
+            self.metadata = dict(metadata)
+        self._save_meta()
+        return len(bars)
+
+    def record_file(self, path: str):
+        """Mark a source file as ingested."""
+        self.files[Path(path).name] = os.path.getsize(path)
+        self._save_meta()
+
+
+def day_digests(root: str) -> dict[datetime.date, str]:
+    """Digest of each trade_date of a bar store (builder fingerprint hook)."""
+    return BarStore(root).day_digests()
+
+
+def history_digests(root: str) -> dict[datetime.date, str]:
+    """Digest of each trade_date chained with every earlier one.
+
+    Fingerprint hook of engines that read the history before a day (rolling
+    percentiles): a changed day changes the digests of all later ones.
+    """
+    out = {}
+    h = hashlib.sha256()
+    for day, digest in day_digests(root).items():
+        h.update(digest.encode())
+        out[day] = h.hexdigest()
+    return out
+
+
+def ingest(
+    paths: Iterable[str],
+    store: BarStore,
+    pattern: str = OUTRIGHT_RE,
+    metadata: Optional[dict] = None,
+) -> int:
+    """Decode new DBN files into the store (front month only).
+
+    Files already ingested (same name and size) are skipped; the others are
+    decoded in name order (Databento names sort chronologically), keeping
+    only outright bars of each batch. The front month is then chosen per
+    trade_date on the bars of all the files together and appended at once.
+
+    Args:
+        paths: ``.dbn.zst`` files
+        store: Target store
+        pattern: Regex of the outright symbols
+        metadata: Versioning fields. Built from the locked spec if None.
+
+    Returns:
+        Rows appended
+    """
+    metadata = metadata or version_metadata()
+    todo = [
+        p for p in sorted(paths) if store.files.get(Path(p).name) != os.path.getsize(p)
+    ]
+    parts = []
+    for path in todo:
+        n = 0
+        for bars in read_dbn(path):
+            outright = bars[bars["symbol"].str.match(pattern)]
+            parts.append(outright)
+            n += len(outright)
+        logger.info(f"{Path(path).name}: {n} outright bars")
+    if not parts:
+        return 0
+    added = store.append(
+        front_month(pd.concat(parts, ignore_index=True), pattern), metadata
+    )
+    for path in todo:
+        store.record_file(path)
+    return added
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Ingest Databento 1m bars into futures_1m_ES"
+    )
+    parser.add_argument("files", nargs="+", help=".dbn.zst OHLCV-1m files")
+    parser.add_argument(
+        "--store", default="DATA/futures_1m_ES", help="bar store directory"
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s"
+    )
+    store = BarStore(args.store)
+    added = ingest(args.files, store)
+    print(f"{added} bars appended, {store.rows} total")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+"""GEXBot quant-historical loader with a compacted per-metric cache.
+
+The GEXBot tree holds one CSV per day per metric (``gamma_one``,
+``gamma_zero``, ``delta_*``, ``gex_full``, ``vanna_*``, ``charm_*``).
+Instead of re-opening thousands of small files on every build, each metric
+is compacted once into a single Parquet file sorted by trade_date::
+
+    <cache>/<metric>.parquet   all rows, sorted by trade_date (stable)
+    <cache>/index.json         per metric: ingested files, trade dates and
+                               the end offset of each date's rows
+
+:meth:`GexStore.refresh` only parses CSVs that are new or changed since
+the last refresh. :meth:`GexStore.asof` aligns any list of trade dates with
+a binary search over the date index (no per-day file reads).
+
+Requires ``pyarrow`` (``pip install es-trading-dashboard[storage]``).
+"""
+
+import argparse
+import datetime
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Iterable, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from ..core.calendar import path_date
+from ..core.exceptions import ConfigurationError
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional dependency
+    pa = None
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = ".compact"
+INDEX_NAME = "index.json"
+
+
+class GexStore:
+    """Compacted, trade_date-indexed GEXBot metrics.
+
+    Attributes:
+        root: GEXBot tree (one directory per metric)
+        cache: Directory of the compacted files
+    """
+
+    def __init__(self, root: str, cache: Optional[str] = None):
+        """Open a store (nothing is parsed until :meth:`refresh`).
+
+        Args:
+            root: GEXBot tree (e.g. ``quant-historical/data/ES_SPX/ES_SPX``)
+            cache: Compacted files directory. ``<root>/.compact`` if None.
+
+        Raises:
+            ConfigurationError: If pyarrow is not installed
+        """
+        if pa is None:
+            raise ConfigurationError(
+                "pyarrow is required for the GEXBot cache "
+                "(pip install es-trading-dashboard[storage])"
+            )
+        self.root = Path(root)
+        self.cache = Path(cache) if cache is not None else self.root / CACHE_DIR
+        self._index: dict[str, dict] = {}
+        self._tables: dict[str, pd.DataFrame] = {}
+        try:
+            with open(self.cache / INDEX_NAME) as f:
+                self._index = json.load(f)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable GEXBot index: {e}")
+
+    def metrics(self) -> list[str]:
+        """Metric directories of the tree."""
+        return sorted(
+            p.name
+            for p in self.root.iterdir()
+            if p.is_dir()
+            and p.resolve() != self.cache.resolve()
+            and not p.name.startswith(".")
+        )
+
+    def _daily_files(self, metric: str) -> dict[str, tuple[datetime.date, list]]:
+        """Dated CSVs of a metric: relative path -> (trade_date, [size, mtime_ns])."""
+        base = self.root / metric
+        files = {}
+        for path in sorted(base.rglob("*.csv")):
+            day = path_date(path.name)
+            if day is None:
+                logger.debug(f"Skipping undated GEXBot file {path}")
+                continue
+            st = path.stat()
+            files[str(path.relative_to(base))] = (day, [st.st_size, st.st_mtime_ns])
+        return files
+
+    def refresh(self, metrics: Optional[Iterable[str]] = None) -> dict[str, int]:
+        """Compact new or changed daily CSVs into the metric files.
+
+        Args:
+            metrics: Metrics to refresh. All metric directories if None.
+
+        Returns:
+            Number of CSVs parsed per refreshed metric
+        """
+        parsed = {}
+        for metric in (self.metrics() if metrics is None else metrics):
+            known = self._index.get(metric, {}).get("files", {})
+            files = self._daily_files(metric)
+            changed = {name: v for name, v in files.items() if known.get(name) != v[1]}
+            removed = set(known) - set(files)
+            if (
+                not changed
+                and not removed
+                and (self.cache / f"{metric}.parquet").exists()
+            ):
+                continue
+            self._compact(metric, files, changed)
+            parsed[metric] = len(changed)
+            logger.info(
+                f"GEXBot {metric}: {len(changed)} new/changed files, {len(files)} total"
+            )
+        return parsed
+
+    def _compact(self, metric: str, files: dict, changed: dict):
+        """Rewrite a metric file from the cached rows plus the changed CSVs."""
+        table = (
+            self.table(metric) if (self.cache / f"{metric}.parquet").exists() else None
+        )
+        keep_days = {day for name, (day, _) in files.items() if name not in changed}
+        parts = []
+        if table is not None and len(table):
+            days = table["trade_date"].dt.date
+            parts.append(table[days.isin(keep_days)])
+        for name, (day, _) in sorted(changed.items(), key=lambda item: item[1][0]):
+            df = pd.read_csv(self.root / metric / name)
+            df.insert(0, "trade_date", pd.Timestamp(day))
+            parts.append(df)
+        frame = (
+            pd.concat(parts, ignore_index=True)
+            if parts
+            else pd.DataFrame({"trade_date": []})
+        )
+        frame["trade_date"] = pd.to_datetime(frame["trade_date"]).astype(
+            "datetime64[ns]"
+        )
+        frame = frame.sort_values("trade_date", kind="stable").reset_index(drop=True)
+        for column in frame.columns[1:]:
+            if frame[column].dtype == object:
+                frame[column] = frame[column].map(
+                    lambda v: None if pd.isna(v) else str(v)
+                )
+
+        self.cache.mkdir(parents=True, exist_ok=True)
+        path = self.cache / f"{metric}.parquet"
+        tmp = path.with_suffix(".tmp")
+        pq.write_table(pa.Table.from_pandas(frame, preserve_index=False), tmp)
+        os.replace(tmp, path)
+
+        days = frame["trade_date"].to_numpy().astype("datetime64[D]")
+        starts = (
+            np.flatnonzero(np.r_[True, days[1:] != days[:-1]])
+            if len(days)
+            else np.empty(0, int)
+        )
+        self._index[metric] = {
+            "files": {name: v[1] for name, v in files.items()},
+            "dates": [str(d) for d in days[starts]],
+            "ends": (
+                np.r_[starts[1:], len(days)].astype(int).tolist() if len(days) else []
+            ),
+        }
+        self._tables[metric] = frame
+        self._save_index()
+
+    def _save_index(self):
+        tmp = self.cache / (INDEX_NAME + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(self._index, f)
+        os.replace(tmp, self.cache / INDEX_NAME)
+
+    def table(
+        self, metric: str, columns: Optional[Sequence[str]] = None
+    ) -> pd.DataFrame:
+        """All rows of a metric, sorted by trade_date.
+
+        Args:
+            metric: Metric name
+            columns: Columns to load (``trade_date`` is always included)
+
+        Raises:
+            ConfigurationError: If the metric was never compacted
+        """
+        if metric not in self._tables:
+            path = self.cache / f"{metric}.parquet"
+            if not path.exists():
+                raise ConfigurationError(
+                    f"GEXBot metric {metric} not compacted (run refresh)"
+                )
+            self._tables[metric] = pq.read_table(path).to_pandas()
+        frame = self._tables[metric]
+        if columns is None:
+            return frame
+        return frame[["trade_date", *[c for c in columns if c != "trade_date"]]]
+
+    def dates(self, metric: str) -> np.ndarray:
+        """Trade dates of a metric (``datetime64[D]``, sorted)."""
+        return np.array(
+            self._index.get(metric, {}).get("dates", []), dtype="datetime64[D]"
+        )
+
+    def asof(
+        self,
+        metric: str,
+        trade_dates: Sequence,
+        columns: Optional[Sequence[str]] = None,
+        tolerance: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """Last row of the latest metric date at or before each trade date.
+
+        Args:
+            metric: Metric name
+            trade_dates: Target trade dates (any order)
+            columns: Columns to return. All if None.
+            tolerance: Maximum age in calendar days (None = unlimited)
+
+        Returns:
+            One row per target, indexed by target trade_date, with
+            ``source_date`` (NaT and NaN values where nothing matches)
+        """
+        targets = np.asarray(pd.to_datetime(list(trade_dates))).astype("datetime64[D]")
+        dates = self.dates(metric)
+        ends = np.asarray(self._index.get(metric, {}).get("ends", []), dtype=np.int64)
+        frame = self.table(metric, columns).rename(
+            columns={"trade_date": "source_date"}
+        )
+        index = pd.DatetimeIndex(targets, name="trade_date")
+        if not len(dates):
+            return frame.iloc[:0].reindex(range(len(targets))).set_axis(index)
+        pos = np.searchsorted(dates, targets, "right") - 1
+        ok = pos >= 0
+        if tolerance is not None:
+            ok &= (targets - dates[np.maximum(pos, 0)]).astype(np.int64) <= tolerance
+        rows = frame.iloc[ends[np.maximum(pos, 0)] - 1].reset_index(drop=True)
+        rows.loc[~ok] = None
+        return rows.set_axis(index)
+
+
+def main(argv=None):
+    """Command line entry point: compact the GEXBot tree."""
+    parser = argparse.ArgumentParser(description="Compact GEXBot daily CSVs per metric")
+    parser.add_argument("root", help="GEXBot tree (one directory per metric)")
+    parser.add_argument("--cache", default=None, help="compacted files directory")
+    parser.add_argument(
+        "--metric", action="append", default=None, help="metric(s) to refresh"
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s"
+    )
+    store = GexStore(args.root, args.cache)
+    parsed = store.refresh(args.metric)
+    print(f"{sum(parsed.values())} files parsed in {len(parsed)} metrics")
+
+
+if __name__ == "__main__":
+    main()
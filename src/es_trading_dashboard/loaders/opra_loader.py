@@ -0,0 +1,262 @@
+"""Streaming loader for OPRA options files (``.csv.zst``, DATA_CATALOG §1.1).
+
+``pandas.read_csv(path, compression="zstd")`` materializes a whole
+multi-GB day in memory. This loader instead:
+- Decompresses incrementally (``zstandard`` stream reader) and parses the
+  text in bounded chunks of ``chunksize`` rows
+- Reads only the needed columns (expiry, strike, right, OI, bid/ask),
+  resolved from the header by name, with compact dtypes (float32 prices,
+  categorical right)
+- Filters each chunk before keeping it: expiry (0DTE) first, on the raw
+  strings, then the ±``STRIKE_WINDOW`` strike window
+
+so peak memory is one chunk plus the (small) filtered result, whatever the
+file size. Contracts are described either by explicit expiry/strike/right
+columns or by an OSI ``symbol`` (``SPXW  250312C05600000``). Databento
+``statistics`` exports (one row per stat) are supported: OI is the
+``quantity`` of the open-interest rows.
+"""
+
+import csv
+import datetime
+import io
+import logging
+from pathlib import Path
+from typing import Iterator, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from ..core.exceptions import ConfigurationError
+from ..core.spec import STRIKE_WINDOW
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+CHUNK_ROWS = 250_000
+
+# Output columns, in order
+OPRA_FIELDS = ("expiry", "strike", "right", "open_interest", "bid", "ask")
+
+# Output column -> accepted header names (first match wins)
+ALIASES = {
+    "symbol": ("symbol", "raw_symbol", "option_symbol"),
+    "expiry": ("expiry", "expiration", "expiration_date", "expirationDate"),
+    "strike": ("strike", "strike_price", "strikePrice"),
+    "right": ("right", "option_type", "put_call", "instrument_class"),
+    "open_interest": ("open_interest", "openInterest", "oi"),
+    "bid": ("bid", "bid_px_00", "bid_px"),
+    "ask": ("ask", "ask_px_00", "ask_px"),
+    "stat_type": ("stat_type",),
+    "quantity": ("quantity",),
+}
+
+# Databento StatType.OPEN_INTEREST
+STAT_OPEN_INTEREST = 9
+
+_DTYPES = {
+    "symbol": str,
+    "expiry": str,
+    "strike": np.float64,
+    "right": str,
+    "open_interest": np.float64,
+    "bid": np.float32,
+    "ask": np.float32,
+    "stat_type": np.float32,
+    "quantity": np.float64,
+}
+
+
+def open_text(path: str) -> io.TextIOBase:
+    """Open a ``.csv`` or ``.csv.zst`` file as a streaming text reader.
+
+    Raises:
+        ConfigurationError: If a ``.zst`` file is given without ``zstandard``
+    """
+    if not str(path).endswith(".zst"):
+        return open(path, newline="", encoding="utf-8")
+    if zstandard is None:
+        raise ConfigurationError(
+            "zstandard is required for .zst files "
+            "(pip install es-trading-dashboard[historical])"
+        )
+    raw = open(path, "rb")
+    stream = zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+    return io.TextIOWrapper(io.BufferedReader(stream), newline="", encoding="utf-8")
+
+
+def resolve_columns(
+    header: Sequence[str], fields: Sequence[str] = OPRA_FIELDS
+) -> dict[str, str]:
+    """Map output fields to the file's header names.
+
+    Args:
+        header: Header of the file
+        fields: Wanted output fields (unavailable bid/ask/OI are skipped)
+
+    Returns:
+        Output name -> file column, including the contract columns the
+        filters need (expiry/strike/right, or ``symbol`` when the contract
+        is given by OSI symbol) and ``stat_type``/``quantity`` for
+        statistics files
+
+    Raises:
+        ConfigurationError: If the contract columns cannot be found
+    """
+    present = set(header)
+    found = {}
+    for name, candidates in ALIASES.items():
+        for candidate in candidates:
+            if candidate in present:
+                found[name] = candidate
+                break
+    contract = ("expiry", "strike", "right")
+    if all(c in found for c in contract):
+        found.pop("symbol", None)
+    elif "symbol" not in found:
+        raise ConfigurationError(
+            "OPRA file has neither expiry/strike/right nor symbol columns: "
+            f"{list(header)}"
+        )
+    else:
+        for c in contract:
+            found.pop(c, None)
+    stats = (
+        "open_interest" in fields
+        and "open_interest" not in found
+        and "stat_type" in found
+        and "quantity" in found
+    )
+    if not stats:
+        found.pop("stat_type", None)
+        found.pop("quantity", None)
+    keep = set(fields) | set(contract) | {"symbol", "stat_type", "quantity"}
+    return {name: col for name, col in found.items() if name in keep}
+
+
+def _ymd(values: pd.Series) -> pd.Series:
+    """YYYYMMDD strings of expiry values (``2025-03-12``, ``20250312``, ...)."""
+    return values.str.replace("-", "", regex=False).str[:8]
+
+
+def _filter_chunk(
+    chunk: pd.DataFrame,
+    expiry: Optional[str],
+    atm: Optional[float],
+    window: float,
+) -> pd.DataFrame:
+    """Parse and filter one chunk (already renamed to output names)."""
+    if "stat_type" in chunk:
+        chunk = chunk[chunk["stat_type"] == STAT_OPEN_INTEREST]
+        chunk = chunk.rename(columns={"quantity": "open_interest"}).drop(
+            columns="stat_type"
+        )
+
+    if "symbol" in chunk:
+        osi = chunk.pop("symbol").str.strip().str[-15:]
+        if expiry is not None:
+            keep = osi.str[:6] == expiry[2:]
+            chunk, osi = chunk[keep], osi[keep]
+        chunk.insert(0, "expiry", "20" + osi.str[:6])
+        chunk.insert(1, "strike", pd.to_numeric(osi.str[7:], errors="coerce") / 1000.0)
+        chunk.insert(2, "right", osi.str[6])
+    else:
+        ymd = _ymd(chunk["expiry"].astype(str))
+        if expiry is not None:
+            keep = ymd == expiry
+            chunk, ymd = chunk[keep], ymd[keep]
+        chunk["expiry"] = ymd
+        chunk["right"] = chunk["right"].str.strip().str[0].str.upper()
+
+    if atm is not None:
+        chunk = chunk[(chunk["strike"] - atm).abs() <= window]
+    return chunk
+
+
+def iter_chunks(
+    path: str,
+    expiry: Optional[datetime.date] = None,
+    atm: Optional[float] = None,
+    window: float = STRIKE_WINDOW,
+    fields: Sequence[str] = OPRA_FIELDS,
+    chunksize: int = CHUNK_ROWS,
+) -> Iterator[pd.DataFrame]:
+    """Stream filtered rows of an OPRA file, one parsed chunk at a time.
+
+    Args:
+        path: ``.csv.zst`` (or plain ``.csv``) file
+        expiry: Keep only this expiry (e.g. the trade date for 0DTE).
+            All expiries if None.
+        atm: ATM strike of the strike window. No strike filter if None.
+        window: Half width of the strike window, in points
+        fields: Output fields (subset of ``OPRA_FIELDS``)
+        chunksize: Rows parsed per chunk (bounds peak memory)
+
+    Yields:
+        Non-empty DataFrames with the available ``fields`` (expiry as
+        YYYYMMDD string, strike float64, right ``C``/``P``)
+
+    Raises:
+        ConfigurationError: If the file layout is not recognized
+    """
+    ymd = expiry.strftime("%Y%m%d") if expiry is not None else None
+    with open_text(path) as f:
+        header = next(csv.reader([f.readline()]))
+        columns = resolve_columns(header, fields)
+        renames = {col: name for name, col in columns.items()}
+        reader = pd.read_csv(
+            f,
+            names=header,
+            header=None,
+            usecols=list(renames),
+            dtype={col: _DTYPES[name] for name, col in columns.items()},
+            chunksize=chunksize,
+        )
+        for chunk in reader:
+            chunk = _filter_chunk(chunk.rename(columns=renames), ymd, atm, window)
+            if len(chunk):
+                yield chunk[[c for c in fields if c in chunk]]
+
+
+def load_options(
+    path: str,
+    expiry: Optional[datetime.date] = None,
+    atm: Optional[float] = None,
+    window: float = STRIKE_WINDOW,
+    fields: Sequence[str] = OPRA_FIELDS,
+    chunksize: int = CHUNK_ROWS,
+) -> pd.DataFrame:
+    """Load the filtered rows of an OPRA file (see :func:`iter_chunks`).
+
+    Returns:
+        DataFrame with the available ``fields``: expiry as datetime64,
+        strike float32, right categorical, OI/bid/ask float32
+    """
+    parts = list(iter_chunks(path, expiry, atm, window, fields, chunksize))
+    if not parts:
+        return pd.DataFrame({f: pd.Series(dtype=np.float32) for f in fields})
+    frame = pd.concat(parts, ignore_index=True)
+    if "expiry" in frame:
+        frame["expiry"] = pd.to_datetime(frame["expiry"], format="%Y%m%d")
+    if "right" in frame:
+        frame["right"] = frame["right"].astype(pd.CategoricalDtype(["C", "P"]))
+    for c in ("strike", "open_interest", "bid", "ask"):
+        if c in frame:
+            frame[c] = frame[c].astype(np.float32)
+    logger.debug(f"{Path(path).name}: {len(frame)} rows kept")
+    return frame.reset_index(drop=True)
+
+
+def load_0dte(
+    path: str,
+    trade_date: datetime.date,
+    atm: Optional[float] = None,
+    window: float = STRIKE_WINDOW,
+    chunksize: int = CHUNK_ROWS,
+) -> pd.DataFrame:
+    """0DTE contracts of ``trade_date`` within ±``window`` of ``atm``."""
+    return load_options(path, trade_date, atm, window, chunksize=chunksize)
@@ -0,0 +1,31 @@
+"""MASTER_OUTPUT builder for ES Trading Dashboard (historical statistics)."""
+
+from ..core.ranges import LEVEL_INDEX, level_dict, range_levels
+from .builder import BuildContext, Engine, MasterOutputBuilder
+from .extremes_engine import extremes_daily, update_extremes
+from .gex_engine import gex_daily_summary
+from .join import JoinSpec, JoinStats, asof_join
+from .manifest import BuildManifest
+from .oi_engine import OICube, oi_snapshots
+from .rv_engine import realized_vol, rolling_percentile, rv_daily
+
+__all__ = [
+    "BuildContext",
+    "BuildManifest",
+    "Engine",
+    "JoinSpec",
+    "JoinStats",
+    "LEVEL_INDEX",
+    "MasterOutputBuilder",
+    "OICube",
+    "asof_join",
+    "extremes_daily",
+    "gex_daily_summary",
+    "level_dict",
+    "oi_snapshots",
+    "range_levels",
+    "realized_vol",
+    "rolling_percentile",
+    "rv_daily",
+    "update_extremes",
+]
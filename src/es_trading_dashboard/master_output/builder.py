@@ -0,0 +1,557 @@
+"""MASTER_OUTPUT builder (ARCHITECTURE §2.1, §3.1).
+
+The builder runs a DAG of engines and writes ``MASTER_OUTPUT_YYYY_MM.csv``:
+- Each :class:`Engine` produces a table indexed by trade_date and may
+  require the tables of other engines (``requires``)
+- ``scope="month"`` engines run per month, months in parallel across a
+  process pool; ``scope="history"`` engines (rolling windows, percentiles)
+  run once in the parent on the concatenated month tables
+- Tables are as-of joined on trade_date (``join.py``: one linear merge
+  per table, per-engine tolerance and fill) and exported per month in a fixed column
+  and row order, with MODEL_VERSION / CONFIG_HASH / ENGINE_START_TIME
+
+Output is deterministic: it does not depend on the number of workers or on
+the order in which months finish.
+
+Rebuilds are incremental (see ``manifest.py``): month engine outputs are
+cached per month, and only trade dates whose source files, CONFIG_HASH or
+engine set changed are recomputed. Sources without dates in their file
+names (the bar store) are fingerprinted per trade date by an engine hook
+(``Engine.digests``) instead of by their files. Months whose content is unchanged are
+not rewritten.
+
+Usage:
+    python -m es_trading_dashboard.master_output.builder \\
+        --start 2024-01-01 --end 2025-12-31 \\
+        --source snapshots=DATA/snapshots_fixed.csv --source bars=DATA/futures_1m_ES \\
+        --source oi=OI_RUNNER --source gex=GEX/quant-historical/data/ES_SPX/ES_SPX \\
+        --out DATA --workers 8
+"""
+
+import argparse
+import datetime
+import hashlib
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from graphlib import CycleError, TopologicalSorter
+from itertools import groupby, repeat
+from pathlib import Path
+from typing import Any, Callable, Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from ..core.exceptions import ConfigurationError
+from ..core.versioning import spec_config, version_metadata
+from ..loaders.databento_loader import day_digests, history_digests
+from .exporters import export_month, month_path
+from .extremes_engine import EXTREMES_MASTER_COLUMNS, extremes_table
+from .gex_engine import GEX_COLUMNS, gex_table
+from .join import JoinSpec, asof_join
+from .manifest import BuildManifest, source_files
+from .oi_engine import OI_COLUMNS, oi_table
+from .range_engine import RANGE_COLUMNS, range_table
+from .rv_engine import RV_COLUMNS, rv_table
+
+logger = logging.getLogger(__name__)
+
+MONTH = "month"
+HISTORY = "history"
+
+MANIFEST_NAME = "manifest.json"
+CACHE_DIR = ".cache"
+
+
+@dataclass(frozen=True)
+class BuildContext:
+    """Inputs shared by the engines of one run.
+
+    Attributes:
+        trade_dates: Trade dates covered (sorted)
+        sources: Raw input paths by source name (e.g. ``snapshots``)
+        config: Builder configuration (hashed into CONFIG_HASH)
+    """
+
+    trade_dates: tuple[datetime.date, ...]
+    sources: Mapping[str, str] = field(default_factory=dict)
+    config: Mapping[str, Any] = field(default_factory=dict)
+
+    @property
+    def start(self) -> datetime.date:
+        """First trade date."""
+        return self.trade_dates[0]
+
+    @property
+    def end(self) -> datetime.date:
+        """Last trade date."""
+        return self.trade_dates[-1]
+
+
+@dataclass(frozen=True)
+class Engine:
+    """Node of the MASTER_OUTPUT DAG.
+
+    Attributes:
+        name: Node name, referenced by ``requires``
+        compute: ``compute(ctx, inputs) -> DataFrame`` indexed by trade_date,
+            where ``inputs`` maps each required engine to its table. Must be
+            a module-level function (it is pickled to the worker processes).
+        columns: Columns of the table (MASTER_OUTPUT columns among them are
+            exported)
+        requires: Engines whose tables are passed in ``inputs``
+        scope: ``"month"`` (per month, in the pool) or ``"history"`` (once,
+            on all months)
+        sources: Source names read by ``compute`` (fingerprinted for
+            incremental rebuilds)
+        join: Tolerance and fill of the table in the master join
+        digests: Fingerprint hooks by source name,
+            ``hook(path) -> {trade_date: digest}``; such sources are
+            fingerprinted per trade date from the digests instead of from
+            their files
+    """
+
+    name: str
+    compute: Callable[[BuildContext, Mapping[str, pd.DataFrame]], pd.DataFrame]
+    columns: tuple[str, ...]
+    requires: tuple[str, ...] = ()
+    scope: str = MONTH
+    sources: tuple[str, ...] = ()
+    join: JoinSpec = JoinSpec()
+    digests: Mapping[str, Callable[[str], Mapping[datetime.date, str]]] = field(
+        default_factory=dict
+    )
+
+
+DEFAULT_ENGINES: tuple[Engine, ...] = (
+    Engine("range", range_table, RANGE_COLUMNS, sources=("snapshots",)),
+    Engine(
+        "rv", rv_table, RV_COLUMNS, sources=("bars",), digests={"bars": history_digests}
+    ),
+    Engine("oi", oi_table, OI_COLUMNS, sources=("oi",)),
+    Engine(
+        "extremes",
+        extremes_table,
+        EXTREMES_MASTER_COLUMNS,
+        sources=("bars",),
+        digests={"bars": day_digests},
+    ),
+    Engine("gex", gex_table, GEX_COLUMNS, scope=HISTORY, sources=("gex",)),
+)
+
+
+def engine_order(engines: Sequence[Engine]) -> list[Engine]:
+    """Validate the DAG and return the engines in dependency order.
+
+    Args:
+        engines: Engines to run
+
+    Returns:
+        Engines sorted so that requirements come first (ties keep the
+        given order)
+
+    Raises:
+        ConfigurationError: On duplicate names or columns, unknown
+            requirements, cycles, or month engines requiring history ones
+    """
+    by_name: dict[str, Engine] = {}
+    owner: dict[str, str] = {}
+    for engine in engines:
+        if engine.scope not in (MONTH, HISTORY):
+            raise ConfigurationError(
+                f"Engine {engine.name}: unknown scope {engine.scope!r}"
+            )
+        if engine.name in by_name:
+            raise ConfigurationError(f"Duplicate engine {engine.name}")
+        by_name[engine.name] = engine
+        for column in engine.columns:
+            if column in owner:
+                raise ConfigurationError(
+                    f"Column {column} produced by both {owner[column]} "
+                    f"and {engine.name}"
+                )
+            owner[column] = engine.name
+    graph = TopologicalSorter()
+    for engine in engines:
+        for dep in engine.requires:
+            if dep not in by_name:
+                raise ConfigurationError(
+                    f"Engine {engine.name} requires unknown engine {dep}"
+                )
+            if engine.scope == MONTH and by_name[dep].scope == HISTORY:
+                raise ConfigurationError(
+                    f"Month engine {engine.name} cannot require history engine {dep}"
+                )
+        graph.add(engine.name, *engine.requires)
+    try:
+        return [by_name[name] for name in graph.static_order()]
+    except CycleError as e:
+        raise ConfigurationError(f"Engine cycle: {' -> '.join(e.args[1])}")
+
+
+def available_engines(
+    engines: Sequence[Engine], sources: Mapping[str, str]
+) -> list[Engine]:
+    """Engines whose sources are all configured, in dependency order.
+
+    Engines requiring a skipped engine are skipped too; their MASTER_OUTPUT
+    columns are written empty.
+
+    Args:
+        engines: Candidate engines
+        sources: Configured source names
+
+    Returns:
+        Runnable engines
+
+    Raises:
+        ConfigurationError: If no engine can run, or the graph is invalid
+    """
+    kept: dict[str, Engine] = {}
+    for engine in engine_order(engines):
+        missing = [s for s in engine.sources if s not in sources]
+        missing += [d for d in engine.requires if d not in kept]
+        if missing:
+            logger.info(f"Skipping engine {engine.name}: missing {', '.join(missing)}")
+            continue
+        kept[engine.name] = engine
+    if not kept:
+        raise ConfigurationError(f"No engine can run with sources {sorted(sources)}")
+    return list(kept.values())
+
+
+def trading_days(start: datetime.date, end: datetime.date) -> list[datetime.date]:
+    """Monday-Friday trade dates between ``start`` and ``end`` (inclusive)."""
+    return [d.date() for d in pd.bdate_range(start, end)]
+
+
+def _index(table: pd.DataFrame) -> pd.DataFrame:
+    """Normalize an engine table to a ``trade_date`` DatetimeIndex."""
+    if "trade_date" in table.columns:
+        table = table.set_index("trade_date")
+    table.index = pd.DatetimeIndex(
+        pd.to_datetime(table.index), name="trade_date"
+    ).normalize()
+    return table
+
+
+def run_engines(
+    engines: Sequence[Engine],
+    ctx: BuildContext,
+    tables: Optional[Mapping[str, pd.DataFrame]] = None,
+) -> dict[str, pd.DataFrame]:
+    """Run engines in the given (dependency) order.
+
+    Args:
+        engines: Engines already sorted by :func:`engine_order`
+        ctx: Build context
+        tables: Tables already computed (inputs of these engines)
+
+    Returns:
+        Tables of ``engines`` by engine name
+    """
+    tables = dict(tables or {})
+    out = {}
+    for engine in engines:
+        inputs = {name: tables[name] for name in engine.requires}
+        started = time.perf_counter()
+        table = _index(engine.compute(ctx, inputs))
+        missing = [c for c in engine.columns if c not in table.columns]
+        if missing:
+            raise ConfigurationError(f"Engine {engine.name} did not produce {missing}")
+        table = table[table.index.isin(pd.to_datetime(ctx.trade_dates))]
+        tables[engine.name] = out[engine.name] = table[list(engine.columns)]
+        logger.debug(
+            f"{engine.name} {ctx.start}..{ctx.end}: {len(table)} rows "
+            f"in {time.perf_counter() - started:.2f}s"
+        )
+    return out
+
+
+class MasterOutputBuilder:
+    """Parallel, per-month MASTER_OUTPUT build.
+
+    Attributes:
+        output_dir: Root of the output tree (``<output_dir>/MASTER_OUTPUT/``)
+        sources: Raw input paths by source name
+        engines: Engines in dependency order
+        workers: Worker processes for month engines (1 = in process)
+        config: Builder configuration
+        metadata: Versioning fields written into every row
+        incremental: Reuse cached outputs of unchanged trade dates
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        sources: Mapping[str, str],
+        engines: Optional[Sequence[Engine]] = None,
+        workers: Optional[int] = None,
+        config: Optional[Mapping[str, Any]] = None,
+        start_time: Optional[datetime.datetime] = None,
+        incremental: bool = True,
+    ):
+        """Configure a build.
+
+        Args:
+            output_dir: Root of the output tree
+            sources: Raw input paths by source name
+            engines: DAG nodes (any order). The ``DEFAULT_ENGINES`` whose
+                sources are configured if None.
+            workers: Worker processes. ``os.cpu_count()`` if None.
+            config: Builder configuration, hashed into CONFIG_HASH together
+                with the locked spec
+            start_time: Engine start time for ENGINE_START_TIME
+            incremental: Reuse cached outputs of unchanged trade dates
+
+        Raises:
+            ConfigurationError: If the engine graph is invalid, or no default
+                engine has its sources configured
+        """
+        self.output_dir = output_dir
+        self.sources = dict(sources)
+        if engines is None:
+            self.engines = available_engines(DEFAULT_ENGINES, self.sources)
+        else:
+            self.engines = engine_order(engines)
+        self.workers = workers
+        self.config = dict(config or {})
+        self.metadata = version_metadata({**spec_config(), **self.config}, start_time)
+        self.incremental = incremental
+        self._dir = month_path(output_dir, 2000, 1).parent
+        self.manifest = BuildManifest(self._dir / MANIFEST_NAME)
+
+    @property
+    def signature(self) -> str:
+        """CONFIG_HASH plus the engine set, salted into every fingerprint."""
+        engines = ";".join(
+            f"{e.name}:{e.scope}:{','.join(e.columns)}:{','.join(e.requires)}:{','.join(e.sources)}"
+            for e in self.engines
+        )
+        return (
+            f"{self.metadata['MODEL_VERSION']}|{self.metadata['CONFIG_HASH']}|{engines}"
+        )
+
+    def _cache_path(self, key: str) -> Path:
+        return self._dir / CACHE_DIR / f"{key}.pkl"
+
+    def _load_cache(self, key: str) -> Optional[dict]:
+        """Cached month engine tables, or None if missing or stale."""
+        path = self._cache_path(key)
+        if not self.incremental or not path.exists():
+            return None
+        try:
+            cached = pd.read_pickle(path)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache {path}: {e}")
+            return None
+        if cached.get("signature") != self.signature:
+            return None
+        return cached["tables"]
+
+    def _save_cache(self, key: str, tables: dict):
+        path = self._cache_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        pd.to_pickle({"signature": self.signature, "tables": tables}, tmp)
+        os.replace(tmp, path)
+
+    def _context(self, days: Sequence[datetime.date]) -> BuildContext:
+        return BuildContext(tuple(days), self.sources, self.config)
+
+    def _run_months(self, months: list[tuple[datetime.date, ...]]) -> list[dict]:
+        """Month engines of every (partial) month, in month order."""
+        engines = [e for e in self.engines if e.scope == MONTH]
+        contexts = [self._context(days) for days in months]
+        if self.workers == 1 or len(months) <= 1:
+            return [run_engines(engines, ctx) for ctx in contexts]
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            return list(pool.map(run_engines, repeat(engines), contexts))
+
+    def _month_tables(self, months: dict[str, tuple], dirty: set) -> dict[str, dict]:
+        """Month engine tables: cached rows for clean dates, recomputed dirty ones."""
+        cached = {key: self._load_cache(key) for key in months}
+        todo = {}
+        for key, days in months.items():
+            redo = days if cached[key] is None else tuple(d for d in days if d in dirty)
+            if redo:
+                todo[key] = redo
+        results = dict(zip(todo, self._run_months(list(todo.values()))))
+
+        tables = {}
+        for key, days in months.items():
+            if key not in results:
+                tables[key] = cached[key]
+                continue
+            fresh = results[key]
+            if cached[key] is not None:
+                stale = pd.to_datetime(todo[key])
+                fresh = {
+                    name: pd.concat(
+                        [table[~table.index.isin(stale)], fresh[name]]
+                    ).sort_index()
+                    for name, table in cached[key].items()
+                }
+            tables[key] = fresh
+            self._save_cache(key, fresh)
+        n_redo = sum(len(d) for d in todo.values())
+        logger.info(
+            f"Recomputed {n_redo} of {sum(map(len, months.values()))} trade dates "
+            f"({len(todo)} of {len(months)} months)"
+        )
+        return tables
+
+    def build(
+        self, start: datetime.date, end: datetime.date, full: bool = False
+    ) -> list[Path]:
+        """Build and write every month between ``start`` and ``end``.
+
+        Month files are always rebuilt whole: ``start`` and ``end`` are
+        extended to the first and last day of their months, so a range
+        ending mid-month does not replace a file with part of its days.
+
+        Args:
+            start: First trade date (inclusive)
+            end: Last trade date (inclusive)
+            full: Recompute every trade date, ignoring the manifest
+
+        Returns:
+            Written files, in month order (unchanged months are skipped)
+        """
+        started = time.perf_counter()
+        start = start.replace(day=1)
+        end = (pd.Timestamp(end) + pd.offsets.MonthEnd(0)).date()
+        days = trading_days(start, end)
+        if not days:
+            return []
+        months = {
+            f"{y:04d}_{m:02d}": tuple(g)
+            for (y, m), g in groupby(days, key=lambda d: (d.year, d.month))
+        }
+
+        # --- Fingerprints: which trade dates changed since the last build ---
+        # (history engines always rerun, so only month engine sources count)
+        month_engines = [e for e in self.engines if e.scope == MONTH]
+        hooks = [
+            (e.name, name, hook)
+            for e in month_engines
+            for name, hook in sorted(e.digests.items())
+            if name in self.sources
+        ]
+        hooked = {name for _, name, _ in hooks}
+        names = [n for e in month_engines for n in e.sources if n not in hooked]
+        dated, shared = source_files(self.sources, names)
+        digests: dict[datetime.date, list[str]] = {}
+        for engine, name, hook in hooks:
+            for day, digest in hook(self.sources[name]).items():
+                digests.setdefault(day, []).append(f"{engine}:{name}\0{digest}")
+        fingerprints = self.manifest.fingerprints(
+            days, dated, shared, self.signature, digests
+        )
+        dirty = set(
+            days
+            if full or not self.incremental
+            else self.manifest.changed(fingerprints)
+        )
+
+        # --- Month engines (parallel, dirty dates only), then history engines ---
+        month_tables = self._month_tables(months, dirty)
+        tables: dict[str, pd.DataFrame] = {}
+        for engine in self.engines:
+            if engine.scope == MONTH:
+                parts = [month_tables[key][engine.name] for key in months]
+                table = pd.concat(parts).sort_index()
+                tables[engine.name] = table[table.index.isin(pd.to_datetime(days))]
+        history = [e for e in self.engines if e.scope == HISTORY]
+        tables.update(run_engines(history, self._context(days), tables))
+
+        # --- As-of join on the days observed by a month engine ---
+        # (as-of and rolling history columns alone do not make a trade date)
+        month_names = [e.name for e in self.engines if e.scope == MONTH]
+        if month_names:
+            keys = np.unique(
+                np.concatenate([tables[n].index.values for n in month_names])
+            )
+        else:
+            keys = pd.to_datetime(days).values
+        master, stats = asof_join(
+            keys,
+            {e.name: tables[e.name] for e in self.engines},
+            {e.name: e.join for e in self.engines},
+        )
+        observed = [c for e in self.engines if e.scope == MONTH for c in e.columns]
+        master = master.dropna(how="all", subset=observed or None)
+        self.manifest.set_coverage({name: st.as_dict() for name, st in stats.items()})
+        logger.info(
+            "Join coverage: "
+            + ", ".join(f"{name} {st.coverage:.1%}" for name, st in stats.items())
+        )
+
+        written = []
+        for (year, month), frame in master.groupby(
+            [master.index.year, master.index.month]
+        ):
+            key = f"{year:04d}_{month:02d}"
+            path = month_path(self.output_dir, year, month)
+            content = self.signature + "\n" + frame.to_csv(lineterminator="\n")
+            digest = hashlib.sha256(content.encode()).hexdigest()
+            if (
+                self.incremental
+                and path.exists()
+                and self.manifest.month_digest(key) == digest
+            ):
+                continue
+            rows = export_month(frame, path, self.metadata)
+            self.manifest.set_month_digest(key, digest)
+            written.append(path)
+            logger.info(f"{path.name}: {rows} trade dates")
+        self.manifest.record(fingerprints)
+        self.manifest.save()
+        logger.info(
+            f"Built {len(months)} months ({len(master)} trade dates, "
+            f"{len(written)} files written) with {len(self.engines)} engines "
+            f"in {time.perf_counter() - started:.1f}s"
+        )
+        return written
+
+
+def _source(value: str) -> tuple[str, str]:
+    """Parse a ``name=path`` source argument."""
+    name, sep, path = value.partition("=")
+    if not sep or not name or not path:
+        raise argparse.ArgumentTypeError(f"expected NAME=PATH, got {value!r}")
+    return name, path
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Build MASTER_OUTPUT monthly CSVs")
+    parser.add_argument("--start", type=datetime.date.fromisoformat, required=True)
+    parser.add_argument("--end", type=datetime.date.fromisoformat, required=True)
+    parser.add_argument(
+        "--source",
+        type=_source,
+        action="append",
+        default=[],
+        metavar="NAME=PATH",
+        help="raw input (e.g. snapshots=snapshots_fixed.csv)",
+    )
+    parser.add_argument("--out", default="DATA", help="output root")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes")
+    parser.add_argument(
+        "--full", action="store_true", help="recompute every trade date"
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s"
+    )
+    builder = MasterOutputBuilder(args.out, dict(args.source), workers=args.workers)
+    for path in builder.build(args.start, args.end, full=args.full):
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
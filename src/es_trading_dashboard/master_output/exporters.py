@@ -0,0 +1,53 @@
+"""CSV export of MASTER_OUTPUT with versioning (SPEC_LOCK §14, §15).
+
+Files are monthly (``<root>/MASTER_OUTPUT/MASTER_OUTPUT_YYYY_MM.csv``), rows
+sorted by trade_date, columns in ``MASTER_COLUMNS`` order followed by the
+MODEL_VERSION / CONFIG_HASH / ENGINE_START_TIME triple. Writes go through a
+temporary file and a rename, so a file is either the previous or the new
+build, never a partial one.
+"""
+
+import os
+from pathlib import Path
+from typing import Mapping, Sequence
+
+import pandas as pd
+
+from .schema import MASTER_COLUMNS, VERSION_COLUMNS
+
+MASTER_NAME = "MASTER_OUTPUT"
+
+
+def month_path(root: str, year: int, month: int, name: str = MASTER_NAME) -> Path:
+    """Path of a monthly output file (``<root>/<name>/<name>_YYYY_MM.csv``)."""
+    return Path(root) / name / f"{name}_{year:04d}_{month:02d}.csv"
+
+
+def export_month(
+    frame: pd.DataFrame,
+    path: Path,
+    metadata: Mapping[str, str],
+    columns: Sequence[str] = MASTER_COLUMNS,
+) -> int:
+    """Write one monthly file atomically.
+
+    Args:
+        frame: Rows indexed or keyed by ``trade_date``; missing columns are
+            written empty
+        path: Output file
+        metadata: Versioning fields (``version_metadata()``)
+        columns: Data columns in output order
+
+    Returns:
+        Number of rows written
+    """
+    out = frame.reset_index() if "trade_date" not in frame.columns else frame.copy()
+    out = out.reindex(columns=list(columns)).sort_values("trade_date", kind="stable")
+    out["trade_date"] = pd.to_datetime(out["trade_date"]).dt.strftime("%Y-%m-%d")
+    for key in VERSION_COLUMNS:
+        out[key] = metadata[key]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    out.to_csv(tmp, index=False, lineterminator="\n")
+    os.replace(tmp, path)
+    return len(out)
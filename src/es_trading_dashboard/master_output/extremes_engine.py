@@ -0,0 +1,246 @@
+"""Max/Min of the 10:00-22:00 operating window from ES 1m bars (SPEC_LOCK §13).
+
+All trade dates are computed at once over the bar arrays of the
+``futures_1m_ES`` store:
+- Day boundaries come from the store's trade_date column
+  (:meth:`~es_trading_dashboard.loaders.databento_loader.BarStore.day_index`),
+  window boundaries from a binary search of each day's 10:00 and 22:00
+  instants (:class:`~es_trading_dashboard.core.calendar.TradeCalendar`,
+  DST-aware) in the sorted timestamps. A bar belongs to the
+  window when its start time is in ``[10:00, 22:00)``
+- Window extremes are a segmented ``fmax``/``fmin`` ``reduceat`` over the
+  window row ranges; the bar of each extreme is the first one of its window
+  reaching it (earliest time on ties), found with a second ``reduceat``
+  over row positions
+- Times are a gather of ``ts_utc`` at those rows, no per-day grouping
+
+Days only depend on their own bars, so :func:`update_extremes` recomputes
+just the last stored day (possibly partial when last written) and the
+appended ones.
+"""
+
+import argparse
+import datetime
+import logging
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from ..core.calendar import TradeCalendar
+from ..core.exceptions import ConfigurationError
+from ..core.spec import TIMEZONE
+from ..core.versioning import version_metadata
+from ..loaders.databento_loader import BarStore
+from .exporters import export_month
+
+logger = logging.getLogger(__name__)
+
+# Calendar windows bounding the operating window
+WINDOW_START = "10:00"
+WINDOW_END = "22:00"
+
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+EXTREMES_COLUMNS = [
+    "trade_date",
+    "MAX_10_22",
+    "MIN_10_22",
+    "MAX_10_22_TIME_local",
+    "MAX_10_22_TIME_utc",
+    "MIN_10_22_TIME_local",
+    "MIN_10_22_TIME_utc",
+]
+
+# MASTER_OUTPUT columns of the builder engine
+EXTREMES_MASTER_COLUMNS = ("max_10_22", "min_10_22")
+
+
+def _segment_arg(
+    values: np.ndarray, lo: np.ndarray, n: np.ndarray, best: np.ndarray
+) -> np.ndarray:
+    """Row of the first value equal to ``best`` in each row range ``[lo, lo + n)``."""
+    total = int(n.sum())
+    offsets = np.r_[0, np.cumsum(n)[:-1]]
+    rows = np.repeat(lo - offsets, n) + np.arange(total)
+    hit = values[rows] == np.repeat(best, n)
+    return np.minimum.reduceat(np.where(hit, rows, np.iinfo(np.int64).max), offsets)
+
+
+def window_extremes(
+    ts_utc: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    days: np.ndarray,
+    offsets: np.ndarray,
+    start: str = WINDOW_START,
+    end: str = WINDOW_END,
+) -> pd.DataFrame:
+    """Window high/low of every trade date and the time they were reached.
+
+    Args:
+        ts_utc: Bar start times, int64 ns (sorted)
+        high: Bar highs
+        low: Bar lows
+        days: ``datetime64[D]`` trade dates of the rows
+            (:meth:`BarStore.day_index`)
+        offsets: Row offset where each day begins, plus the row count
+        start: Calendar window where the range starts (inclusive)
+        end: Calendar window where the range ends (exclusive)
+
+    Returns:
+        ``EXTREMES_COLUMNS`` without ``trade_date``, indexed by trade_date
+        (NaN / None on days without bars in the window)
+    """
+    ts_utc = np.asarray(ts_utc, dtype=np.int64)
+    high = np.asarray(high, dtype=float)
+    low = np.asarray(low, dtype=float)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    index = pd.DatetimeIndex(
+        np.asarray(days, dtype="datetime64[ns]"), name="trade_date"
+    )
+    out = pd.DataFrame(index=index, columns=EXTREMES_COLUMNS[1:], dtype=object)
+    out["MAX_10_22"] = np.nan
+    out["MIN_10_22"] = np.nan
+    if not len(days):
+        return out
+    # Window rows of each day: [lo, hi) clipped to the day's own rows
+    calendar = TradeCalendar.build(
+        days[0].astype(datetime.date), days[-1].astype(datetime.date)
+    )
+    lo = np.clip(
+        np.searchsorted(ts_utc, calendar.boundary(start, days), "left"),
+        offsets[:-1],
+        offsets[1:],
+    )
+    hi = np.clip(
+        np.searchsorted(ts_utc, calendar.boundary(end, days), "left"), lo, offsets[1:]
+    )
+    has = hi > lo
+    if not has.any():
+        return out
+    lo, n = lo[has], (hi - lo)[has]
+    # reduceat over [lo_0, hi_0, lo_1, hi_1, ...] (even slots are the windows);
+    # a NaN sentinel keeps hi == len valid
+    pairs = np.column_stack([lo, lo + n]).ravel()
+    highs = np.fmax.reduceat(np.r_[high, np.nan], pairs)[::2]
+    lows = np.fmin.reduceat(np.r_[low, np.nan], pairs)[::2]
+    at_max = _segment_arg(high, lo, n, highs)
+    at_min = _segment_arg(low, lo, n, lows)
+
+    out.loc[has, "MAX_10_22"] = highs
+    out.loc[has, "MIN_10_22"] = lows
+    for name, rows in (("MAX_10_22", at_max), ("MIN_10_22", at_min)):
+        found = rows < len(ts_utc)  # all-NaN windows have no extreme bar
+        times = pd.DatetimeIndex(
+            ts_utc[np.where(found, rows, 0)].astype("datetime64[ns]"), tz="UTC"
+        )
+        utc = np.where(found, times.strftime(TIME_FORMAT), None)
+        local = np.where(found, times.tz_convert(TIMEZONE).strftime(TIME_FORMAT), None)
+        out.loc[has, f"{name}_TIME_utc"] = utc
+        out.loc[has, f"{name}_TIME_local"] = local
+    return out
+
+
+def extremes_daily(
+    source: str,
+    start: Optional[datetime.date] = None,
+    end: Optional[datetime.date] = None,
+) -> pd.DataFrame:
+    """10:00-22:00 extremes of the stored trade dates.
+
+    Args:
+        source: ``futures_1m_ES`` bar store directory
+        start: First trade date. From the first stored day if None.
+        end: Last trade date (inclusive). To the last stored day if None.
+
+    Returns:
+        ``EXTREMES_COLUMNS`` without ``trade_date``, indexed by trade_date
+
+    Raises:
+        ConfigurationError: If the store is empty
+    """
+    store = BarStore(source)
+    if not store.rows:
+        raise ConfigurationError(f"Bar store {source} is empty")
+    cols = store.columns(start, end, ["ts_utc", "high", "low"])
+    days, offsets = store.day_index(start, end)
+    return window_extremes(cols["ts_utc"], cols["high"], cols["low"], days, offsets)
+
+
+def update_extremes(source: str, path: Path, metadata: Optional[dict] = None) -> int:
+    """Bring an extremes CSV up to date with the bar store.
+
+    Rows before the last stored trade date of the CSV are kept; that date
+    (possibly computed on a partial day) and newer ones are recomputed. A
+    file written by another MODEL_VERSION / CONFIG_HASH, or without these
+    columns, is rebuilt.
+
+    Args:
+        source: ``futures_1m_ES`` bar store directory
+        path: Extremes CSV
+        metadata: Versioning fields. ``version_metadata()`` if None.
+
+    Returns:
+        Number of trade dates recomputed
+    """
+    metadata = metadata or version_metadata()
+    kept, start = None, None
+    if path.exists():
+        old = pd.read_csv(path, dtype={c: str for c in EXTREMES_COLUMNS[3:]})
+        same = len(old) and all(
+            key in old and (old[key] == metadata[key]).all()
+            for key in ("MODEL_VERSION", "CONFIG_HASH")
+        )
+        if same:
+            start = datetime.date.fromisoformat(old["trade_date"].iloc[-1])
+            kept = old[old["trade_date"] < start.isoformat()].set_index("trade_date")
+            kept.index = pd.DatetimeIndex(pd.to_datetime(kept.index), name="trade_date")
+    fresh = extremes_daily(source, start)
+    table = fresh if kept is None else pd.concat([kept[EXTREMES_COLUMNS[1:]], fresh])
+    export_month(table, path, metadata, EXTREMES_COLUMNS)
+    return len(fresh)
+
+
+def extremes_table(ctx, inputs) -> pd.DataFrame:
+    """MASTER_OUTPUT ``max_10_22`` / ``min_10_22``.
+
+    Args:
+        ctx: Build context; needs the ``bars`` source (``futures_1m_ES``)
+        inputs: Unused (no required engines)
+
+    Returns:
+        ``EXTREMES_MASTER_COLUMNS`` indexed by trade_date
+
+    Raises:
+        ConfigurationError: If the ``bars`` source is not configured
+    """
+    if "bars" not in ctx.sources:
+        raise ConfigurationError("extremes engine needs a 'bars' source")
+    table = extremes_daily(ctx.sources["bars"], ctx.start, ctx.end)
+    return table.rename(columns={"MAX_10_22": "max_10_22", "MIN_10_22": "min_10_22"})[
+        list(EXTREMES_MASTER_COLUMNS)
+    ]
+
+
+def main(argv=None):
+    """Nightly max/min 10-22 job (appends new trade dates)."""
+    parser = argparse.ArgumentParser(description="Update the 10:00-22:00 max/min table")
+    parser.add_argument(
+        "--bars", default="DATA/futures_1m_ES", help="bar store directory"
+    )
+    parser.add_argument(
+        "--out", default="DATA/max_min/max_min_10_22.csv", help="output CSV"
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s"
+    )
+    rows = update_extremes(args.bars, Path(args.out))
+    print(f"{args.out}: {rows} trade dates recomputed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Daily GEX summary from GEXBot profiles (SPEC_LOCK §12, README ``gex_daily_summary``).
+
+One value per trade_date, valid for the whole day: the last profile row of
+the latest GEXBot date at or before the trade date (as-of join over the
+compacted ``gex_full`` metric, see
+:class:`~es_trading_dashboard.loaders.gexbot_loader.GexStore`).
+
+- ``zero_gamma_level``, ``call_wall_level``, ``put_wall_level`` come from
+  the profile
+- ``gamma_regime`` is POSITIVE when spot is at or above zero gamma
+  (mean-reverting), NEGATIVE below (trending); the sign of the net GEX is
+  used when spot is missing
+- ``gamma_major_sign`` is the sign of the net GEX (+1 / -1)
+"""
+
+import logging
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+from ..core.exceptions import ConfigurationError
+from ..loaders.gexbot_loader import GexStore
+
+logger = logging.getLogger(__name__)
+
+GEX_METRIC = "gex_full"
+GEX_TOLERANCE_DAYS = 3
+
+# Field -> accepted GEXBot column names (first match wins)
+GEX_ALIASES = {
+    "spot": ("spot", "price", "underlying"),
+    "zero_gamma": ("zero_gamma", "zero_gamma_level", "zero_gex"),
+    "call_wall": ("call_wall", "major_pos_oi", "major_pos_vol"),
+    "put_wall": ("put_wall", "major_neg_oi", "major_neg_vol"),
+    "net_gex": ("sum_gex_oi", "sum_gex_vol", "net_gex", "sum_gex"),
+}
+
+GEX_SUMMARY_COLUMNS = [
+    "trade_date",
+    "zero_gamma_level",
+    "call_wall_level",
+    "put_wall_level",
+    "gamma_regime",
+    "gamma_major_sign",
+]
+
+# MASTER_OUTPUT columns of the builder engine
+GEX_COLUMNS = ("zero_gamma", "call_wall", "put_wall", "gamma_regime")
+
+
+def gex_daily_summary(
+    store,
+    trade_dates: Sequence,
+    metric: str = GEX_METRIC,
+    tolerance: int = GEX_TOLERANCE_DAYS,
+) -> pd.DataFrame:
+    """``gex_daily_summary`` rows for the given trade dates.
+
+    Args:
+        store: Refreshed ``GexStore``
+        trade_dates: Target trade dates
+        metric: Compacted metric holding the profiles
+        tolerance: Maximum profile age in calendar days
+
+    Returns:
+        ``GEX_SUMMARY_COLUMNS`` without ``trade_date``, indexed by trade_date
+
+    Raises:
+        ConfigurationError: If the metric has no zero gamma column
+    """
+    header = store.table(metric).columns
+    found = {}
+    for name, candidates in GEX_ALIASES.items():
+        match = next((c for c in candidates if c in header), None)
+        if match is not None:
+            found[name] = match
+    if "zero_gamma" not in found:
+        raise ConfigurationError(
+            f"GEXBot {metric} has no zero gamma column: {list(header)}"
+        )
+    rows = store.asof(metric, trade_dates, list(found.values()), tolerance)
+
+    def column(name):
+        if name not in found:
+            return np.full(len(rows), np.nan)
+        return pd.to_numeric(rows[found[name]], errors="coerce").to_numpy(float)
+
+    spot, zero, net = column("spot"), column("zero_gamma"), column("net_gex")
+    sign = np.sign(net)
+    above = np.where(np.isnan(spot), sign > 0, spot >= zero)
+    known = np.where(np.isnan(spot), ~np.isnan(net), ~np.isnan(zero))
+    regime = np.where(known, np.where(above, "POSITIVE", "NEGATIVE"), None)
+    return pd.DataFrame(
+        {
+            "zero_gamma_level": zero,
+            "call_wall_level": column("call_wall"),
+            "put_wall_level": column("put_wall"),
+            "gamma_regime": regime,
+            "gamma_major_sign": np.where(sign == 0, np.nan, sign),
+        },
+        index=rows.index,
+    )
+
+
+def gex_table(ctx, inputs) -> pd.DataFrame:
+    """MASTER_OUTPUT GEX columns (history engine: one as-of join for all days).
+
+    Refreshes the compacted metric first, so new daily CSVs are picked up.
+
+    Args:
+        ctx: Build context; needs the ``gex`` source (GEXBot tree) and
+            optionally ``gex_cache`` (compacted files directory)
+        inputs: Unused (no required engines)
+
+    Returns:
+        ``GEX_COLUMNS`` indexed by trade_date
+
+    Raises:
+        ConfigurationError: If the ``gex`` source is not configured
+    """
+    if "gex" not in ctx.sources:
+        raise ConfigurationError("gex engine needs a 'gex' source")
+    store = GexStore(ctx.sources["gex"], ctx.sources.get("gex_cache"))
+    store.refresh([GEX_METRIC])
+    summary = gex_daily_summary(store, ctx.trade_dates)
+    return summary.rename(
+        columns={
+            "zero_gamma_level": "zero_gamma",
+            "call_wall_level": "call_wall",
+            "put_wall_level": "put_wall",
+        }
+    )[list(GEX_COLUMNS)]
@@ -0,0 +1,181 @@
+"""Sorted as-of join of trade_date tables (README ``daily_summary_master``).
+
+Every feature table (bar stats, ``rv_daily``, ``oi_snapshots``,
+``gex_daily_summary``, Phase 2 features) is indexed by a sorted, unique
+trade_date. The master is built on a sorted key calendar in one pass per
+table:
+- Table dates and keys are merged with a stable sort of the two
+  concatenated sorted runs (timsort detects the runs, so the merge is
+  linear) and a running maximum gives, for each key, the last table row at
+  or before it; no key x row product is ever formed
+- A match older than the table's ``tolerance`` (calendar days) is dropped;
+  ``tolerance=0`` is an exact join, None accepts any earlier row
+- Unmatched keys get the table's ``fill`` value (NaN by default; a fill
+  of another type upcasts the column); NaN values of matched rows are kept
+  as they are
+- Each column is gathered once with a positional take
+
+Build time is linear in keys + rows for each table, so adding tables adds
+time proportionally. :class:`JoinStats` records the coverage of each table.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import take
+
+from ..core.exceptions import ConfigurationError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class JoinSpec:
+    """Join policy of one table.
+
+    Attributes:
+        tolerance: Maximum age of a matched row in calendar days (0 = exact
+            date, None = unlimited)
+        fill: Value of unmatched keys: a scalar for every column, a mapping
+            column -> value (other columns NaN), or None for NaN
+    """
+
+    tolerance: Optional[int] = 0
+    fill: Any = None
+
+    def fill_value(self, column: str) -> Any:
+        """Fill value of ``column`` for unmatched keys."""
+        if isinstance(self.fill, Mapping):
+            return self.fill.get(column)
+        return self.fill
+
+
+@dataclass(frozen=True)
+class JoinStats:
+    """Join coverage of one table.
+
+    Attributes:
+        rows: Rows of the table
+        keys: Keys of the join
+        exact: Keys matched on their own date
+        asof: Keys matched on an earlier date within tolerance
+        stale: Keys whose last earlier row is beyond tolerance
+    """
+
+    rows: int
+    keys: int
+    exact: int
+    asof: int
+    stale: int
+
+    @property
+    def missing(self) -> int:
+        """Keys without a match (filled)."""
+        return self.keys - self.exact - self.asof
+
+    @property
+    def coverage(self) -> float:
+        """Share of matched keys (1.0 when there are no keys)."""
+        return (self.exact + self.asof) / self.keys if self.keys else 1.0
+
+    def as_dict(self) -> dict:
+        """JSON-ready statistics (for the build manifest)."""
+        return {
+            "rows": self.rows,
+            "keys": self.keys,
+            "exact": self.exact,
+            "asof": self.asof,
+            "stale": self.stale,
+            "missing": self.missing,
+            "coverage": round(self.coverage, 6),
+        }
+
+
+def _days(index: pd.Index, name: str) -> np.ndarray:
+    """Sorted unique trade dates of an index as int64 day numbers."""
+    days = np.asarray(
+        pd.DatetimeIndex(index).values.astype("datetime64[D]"), dtype=np.int64
+    )
+    if len(days) > 1 and not (days[1:] > days[:-1]).all():
+        raise ConfigurationError(
+            f"Join table {name}: trade dates must be sorted and unique"
+        )
+    return days
+
+
+def asof_positions(keys: np.ndarray, dates: np.ndarray) -> np.ndarray:
+    """Position of the last date at or before each key (-1 if none).
+
+    Args:
+        keys: Sorted int64 keys
+        dates: Sorted unique int64 dates
+
+    Returns:
+        int64 positions into ``dates``, one per key
+    """
+    merged = np.concatenate([dates, keys])
+    # Stable: a date equal to a key sorts before it (dates come first)
+    order = np.argsort(merged, kind="stable")
+    is_date = order < len(dates)
+    last = np.maximum.accumulate(np.where(is_date, order, -1))
+    pos = np.empty(len(keys), dtype=np.int64)
+    pos[order[~is_date] - len(dates)] = last[~is_date]
+    return pos
+
+
+def asof_join(
+    keys: Sequence,
+    tables: Mapping[str, pd.DataFrame],
+    specs: Optional[Mapping[str, JoinSpec]] = None,
+) -> tuple[pd.DataFrame, dict[str, JoinStats]]:
+    """Join trade_date-indexed tables onto a key calendar.
+
+    Args:
+        keys: Sorted unique trade dates of the result
+        tables: Tables indexed by sorted unique trade_date, in column order;
+            column names must not repeat across tables
+        specs: Join policy by table name. Exact join, NaN fill if missing.
+
+    Returns:
+        Tuple (joined frame indexed by trade_date, statistics by table)
+
+    Raises:
+        ConfigurationError: If keys or a table index are not sorted and
+            unique, or a column appears in two tables
+    """
+    specs = specs or {}
+    index = pd.DatetimeIndex(pd.to_datetime(keys), name="trade_date")
+    key_days = _days(index, "keys")
+    columns: dict[str, Any] = {}
+    stats: dict[str, JoinStats] = {}
+    for name, table in tables.items():
+        spec = specs.get(name, JoinSpec())
+        dates = _days(table.index, name)
+        pos = asof_positions(key_days, dates)
+        found = pos >= 0
+        matched = dates[np.maximum(pos, 0)] if len(dates) else key_days
+        age = np.where(found, key_days - matched, -1)
+        ok = found if spec.tolerance is None else found & (age <= spec.tolerance)
+        take_pos = np.where(ok, pos, -1)
+        for column in table.columns:
+            if column in columns:
+                raise ConfigurationError(
+                    f"Join column {column} of {name} already joined"
+                )
+            values = pd.Series(
+                take(table[column].array, take_pos, allow_fill=True), index=index
+            )
+            fill = spec.fill_value(column)
+            columns[column] = values if fill is None else values.where(ok, fill)
+        stats[name] = JoinStats(
+            rows=len(table),
+            keys=len(key_days),
+            exact=int((ok & (age == 0)).sum()),
+            asof=int((ok & (age > 0)).sum()),
+            stale=int((found & ~ok).sum()),
+        )
+        logger.debug(f"join {name}: {stats[name].as_dict()}")
+    return pd.DataFrame(columns, index=index), stats
@@ -0,0 +1,184 @@
+"""Input fingerprints for incremental MASTER_OUTPUT rebuilds (SPEC_LOCK §15).
+
+Corrections happen only by rebuilding from raw data, so the builder needs to
+know which trade dates a raw change touches:
+- Source files are mapped to trade dates by the date in their path
+  (``..._2026-03-11.csv.zst``, ``20260311``, ``trade_date=2026-03-11/``);
+  undated files (a single CSV, a config table) belong to every date
+- Stores that keep their own per-day digests (the bar store) contribute
+  those instead of file hashes
+- File contents are hashed (SHA256) once per (size, mtime) and remembered
+- A trade date's fingerprint combines its files' hashes and digests, the
+  CONFIG_HASH and the engine set; the builder recomputes only dates whose
+  fingerprint changed and reuses cached engine outputs for the others
+
+The manifest is a JSON file written atomically next to the outputs.
+"""
+
+import datetime
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Iterable, Mapping, Optional, Sequence
+
+from ..core.calendar import path_date
+
+logger = logging.getLogger(__name__)
+
+
+def source_files(
+    sources: Mapping[str, str],
+    names: Iterable[str],
+) -> tuple[dict[datetime.date, list[str]], list[str]]:
+    """Files of the named sources, split into dated and shared.
+
+    Args:
+        sources: Source paths by name (files or directories)
+        names: Source names to resolve (unknown names are ignored)
+
+    Returns:
+        Tuple (files by trade date, shared files), paths sorted
+    """
+    dated: dict[datetime.date, list[str]] = {}
+    shared: list[str] = []
+    for name in sorted(set(names)):
+        if name not in sources:
+            continue
+        root = Path(sources[name])
+        if root.is_dir():
+            files = [p for p in root.rglob("*") if p.is_file()]
+            for p in files:
+                day = path_date(str(p.relative_to(root)))
+                if day is None:
+                    shared.append(str(p))
+                else:
+                    dated.setdefault(day, []).append(str(p))
+        elif root.exists():
+            shared.append(str(root))
+    for files in dated.values():
+        files.sort()
+    return dated, sorted(shared)
+
+
+class BuildManifest:
+    """Per-trade_date fingerprints, file hashes and month digests.
+
+    Layout::
+
+        {"files": {path: {"size", "mtime_ns", "sha256"}},
+         "days": {"2026-03-11": fingerprint},
+         "months": {"2026_03": digest},
+         "coverage": {engine: {"rows", "keys", "exact", "asof", ...}}}
+
+    Attributes:
+        path: Manifest file
+    """
+
+    def __init__(self, path: str):
+        """Load the manifest (empty if missing or unreadable).
+
+        Args:
+            path: Manifest file
+        """
+        self.path = Path(path)
+        self._data = {"files": {}, "days": {}, "months": {}, "coverage": {}}
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            for key in self._data:
+                self._data[key].update(data.get(key, {}))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable manifest {self.path}: {e}")
+
+    def file_hash(self, path: str) -> str:
+        """SHA256 of a file, recomputed only when its size or mtime changed."""
+        st = os.stat(path)
+        entry = self._data["files"].get(path)
+        if (
+            entry
+            and entry["size"] == st.st_size
+            and entry["mtime_ns"] == st.st_mtime_ns
+        ):
+            return entry["sha256"]
+        with open(path, "rb") as f:
+            digest = hashlib.file_digest(f, "sha256").hexdigest()
+        self._data["files"][path] = {
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "sha256": digest,
+        }
+        return digest
+
+    def fingerprints(
+        self,
+        days: Sequence[datetime.date],
+        dated: Mapping[datetime.date, Sequence[str]],
+        shared: Sequence[str],
+        salt: str,
+        digests: Optional[Mapping[datetime.date, Sequence[str]]] = None,
+    ) -> dict[datetime.date, str]:
+        """Fingerprint every trade date.
+
+        Args:
+            days: Trade dates
+            dated: Source files by trade date
+            shared: Source files of every trade date
+            salt: CONFIG_HASH and engine signature
+            digests: Content digests by trade date, from sources that
+                fingerprint themselves
+
+        Returns:
+            Fingerprint by trade date
+        """
+        base = hashlib.sha256(salt.encode())
+        for path in shared:
+            base.update(f"{path}\0{self.file_hash(path)}\n".encode())
+        out = {}
+        for day in days:
+            h = base.copy()
+            for path in dated.get(day, ()):
+                h.update(f"{path}\0{self.file_hash(path)}\n".encode())
+            for digest in (digests or {}).get(day, ()):
+                h.update(f"{digest}\n".encode())
+            out[day] = h.hexdigest()
+        return out
+
+    def changed(self, fingerprints: Mapping[datetime.date, str]) -> list[datetime.date]:
+        """Trade dates whose fingerprint differs from the recorded one."""
+        days = self._data["days"]
+        return sorted(
+            d for d, fp in fingerprints.items() if days.get(d.isoformat()) != fp
+        )
+
+    def record(self, fingerprints: Mapping[datetime.date, str]):
+        """Record fingerprints of rebuilt trade dates."""
+        self._data["days"].update({d.isoformat(): fp for d, fp in fingerprints.items()})
+
+    def month_digest(self, key: str) -> Optional[str]:
+        """Digest of the last exported content of a month."""
+        return self._data["months"].get(key)
+
+    def set_month_digest(self, key: str, digest: str):
+        """Record the digest of an exported month."""
+        self._data["months"][key] = digest
+
+    def set_coverage(self, stats: Mapping[str, Mapping]):
+        """Record the join coverage of the last build, by table."""
+        self._data["coverage"] = {name: dict(s) for name, s in stats.items()}
+
+    def forget_days(self, days: Iterable[datetime.date]):
+        """Drop fingerprints (forces a rebuild of those dates)."""
+        for day in days:
+            self._data["days"].pop(day.isoformat(), None)
+
+    def save(self):
+        """Write the manifest atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(self._data, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.path)
@@ -0,0 +1,448 @@
+"""OI snapshots from the OI runner files (SPEC_LOCK §11, README ``oi_snapshots``).
+
+Every (trade_date, slot) snapshot of ``ES_OI_RAW_*`` / ``ES_OI_MASTER_RAW``
+is loaded into one dense cube::
+
+    oi[snapshot, expiry_bucket, right, strike_index]    float32
+
+on the ``STRIKE_STEP`` grid, snapshots in time order. All per-snapshot
+fields then come from array operations on the whole cube at once:
+- The ±``STRIKE_WINDOW`` window around the underlying is a gather of
+  ``2 * 100 / 5 + 1`` strike indexes per snapshot (O(window), no filters)
+- Window sums and walls (argmax) reduce the gathered block
+- Deltas vs yesterday (same slot) and vs the previous snapshot subtract the
+  same window gathered from the reference snapshot
+
+Expiries are grouped in ``EXPIRY_BUCKETS`` (0DTE up to one year) so the
+cube size does not grow with the number of listed expiries.
+"""
+
+import argparse
+import datetime
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..core.calendar import WINDOW_NAMES, locate, path_date
+from ..core.exceptions import ConfigurationError
+from ..core.spec import STRIKE_STEP, STRIKE_WINDOW, TIMEZONE
+from ..core.versioning import version_metadata
+from .exporters import export_month
+
+logger = logging.getLogger(__name__)
+
+# Snapshot slots (SPEC_LOCK §11), local Zurich time
+OI_SLOTS = ("02:15", "10:00", "15:30", "22:00")
+
+# name -> (min, max) calendar days to expiry, inclusive
+EXPIRY_BUCKETS = {
+    "0DTE": (0, 0),
+    "1-7D": (1, 7),
+    "8-30D": (8, 30),
+    "31-365D": (31, 365),
+}
+
+RIGHTS = ("C", "P")
+
+# Field -> accepted header names in the OI runner files (first match wins)
+OI_ALIASES = {
+    "timestamp": ("timestamp", "ts", "time", "snapshot_time"),
+    "trade_date": ("trade_date",),
+    "slot": ("snapshot_slot", "slot"),
+    "expiry": ("expiry", "expiration", "lastTradeDateOrContractMonth"),
+    "strike": ("strike",),
+    "right": ("right", "option_type", "put_call"),
+    "open_interest": ("open_interest", "oi", "openInterest"),
+    "underlying": ("underlying", "underlying_price", "es_last", "es_price"),
+}
+
+OI_SNAPSHOT_COLUMNS = [
+    "trade_date",
+    "snapshot_slot",
+    "expiry_bucket",
+    "underlying",
+    "oi_call_sum_100",
+    "oi_put_sum_100",
+    "call_wall_strike",
+    "call_wall_oi",
+    "put_wall_strike",
+    "put_wall_oi",
+    "delta_oi_call_vs_yesterday",
+    "delta_oi_put_vs_yesterday",
+    "delta_oi_call_vs_prev_snapshot",
+    "delta_oi_put_vs_prev_snapshot",
+]
+
+# MASTER_OUTPUT: 0DTE walls of the 10:00 snapshot
+OI_COLUMNS = ("oi_call_max", "oi_put_max")
+MASTER_SLOT = "10:00"
+MASTER_BUCKET = "0DTE"
+
+RAW_GLOB = "ES_OI_*RAW*.csv"
+
+
+def _minutes(slot: str) -> int:
+    hour, minute = slot.split(":")
+    return int(hour) * 60 + int(minute)
+
+
+# Calendar window -> OI slot (last slot at or before the window start)
+_WINDOW_SLOT = (
+    np.searchsorted(
+        [_minutes(s) for s in OI_SLOTS], [_minutes(w) for w in WINDOW_NAMES], "right"
+    )
+    - 1
+)
+
+
+def _slot_names(values: pd.Series) -> np.ndarray:
+    """``10:00`` / ``1000`` / ``10:00:00`` -> ``10:00``."""
+    digits = values.astype(str).str.replace(":", "", regex=False).str.zfill(4).str[:4]
+    return (digits.str[:2] + ":" + digits.str[2:]).to_numpy()
+
+
+def read_oi_raw(paths: Iterable[str]) -> pd.DataFrame:
+    """Load OI runner raw files into normalized rows.
+
+    Snapshots are identified by ``trade_date`` + ``snapshot_slot`` columns
+    when present, otherwise by the timestamp (naive times are Zurich): the
+    slot is the last one at or before the time, and 00:00-02:14 is the
+    22:00 snapshot of the previous trade date.
+
+    Args:
+        paths: ``ES_OI_RAW_YYYY-MM-DD.csv`` / ``ES_OI_MASTER_RAW.csv`` files
+
+    Returns:
+        Rows with ``trade_date`` (datetime64), ``slot``, ``expiry``
+        (datetime64), ``strike``, ``right`` (C/P), ``open_interest`` and
+        ``underlying``
+
+    Raises:
+        ConfigurationError: If a file lacks required columns
+    """
+    frames = []
+    for path in paths:
+        header = pd.read_csv(path, nrows=0).columns
+        found = {}
+        for name, candidates in OI_ALIASES.items():
+            match = next((c for c in candidates if c in header), None)
+            if match is not None:
+                found[name] = match
+        has_keys = "trade_date" in found and "slot" in found
+        required = ["expiry", "strike", "right", "open_interest", "underlying"]
+        missing = [n for n in required if n not in found]
+        if not has_keys and "timestamp" not in found:
+            missing.append("timestamp or trade_date+snapshot_slot")
+        if missing:
+            raise ConfigurationError(f"{Path(path).name}: missing OI columns {missing}")
+        raw = pd.read_csv(
+            path, usecols=list(found.values()), dtype={found["expiry"]: str}
+        )
+        raw = raw.rename(columns={col: name for name, col in found.items()})
+        if has_keys:
+            day = pd.to_datetime(raw["trade_date"]).to_numpy().astype("datetime64[D]")
+            slot = _slot_names(raw["slot"])
+        else:
+            ts = pd.DatetimeIndex(pd.to_datetime(raw["timestamp"]))
+            ts = ts.tz_localize(TIMEZONE) if ts.tz is None else ts
+            day, window = locate(ts.tz_convert("UTC").as_unit("ns").asi8)
+            slot = np.asarray(OI_SLOTS)[_WINDOW_SLOT[window]]
+        expiry = raw["expiry"].str.replace("-", "", regex=False).str[:8]
+        frames.append(
+            pd.DataFrame(
+                {
+                    "trade_date": day,
+                    "slot": slot,
+                    "expiry": pd.to_datetime(expiry, format="%Y%m%d")
+                    .to_numpy()
+                    .astype("datetime64[D]"),
+                    "strike": raw["strike"].to_numpy(float),
+                    "right": raw["right"]
+                    .astype(str)
+                    .str.strip()
+                    .str[0]
+                    .str.upper()
+                    .to_numpy(),
+                    "open_interest": raw["open_interest"].to_numpy(float),
+                    "underlying": raw["underlying"].to_numpy(float),
+                }
+            )
+        )
+    if not frames:
+        return pd.DataFrame(
+            columns=[
+                "trade_date",
+                "slot",
+                "expiry",
+                "strike",
+                "right",
+                "open_interest",
+                "underlying",
+            ]
+        )
+    return pd.concat(frames, ignore_index=True)
+
+
+@dataclass(frozen=True)
+class OICube:
+    """Dense OI of every snapshot on the strike grid.
+
+    Attributes:
+        trade_dates: ``datetime64[D]`` trade date of each snapshot
+        slots: Slot index (into ``OI_SLOTS``) of each snapshot
+        underlying: Underlying price of each snapshot
+        oi: ``(snapshots, buckets, 2, strikes)`` OI
+        k0: Grid index of strike column 0 (strike = (k0 + j) * step)
+        step: Strike step
+    """
+
+    trade_dates: np.ndarray
+    slots: np.ndarray
+    underlying: np.ndarray
+    oi: np.ndarray
+    k0: int
+    step: float = STRIKE_STEP
+
+    @classmethod
+    def from_rows(cls, rows: pd.DataFrame, step: float = STRIKE_STEP) -> "OICube":
+        """Scatter normalized rows (:func:`read_oi_raw`) into the cube.
+
+        Rows off the strike grid, with an unknown right or outside the
+        expiry buckets are dropped.
+        """
+        dte = (
+            rows["expiry"].to_numpy().astype("datetime64[D]")
+            - rows["trade_date"].to_numpy().astype("datetime64[D]")
+        ).astype(int)
+        bucket = np.full(len(rows), -1)
+        for b, (lo, hi) in enumerate(EXPIRY_BUCKETS.values()):
+            bucket[(dte >= lo) & (dte <= hi)] = b
+        grid = rows["strike"].to_numpy(float) / step
+        k = np.rint(grid).astype(np.int64)
+        right = np.searchsorted(RIGHTS, rows["right"].to_numpy(str))
+        keep = (
+            (bucket >= 0)
+            & np.isclose(grid, k)
+            & np.isin(rows["right"].to_numpy(str), RIGHTS)
+            & np.isfinite(rows["open_interest"].to_numpy(float))
+        )
+        if (~keep).any():
+            logger.debug(f"Dropped {int((~keep).sum())} OI rows (off grid or bucket)")
+
+        slot_names = rows["slot"].to_numpy(str)
+        slot = np.searchsorted(OI_SLOTS, slot_names)
+        keep &= np.isin(slot_names, OI_SLOTS)
+        day = rows["trade_date"].to_numpy().astype("datetime64[D]")
+        keys = day.astype(np.int64) * len(OI_SLOTS) + slot
+        snap_keys, snap = np.unique(keys[keep], return_inverse=True)
+        n_snap = len(snap_keys)
+        if not n_snap:
+            return cls(
+                np.empty(0, "datetime64[D]"),
+                np.empty(0, int),
+                np.empty(0),
+                np.zeros((0, len(EXPIRY_BUCKETS), 2, 0), np.float32),
+                0,
+                step,
+            )
+
+        k0 = int(k[keep].min())
+        n_strikes = int(k[keep].max()) - k0 + 1
+        n_buckets = len(EXPIRY_BUCKETS)
+        flat = ((snap * n_buckets + bucket[keep]) * 2 + right[keep]) * n_strikes + (
+            k[keep] - k0
+        )
+        oi = np.bincount(
+            flat,
+            weights=rows["open_interest"].to_numpy(float)[keep],
+            minlength=n_snap * n_buckets * 2 * n_strikes,
+        )
+        underlying = np.bincount(
+            snap, weights=rows["underlying"].to_numpy(float)[keep], minlength=n_snap
+        ) / np.bincount(snap, minlength=n_snap)
+        return cls(
+            trade_dates=(snap_keys // len(OI_SLOTS)).astype("datetime64[D]"),
+            slots=snap_keys % len(OI_SLOTS),
+            underlying=underlying,
+            oi=oi.reshape(n_snap, n_buckets, 2, n_strikes).astype(np.float32),
+            k0=k0,
+            step=step,
+        )
+
+    def references(self) -> tuple[np.ndarray, np.ndarray]:
+        """Previous snapshot and same slot of the previous trade date (-1 if none)."""
+        n = len(self.slots)
+        prev = np.arange(n) - 1
+        days, day_rank = np.unique(self.trade_dates, return_inverse=True)
+        n_slots = len(OI_SLOTS)
+        table = np.full(len(days) * n_slots, -1)
+        key = day_rank * n_slots + self.slots
+        table[key] = np.arange(n)
+        yesterday = np.where(day_rank > 0, table[np.maximum(key - n_slots, 0)], -1)
+        return prev, yesterday
+
+    def window(
+        self, snapshots: np.ndarray, centers: np.ndarray, window: float
+    ) -> np.ndarray:
+        """Gather the strike window of ``centers`` from ``snapshots``.
+
+        Returns:
+            ``(n, buckets, 2, 2h+1)`` block (0 outside the grid or for
+            snapshot -1)
+        """
+        half = int(round(window / self.step))
+        idx = centers[:, None] + np.arange(-half, half + 1)
+        n_strikes = self.oi.shape[-1]
+        valid = (idx >= 0) & (idx < n_strikes) & (snapshots[:, None] >= 0)
+        block = self.oi[
+            np.maximum(snapshots, 0)[:, None, None, None],
+            np.arange(self.oi.shape[1])[None, :, None, None],
+            np.arange(2)[None, None, :, None],
+            np.clip(idx, 0, n_strikes - 1)[:, None, None, :],
+        ]
+        return block * valid[:, None, None, :]
+
+
+def oi_snapshots(cube: OICube, window: float = STRIKE_WINDOW) -> pd.DataFrame:
+    """``oi_snapshots`` rows: one per (snapshot, expiry bucket).
+
+    Args:
+        cube: Dense OI cube
+        window: Half width of the strike window around the underlying
+
+    Returns:
+        ``OI_SNAPSHOT_COLUMNS`` rows, sorted by trade_date, slot, bucket
+    """
+    n = len(cube.slots)
+    n_buckets = len(EXPIRY_BUCKETS)
+    half = int(round(window / cube.step))
+    finite = np.isfinite(cube.underlying)
+    centers = (
+        np.where(finite, np.rint(np.nan_to_num(cube.underlying) / cube.step), 0).astype(
+            np.int64
+        )
+        - cube.k0
+    )
+    snaps = np.arange(n)
+    block = cube.window(snaps, centers, window)
+    sums = block.sum(axis=-1)
+    best = block.argmax(axis=-1)
+    wall_oi = np.take_along_axis(block, best[..., None], axis=-1)[..., 0]
+    wall_strike = (cube.k0 + centers[:, None, None] - half + best) * cube.step
+    wall_strike = np.where(wall_oi > 0, wall_strike, np.nan)
+
+    prev, yesterday = cube.references()
+    deltas = {}
+    for name, ref in (("yesterday", yesterday), ("prev_snapshot", prev)):
+        delta = sums - cube.window(ref, centers, window).sum(axis=-1)
+        deltas[name] = np.where((ref >= 0)[:, None, None], delta, np.nan)
+
+    def flat(values, side=None):
+        values = values if side is None else values[:, :, side]
+        out = np.asarray(values, dtype=float).reshape(n * n_buckets)
+        return np.where(np.repeat(finite, n_buckets), out, np.nan)
+
+    return pd.DataFrame(
+        {
+            "trade_date": np.repeat(cube.trade_dates, n_buckets),
+            "snapshot_slot": np.repeat(np.asarray(OI_SLOTS)[cube.slots], n_buckets),
+            "expiry_bucket": np.tile(list(EXPIRY_BUCKETS), n),
+            "underlying": np.repeat(cube.underlying, n_buckets),
+            "oi_call_sum_100": flat(sums, 0),
+            "oi_put_sum_100": flat(sums, 1),
+            "call_wall_strike": flat(wall_strike, 0),
+            "call_wall_oi": flat(wall_oi, 0),
+            "put_wall_strike": flat(wall_strike, 1),
+            "put_wall_oi": flat(wall_oi, 1),
+            "delta_oi_call_vs_yesterday": flat(deltas["yesterday"], 0),
+            "delta_oi_put_vs_yesterday": flat(deltas["yesterday"], 1),
+            "delta_oi_call_vs_prev_snapshot": flat(deltas["prev_snapshot"], 0),
+            "delta_oi_put_vs_prev_snapshot": flat(deltas["prev_snapshot"], 1),
+        }
+    )
+
+
+def raw_files(
+    source: str,
+    start: Optional[datetime.date] = None,
+    end: Optional[datetime.date] = None,
+) -> list[str]:
+    """OI runner raw files of a source (file or directory) for a date range.
+
+    Dated daily files outside ``[start, end]`` are skipped; undated files
+    (``ES_OI_MASTER_RAW.csv``) are always read.
+    """
+    root = Path(source)
+    if not root.is_dir():
+        return [str(root)]
+    files = []
+    for path in sorted(root.glob(RAW_GLOB)):
+        day = path_date(path.name)
+        if day is not None and ((start and day < start) or (end and day > end)):
+            continue
+        files.append(str(path))
+    return files
+
+
+def oi_table(ctx, inputs) -> pd.DataFrame:
+    """MASTER_OUTPUT OI columns: 0DTE call/put wall strikes at 10:00.
+
+    Args:
+        ctx: Build context; needs the ``oi`` source (raw file or directory)
+        inputs: Unused (no required engines)
+
+    Returns:
+        ``OI_COLUMNS`` indexed by trade_date
+
+    Raises:
+        ConfigurationError: If the ``oi`` source is not configured
+    """
+    if "oi" not in ctx.sources:
+        raise ConfigurationError("oi engine needs an 'oi' source")
+    rows = read_oi_raw(raw_files(ctx.sources["oi"], ctx.start, ctx.end))
+    snaps = oi_snapshots(OICube.from_rows(rows))
+    snaps = snaps[
+        (snaps["snapshot_slot"] == MASTER_SLOT)
+        & (snaps["expiry_bucket"] == MASTER_BUCKET)
+    ]
+    return pd.DataFrame(
+        {
+            "oi_call_max": snaps["call_wall_strike"].to_numpy(),
+            "oi_put_max": snaps["put_wall_strike"].to_numpy(),
+        },
+        index=pd.DatetimeIndex(snaps["trade_date"].to_numpy(), name="trade_date"),
+    )
+
+
+def main(argv=None):
+    """Build ``oi_snapshots`` from the OI runner files."""
+    parser = argparse.ArgumentParser(
+        description="Build oi_snapshots from OI runner raw files"
+    )
+    parser.add_argument(
+        "source", help="ES_OI_MASTER_RAW.csv or directory of ES_OI_RAW_*.csv"
+    )
+    parser.add_argument("--out", default="DATA/oi/oi_snapshots.csv", help="output CSV")
+    parser.add_argument("--start", type=datetime.date.fromisoformat, default=None)
+    parser.add_argument("--end", type=datetime.date.fromisoformat, default=None)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s"
+    )
+    cube = OICube.from_rows(read_oi_raw(raw_files(args.source, args.start, args.end)))
+    logger.info(
+        f"{len(cube.slots)} snapshots, "
+        f"cube {cube.oi.shape} ({cube.oi.nbytes / 1e6:.1f} MB)"
+    )
+    table = oi_snapshots(cube)
+    rows = export_month(table, Path(args.out), version_metadata(), OI_SNAPSHOT_COLUMNS)
+    print(f"{args.out}: {rows} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""MASTER_OUTPUT range engine (SPEC_LOCK §5, §6).
+
+Rebuilds the morning and afternoon ranges of every trade date from the
+fixed snapshots with the vectorized range kernel
+(:mod:`~es_trading_dashboard.core.ranges`, shared with the live collector).
+"""
+
+import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ..core.exceptions import ConfigurationError
+from ..core.ranges import LEVEL_INDEX, range_levels
+
+RANGE_COLUMNS = (
+    "vwap_es",
+    "spx_open",
+    "morning_high",
+    "morning_low",
+    "afternoon_high",
+    "afternoon_low",
+    "iv_atm",
+)
+
+
+def read_snapshots(
+    source: str, start: datetime.date, end: datetime.date
+) -> pd.DataFrame:
+    """Fixed snapshots of the live collector for a trade_date range.
+
+    Args:
+        source: ``snapshots_fixed.csv`` or a ParquetStore root
+            (``range_snapshots`` table)
+        start: First trade date (inclusive)
+        end: Last trade date (inclusive)
+
+    Returns:
+        Snapshot rows (``SNAP_COLUMNS``) with ``date`` as YYYYMMDD strings
+    """
+    if Path(source).is_dir():
+        from ..collector.parquet_store import ParquetStore
+
+        snaps = ParquetStore(source).read("range_snapshots", start, end)
+    else:
+        snaps = pd.read_csv(source, dtype={"date": str, "slot": str})
+    dates = snaps["date"].astype(str)
+    return snaps[
+        (dates >= start.strftime("%Y%m%d")) & (dates <= end.strftime("%Y%m%d"))
+    ]
+
+
+def range_table(ctx, inputs) -> pd.DataFrame:
+    """Morning and afternoon ranges per trade date (SPEC_LOCK §5, §6).
+
+    Levels are rebuilt from each day's fixed snapshot inputs (base, IV
+    daily, IV straddle) with one :func:`range_levels` call for all days:
+    morning from the ES 10:00 VWAP snapshot, afternoon from the SPX 15:30
+    official open. High/low are the R1 UP / R1 DOWN levels.
+
+    Args:
+        ctx: Build context; needs the ``snapshots`` source
+        inputs: Unused (no required engines)
+
+    Returns:
+        ``RANGE_COLUMNS`` indexed by trade_date
+
+    Raises:
+        ConfigurationError: If the ``snapshots`` source is not configured
+    """
+    if "snapshots" not in ctx.sources:
+        raise ConfigurationError("range engine needs a 'snapshots' source")
+    snaps = read_snapshots(ctx.sources["snapshots"], ctx.start, ctx.end)
+    by_slot = {
+        slot: snaps[snaps["slot"] == slot]
+        .drop_duplicates("date", keep="last")
+        .set_index("date")
+        for slot in ("ES_10:00", "SPX_15:30")
+    }
+    days = by_slot["ES_10:00"].index.union(by_slot["SPX_15:30"].index)
+    am = by_slot["ES_10:00"].reindex(days)
+    pm = by_slot["SPX_15:30"].reindex(days)
+
+    def stacked(column, scale=1.0):
+        return (
+            np.stack([am[column].to_numpy(float), pm[column].to_numpy(float)]) * scale
+        )
+
+    levels = range_levels(
+        stacked("base_value"),
+        stacked("iv_daily_pct_fixed", 0.01),
+        stacked("iv_straddle_pct_fixed", 0.01),
+    )
+    up, dn = LEVEL_INDEX["R1 UP"], LEVEL_INDEX["R1 DOWN"]
+    return pd.DataFrame(
+        {
+            "vwap_es": am["base_value"].to_numpy(float),
+            "spx_open": pm["spx_open_official"].to_numpy(float),
+            "morning_high": levels[0, :, up],
+            "morning_low": levels[0, :, dn],
+            "afternoon_high": levels[1, :, up],
+            "afternoon_low": levels[1, :, dn],
+            "iv_atm": am["iv_straddle_pct_fixed"].to_numpy(float),
+        },
+        index=pd.DatetimeIndex(
+            pd.to_datetime(days, format="%Y%m%d"), name="trade_date"
+        ),
+    )
@@ -0,0 +1,257 @@
+"""Realized volatility from ES 1m bars (SPEC_LOCK §10, README ``rv_daily``).
+
+All four session windows of all trade dates are computed in one pass over
+the bar arrays of the ``futures_1m_ES`` store:
+- 1m log returns close-to-close; the first bar of a trade_date uses its own
+  open, so no return spans two sessions
+- A bar belongs to a window when its start time (Zurich) is in
+  ``[start, end)``; squared returns are summed per (trade_date, window)
+  with ``np.bincount``
+- RV is ``100 * sqrt(sum r^2)``: the window's realized move in percent,
+  not annualized (same scale as the daily straddle IV)
+
+Percentiles (60, 120 trade dates and full history) use a Fenwick tree over
+value ranks: each day inserts one value and evicts one, so a percentile
+costs O(log n) instead of re-sorting the window.
+"""
+
+import argparse
+import datetime
+import logging
+from pathlib import Path
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from ..core.exceptions import ConfigurationError
+from ..core.spec import TIMEZONE
+from ..core.versioning import version_metadata
+from ..loaders.databento_loader import BarStore
+from .exporters import export_month
+
+logger = logging.getLogger(__name__)
+
+# name -> (start, end) local time, end exclusive
+RV_WINDOWS = {
+    "RV_0215_2200": ((2, 15), (22, 0)),
+    "RV_1000_2200": ((10, 0), (22, 0)),
+    "RV_1000_1530": ((10, 0), (15, 30)),
+    "RV_1530_2200": ((15, 30), (22, 0)),
+}
+
+# Percentile lookbacks in trade dates (None = full history)
+PCTL_WINDOWS = {"RV_PCTL_60D": 60, "RV_PCTL_120D": 120, "RV_PCTL_FULL": None}
+PCTL_BASE = "RV_0215_2200"
+
+RV_DAILY_COLUMNS = ["trade_date", *RV_WINDOWS, *PCTL_WINDOWS]
+
+# MASTER_OUTPUT columns of the builder engine
+RV_COLUMNS = ("rv_morning", "rv_afternoon", "rv_full")
+_MASTER_NAMES = {
+    "RV_1000_1530": "rv_morning",
+    "RV_1530_2200": "rv_afternoon",
+    "RV_0215_2200": "rv_full",
+}
+
+
+def local_minutes(ts_utc: np.ndarray) -> np.ndarray:
+    """Minute of the Zurich day (0-1439) of UTC nanosecond timestamps."""
+    local = pd.DatetimeIndex(
+        np.asarray(ts_utc, dtype="datetime64[ns]"), tz="UTC"
+    ).tz_convert(TIMEZONE)
+    return np.asarray(local.hour * 60 + local.minute)
+
+
+def realized_vol(
+    ts_utc: np.ndarray,
+    open_: np.ndarray,
+    close: np.ndarray,
+    trade_date: np.ndarray,
+    windows: Optional[dict] = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Realized volatility of every (trade_date, window).
+
+    Args:
+        ts_utc: Bar start times, int64 ns (sorted)
+        open_: Bar opens
+        close: Bar closes
+        trade_date: ``datetime64[D]`` trade date of each bar (sorted)
+        windows: Name -> ((h, m), (h, m)). ``RV_WINDOWS`` if None.
+
+    Returns:
+        Tuple (trade dates, ``(days, windows)`` RV matrix in percent, NaN
+        where a window has no bars)
+    """
+    windows = RV_WINDOWS if windows is None else windows
+    n = len(close)
+    if not n:
+        return np.empty(0, dtype="datetime64[D]"), np.empty((0, len(windows)))
+    trade_date = np.asarray(trade_date)
+    first = np.r_[True, trade_date[1:] != trade_date[:-1]]
+    day_id = np.cumsum(first) - 1
+    n_days = int(day_id[-1]) + 1
+
+    close = np.asarray(close, dtype=float)
+    prev = np.r_[np.nan, close[:-1]]
+    prev[first] = np.asarray(open_, dtype=float)[first]
+    r2 = np.log(close / prev) ** 2
+
+    minutes = local_minutes(ts_utc)
+    rv = np.full((n_days, len(windows)), np.nan)
+    for j, (start, end) in enumerate(windows.values()):
+        mask = (minutes >= start[0] * 60 + start[1]) & (minutes < end[0] * 60 + end[1])
+        mask &= np.isfinite(r2)
+        sums = np.bincount(day_id[mask], weights=r2[mask], minlength=n_days)
+        counts = np.bincount(day_id[mask], minlength=n_days)
+        rv[counts > 0, j] = 100.0 * np.sqrt(sums[counts > 0])
+    return trade_date[first], rv
+
+
+class _Fenwick:
+    """Binary indexed tree of counts over value ranks."""
+
+    __slots__ = ("tree",)
+
+    def __init__(self, size: int):
+        self.tree = [0] * (size + 1)
+
+    def add(self, rank: int, delta: int):
+        tree = self.tree
+        i = rank + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def count_le(self, rank: int) -> int:
+        """Number of stored values with rank <= ``rank``."""
+        tree = self.tree
+        i = rank + 1
+        total = 0
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+
+def rolling_percentile(
+    values: Sequence[float], window: Optional[int] = None
+) -> np.ndarray:
+    """Percentile rank of each value within its trailing window.
+
+    ``100 * #(window values <= value) / #(window values)``, the window being
+    the last ``window`` rows including the current one (NaN rows count
+    toward the length but hold no value).
+
+    Args:
+        values: Daily values in trade_date order
+        window: Lookback in rows. Expanding (full history) if None.
+
+    Returns:
+        Float array in [0, 100], NaN where the value is NaN
+    """
+    values = np.asarray(values, dtype=float)
+    out = np.full(len(values), np.nan)
+    valid = ~np.isnan(values)
+    levels = np.unique(values[valid])
+    ranks = np.searchsorted(levels, values).tolist()
+    valid_list = valid.tolist()
+    tree = _Fenwick(len(levels))
+    stored = 0
+    for i, rank in enumerate(ranks):
+        if window is not None and i >= window and valid_list[i - window]:
+            tree.add(ranks[i - window], -1)
+            stored -= 1
+        if valid_list[i]:
+            tree.add(rank, 1)
+            stored += 1
+            out[i] = 100.0 * tree.count_le(rank) / stored
+    return out
+
+
+def _bar_columns(
+    source: str, start: Optional[datetime.date], end: Optional[datetime.date]
+):
+    store = BarStore(source)
+    if not store.rows:
+        raise ConfigurationError(f"Bar store {source} is empty")
+    return store.columns(start, end, ["ts_utc", "open", "close", "trade_date"])
+
+
+def rv_daily(
+    source: str,
+    start: Optional[datetime.date] = None,
+    end: Optional[datetime.date] = None,
+) -> pd.DataFrame:
+    """``rv_daily`` table: the four windows and their percentiles.
+
+    Percentiles always use the whole stored history before ``start``.
+
+    Args:
+        source: ``futures_1m_ES`` bar store directory
+        start: First trade date to return. From the first stored day if None.
+        end: Last trade date (inclusive). To the last stored day if None.
+
+    Returns:
+        ``RV_DAILY_COLUMNS`` without ``trade_date``, indexed by trade_date
+    """
+    cols = _bar_columns(source, None, end)
+    days, rv = realized_vol(
+        cols["ts_utc"], cols["open"], cols["close"], cols["trade_date"]
+    )
+    table = pd.DataFrame(
+        rv, columns=list(RV_WINDOWS), index=pd.DatetimeIndex(days, name="trade_date")
+    )
+    for name, window in PCTL_WINDOWS.items():
+        table[name] = rolling_percentile(table[PCTL_BASE].to_numpy(), window)
+    if start is not None:
+        table = table[table.index >= pd.Timestamp(start)]
+    return table
+
+
+def rv_table(ctx, inputs) -> pd.DataFrame:
+    """MASTER_OUTPUT RV columns (morning, afternoon, full session).
+
+    Args:
+        ctx: Build context; needs the ``bars`` source (``futures_1m_ES``)
+        inputs: Unused (no required engines)
+
+    Returns:
+        ``RV_COLUMNS`` indexed by trade_date
+
+    Raises:
+        ConfigurationError: If the ``bars`` source is not configured
+    """
+    if "bars" not in ctx.sources:
+        raise ConfigurationError("rv engine needs a 'bars' source")
+    cols = _bar_columns(ctx.sources["bars"], ctx.start, ctx.end)
+    days, rv = realized_vol(
+        cols["ts_utc"], cols["open"], cols["close"], cols["trade_date"]
+    )
+    table = pd.DataFrame(
+        rv, columns=list(RV_WINDOWS), index=pd.DatetimeIndex(days, name="trade_date")
+    )
+    return table.rename(columns=_MASTER_NAMES)[list(RV_COLUMNS)]
+
+
+def main(argv=None):
+    """Nightly ``rv_daily`` job."""
+    parser = argparse.ArgumentParser(description="Build rv_daily from the 1m bar store")
+    parser.add_argument(
+        "--bars", default="DATA/futures_1m_ES", help="bar store directory"
+    )
+    parser.add_argument("--out", default="DATA/iv_rv/rv_daily.csv", help="output CSV")
+    parser.add_argument("--start", type=datetime.date.fromisoformat, default=None)
+    parser.add_argument("--end", type=datetime.date.fromisoformat, default=None)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s"
+    )
+    table = rv_daily(args.bars, args.start, args.end)
+    rows = export_month(table, Path(args.out), version_metadata(), RV_DAILY_COLUMNS)
+    print(f"{args.out}: {rows} trade dates")
+
+
+if __name__ == "__main__":
+    main()
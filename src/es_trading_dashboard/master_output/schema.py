@@ -0,0 +1,29 @@
+"""Column layout of MASTER_OUTPUT (DATA_CATALOG §4)."""
+
+MASTER_COLUMNS = [
+    "trade_date",
+    "vwap_es",
+    "spx_open",
+    "morning_high",
+    "morning_low",
+    "afternoon_high",
+    "afternoon_low",
+    "iv_atm",
+    "rv_overnight",
+    "rv_morning",
+    "rv_afternoon",
+    "rv_full",
+    "iv_percentile_60d",
+    "iv_percentile_120d",
+    "oi_call_max",
+    "oi_put_max",
+    "zero_gamma",
+    "call_wall",
+    "put_wall",
+    "gamma_regime",
+    "max_10_22",
+    "min_10_22",
+]
+
+# Versioning fields appended to every row (SPEC_LOCK §14)
+VERSION_COLUMNS = ["MODEL_VERSION", "CONFIG_HASH", "ENGINE_START_TIME"]
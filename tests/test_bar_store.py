@@ -0,0 +1,183 @@
+"""futures_1m_ES bar store: trade dates, front month, append and slicing."""
+
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from es_trading_dashboard.core.exceptions import ConfigurationError
+from es_trading_dashboard.loaders import databento_loader
+from es_trading_dashboard.loaders.databento_loader import (
+    BarStore,
+    front_month,
+    ingest,
+    read_dbn,
+    trade_dates,
+)
+
+
+def _bars(start, end, symbol="ESH5", volume=10, freq="15min"):
+    """Synthetic bars every ``freq`` between two UTC instants."""
+    ts = pd.date_range(start, end, freq=freq, tz="UTC", inclusive="left")
+    ns = ts.as_unit("ns").asi8
+    close = 6000 + np.cumsum(np.sin(np.arange(len(ts))))
+    return pd.DataFrame(
+        {
+            "ts_utc": ns,
+            "open": close - 0.25,
+            "high": close + 1.0,
+            "low": close - 1.0,
+            "close": close,
+            "volume": np.full(len(ts), volume, dtype=np.int64),
+            "symbol": symbol,
+            "trade_date": trade_dates(ns),
+        }
+    )
+
+
+def _scalar_trade_date(ns):
+    local = pd.Timestamp(ns, tz="UTC").tz_convert("Europe/Zurich")
+    day = local.date()
+    if (local.hour, local.minute) < (2, 15):
+        day -= datetime.timedelta(days=1)
+    return day
+
+
+def test_trade_dates_match_the_scalar_rule():
+    ts = pd.date_range("2025-03-03", "2025-03-08", freq="7min", tz="UTC")
+    days = trade_dates(ts.as_unit("ns").asi8)
+    assert [d.astype(datetime.date) for d in days] == [
+        _scalar_trade_date(t.value) for t in ts
+    ]
+    assert len(trade_dates(np.empty(0, dtype=np.int64))) == 0
+
+
+def test_autumn_dst_repeated_hour_stays_in_the_new_trade_date():
+    # 2024-10-27: 02:00-02:59 CEST (00:00-00:59 UTC) repeats as CET
+    ts = pd.date_range("2024-10-26 23:00", "2024-10-27 02:00", freq="min", tz="UTC")
+    days = trade_dates(ts.as_unit("ns").asi8)
+    assert (np.diff(days.astype(int)) >= 0).all()
+    assert str(days[ts.get_loc(pd.Timestamp("2024-10-27 00:14", tz="UTC"))]) == (
+        "2024-10-26"
+    )
+    assert str(days[ts.get_loc(pd.Timestamp("2024-10-27 01:10", tz="UTC"))]) == (
+        "2024-10-27"
+    )
+
+
+def test_front_month_keeps_the_largest_outright_per_day():
+    day1 = ("2025-03-10 02:00", "2025-03-10 20:00")
+    day2 = ("2025-03-11 02:00", "2025-03-11 20:00")
+    bars = pd.concat(
+        [
+            _bars(*day1, "ESH5", volume=50),
+            _bars(*day1, "ESM5", volume=5),
+            _bars(*day2, "ESH5", volume=5),
+            _bars(*day2, "ESM5", volume=50),
+            _bars(*day2, "ESH5-ESM5", volume=500),
+        ]
+    )
+
+    front = front_month(bars)
+
+    by_day = front.groupby("trade_date")["symbol"].unique()
+    assert {f"{d:%Y-%m-%d}": list(s) for d, s in by_day.items()} == {
+        "2025-03-10": ["ESH5"],
+        "2025-03-11": ["ESM5"],
+    }
+    assert front["ts_utc"].is_monotonic_increasing
+
+
+def test_ingest_picks_the_front_month_across_files(tmp_path, monkeypatch):
+    # 2025-03-11 spans both files; ESM5 leads on the day, not in file a
+    day1 = ("2025-03-10 02:00", "2025-03-10 20:00")
+    files = {
+        "a.dbn.zst": [
+            _bars(*day1, "ESH5", volume=50),
+            _bars("2025-03-11 02:00", "2025-03-11 10:00", "ESH5", volume=50),
+            _bars("2025-03-11 02:00", "2025-03-11 10:00", "ESM5", volume=5),
+        ],
+        "b.dbn.zst": [
+            _bars("2025-03-11 10:00", "2025-03-11 20:00", "ESM5", volume=500),
+            _bars("2025-03-11 10:00", "2025-03-11 20:00", "ESH5-ESM5", volume=900),
+        ],
+    }
+    for name in files:
+        (tmp_path / name).write_bytes(b"dbn")
+    monkeypatch.setattr(
+        databento_loader, "read_dbn", lambda path: iter(files[path.split("/")[-1]])
+    )
+    store = BarStore(str(tmp_path / "bars"))
+
+    added = ingest([str(tmp_path / n) for n in files], store, metadata={"a": "1"})
+
+    front = store.read()
+    assert added == len(front) == store.rows
+    by_day = front.groupby("trade_date")["symbol"].unique()
+    assert {f"{d:%Y-%m-%d}": list(s) for d, s in by_day.items()} == {
+        "2025-03-10": ["ESH5"],
+        "2025-03-11": ["ESM5"],
+    }
+    assert sorted(store.files) == ["a.dbn.zst", "b.dbn.zst"]
+    assert ingest([str(tmp_path / n) for n in files], store) == 0
+
+
+def test_append_and_slice_roundtrip(tmp_path):
+    bars = _bars("2025-03-03", "2025-03-08")
+    store = BarStore(str(tmp_path / "bars"))
+    assert store.append(bars.iloc[:100], {"MODEL_VERSION": "x"}) == 100
+    assert store.append(bars.iloc[50:]) == len(bars) - 100  # overlap skipped
+
+    reopened = BarStore(str(tmp_path / "bars"))
+    assert reopened.rows == len(bars)
+    assert reopened.metadata == {"MODEL_VERSION": "x"}
+    assert reopened.last_ts == bars["ts_utc"].iloc[-1]
+    np.testing.assert_array_equal(reopened.column("close"), bars["close"])
+
+    start, end = datetime.date(2025, 3, 4), datetime.date(2025, 3, 5)
+    cols = reopened.columns(start, end, ["ts_utc", "trade_date"])
+    expected = bars[
+        (bars["trade_date"] >= np.datetime64(start))
+        & (bars["trade_date"] <= np.datetime64(end))
+    ]
+    np.testing.assert_array_equal(cols["ts_utc"], expected["ts_utc"])
+    with pytest.raises(ValueError):
+        cols["ts_utc"][0] = 0  # read-only map
+
+    frame = reopened.read(start, end)
+    assert list(frame["symbol"].unique()) == ["ESH5"]
+    assert frame["ts_local"].dt.tz is not None
+
+
+def test_day_index_offsets(tmp_path):
+    bars = _bars("2025-03-03", "2025-03-08")
+    store = BarStore(str(tmp_path / "bars"))
+    store.append(bars)
+
+    days, offsets = store.day_index(datetime.date(2025, 3, 4))
+
+    counts = bars[bars["trade_date"] >= np.datetime64("2025-03-04")].groupby(
+        "trade_date"
+    )
+    assert list(days) == list(counts.size().index)
+    assert np.diff(offsets).tolist() == counts.size().tolist()
+    empty_days, empty_offsets = BarStore(str(tmp_path / "none")).day_index()
+    assert len(empty_days) == 0 and empty_offsets.tolist() == [0]
+
+
+def test_incompatible_layout_rejected(tmp_path):
+    store = BarStore(str(tmp_path / "bars"))
+    store.append(_bars("2025-03-03", "2025-03-04"))
+    meta = tmp_path / "bars" / "meta.json"
+    meta.write_text(meta.read_text().replace('"<f8"', '"<f4"'))
+    with pytest.raises(ConfigurationError):
+        BarStore(str(tmp_path / "bars"))
+
+
+@pytest.mark.skipif(
+    databento_loader.databento is not None, reason="databento is installed"
+)
+def test_read_dbn_needs_the_sdk(tmp_path):
+    with pytest.raises(ConfigurationError, match="historical"):
+        read_dbn(str(tmp_path / "x.dbn.zst"))
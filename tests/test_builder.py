@@ -0,0 +1,162 @@
+"""MASTER_OUTPUT builder: engine DAG, determinism and export layout."""
+
+import csv
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from es_trading_dashboard.collector.sample_engine import calc_ranges
+from es_trading_dashboard.collector.schema import SNAP_COLUMNS
+from es_trading_dashboard.core.exceptions import ConfigurationError
+from es_trading_dashboard.master_output.builder import (
+    HISTORY,
+    BuildContext,
+    Engine,
+    MasterOutputBuilder,
+    engine_order,
+    run_engines,
+)
+from es_trading_dashboard.master_output.schema import MASTER_COLUMNS, VERSION_COLUMNS
+
+START, END = datetime.date(2025, 1, 1), datetime.date(2025, 3, 31)
+STARTED = datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def write_snapshots(path, days, seed=0):
+    """Morning and afternoon snapshot rows of ``days``."""
+    rng = np.random.default_rng(seed)
+    with open(path, "w", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(SNAP_COLUMNS)
+        for d in days:
+            ds = d.strftime("%Y%m%d")
+            vwap, iv_d, iv_s = 5000 + rng.normal(0, 50), 0.9, 0.6 + rng.random() / 10
+            w.writerow(
+                [f"{d} 10:00:00", "ES_10:00", ds, "VWAP", vwap, None, None, iv_d, iv_s]
+                + [0] * 9
+            )
+            w.writerow(
+                [f"{d} 15:30:00", "SPX_15:30", ds, "OPEN", vwap - 20, vwap - 20, 20.0]
+                + [iv_d, iv_s]
+                + [0] * 9
+            )
+
+
+def business_days(start=START, end=END):
+    return [d.date() for d in pd.bdate_range(start, end)]
+
+
+@pytest.fixture
+def snapshots(tmp_path):
+    path = tmp_path / "snapshots_fixed.csv"
+    # A holiday without snapshots: no MASTER_OUTPUT row
+    write_snapshots(
+        path, [d for d in business_days() if d != datetime.date(2025, 1, 20)]
+    )
+    return str(path)
+
+
+def _build(out, snapshots, **kwargs):
+    builder = MasterOutputBuilder(
+        str(out), {"snapshots": snapshots}, start_time=STARTED, **kwargs
+    )
+    return builder.build(START, END)
+
+
+def test_monthly_files_layout(tmp_path, snapshots):
+    files = _build(tmp_path / "out", snapshots, workers=1)
+
+    assert [p.name for p in files] == [
+        f"MASTER_OUTPUT_2025_{m:02d}.csv" for m in (1, 2, 3)
+    ]
+    jan = pd.read_csv(files[0])
+    assert list(jan.columns) == MASTER_COLUMNS + VERSION_COLUMNS
+    assert "2025-01-20" not in set(jan["trade_date"])
+    assert jan["trade_date"].is_monotonic_increasing
+    assert len(jan) == 22
+    assert (jan["ENGINE_START_TIME"] == "2026-01-01T00:00:00+00:00").all()
+    assert jan["rv_full"].isna().all()  # no engine produces it
+
+
+def test_ranges_match_the_scalar_formulas(tmp_path, snapshots):
+    files = _build(tmp_path / "out", snapshots, workers=1)
+    out = pd.read_csv(files[1]).iloc[0]
+    snaps = pd.read_csv(snapshots, dtype={"date": str})
+    am = snaps[(snaps["slot"] == "ES_10:00") & (snaps["date"] == "20250203")].iloc[0]
+    pm = snaps[(snaps["slot"] == "SPX_15:30") & (snaps["date"] == "20250203")].iloc[0]
+
+    morning = calc_ranges(
+        am["base_value"],
+        am["iv_daily_pct_fixed"] / 100,
+        am["iv_straddle_pct_fixed"] / 100,
+    )
+    afternoon = calc_ranges(
+        pm["base_value"],
+        pm["iv_daily_pct_fixed"] / 100,
+        pm["iv_straddle_pct_fixed"] / 100,
+    )
+    assert out["trade_date"] == "2025-02-03"
+    assert out["morning_high"] == pytest.approx(morning["R1 UP"], abs=1e-9)
+    assert out["morning_low"] == pytest.approx(morning["R1 DOWN"], abs=1e-9)
+    assert out["afternoon_high"] == pytest.approx(afternoon["R1 UP"], abs=1e-9)
+    assert out["spx_open"] == pytest.approx(pm["spx_open_official"])
+
+
+def test_output_does_not_depend_on_the_worker_count(tmp_path, snapshots):
+    serial = _build(tmp_path / "w1", snapshots, workers=1)
+    parallel = _build(tmp_path / "w3", snapshots, workers=3)
+    assert [p.read_bytes() for p in serial] == [p.read_bytes() for p in parallel]
+
+
+def _day_count(ctx, inputs):
+    days = pd.DatetimeIndex(pd.to_datetime(ctx.trade_dates), name="trade_date")
+    return pd.DataFrame({"rv_full": float(len(days))}, index=days)
+
+
+def _running_total(ctx, inputs):
+    return pd.DataFrame({"iv_percentile_60d": inputs["count"]["rv_full"].cumsum()})
+
+
+def test_history_engine_gets_its_requirements():
+    engines = [
+        Engine("total", _running_total, ("iv_percentile_60d",), ("count",), HISTORY),
+        Engine("count", _day_count, ("rv_full",)),
+    ]
+    ordered = engine_order(engines)
+    assert [e.name for e in ordered] == ["count", "total"]
+
+    days = business_days()
+    tables = run_engines(ordered, BuildContext(tuple(days)))
+    assert tables["count"]["rv_full"].iloc[0] == len(days)
+    assert tables["total"]["iv_percentile_60d"].iloc[-1] == len(days) ** 2
+
+
+@pytest.mark.parametrize(
+    "engines",
+    [
+        [Engine("a", _day_count, ("x",)), Engine("a", _day_count, ("y",))],
+        [Engine("a", _day_count, ("x",)), Engine("b", _day_count, ("x",))],
+        [Engine("a", _day_count, ("x",), requires=("missing",))],
+        [
+            Engine("a", _day_count, ("x",), requires=("b",)),
+            Engine("b", _day_count, ("y",), requires=("a",)),
+        ],
+        [
+            Engine("a", _day_count, ("x",), requires=("h",)),
+            Engine("h", _day_count, ("y",), scope=HISTORY),
+        ],
+        [Engine("a", _day_count, ("x",), scope="weekly")],
+    ],
+    ids=["duplicate", "column", "unknown", "cycle", "month-on-history", "scope"],
+)
+def test_invalid_graphs_are_rejected(engines):
+    with pytest.raises(ConfigurationError):
+        engine_order(engines)
+
+
+def test_engine_must_produce_its_columns():
+    ctx = BuildContext(tuple(business_days()))
+    with pytest.raises(ConfigurationError):
+        run_engines([Engine("a", _day_count, ("rv_full", "other"))], ctx)
@@ -0,0 +1,80 @@
+"""Trade date / window calendar: scalar helpers vs the vectorized index."""
+
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from es_trading_dashboard.core.calendar import (
+    WINDOW_NAMES,
+    TradeCalendar,
+    locate,
+    trade_date,
+    trade_dates,
+    window,
+)
+from es_trading_dashboard.core.exceptions import ConfigurationError
+
+UTC = datetime.timezone.utc
+
+# Spring forward (02:00 -> 03:00) and fall back (03:00 -> 02:00), Zurich 2024
+DST_DAYS = ["2024-03-31", "2024-10-27"]
+
+
+def _minutes(day: str) -> pd.DatetimeIndex:
+    """Every minute of the three UTC days around ``day``."""
+    start = pd.Timestamp(day, tz="UTC") - pd.Timedelta(days=1)
+    return pd.date_range(start, periods=3 * 24 * 60, freq="min").as_unit("ns")
+
+
+@pytest.mark.parametrize("day", DST_DAYS)
+def test_vectorized_matches_scalar_across_dst(day):
+    ts = _minutes(day)
+    days, windows = locate(ts.asi8)
+    scalar = [(trade_date(t), window(t)) for t in ts.to_pydatetime()]
+    assert [d.astype(datetime.date) for d in days] == [d for d, _ in scalar]
+    assert [WINDOW_NAMES[w] for w in windows] == [w for _, w in scalar]
+    np.testing.assert_array_equal(trade_dates(ts.asi8), days)
+
+
+@pytest.mark.parametrize(
+    "utc, expected_day, expected_window",
+    [
+        # Spring: 01:59 CET is still the previous session, 02:15 moves to 03:00 CEST
+        ("2024-03-31 00:59", "2024-03-30", "22:01"),
+        ("2024-03-31 01:00", "2024-03-31", "02:15"),
+        # Autumn: the session starts at the first 02:15 (CEST); the repeated
+        # 02:00-02:59 (CET) stays in the 02:15 window
+        ("2024-10-27 00:14", "2024-10-26", "22:01"),
+        ("2024-10-27 00:15", "2024-10-27", "02:15"),
+        ("2024-10-27 01:30", "2024-10-27", "02:15"),
+        ("2024-10-27 08:00", "2024-10-27", "02:15"),
+        ("2024-10-27 09:00", "2024-10-27", "10:00"),
+    ],
+)
+def test_dst_boundaries(utc, expected_day, expected_window):
+    ts = pd.Timestamp(utc, tz="UTC")
+    days, windows = locate(np.array([ts.value]))
+    assert str(days[0]) == expected_day
+    assert WINDOW_NAMES[windows[0]] == expected_window
+    assert trade_date(ts.to_pydatetime()).isoformat() == expected_day
+    assert window(ts.to_pydatetime()) == expected_window
+
+
+def test_naive_local_matches_aware():
+    aware = datetime.datetime(2024, 7, 1, 0, 30, tzinfo=UTC)  # 02:30 CEST
+    assert trade_date(aware) == trade_date(datetime.datetime(2024, 7, 1, 2, 30))
+    assert window(datetime.datetime(2024, 7, 1, 2, 14)) == "22:01"
+    assert trade_date(datetime.datetime(2024, 7, 1, 2, 14)) == datetime.date(
+        2024, 6, 30
+    )
+
+
+def test_boundary_rejects_days_outside_calendar():
+    calendar = TradeCalendar.build(
+        datetime.date(2024, 1, 1), datetime.date(2024, 1, 31)
+    )
+    assert len(calendar.boundary("10:00")) == 31
+    with pytest.raises(ConfigurationError):
+        calendar.boundary("10:00", np.array(["2024-02-01"], dtype="datetime64[D]"))
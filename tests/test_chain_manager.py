@@ -0,0 +1,118 @@
+"""0DTE chain manager: batched qualification and sliding subscriptions."""
+
+import pytest
+
+from es_trading_dashboard.collector.chain_manager import ChainManager
+from es_trading_dashboard.collector.simulator import SimConfig, SimulatedIB
+
+EXPIRY = "20260310"
+
+
+class CountingIB(SimulatedIB):
+    """Simulator recording qualification batches and subscriptions."""
+
+    def __init__(self, **kwargs):
+        super().__init__(SimConfig(tick_rates={}, **kwargs))
+        self.batches = []
+        self.cancelled = []
+        self.connect()
+
+    def qualifyContracts(self, *contracts):  # noqa: N802
+        self.batches.append(contracts)
+        return super().qualifyContracts(*contracts)
+
+    def cancelMktData(self, contract):  # noqa: N802
+        self.cancelled.append((contract.strike, contract.right))
+        super().cancelMktData(contract)
+
+    def live(self):
+        return sorted({t.contract.strike for t in self._streams.values()})
+
+
+@pytest.fixture
+def ib():
+    return CountingIB(es_price=5000.0, strike_step=5.0, n_strikes=60)
+
+
+def _chain(ib, **kwargs):
+    return ChainManager(ib, EXPIRY, "E2B", ib._strikes(), **kwargs)
+
+
+def test_window_is_qualified_in_one_batch(ib):
+    chain = _chain(ib, max_lines=10, exchanges=("GLOBEX", "CME"))
+    assert chain.set_atm(5000.0)
+
+    # GLOBEX qualifies nothing, CME everything within +-100 points
+    assert [len(b) for b in ib.batches] == [82, 82]
+    assert chain.exchange == "CME"
+    assert sorted({c.strike for c in ib.batches[1]}) == [
+        5000.0 + 5 * i for i in range(-20, 21)
+    ]
+    assert chain.call.contract.right == "C" and chain.put.contract.right == "P"
+    assert chain.call.contract.strike == 5000.0
+
+
+def test_live_strikes_follow_the_line_budget(ib):
+    chain = _chain(ib, max_lines=10)
+    chain.set_atm(5000.0)
+    assert ib.live() == [4990.0, 4995.0, 5000.0, 5005.0, 5010.0]
+    assert len(list(chain.tickers())) == 10
+
+
+def test_moving_the_atm_slides_without_requalifying(ib):
+    chain = _chain(ib, max_lines=10)
+    chain.set_atm(5000.0)
+    ib.batches.clear()
+
+    assert chain.set_atm(5005.0)
+    assert ib.batches == []
+    assert ib.live() == [4995.0, 5000.0, 5005.0, 5010.0, 5015.0]
+    assert sorted(ib.cancelled) == [(4990.0, "C"), (4990.0, "P")]
+
+
+def test_window_is_extended_near_its_edge(ib):
+    chain = _chain(ib, max_lines=10)
+    chain.set_atm(5000.0)
+    ib.batches.clear()
+
+    assert chain.set_atm(5095.0)
+    (batch,) = ib.batches
+    # Only the strikes missing from the new window are requested
+    assert min(c.strike for c in batch) == 5105.0
+    assert max(c.strike for c in batch) == 5195.0
+    assert chain.call.contract.strike == 5095.0
+
+
+def test_unlisted_strike_is_rejected(ib):
+    chain = _chain(ib)
+    assert not chain.set_atm(1000.0)
+    assert chain.atm is None
+
+
+def test_nearest_listed_strike(ib):
+    chain = _chain(ib)
+    assert chain.nearest(5001.2) == 5000.0
+    assert chain.nearest(5003.0) == 5005.0
+    assert chain.nearest(1.0) == 4700.0
+
+
+def test_close_cancels_everything(ib):
+    chain = _chain(ib, max_lines=4)
+    chain.set_atm(5000.0)
+    chain.close()
+    assert ib.live() == []
+    assert chain.call is None
+
+
+def test_switch_expiry_requalifies_on_the_same_connection(ib):
+    chain = _chain(ib, max_lines=4)
+    chain.set_atm(5000.0)
+    ib.batches.clear()
+
+    chain.switch_expiry("20260311", ib._strikes())
+
+    assert ib.live() == [] and chain.contracts == {}
+    assert chain.set_atm(5000.0)
+    assert {c.lastTradeDateOrContractMonth for c in ib.batches[0]} == {"20260311"}
+    assert chain.call.contract.lastTradeDateOrContractMonth == "20260311"
+    assert ib.isConnected()
@@ -0,0 +1,92 @@
+"""Contract cache persisted across restarts, and chain preloading."""
+
+import datetime
+import json
+
+from ib_insync import Future, FuturesOption, Index
+
+from es_trading_dashboard.collector.chain_manager import ChainManager
+from es_trading_dashboard.collector.contract_cache import (
+    ContractCache,
+    contract_from_dict,
+    contract_to_dict,
+)
+from es_trading_dashboard.collector.simulator import SimConfig, SimulatedIB
+
+DAY = datetime.date(2026, 3, 10)
+ES = Future("ES", "20260320", "CME", localSymbol="ESH6", conId=11)
+CHAIN = {"tradingClass": "E2B", "expirations": ["20260310"], "strikes": [5000.0]}
+
+
+def test_contracts_roundtrip_with_their_subclass():
+    for contract in (ES, Index("SPX", "CBOE", conId=12)):
+        rebuilt = contract_from_dict(json.loads(json.dumps(contract_to_dict(contract))))
+        assert type(rebuilt) is type(contract)
+        assert rebuilt == contract
+
+
+def test_entry_survives_a_restart(tmp_path):
+    path = tmp_path / "cache.json"
+    ContractCache(str(path)).save(DAY, es=contract_to_dict(ES), chain=CHAIN)
+
+    entry = ContractCache(str(path)).load(DAY, expiry="20260310")
+    assert contract_from_dict(entry["es"]) == ES
+    assert entry["chain"] == CHAIN
+    assert not (tmp_path / "cache.json.tmp").exists()
+
+
+def test_save_merges_fields_and_drops_other_days(tmp_path):
+    cache = ContractCache(str(tmp_path / "cache.json"))
+    cache.save(DAY - datetime.timedelta(days=1), es=contract_to_dict(ES))
+    cache.save(DAY, es=contract_to_dict(ES))
+    cache.save(DAY, chain=CHAIN)
+
+    assert cache.load(DAY - datetime.timedelta(days=1)) is None
+    assert set(cache.load(DAY)) == {"saved", "es", "chain"}
+
+
+def test_invalidation_rules(tmp_path):
+    cache = ContractCache(str(tmp_path / "cache.json"), ttl=3600)
+    cache.save(DAY, es=contract_to_dict(ES), chain=CHAIN)
+    assert cache.load(DAY, expiry="20260311") is None  # expiry not listed
+    assert cache.load(DAY) is None  # dropped by the failed load
+
+    cache.save(DAY, es=contract_to_dict(ES), chain=CHAIN)
+    assert cache.load(datetime.date(2026, 3, 21)) is None  # no entry that day
+    cache.save(datetime.date(2026, 3, 21), es=contract_to_dict(ES))
+    assert cache.load(datetime.date(2026, 3, 21)) is None  # ES expired (roll)
+
+    expired = ContractCache(str(tmp_path / "old.json"), ttl=0)
+    expired.save(DAY, es=contract_to_dict(ES))
+    assert expired.load(DAY) is None
+
+
+def test_corrupt_file_is_ignored(tmp_path):
+    path = tmp_path / "cache.json"
+    path.write_text("{not json")
+    assert ContractCache(str(path)).load(DAY) is None
+
+
+def test_preloaded_window_skips_qualification():
+    ib = SimulatedIB(SimConfig(tick_rates={}, es_price=5000.0, n_strikes=40))
+    ib.connect()
+    strikes = [5000.0 + 5 * i for i in range(-20, 21)]
+    contracts = {
+        k: tuple(
+            FuturesOption(
+                "ES", "20260310", k, r, "CME", tradingClass="E2B", conId=i * 2 + j
+            )
+            for j, r in enumerate("CP")
+        )
+        for i, k in enumerate(strikes)
+    }
+    calls = []
+    ib.qualifyContracts = lambda *c: calls.append(c) or list(c)
+
+    chain = ChainManager(ib, "20260310", "E2B", strikes, max_lines=4)
+    chain.preload(contracts, "CME")
+
+    assert chain.set_atm(5000.0)
+    assert calls == []
+    assert chain.exchange == "CME"
+    assert chain.call.contract.conId == contracts[5000.0][0].conId
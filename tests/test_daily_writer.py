@@ -0,0 +1,180 @@
+"""Background CSV writer: roundtrip, batching, drops and sink retries."""
+
+import csv
+import time
+
+import pytest
+
+from es_trading_dashboard.collector.daily_writer import DailyWriter
+
+HEADER = ["timestamp", "value"]
+
+
+class MemorySink:
+    """Sink collecting rows in memory, failing while ``fail`` is set."""
+
+    def __init__(self):
+        self.rows = []
+        self.fail = False
+        self.fsyncs = 0
+
+    def write_rows(self, rows):
+        if self.fail:
+            raise OSError("disk full")
+        self.rows.extend(rows)
+
+    def flush(self, fsync=False):
+        self.fsyncs += fsync
+
+    def close(self):
+        pass
+
+
+def _read(path):
+    with open(path, newline="") as f:
+        return list(csv.reader(f))
+
+
+@pytest.fixture
+def writer():
+    w = DailyWriter(batch_size=1000, flush_interval=60.0)
+    yield w
+    w.stop()
+
+
+def test_roundtrip(tmp_path, writer):
+    path = tmp_path / "log.csv"
+    writer.register("log", str(path), HEADER)
+    writer.start()
+    for i in range(5):
+        assert writer.write("log", [f"t{i}", i])
+
+    assert writer.flush()
+    assert _read(path) == [HEADER] + [[f"t{i}", str(i)] for i in range(5)]
+    stats = writer.stats()
+    assert (stats["rows_written"], stats["pending_rows"], stats["dropped"]) == (
+        5,
+        0,
+        0,
+    )
+    assert stats["last_flush"] is not None
+
+
+def test_existing_file_is_appended_without_header(tmp_path, writer):
+    path = tmp_path / "log.csv"
+    path.write_text("timestamp,value\r\nt0,0\r\n")
+    writer.register("log", str(path), HEADER)
+    writer.start()
+    writer.write("log", ["t1", 1])
+
+    assert writer.finalize()
+    assert _read(path) == [HEADER, ["t0", "0"], ["t1", "1"]]
+
+
+def test_batch_size_triggers_a_flush(tmp_path):
+    path = tmp_path / "log.csv"
+    w = DailyWriter(batch_size=3, flush_interval=60.0)
+    w.register("log", str(path), HEADER)
+    w.start()
+    try:
+        for i in range(3):
+            w.write("log", [f"t{i}", i])
+        deadline = time.monotonic() + 5
+        while w.rows_written < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert w.rows_written == 3
+    finally:
+        w.stop()
+    assert len(_read(path)) == 4
+
+
+def test_stop_writes_pending_rows(tmp_path):
+    paths = {name: tmp_path / f"{name}.csv" for name in ("a", "b")}
+    w = DailyWriter(batch_size=1000, flush_interval=60.0)
+    for name, path in paths.items():
+        w.register(name, str(path), HEADER)
+    w.start()
+    w.write("a", ["ta", 1])
+    w.write("b", ["tb", 2])
+    w.stop()
+    assert _read(paths["a"])[1:] == [["ta", "1"]]
+    assert _read(paths["b"])[1:] == [["tb", "2"]]
+
+
+def test_full_queue_drops_rows_without_blocking(tmp_path):
+    w = DailyWriter(max_queue=1)
+    w.register("log", str(tmp_path / "log.csv"), HEADER)  # thread not started
+    assert w.write("log", ["t0", 0])
+    started = time.monotonic()
+    assert not w.write("log", ["t1", 1])
+    assert time.monotonic() - started < 0.1
+    assert w.dropped == 1
+    assert w.stats()["queue_depth"] == 1
+
+
+def test_flush_gives_up_on_a_full_queue(tmp_path):
+    w = DailyWriter(max_queue=1)
+    w.register("log", str(tmp_path / "log.csv"), HEADER)  # thread not started
+    w.write("log", ["t0", 0])
+    started = time.monotonic()
+    assert not w.flush(timeout=0.05)
+    assert time.monotonic() - started < 1.0
+
+
+def test_rows_fan_out_to_every_sink(tmp_path, writer):
+    path = tmp_path / "log.csv"
+    extra = MemorySink()
+    writer.register("log", str(path), HEADER)
+    writer.add_sink("log", extra)
+    writer.start()
+    writer.write("log", ["t0", 0])
+
+    assert writer.finalize()
+    assert _read(path)[1:] == [["t0", "0"]]
+    assert extra.rows == [["t0", 0]]
+    assert extra.fsyncs == 1
+
+
+def test_failed_rows_are_retried_without_duplicates(tmp_path, writer):
+    path = tmp_path / "log.csv"
+    flaky = MemorySink()
+    writer.register("log", str(path), HEADER)
+    writer.add_sink("log", flaky)
+    writer.start()
+    flaky.fail = True
+    writer.write("log", ["t0", 0])
+    writer.flush()
+
+    assert writer.stats()["pending_rows"] == 1
+    assert writer.rows_written == 0
+
+    flaky.fail = False
+    writer.write("log", ["t1", 1])
+    writer.flush()
+
+    assert flaky.rows == [["t0", 0], ["t1", 1]]
+    assert _read(path)[1:] == [["t0", "0"], ["t1", "1"]]
+    assert writer.rows_written == 2
+    assert writer.stats()["pending_rows"] == 0
+
+
+def test_retry_limit_drops_the_oldest_rows(writer):
+    flaky = MemorySink()
+    flaky.fail = True
+    writer.retry_limit = 2
+    writer.add_sink("log", flaky)
+    writer.start()
+    for i in range(5):
+        writer.write("log", [i])
+    writer.flush()
+
+    assert writer.failed_rows == 3
+    flaky.fail = False
+    writer.flush()
+    assert flaky.rows == [[3], [4]]
+
+
+def test_unregistered_target_is_dropped(writer):
+    assert not writer.write("nope", ["t0", 0])
+    assert writer.dropped == 1
+    assert writer.stats()["queue_depth"] == 0
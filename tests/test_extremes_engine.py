@@ -0,0 +1,142 @@
+"""10:00-22:00 max/min extraction vs a groupby reference, and CSV updates."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from es_trading_dashboard.loaders.databento_loader import BarStore, trade_dates
+from es_trading_dashboard.master_output.extremes_engine import (
+    EXTREMES_COLUMNS,
+    extremes_daily,
+    update_extremes,
+    window_extremes,
+)
+
+META = {"MODEL_VERSION": "m1", "CONFIG_HASH": "c1", "ENGINE_START_TIME": "t"}
+
+
+def _bars(start, end):
+    """Random-walk 1m bars on business days, with repeated highs (ties)."""
+    rng = np.random.default_rng(5)
+    ts = pd.date_range(start, end, freq="min", tz="UTC", inclusive="left")
+    ts = ts[ts.weekday < 5]
+    close = (5800 + np.cumsum(rng.integers(-2, 3, len(ts)) * 0.25)).astype(float)
+    ns = ts.as_unit("ns").asi8
+    return pd.DataFrame(
+        {
+            "ts_utc": ns,
+            "open": close,
+            "high": close + 0.25,
+            "low": close - 0.25,
+            "close": close,
+            "volume": np.ones(len(ts), dtype=np.int64),
+            "symbol": "ESM5",
+            "trade_date": trade_dates(ns),
+        }
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    root = tmp_path / "bars"
+    BarStore(str(root)).append(_bars("2025-03-24", "2025-04-05"))
+    return root
+
+
+def _reference(bars):
+    """Window extremes with groupby/idxmax (first bar on ties)."""
+    ts = pd.DatetimeIndex(bars["ts_utc"].to_numpy(dtype="datetime64[ns]"), tz="UTC")
+    local = ts.tz_convert("Europe/Zurich")
+    w = bars[(local.hour >= 10) & (local.hour < 22)]
+    g = w.groupby("trade_date")
+    times = ts[w.index]
+    at_max = g["high"].idxmax()
+    at_min = g["low"].idxmin()
+    fmt = "%Y-%m-%d %H:%M:%S"
+    return pd.DataFrame(
+        {
+            "MAX_10_22": g["high"].max(),
+            "MIN_10_22": g["low"].min(),
+            "MAX_10_22_TIME_local": times[w.index.get_indexer(at_max)]
+            .tz_convert("Europe/Zurich")
+            .strftime(fmt),
+            "MIN_10_22_TIME_utc": times[w.index.get_indexer(at_min)].strftime(fmt),
+        }
+    )
+
+
+def test_matches_groupby_across_dst(store):
+    bars = BarStore(str(store)).read()
+    bars["ts_utc"] = bars["ts_utc"].astype("int64")
+
+    table = extremes_daily(str(store)).dropna(subset=["MAX_10_22"])
+    ref = _reference(bars)
+
+    assert list(table.index) == list(pd.DatetimeIndex(ref.index))
+    np.testing.assert_array_equal(table["MAX_10_22"].astype(float), ref["MAX_10_22"])
+    np.testing.assert_array_equal(table["MIN_10_22"].astype(float), ref["MIN_10_22"])
+    assert (
+        table["MAX_10_22_TIME_local"].tolist() == ref["MAX_10_22_TIME_local"].tolist()
+    )
+    assert table["MIN_10_22_TIME_utc"].tolist() == ref["MIN_10_22_TIME_utc"].tolist()
+
+
+def test_ties_nan_and_empty_windows():
+    # 10:00-10:03 CET = 09:00-09:03 UTC
+    minute = np.int64(60_000_000_000)
+    ts = (
+        np.datetime64("2024-03-04T09:00", "ns").astype(np.int64) + np.arange(4) * minute
+    )
+    days = np.array(["2024-03-04", "2024-03-05"], dtype="datetime64[D]")
+    offsets = np.array([0, 4, 4])
+
+    out = window_extremes(
+        ts, np.array([1.0, 3, 3, np.nan]), np.full(4, np.nan), days, offsets
+    )
+
+    first = out.iloc[0]
+    assert first["MAX_10_22"] == 3
+    assert first["MAX_10_22_TIME_local"] == "2024-03-04 10:01:00"
+    assert np.isnan(first["MIN_10_22"]) and first["MIN_10_22_TIME_utc"] is None
+    assert np.isnan(out.iloc[1]["MAX_10_22"])
+
+
+def test_update_after_append_equals_full_rebuild(tmp_path):
+    bars = _bars("2025-03-24", "2025-04-05")
+    cut = int(np.searchsorted(bars["ts_utc"], pd.Timestamp("2025-04-01 14:03").value))
+    store = BarStore(str(tmp_path / "inc"))
+    store.append(bars.iloc[:cut])
+    path = tmp_path / "inc.csv"
+    update_extremes(str(tmp_path / "inc"), path, META)
+
+    store.append(bars.iloc[cut:])
+    recomputed = update_extremes(str(tmp_path / "inc"), path, META)
+
+    BarStore(str(tmp_path / "full")).append(bars)
+    full = tmp_path / "full.csv"
+    update_extremes(str(tmp_path / "full"), full, META)
+    assert recomputed == 4  # the partial 2025-04-01 and three new days
+    assert path.read_text() == full.read_text()
+    assert pd.read_csv(path).columns[: len(EXTREMES_COLUMNS)].tolist() == (
+        EXTREMES_COLUMNS
+    )
+
+
+def test_other_config_hash_rebuilds_the_file(store, tmp_path):
+    path = Path(tmp_path / "x.csv")
+    total = update_extremes(str(store), path, META)
+    assert update_extremes(str(store), path, META) == 1
+    assert update_extremes(str(store), path, {**META, "CONFIG_HASH": "c2"}) == total
+    assert set(pd.read_csv(path)["CONFIG_HASH"]) == {"c2"}
+
+
+def test_file_without_versioning_columns_is_rebuilt(store, tmp_path):
+    path = Path(tmp_path / "x.csv")
+    total = update_extremes(str(store), path, META)
+    old = pd.read_csv(path).drop(columns=["MODEL_VERSION", "CONFIG_HASH"])
+    old.to_csv(path, index=False)
+
+    assert update_extremes(str(store), path, META) == total
+    assert set(pd.read_csv(path)["CONFIG_HASH"]) == {META["CONFIG_HASH"]}
@@ -0,0 +1,130 @@
+"""GEXBot compacted cache, as-of lookups and the daily GEX summary."""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from es_trading_dashboard.core.exceptions import ConfigurationError  # noqa: E402
+from es_trading_dashboard.loaders.gexbot_loader import GexStore  # noqa: E402
+from es_trading_dashboard.master_output.gex_engine import (  # noqa: E402
+    gex_daily_summary,
+)
+
+DAYS = pd.bdate_range("2025-03-03", "2025-03-14")
+
+
+def _write(root, metric, day, rows=3, seed=0, **columns):
+    """One GEXBot daily CSV; returns its frame."""
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame(
+        {
+            "timestamp": pd.date_range(f"{day.date()} 15:30", periods=rows, freq="h")
+            .astype(str)
+            .tolist(),
+            "spot": 5700 + rng.normal(0, 10, rows),
+            "zero_gamma": 5690 + rng.normal(0, 10, rows),
+            "major_pos_oi": 5800.0,
+            "major_neg_oi": 5600.0,
+            "sum_gex_oi": rng.normal(0, 1, rows),
+        }
+    )
+    for name, value in columns.items():
+        frame[name] = value
+    path = root / metric / f"{day.date()}_ES_SPX_classic_{metric}.csv"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    frame.to_csv(path, index=False)
+    return frame
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "gex"
+    for i, day in enumerate(DAYS):
+        _write(root, "gex_full", day, seed=i)
+        _write(root, "gamma_one", day, rows=1, seed=i)
+    (root / "gex_full" / "README.csv").write_text("undated\n")
+    return root
+
+
+def test_refresh_parses_only_new_and_changed_files(tree):
+    assert GexStore(str(tree)).refresh() == {"gamma_one": 10, "gex_full": 10}
+    assert GexStore(str(tree)).refresh() == {}
+
+    new_day = pd.Timestamp("2025-03-17")
+    _write(tree, "gex_full", new_day, seed=99)
+    changed = _write(tree, "gex_full", DAYS[2], rows=1, seed=7)
+    os.remove(tree / "gex_full" / f"{DAYS[0].date()}_ES_SPX_classic_gex_full.csv")
+
+    store = GexStore(str(tree))
+    assert store.refresh(["gex_full"]) == {"gex_full": 2}
+    table = store.table("gex_full")
+    assert table["trade_date"].is_monotonic_increasing
+    assert table["trade_date"].min() == DAYS[1]
+    assert table["trade_date"].max() == new_day
+    day2 = table[table["trade_date"] == DAYS[2]]
+    np.testing.assert_array_equal(day2["spot"], changed["spot"])
+
+
+def test_asof_matches_the_daily_files(tree):
+    GexStore(str(tree)).refresh()
+    store = GexStore(str(tree))  # index and Parquet reloaded from disk
+    targets = [
+        pd.Timestamp("2025-03-01"),  # before the first date
+        DAYS[3],
+        pd.Timestamp("2025-03-09"),  # Sunday: Friday's profile, 2 days old
+        pd.Timestamp("2025-03-20"),  # 6 days after the last date
+    ]
+
+    rows = store.asof("gex_full", targets, ["spot", "zero_gamma"], tolerance=3)
+
+    assert list(rows.index) == targets
+    assert rows.iloc[0].isna().all() and rows.iloc[3].isna().all()
+    for target, source in ((DAYS[3], DAYS[3]), (targets[2], DAYS[4])):
+        name = f"{source.date()}_ES_SPX_classic_gex_full.csv"
+        last = pd.read_csv(tree / "gex_full" / name).iloc[-1]
+        assert rows.loc[target, "source_date"] == source
+        assert rows.loc[target, "spot"] == last["spot"]
+        assert rows.loc[target, "zero_gamma"] == last["zero_gamma"]
+    assert not store.asof("gex_full", targets[3:])["spot"].isna().any()
+
+
+def test_uncompacted_metric_rejected(tree):
+    with pytest.raises(ConfigurationError):
+        GexStore(str(tree)).table("gex_full")
+
+
+def test_summary_regime_and_walls(tmp_path):
+    root = tmp_path / "gex"
+    _write(root, "gex_full", DAYS[0], rows=1, spot=5700.0, zero_gamma=5650.0)
+    _write(root, "gex_full", DAYS[1], rows=1, spot=5600.0, zero_gamma=5650.0)
+    _write(root, "gex_full", DAYS[2], rows=1, spot=np.nan, sum_gex_oi=-2.0)
+    store = GexStore(str(root))
+    store.refresh()
+
+    summary = gex_daily_summary(store, DAYS[:4])
+
+    assert summary["gamma_regime"].tolist() == [
+        "POSITIVE",
+        "NEGATIVE",
+        "NEGATIVE",
+        "NEGATIVE",
+    ]
+    assert summary["call_wall_level"].tolist() == [5800.0] * 4
+    assert summary["put_wall_level"].tolist() == [5600.0] * 4
+    assert summary["gamma_major_sign"].iloc[2] == -1
+
+
+def test_summary_needs_zero_gamma(tmp_path):
+    root = tmp_path / "gex"
+    _write(root, "gex_full", DAYS[0]).drop(columns="zero_gamma").to_csv(
+        root / "gex_full" / f"{DAYS[0].date()}_ES_SPX_classic_gex_full.csv",
+        index=False,
+    )
+    store = GexStore(str(root))
+    store.refresh()
+    with pytest.raises(ConfigurationError, match="zero gamma"):
+        gex_daily_summary(store, DAYS[:1])
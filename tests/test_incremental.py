@@ -0,0 +1,165 @@
+"""Incremental MASTER_OUTPUT rebuilds: fingerprints and dirty trade dates."""
+
+import datetime
+import io
+import os
+
+import pandas as pd
+import pytest
+
+from es_trading_dashboard.master_output.builder import Engine, MasterOutputBuilder
+from es_trading_dashboard.master_output.manifest import BuildManifest, source_files
+
+START, END = datetime.date(2025, 1, 1), datetime.date(2025, 3, 31)
+STARTED = datetime.datetime(2025, 4, 1, tzinfo=datetime.timezone.utc)
+
+# Trade dates each call of the recording engine computed
+COMPUTED: list = []
+
+
+def _daily_values(ctx, inputs):
+    """One value per trade date, read from ``<daily>/value_YYYY-MM-DD.txt``."""
+    COMPUTED.append(ctx.trade_dates)
+    rows = {}
+    for day in ctx.trade_dates:
+        path = os.path.join(ctx.sources["daily"], f"value_{day.isoformat()}.txt")
+        if os.path.exists(path):
+            with open(path) as f:
+                rows[pd.Timestamp(day)] = float(f.read())
+    index = pd.DatetimeIndex(list(rows), name="trade_date")
+    return pd.DataFrame({"rv_full": list(rows.values())}, index=index)
+
+
+ENGINES = [Engine("daily", _daily_values, ("rv_full",), sources=("daily",))]
+
+
+def _days():
+    return [d.date() for d in pd.bdate_range(START, END)]
+
+
+def _write(root, day, value):
+    (root / f"value_{day.isoformat()}.txt").write_text(str(value))
+
+
+@pytest.fixture
+def daily(tmp_path):
+    root = tmp_path / "daily"
+    root.mkdir()
+    for i, day in enumerate(_days()):
+        _write(root, day, i)
+    return root
+
+
+def _builder(out, daily, **kwargs):
+    return MasterOutputBuilder(
+        str(out),
+        {"daily": str(daily)},
+        engines=ENGINES,
+        workers=1,
+        start_time=STARTED,
+        **kwargs,
+    )
+
+
+def _recomputed():
+    days = sorted(d for call in COMPUTED for d in call)
+    COMPUTED.clear()
+    return days
+
+
+def test_unchanged_inputs_recompute_and_write_nothing(tmp_path, daily):
+    out = tmp_path / "out"
+    assert len(_builder(out, daily).build(START, END)) == 3
+    assert _recomputed() == _days()
+
+    assert _builder(out, daily).build(START, END) == []
+    assert _recomputed() == []
+
+
+def test_only_changed_trade_dates_are_recomputed(tmp_path, daily):
+    out = tmp_path / "out"
+    first = {p.name: p.read_text() for p in _builder(out, daily).build(START, END)}
+    _recomputed()
+
+    changed = datetime.date(2025, 2, 12)
+    _write(daily, changed, 1000)
+    written = _builder(out, daily).build(START, END)
+
+    assert _recomputed() == [changed]
+    assert [p.name for p in written] == ["MASTER_OUTPUT_2025_02.csv"]
+    feb = pd.read_csv(written[0]).set_index("trade_date")
+    assert feb.loc["2025-02-12", "rv_full"] == 1000
+    old = pd.read_csv(io.StringIO(first["MASTER_OUTPUT_2025_02.csv"]))
+    assert feb.drop("2025-02-12")["rv_full"].tolist() == (
+        old.set_index("trade_date").drop("2025-02-12")["rv_full"].tolist()
+    )
+
+
+def test_incremental_output_equals_a_full_build(tmp_path, daily):
+    _builder(tmp_path / "inc", daily).build(START, END)
+    _write(daily, datetime.date(2025, 1, 7), -1)
+    _write(daily, datetime.date(2025, 3, 3), -2)
+    _builder(tmp_path / "inc", daily).build(START, END)
+    full = _builder(tmp_path / "full", daily, incremental=False)
+    full.build(START, END)
+
+    inc_dir = tmp_path / "inc" / "MASTER_OUTPUT"
+    full_dir = tmp_path / "full" / "MASTER_OUTPUT"
+    for path in sorted(full_dir.glob("*.csv")):
+        assert (inc_dir / path.name).read_text() == path.read_text()
+
+
+def test_partial_range_rebuilds_whole_months(tmp_path, daily):
+    out = tmp_path / "out"
+    _builder(out, daily).build(START, END)
+    _write(daily, datetime.date(2025, 2, 12), 1000)
+
+    written = _builder(out, daily).build(
+        datetime.date(2025, 2, 10), datetime.date(2025, 2, 14)
+    )
+
+    assert [p.name for p in written] == ["MASTER_OUTPUT_2025_02.csv"]
+    feb = pd.read_csv(written[0]).set_index("trade_date")
+    assert len(feb) == len([d for d in _days() if d.month == 2])
+    assert feb.loc["2025-02-12", "rv_full"] == 1000
+
+
+def test_config_change_recomputes_everything(tmp_path, daily):
+    out = tmp_path / "out"
+    _builder(out, daily).build(START, END)
+    _recomputed()
+    _builder(out, daily, config={"window": 2}).build(START, END)
+    assert _recomputed() == _days()
+
+
+def test_full_rebuild_ignores_the_manifest(tmp_path, daily):
+    out = tmp_path / "out"
+    _builder(out, daily).build(START, END)
+    _recomputed()
+    _builder(out, daily).build(START, END, full=True)
+    assert _recomputed() == _days()
+
+
+def test_source_files_split_dated_and_shared(tmp_path, daily):
+    (daily / "config.json").write_text("{}")
+    dated, shared = source_files({"daily": str(daily), "x": "missing"}, ["daily", "x"])
+    assert sorted(dated) == _days()
+    assert dated[datetime.date(2025, 1, 2)] == [str(daily / "value_2025-01-02.txt")]
+    assert shared == [str(daily / "config.json")]
+
+
+def test_fingerprints_follow_file_content_and_salt(tmp_path, daily):
+    manifest = BuildManifest(str(tmp_path / "manifest.json"))
+    dated, shared = source_files({"daily": str(daily)}, ["daily"])
+    days = _days()[:3]
+    base = manifest.fingerprints(days, dated, shared, "salt")
+    manifest.record(base)
+    manifest.save()
+
+    reloaded = BuildManifest(str(tmp_path / "manifest.json"))
+    assert reloaded.changed(base) == []
+    _write(daily, days[1], 99)
+    assert reloaded.changed(reloaded.fingerprints(days, dated, shared, "salt")) == [
+        days[1]
+    ]
+    assert reloaded.changed(reloaded.fingerprints(days, dated, shared, "other")) == days
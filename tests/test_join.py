@@ -0,0 +1,89 @@
+"""As-of join of trade_date tables vs ``pd.merge_asof``."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from es_trading_dashboard.core.exceptions import ConfigurationError
+from es_trading_dashboard.master_output.join import JoinSpec, asof_join, asof_positions
+
+
+def _table(rng, days, share, column):
+    """Random float table on a random subset of ``days``."""
+    index = pd.DatetimeIndex(
+        np.sort(rng.choice(days, int(len(days) * share), replace=False)),
+        name="trade_date",
+    )
+    values = rng.normal(size=len(index))
+    values[rng.random(len(index)) < 0.1] = np.nan  # NaN of matched rows are kept
+    return pd.DataFrame({column: values}, index=index)
+
+
+def _reference(keys, table, tolerance):
+    """Backward ``merge_asof`` of ``table`` onto ``keys``."""
+    right = table.reset_index().rename(columns={"trade_date": "key"})
+    return pd.merge_asof(
+        pd.DataFrame({"key": keys}),
+        right,
+        on="key",
+        direction="backward",
+        tolerance=None if tolerance is None else pd.Timedelta(days=tolerance),
+    ).set_index("key")
+
+
+@pytest.mark.parametrize("tolerance", [0, 1, 3, 10, None])
+def test_matches_merge_asof(tolerance):
+    rng = np.random.default_rng(7)
+    days = pd.date_range("2024-01-01", "2024-12-31", freq="D").as_unit("ns")
+    keys = pd.DatetimeIndex(pd.bdate_range("2024-01-01", "2024-12-31")).as_unit("ns")
+    tables = {"a": _table(rng, days, 0.5, "x"), "b": _table(rng, days, 0.1, "y")}
+    spec = JoinSpec(tolerance=tolerance)
+
+    joined, stats = asof_join(keys, tables, {"a": spec, "b": spec})
+
+    for name, table in tables.items():
+        expected = _reference(keys, table, tolerance)
+        np.testing.assert_array_equal(
+            joined[table.columns[0]].to_numpy(), expected[table.columns[0]].to_numpy()
+        )
+        assert stats[name].keys == len(keys)
+        assert stats[name].rows == len(table)
+    assert list(joined.columns) == ["x", "y"]
+
+
+def test_fill_and_stats():
+    keys = pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-05", "2024-01-10"])
+    table = pd.DataFrame(
+        {"v": [1.0, 2.0]}, index=pd.to_datetime(["2024-01-02", "2024-01-04"])
+    )
+
+    joined, stats = asof_join(keys, {"t": table}, {"t": JoinSpec(tolerance=2, fill=0)})
+
+    assert joined["v"].tolist() == [0, 1.0, 2.0, 0]
+    s = stats["t"]
+    assert (s.exact, s.asof, s.stale, s.missing) == (1, 1, 1, 2)
+
+
+def test_empty_table():
+    keys = pd.to_datetime(["2024-01-01", "2024-01-02"])
+    empty = pd.DataFrame({"v": pd.Series([], dtype=float)}, index=pd.DatetimeIndex([]))
+
+    joined, stats = asof_join(keys, {"t": empty})
+
+    assert joined["v"].isna().all()
+    assert stats["t"].missing == 2
+
+
+def test_asof_positions_equal_dates_match():
+    dates = np.array([2, 5, 9])
+    keys = np.array([1, 2, 4, 5, 10])
+    assert asof_positions(keys, dates).tolist() == [-1, 0, 0, 1, 2]
+
+
+def test_unsorted_index_rejected():
+    keys = pd.to_datetime(["2024-01-01"])
+    table = pd.DataFrame(
+        {"v": [1.0, 2.0]}, index=pd.to_datetime(["2024-01-02", "2024-01-01"])
+    )
+    with pytest.raises(ConfigurationError):
+        asof_join(keys, {"t": table})
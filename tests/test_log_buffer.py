@@ -0,0 +1,74 @@
+"""Ring buffer of the live log vs a plain list of rows."""
+
+import datetime
+
+import numpy as np
+import pytest
+
+from es_trading_dashboard.collector.log_buffer import LogRingBuffer
+
+COLUMNS = ["timestamp", "mode", "es_last", "spx_last"]
+T0 = datetime.datetime(2026, 3, 10, 10, 0)
+
+
+def _row(i):
+    mode = None if i % 5 == 0 else ("LIVE" if i % 2 else "FOTO")
+    return [
+        T0 + datetime.timedelta(seconds=10 * i),
+        mode,
+        5000.0 + i,
+        None if i % 3 == 0 else 6000.0 + i,
+    ]
+
+
+@pytest.mark.parametrize("n_rows", [0, 1, 7, 8, 9, 30])
+def test_last_rows_match_a_list(n_rows):
+    buf = LogRingBuffer(capacity=8, columns=COLUMNS)
+    rows = [_row(i) for i in range(n_rows)]
+    for row in rows:
+        buf.append(row)
+
+    assert len(buf) == min(n_rows, 8)
+    assert buf.count == n_rows
+    for n in (1, 3, 8, 20):
+        expected = rows[len(rows) - min(n, len(buf)) :]
+        assert buf.rows(n, newest_first=False) == expected
+        assert buf.rows(n) == expected[::-1]
+
+
+def test_views_are_contiguous_and_read_only():
+    buf = LogRingBuffer(capacity=4, columns=COLUMNS)
+    for i in range(6):
+        buf.append(_row(i))
+
+    view = buf.last(3)
+    np.testing.assert_array_equal(view["es_last"], [5003.0, 5004.0, 5005.0])
+    assert view["es_last"].base is not None  # a view, not a copy
+    with pytest.raises(ValueError):
+        view["es_last"][0] = 0.0
+
+
+def test_view_survives_later_appends_until_capacity_minus_n():
+    buf = LogRingBuffer(capacity=4, columns=COLUMNS)
+    for i in range(5):
+        buf.append(_row(i))
+    view = buf.last(2)
+    expected = view["es_last"].copy()
+    buf.append(_row(5))
+    buf.append(_row(6))
+    np.testing.assert_array_equal(view["es_last"], expected)
+
+
+def test_text_codes_decode():
+    buf = LogRingBuffer(capacity=4, columns=COLUMNS)
+    for i in range(4):
+        buf.append(_row(i))
+    codes = buf.last()["mode"]
+    assert buf.decode("mode", codes) == [None, "LIVE", "FOTO", "LIVE"]
+    assert buf.labels("mode") == ["LIVE", "FOTO"]
+
+
+def test_iso_timestamps_are_parsed():
+    buf = LogRingBuffer(capacity=2, columns=COLUMNS)
+    buf.append(["2026-03-10T10:00:00", "LIVE", 1.0, 2.0])
+    assert buf.rows(1)[0][0] == T0
@@ -0,0 +1,147 @@
+"""OI cube window sums, walls and deltas vs a naive groupby."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from es_trading_dashboard.master_output.oi_engine import (
+    EXPIRY_BUCKETS,
+    OI_SLOTS,
+    OICube,
+    oi_snapshots,
+    read_oi_raw,
+)
+
+STEP = 5.0
+WINDOW = 100.0
+
+
+@pytest.fixture(scope="module")
+def rows():
+    """Normalized OI rows: 3 trade dates x 4 slots, every bucket, both rights."""
+    rng = np.random.default_rng(3)
+    frames = []
+    for day in pd.bdate_range("2025-03-03", periods=3):
+        for slot in OI_SLOTS:
+            underlying = 6000 + rng.normal(0, 40)
+            expiries = [day + pd.Timedelta(days=k) for k in (0, 3, 20, 200, 500)]
+            strikes = np.arange(5700, 6305, STEP)
+            e, k, r = (
+                a.ravel()
+                for a in np.meshgrid(expiries, strikes, ["C", "P"], indexing="ij")
+            )
+            frames.append(
+                pd.DataFrame(
+                    {
+                        "trade_date": day,
+                        "slot": slot,
+                        "expiry": e,
+                        "strike": k,
+                        "right": r,
+                        "open_interest": rng.integers(1, 10_000, len(e)).astype(float),
+                        "underlying": underlying,
+                    }
+                )
+            )
+    out = pd.concat(frames, ignore_index=True)
+    out["expiry"] = pd.to_datetime(out["expiry"])
+    return out
+
+
+def _naive(rows):
+    """Window sums and walls per (trade_date, slot, bucket, right) with pandas."""
+    dte = (rows["expiry"] - rows["trade_date"]).dt.days
+    bucket = pd.Series(None, index=rows.index, dtype=object)
+    for name, (lo, hi) in EXPIRY_BUCKETS.items():
+        bucket[(dte >= lo) & (dte <= hi)] = name
+    center = (rows["underlying"] / STEP).round() * STEP
+    near = rows[bucket.notna() & ((rows["strike"] - center).abs() <= WINDOW)]
+    near = near.assign(bucket=bucket)
+    per_strike = near.groupby(["trade_date", "slot", "bucket", "right", "strike"])[
+        "open_interest"
+    ].sum()
+    grouped = per_strike.groupby(level=[0, 1, 2, 3])
+    return pd.DataFrame(
+        {
+            "sum": grouped.sum(),
+            "wall_strike": grouped.idxmax().map(lambda key: key[-1]),
+            "wall_oi": grouped.max(),
+        }
+    )
+
+
+def test_sums_and_walls_match_groupby(rows):
+    snaps = oi_snapshots(OICube.from_rows(rows, STEP), WINDOW)
+    naive = _naive(rows)
+
+    assert len(snaps) == 3 * len(OI_SLOTS) * len(EXPIRY_BUCKETS)
+    for row in snaps.itertuples():
+        key = (pd.Timestamp(row.trade_date), row.snapshot_slot, row.expiry_bucket)
+        call, put = naive.loc[key + ("C",)], naive.loc[key + ("P",)]
+        assert row.oi_call_sum_100 == call["sum"]
+        assert row.oi_put_sum_100 == put["sum"]
+        assert (row.call_wall_strike, row.call_wall_oi) == (
+            call["wall_strike"],
+            call["wall_oi"],
+        )
+        assert (row.put_wall_strike, row.put_wall_oi) == (
+            put["wall_strike"],
+            put["wall_oi"],
+        )
+
+
+def test_deltas_use_the_current_window(rows):
+    snaps = oi_snapshots(OICube.from_rows(rows, STEP), WINDOW).set_index(
+        ["trade_date", "snapshot_slot", "expiry_bucket"]
+    )
+    day0, day1 = np.sort(rows["trade_date"].unique())[:2]
+    current = rows[(rows["trade_date"] == day1) & (rows["slot"] == "10:00")]
+    center = round(current["underlying"].iloc[0] / STEP) * STEP
+
+    def window_sum(day, slot):
+        x = rows[
+            (rows["trade_date"] == day)
+            & (rows["slot"] == slot)
+            & (rows["expiry"] == rows["trade_date"])
+            & (rows["right"] == "C")
+            & ((rows["strike"] - center).abs() <= WINDOW)
+        ]
+        return x["open_interest"].sum()
+
+    row = snaps.loc[(day1, "10:00", "0DTE")]
+    assert row["delta_oi_call_vs_yesterday"] == window_sum(day1, "10:00") - window_sum(
+        day0, "10:00"
+    )
+    assert row["delta_oi_call_vs_prev_snapshot"] == (
+        window_sum(day1, "10:00") - window_sum(day1, "02:15")
+    )
+    first = snaps.loc[(day0, "02:15")]
+    assert first["delta_oi_call_vs_yesterday"].isna().all()
+    assert first["delta_oi_call_vs_prev_snapshot"].isna().all()
+
+
+def test_read_oi_raw_maps_timestamps_to_slots(tmp_path):
+    path = tmp_path / "ES_OI_RAW_2025-03-04.csv"
+    pd.DataFrame(
+        {
+            "timestamp": [
+                "2025-03-04 10:00:02",
+                "2025-03-05 00:30:00",
+                "2025-03-04 02:10:00",
+            ],
+            "expiry": ["20250304", "20250305", "20250304"],
+            "strike": [6000, 6000, 6000],
+            "right": ["C", "P", "C"],
+            "oi": [1, 2, 3],
+            "underlying": [6001.0, 6001.0, 6001.0],
+        }
+    ).to_csv(path, index=False)
+
+    raw = read_oi_raw([str(path)])
+
+    assert raw["slot"].tolist() == ["10:00", "22:00", "22:00"]
+    assert [str(d.date()) for d in raw["trade_date"]] == [
+        "2025-03-04",
+        "2025-03-04",
+        "2025-03-03",
+    ]
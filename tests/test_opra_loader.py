@@ -0,0 +1,137 @@
+"""Streaming OPRA loader vs a whole-file ``read_csv`` reference."""
+
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from es_trading_dashboard.core.exceptions import ConfigurationError
+from es_trading_dashboard.loaders.opra_loader import (
+    STAT_OPEN_INTEREST,
+    iter_chunks,
+    load_0dte,
+    load_options,
+    resolve_columns,
+)
+
+DAY = datetime.date(2025, 3, 12)
+EXPIRIES = ["2025-03-12", "2025-03-13", "2025-03-21", "2025-06-20"]
+
+
+def _chain(n=2000, seed=1):
+    """Random contracts with explicit expiry/strike/right columns."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "ts": "2025-03-12T10:30:00Z",
+            "expiration": rng.choice(EXPIRIES, n),
+            "strike_price": rng.integers(1000, 1600, n) * 5.0,
+            "option_type": rng.choice(["call", "put"], n),
+            "openInterest": rng.integers(0, 5000, n),
+            "bid": rng.random(n).round(2),
+            "ask": (rng.random(n) + 1).round(2),
+            "underlying": "SPX",
+        }
+    )
+
+
+def _write(frame, path):
+    if str(path).endswith(".zst"):
+        zstandard = pytest.importorskip("zstandard")
+        data = frame.to_csv(index=False).encode()
+        path.write_bytes(zstandard.ZstdCompressor().compress(data))
+    else:
+        frame.to_csv(path, index=False)
+    return str(path)
+
+
+def _reference(frame, expiry, atm, window):
+    keep = frame["expiration"] == expiry.isoformat()
+    keep &= (frame["strike_price"] - atm).abs() <= window
+    return frame[keep]
+
+
+@pytest.mark.parametrize("name", ["chain.csv", "chain.csv.zst"])
+@pytest.mark.parametrize("chunksize", [7, 500, 100_000])
+def test_filtered_rows_match_read_csv(tmp_path, name, chunksize):
+    frame = _chain()
+    path = _write(frame, tmp_path / name)
+
+    loaded = load_0dte(path, DAY, atm=6000.0, window=200, chunksize=chunksize)
+
+    ref = _reference(frame, DAY, 6000.0, 200)
+    assert len(loaded) == len(ref) > 0
+    assert (loaded["expiry"] == pd.Timestamp(DAY)).all()
+    np.testing.assert_array_equal(loaded["strike"], ref["strike_price"])
+    assert loaded["right"].tolist() == [r[0].upper() for r in ref["option_type"]]
+    np.testing.assert_array_equal(loaded["open_interest"], ref["openInterest"])
+    np.testing.assert_allclose(loaded["bid"], ref["bid"], rtol=1e-6)
+    assert loaded["strike"].dtype == np.float32
+    assert isinstance(loaded["right"].dtype, pd.CategoricalDtype)
+
+
+def test_chunks_are_bounded_and_non_empty(tmp_path):
+    path = _write(_chain(), tmp_path / "chain.csv")
+    chunks = list(iter_chunks(path, DAY, chunksize=100))
+    assert chunks and all(0 < len(c) <= 100 for c in chunks)
+    assert list(chunks[0].columns) == [
+        "expiry",
+        "strike",
+        "right",
+        "open_interest",
+        "bid",
+        "ask",
+    ]
+
+
+def test_statistics_file_with_osi_symbols(tmp_path):
+    rows = [
+        ("SPXW  250312C06000000", STAT_OPEN_INTEREST, 120),
+        ("SPXW  250312C06000000", 1, 999),  # not an OI stat
+        ("SPXW  250312P05995000", STAT_OPEN_INTEREST, 80),
+        ("SPXW  250313C06000000", STAT_OPEN_INTEREST, 50),
+    ]
+    frame = pd.DataFrame(rows, columns=["symbol", "stat_type", "quantity"])
+    frame.insert(0, "ts_event", "2025-03-12T10:30:00Z")
+    path = _write(frame, tmp_path / "stats.csv")
+
+    loaded = load_0dte(path, DAY)
+    everything = load_options(
+        path, fields=("expiry", "strike", "right", "open_interest")
+    )
+
+    assert loaded[["strike", "right", "open_interest"]].values.tolist() == [
+        [6000.0, "C", 120.0],
+        [5995.0, "P", 80.0],
+    ]
+    assert list(everything.columns) == ["expiry", "strike", "right", "open_interest"]
+    assert len(everything) == 3
+
+
+def test_fields_without_the_contract_columns(tmp_path):
+    frame = _chain(200)
+    path = _write(frame, tmp_path / "chain.csv")
+
+    loaded = load_options(path, DAY, atm=6000.0, fields=("strike", "open_interest"))
+
+    expected = _reference(frame, DAY, 6000.0, 100.0)
+    assert list(loaded.columns) == ["strike", "open_interest"]
+    assert loaded["open_interest"].tolist() == expected["openInterest"].tolist()
+
+
+def test_resolve_columns():
+    assert resolve_columns(["expiry", "strike", "right", "oi", "symbol"]) == {
+        "expiry": "expiry",
+        "strike": "strike",
+        "right": "right",
+        "open_interest": "oi",
+    }
+    with pytest.raises(ConfigurationError):
+        resolve_columns(["ts", "price"])
+
+
+def test_empty_result_keeps_the_fields(tmp_path):
+    path = _write(_chain(50), tmp_path / "chain.csv")
+    empty = load_0dte(path, datetime.date(2025, 1, 2))
+    assert empty.empty and list(empty.columns)[:3] == ["expiry", "strike", "right"]
@@ -0,0 +1,188 @@
+"""Parquet store: typed roundtrip, trade_date partitions, compaction, sink."""
+
+import csv
+import datetime
+
+import pytest
+
+pytest.importorskip("pyarrow")
+import pyarrow.parquet as pq  # noqa: E402
+
+from es_trading_dashboard.collector.parquet_store import (  # noqa: E402
+    ParquetSink,
+    ParquetStore,
+)
+from es_trading_dashboard.collector.schema import (  # noqa: E402
+    LOG_COLUMNS,
+    SNAP_COLUMNS,
+)
+
+D1, D2 = datetime.date(2026, 3, 10), datetime.date(2026, 3, 11)
+
+
+def _row(ts, es_last, mode="LIVE"):
+    values = [None] * (len(LOG_COLUMNS) - 3)
+    return [ts, mode, es_last] + values
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ParquetStore(str(tmp_path / "pq"), config={"a": 1})
+
+
+def test_roundtrip_keeps_types_and_nulls(store):
+    dates = store.append(
+        "market_10s",
+        [_row("2026-03-10 10:00:00", 5000.25), _row("2026-03-10 10:00:10", None)],
+    )
+    assert dates == {D1}
+
+    df = store.read("market_10s")
+    assert df["es_last"].tolist()[0] == 5000.25
+    assert df["es_last"].isna().tolist() == [False, True]
+    assert df["spx_last"].isna().all()
+    assert df["mode"].tolist() == ["LIVE", "LIVE"]
+    assert str(df["timestamp"].dt.tz) == "Europe/Zurich"
+
+
+def test_rows_before_session_start_belong_to_the_previous_trade_date(store):
+    dates = store.append(
+        "market_10s",
+        [
+            _row("2026-03-11 02:14:50", 1.0),
+            _row("2026-03-11 02:15:00", 2.0),
+            _row("2026-03-11 23:59:50", 3.0),
+        ],
+    )
+    assert dates == {D1, D2}
+    assert store.trade_dates("market_10s") == [D1, D2]
+    assert store.read("market_10s", start=D2)["es_last"].tolist() == [2.0, 3.0]
+    assert store.read("market_10s", end=D1)["es_last"].tolist() == [1.0]
+
+
+def test_versioning_metadata_in_every_file(store):
+    store.append("market_10s", [_row("2026-03-10 10:00:00", 1.0)])
+    (path,) = (store.root / "market_10s").rglob("*.parquet")
+    meta = pq.read_schema(path).metadata
+    assert meta[b"MODEL_VERSION"] == store.metadata["MODEL_VERSION"].encode()
+    assert meta[b"CONFIG_HASH"] == store.metadata["CONFIG_HASH"].encode()
+    assert b"ENGINE_START_TIME" in meta
+
+
+def test_compact_merges_parts_in_timestamp_order(store):
+    store.append("market_10s", [_row("2026-03-10 10:00:20", 3.0)])
+    store.append("market_10s", [_row("2026-03-10 10:00:00", 1.0)])
+    store.append("market_10s", [_row("2026-03-10 10:00:10", 2.0)])
+    part_dir = store.root / "market_10s" / "trade_date=2026-03-10"
+    assert len(list(part_dir.glob("*.parquet"))) == 3
+
+    store.compact("market_10s", D1)
+
+    assert [p.name for p in part_dir.iterdir()] == ["data.parquet"]
+    assert store.read("market_10s")["es_last"].tolist() == [1.0, 2.0, 3.0]
+
+
+def test_compact_keeps_the_previous_compaction(store):
+    store.append("market_10s", [_row("2026-03-10 10:00:00", 1.0)])
+    store.append("market_10s", [_row("2026-03-10 10:00:10", 2.0)])
+    store.compact("market_10s", D1)
+    store.append("market_10s", [_row("2026-03-10 10:00:20", 3.0)])
+
+    store.compact("market_10s", D1)
+    store.compact("market_10s", D1)
+
+    part_dir = store.root / "market_10s" / "trade_date=2026-03-10"
+    assert [p.name for p in part_dir.iterdir()] == ["data.parquet"]
+    assert store.read("market_10s")["es_last"].tolist() == [1.0, 2.0, 3.0]
+
+
+def test_export_csv_restores_the_csv_layout(store, tmp_path):
+    rows = [_row("2026-03-10 10:00:00", 5000.25), _row("2026-03-10 10:00:10", None)]
+    store.append("market_10s", rows)
+    path = tmp_path / "out.csv"
+
+    assert store.export_csv("market_10s", str(path)) == 2
+    with open(path, newline="") as f:
+        out = list(csv.reader(f))
+    assert out[0] == LOG_COLUMNS
+    assert out[1][:3] == ["2026-03-10 10:00:00", "LIVE", "5000.25"]
+    assert out[2][2] == ""
+
+
+def test_snapshot_levels_are_named_by_value_and_exported_by_position(store, tmp_path):
+    levels = [float(i) for i in range(1, 10)]  # ORDER_KEYS order
+    row = ["2026-03-10 10:00:00", "ES_10:00", "20260310", "VWAP", 5000.0]
+    row += [None, None, 20.0, 18.0] + levels
+    store.append("range_snapshots", [row])
+
+    df = store.read("range_snapshots")
+    assert df["FIB_R1_UP"].tolist() == [1.0]
+    assert df["CENTER"].tolist() == [5.0]
+
+    path = tmp_path / "snapshots_fixed.csv"
+    store.export_csv("range_snapshots", str(path))
+    with open(path, newline="") as f:
+        header, out = list(csv.reader(f))
+    assert header == SNAP_COLUMNS
+    assert header[9:11] == ["R1_UP", "R2_UP"]  # baseline header kept
+    assert out[9:] == [str(v) for v in levels]
+
+
+def test_sink_buffers_parts_and_compacts_on_fsync(store):
+    sink = ParquetSink(store, "market_10s", part_rows=2)
+    sink.write_rows([_row("2026-03-10 10:00:00", 1.0)])
+    assert store.trade_dates("market_10s") == []
+    sink.write_rows([_row("2026-03-10 10:00:10", 2.0)])
+    sink.write_rows([_row("2026-03-10 10:00:20", 3.0)])
+    sink.flush()
+    assert len(store.read("market_10s")) == 2
+
+    sink.flush(fsync=True)
+
+    part_dir = store.root / "market_10s" / "trade_date=2026-03-10"
+    assert [p.name for p in part_dir.iterdir()] == ["data.parquet"]
+    assert store.read("market_10s")["es_last"].tolist() == [1.0, 2.0, 3.0]
+
+
+def test_sink_keeps_rows_when_the_append_fails(store, monkeypatch):
+    sink = ParquetSink(store, "market_10s", part_rows=2)
+    sink.write_rows([_row("2026-03-10 10:00:00", 1.0)])
+    real_write = pq.write_table
+
+    def full_disk(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(pq, "write_table", full_disk)
+    with pytest.raises(OSError):
+        sink.write_rows([_row("2026-03-10 10:00:10", 2.0)])
+    with pytest.raises(OSError):
+        sink.flush(fsync=True)
+    assert store.read("market_10s").empty
+
+    # The writer sends the refused rows again once the disk recovers
+    monkeypatch.setattr(pq, "write_table", real_write)
+    sink.write_rows([_row("2026-03-10 10:00:10", 2.0)])
+    sink.flush(fsync=True)
+
+    assert store.read("market_10s")["es_last"].tolist() == [1.0, 2.0]
+
+
+def test_failed_append_leaves_no_partial_days(store, monkeypatch):
+    real_write = pq.write_table
+    calls = []
+
+    def second_part_fails(table, path, *args, **kwargs):
+        calls.append(path)
+        if len(calls) == 2:
+            raise OSError("disk full")
+        real_write(table, path, *args, **kwargs)
+
+    monkeypatch.setattr(pq, "write_table", second_part_fails)
+    rows = [_row("2026-03-11 02:14:50", 1.0), _row("2026-03-11 02:15:00", 2.0)]
+    with pytest.raises(OSError):
+        store.append("market_10s", rows)
+
+    assert list((store.root / "market_10s").rglob("*parquet*")) == []
+    monkeypatch.setattr(pq, "write_table", real_write)
+    assert store.append("market_10s", rows) == {D1, D2}
+    assert store.read("market_10s")["es_last"].tolist() == [1.0, 2.0]
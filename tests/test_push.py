@@ -0,0 +1,89 @@
+"""SSE push hub: render once per version, deltas, catch-up and sync flags."""
+
+import json
+import threading
+
+from es_trading_dashboard.collector.push import PushHub
+from es_trading_dashboard.collector.state_store import StateStore
+
+
+def _hub(history=64):
+    store = StateStore({"price": 1.0, "foto": "a"}, history=history)
+    calls = []
+
+    def render(snapshot):
+        calls.append(snapshot.version)
+        return {("price", "children"): snapshot["price"], ("foto", "children"): 0}
+
+    return store, PushHub(store, render, sync_keys=["foto"], keepalive=0.01), calls
+
+
+def _body(frame):
+    head, data = frame.strip().rsplit("data: ", 1)
+    return head, json.loads(data)
+
+
+def test_full_frame_then_deltas():
+    store, hub, _ = _hub()
+    head, body = _body(hub.frame(None, store.current))
+    assert head.startswith("id: 0\nevent: delta")
+    assert body["patch"] == {"price": {"children": 1.0}, "foto": {"children": 0}}
+    assert body["sync"] is True
+
+    store.publish(price=2.0)
+    _, body = _body(hub.frame(0, store.current))
+    assert (body["v"], body["prev"]) == (1, 0)
+    assert body["patch"] == {"price": {"children": 2.0}}
+    assert body["sync"] is False
+
+    store.publish(foto="b")
+    _, body = _body(hub.frame(1, store.current))
+    assert body["patch"] == {}
+    assert body["sync"] is True
+
+
+def test_each_version_renders_once_and_frames_are_shared():
+    store, hub, calls = _hub()
+    store.publish(price=2.0)
+    frames = {hub.frame(0, store.current) for _ in range(10)}
+    assert len(frames) == 1
+    assert calls == [1, 0]
+
+
+def test_evicted_version_gets_a_full_frame():
+    store, hub, _ = _hub(history=2)
+    for i in range(3):
+        store.publish(price=float(i))
+    _, body = _body(hub.frame(0, store.current))
+    assert body["prev"] is None
+    assert set(body["patch"]) == {"price", "foto"}
+
+
+def test_stream_catches_up_from_last_event_id_and_keeps_alive():
+    store, hub, _ = _hub()
+    store.publish(price=2.0)
+    stop = threading.Event()
+    stream = hub.stream(last_event_id="0", stop=stop)
+
+    assert next(stream) == "retry: 3000\n\n"
+    _, body = _body(next(stream))
+    assert (body["prev"], body["v"]) == (0, 1)
+    assert hub.viewers == 1
+    assert next(stream) == ": keepalive\n\n"
+
+    store.publish(price=3.0)
+    _, body = _body(next(stream))
+    assert body["patch"] == {"price": {"children": 3.0}}
+
+    stop.set()
+    assert list(stream) in ([], [": keepalive\n\n"])
+    assert hub.viewers == 0
+
+
+def test_up_to_date_viewer_gets_no_catch_up_frame():
+    store, hub, _ = _hub()
+    stream = hub.stream(last_event_id=str(store.version))
+    assert next(stream) == "retry: 3000\n\n"
+    assert next(stream) == ": keepalive\n\n"
+    stream.close()
+    assert hub.viewers == 0
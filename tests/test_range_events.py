@@ -0,0 +1,90 @@
+"""Touch / reject / breakout state machines of the range-event engine."""
+
+import pytest
+
+from es_trading_dashboard.collector.range_engine import RangeEventEngine
+
+PANELS = (("ES_P", "ES"), ("SPX_P", "SPX"))
+
+
+@pytest.fixture
+def engine():
+    """Two panels with only a CENTER level at 100 (ES) and 5000 (SPX)."""
+    eng = RangeEventEngine(PANELS, buffer=0.25, cooldown=30, window=300)
+    eng.set_levels("ES_P", {"CENTER": 100.0}, ts=0.0)
+    eng.set_levels("SPX_P", {"CENTER": 5000.0}, ts=0.0)
+    return eng
+
+
+def _center(eng, panel):
+    return next(r for r in eng.rows(panel) if r["level"] == "CENTER")
+
+
+def _feed(eng, ticks, spx=None):
+    """Feed (ts, es_last) ticks; returns the ticks on which an event fired."""
+    return [ts for ts, es in ticks if eng.update(ts, es, spx)]
+
+
+def test_touch_needs_a_cross_from_the_other_side(engine):
+    # First price above the level only sets the side, it is not a touch
+    assert _feed(engine, [(1, 100.5), (2, 101.0)]) == []
+    assert _feed(engine, [(3, 99.7)]) == [3]
+    row = _center(engine, "ES_P")
+    assert (row["touch_flag"], row["touch_count"]) == (1, 1)
+    assert row["time_from_range_birth_to_first_touch"] == round(3 / 60, 2)
+
+
+def test_buffer_must_be_exceeded(engine):
+    _feed(engine, [(1, 99.0), (2, 100.2), (3, 99.9)])
+    assert _center(engine, "ES_P")["touch_count"] == 0
+
+
+def test_cooldown_suppresses_repeated_touches(engine):
+    ticks = [(0, 99.0), (10, 100.5), (20, 99.5), (25, 100.5), (45, 99.5)]
+    _feed(engine, ticks)
+    # 10 counted; 20 and 25 within 30s of the last counted touch; 45 counted
+    row = _center(engine, "ES_P")
+    assert row["touch_count"] == 2
+    assert engine.last_touch[4] == 45
+    assert engine.first_touch[4] == 10
+
+
+def test_reject_within_window(engine):
+    _feed(engine, [(0, 99.0), (10, 100.5), (100, 99.7)])
+    row = _center(engine, "ES_P")
+    assert row["has_reject"] == 1
+    assert row["has_breakout"] == 0
+
+
+def test_breakout_when_price_holds_beyond_the_level(engine):
+    ticks = [(0, 99.0), (10, 100.5)] + [(t, 100.1) for t in range(20, 320, 10)]
+    fired = _feed(engine, ticks)
+    row = _center(engine, "ES_P")
+    assert row["has_breakout"] == 1
+    assert row["has_reject"] == 0
+    assert fired == [10, 310]
+    assert engine.breakout_time[4] == 310
+
+
+def test_dip_back_through_the_level_resets_the_breakout_clock(engine):
+    ticks = [(0, 99.0), (10, 100.5), (200, 99.9), (250, 100.1), (400, 100.1)]
+    _feed(engine, ticks)
+    # Deadline (310) passed without holding for a full window after the dip
+    row = _center(engine, "ES_P")
+    assert (row["has_breakout"], row["has_reject"]) == (0, 0)
+
+
+def test_spx_panel_follows_spx_price(engine):
+    engine.update(0, 99.0, 4990.0)
+    assert engine.update(1, 99.0, 5001.0)
+    assert _center(engine, "SPX_P")["touch_count"] == 1
+    assert _center(engine, "ES_P")["touch_count"] == 0
+
+
+def test_reset_clears_levels_and_events(engine):
+    _feed(engine, [(0, 99.0), (10, 100.5)])
+    engine.reset()
+    row = _center(engine, "ES_P")
+    assert row["level_value"] is None
+    assert row["touch_count"] == 0
+    assert not engine.update(20, 99.0, None)
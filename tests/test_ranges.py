@@ -0,0 +1,68 @@
+"""Vectorized range kernel vs the scalar SPEC_LOCK formulas."""
+
+import math
+
+import numpy as np
+import pytest
+
+from es_trading_dashboard.core.ranges import LEVEL_INDEX, level_dict, range_levels
+from es_trading_dashboard.core.spec import FIB_DN, FIB_UP, ORDER_KEYS
+
+
+def _scalar(base, iv_daily, iv_straddle):
+    """SPEC_LOCK §5/§6 levels of one base, in ORDER_KEYS order."""
+    r1, r2 = base * iv_daily, base * iv_straddle
+    return {
+        "FIBO EST R1 UP": base + r1 * FIB_UP,
+        "FIBO EST R2 UP": base + r2 * FIB_UP,
+        "R1 UP": base + r1,
+        "R2 UP": base + r2,
+        "CENTER": base,
+        "R2 DOWN": base - r2,
+        "R1 DOWN": base - r1,
+        "FIBO EST R2 DOWN": base - r2 * FIB_DN,
+        "FIBO EST R1 DOWN": base - r1 * FIB_DN,
+    }
+
+
+def test_bit_identical_to_the_scalar_formulas():
+    rng = np.random.default_rng(0)
+    base = rng.uniform(3000, 7000, 500)
+    iv_daily = rng.uniform(0.003, 0.03, 500)
+    iv_straddle = rng.uniform(0.002, 0.02, 500)
+
+    levels = range_levels(base, iv_daily, iv_straddle)
+
+    assert levels.shape == (500, 9)
+    for i in range(500):
+        expected = _scalar(base[i], iv_daily[i], iv_straddle[i])
+        assert levels[i].tolist() == [expected[k] for k in ORDER_KEYS]
+
+
+def test_spread_projection_and_broadcasting():
+    levels = range_levels(5000.0, 0.01, 0.008, spread=[0.0, 25.0])
+    assert levels.shape == (2, 9)
+    np.testing.assert_array_equal(levels[1], levels[0] + 25.0)
+    assert levels[0, LEVEL_INDEX["CENTER"]] == 5000.0
+
+
+def test_missing_inputs_give_nan_rows():
+    levels = range_levels([5000.0, np.nan], [0.01, 0.01], [0.008, 0.008])
+    assert not np.isnan(levels[0]).any()
+    assert np.isnan(levels[1]).all()
+    assert level_dict(levels[1]) == {}
+
+
+def test_preallocated_output():
+    out = np.empty(9)
+    result = range_levels(5000.0, 0.01, 0.008, out=out)
+    assert result is out
+    assert level_dict(out) == pytest.approx(_scalar(5000.0, 0.01, 0.008))
+
+
+def test_level_dict_maps_nan_levels_to_none():
+    row = range_levels(5000.0, 0.01, 0.008)
+    row[LEVEL_INDEX["R1 UP"]] = math.nan
+    levels = level_dict(row)
+    assert list(levels) == ORDER_KEYS
+    assert levels["R1 UP"] is None
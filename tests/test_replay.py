@@ -0,0 +1,83 @@
+"""Offline replay of recorded samples through the sample engine."""
+
+import csv
+import datetime
+
+from es_trading_dashboard.collector.replay import (
+    Replayer,
+    in_range,
+    main,
+    recorded_samples,
+    sample_row,
+)
+from es_trading_dashboard.collector.sample_engine import Sample
+from es_trading_dashboard.collector.schema import SAMPLE_COLUMNS
+
+
+def _session(day, step=30):
+    """One sample every ``step`` seconds from 09:30 to 22:05 of ``day``."""
+    t = datetime.datetime.combine(day, datetime.time(9, 30))
+    end = datetime.datetime.combine(day, datetime.time(22, 5))
+    i = 0
+    while t <= end:
+        es = 6000.0 + (i % 40) * 0.5
+        yield Sample(t, es, 5995.0, 1.0, es - 30.0, 5960.0, 40.0, 41.0, 1.1)
+        t += datetime.timedelta(seconds=step)
+        i += 1
+
+
+def _days():
+    return [datetime.date(2026, 3, 10), datetime.date(2026, 3, 11)]
+
+
+def test_replaying_recorded_samples_is_deterministic(tmp_path):
+    samples = [s for day in _days() for s in _session(day)]
+    path = tmp_path / "samples.csv"
+    with open(path, "w", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(SAMPLE_COLUMNS)
+        w.writerows(sample_row(s) for s in samples)
+
+    live = Replayer().run(samples)
+    replayed = Replayer().run(recorded_samples(str(path)))
+
+    assert replayed.samples == live.samples == len(samples)
+    assert replayed.snapshot_rows == live.snapshot_rows
+    assert replayed.log_rows == live.log_rows
+    assert replayed.event_rows == live.event_rows
+
+
+def test_event_rows_per_trade_date():
+    result = Replayer().run(s for day in _days() for s in _session(day))
+
+    assert len(result.snapshot_rows) == 2 * 5
+    by_day = {}
+    for row in result.event_rows:
+        by_day.setdefault(row["trade_date"], set()).add(row["panel"])
+    assert sorted(by_day) == ["2026-03-10", "2026-03-11"]
+    assert "ES_10:00" in by_day["2026-03-10"]
+
+
+def test_in_range_filters_by_trade_date():
+    samples = [s for day in _days() for s in _session(day, step=3600)]
+    late = Sample(datetime.datetime(2026, 3, 12, 1, 0))  # trade_date 03-11
+    kept = list(in_range(samples + [late], start=_days()[1]))
+    assert kept[0].timestamp.date() == _days()[1]
+    assert kept[-1] is late
+    assert list(in_range(samples, end=_days()[0])) == samples[: len(samples) // 2]
+
+
+def test_main_applies_the_date_range_to_recorded_samples(tmp_path, capsys):
+    path = tmp_path / "samples.csv"
+    with open(path, "w", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(SAMPLE_COLUMNS)
+        w.writerows(sample_row(s) for day in _days() for s in _session(day))
+
+    out = tmp_path / "out"
+    main([str(path), "--format", "samples", "--start", "2026-03-11", "--out", str(out)])
+
+    with open(out / "snapshots_fixed.csv", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert {r["date"] for r in rows} == {"20260311"}
+    assert len(rows) == 5
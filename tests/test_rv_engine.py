@@ -0,0 +1,111 @@
+"""Realized volatility windows and rolling percentiles vs naive references."""
+
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from es_trading_dashboard.loaders.databento_loader import BarStore, trade_dates
+from es_trading_dashboard.master_output.rv_engine import (
+    PCTL_WINDOWS,
+    RV_WINDOWS,
+    realized_vol,
+    rolling_percentile,
+    rv_daily,
+)
+
+
+@pytest.fixture(scope="module")
+def bars():
+    """1m bars over two weeks, including the spring DST change."""
+    rng = np.random.default_rng(11)
+    ts = pd.date_range("2025-03-24", "2025-04-05", freq="min", tz="UTC")
+    ts = ts[ts.weekday < 5]
+    close = 5700 * np.exp(np.cumsum(rng.normal(0, 4e-4, len(ts))))
+    ns = ts.as_unit("ns").asi8
+    return pd.DataFrame(
+        {
+            "ts_utc": ns,
+            "open": close * np.exp(rng.normal(0, 1e-4, len(ts))),
+            "high": close + 1,
+            "low": close - 1,
+            "close": close,
+            "volume": np.ones(len(ts), dtype=np.int64),
+            "symbol": "ESM5",
+            "trade_date": trade_dates(ns),
+        }
+    )
+
+
+def _naive_rv(bars):
+    """RV per (trade_date, window) with a plain loop over trade dates."""
+    local = pd.DatetimeIndex(bars["ts_utc"].to_numpy(dtype="datetime64[ns]"), tz="UTC")
+    minutes = local.tz_convert("Europe/Zurich")
+    minutes = minutes.hour * 60 + minutes.minute
+    out = {}
+    for day, group in bars.groupby("trade_date"):
+        prev = group["close"].shift(1)
+        prev.iloc[0] = group["open"].iloc[0]
+        r2 = np.log(group["close"] / prev) ** 2
+        m = np.asarray(minutes[group.index])
+        row = []
+        for (sh, sm), (eh, em) in RV_WINDOWS.values():
+            mask = (m >= sh * 60 + sm) & (m < eh * 60 + em)
+            row.append(100 * np.sqrt(r2[mask].sum()) if mask.any() else np.nan)
+        out[pd.Timestamp(day)] = row
+    return pd.DataFrame.from_dict(out, orient="index", columns=list(RV_WINDOWS))
+
+
+def _sorted_percentile(values, window):
+    """Percentile rank by sorting each trailing window."""
+    out = []
+    for i, v in enumerate(values):
+        lo = 0 if window is None else max(0, i - window + 1)
+        past = np.sort([x for x in values[lo : i + 1] if not np.isnan(x)])
+        if np.isnan(v):
+            out.append(np.nan)
+        else:
+            out.append(100.0 * np.searchsorted(past, v, "right") / len(past))
+    return np.array(out)
+
+
+def test_realized_vol_matches_a_loop(bars):
+    days, rv = realized_vol(
+        bars["ts_utc"].to_numpy(),
+        bars["open"].to_numpy(),
+        bars["close"].to_numpy(),
+        bars["trade_date"].to_numpy(),
+    )
+    naive = _naive_rv(bars)
+    assert list(pd.DatetimeIndex(days)) == list(naive.index)
+    np.testing.assert_allclose(rv, naive.to_numpy(), rtol=1e-10)
+
+
+def test_realized_vol_of_no_bars():
+    days, rv = realized_vol(*(np.empty(0) for _ in range(4)))
+    assert len(days) == 0 and rv.shape == (0, len(RV_WINDOWS))
+
+
+@pytest.mark.parametrize("window", [None, 1, 5, 60])
+def test_rolling_percentile_matches_sorting(window):
+    rng = np.random.default_rng(window or 0)
+    values = rng.integers(0, 20, 300).astype(float)  # ties on purpose
+    values[rng.random(300) < 0.1] = np.nan
+    np.testing.assert_allclose(
+        rolling_percentile(values, window), _sorted_percentile(values, window)
+    )
+
+
+def test_rv_daily_percentiles_use_history_before_start(tmp_path, bars):
+    store = BarStore(str(tmp_path / "bars"))
+    store.append(bars)
+
+    full = rv_daily(str(tmp_path / "bars"))
+    tail = rv_daily(str(tmp_path / "bars"), start=datetime.date(2025, 4, 1))
+
+    assert list(full.columns) == [*RV_WINDOWS, *PCTL_WINDOWS]
+    pd.testing.assert_frame_equal(tail, full[full.index >= "2025-04-01"])
+    np.testing.assert_allclose(
+        full["RV_PCTL_FULL"], _sorted_percentile(full["RV_0215_2200"].tolist(), None)
+    )
@@ -0,0 +1,132 @@
+"""Sample engine: modes, fixed snapshots, log cadence and finalize."""
+
+import datetime
+import math
+
+import pytest
+
+from es_trading_dashboard.collector.sample_engine import (
+    MODE_AFTERNOON,
+    MODE_MORNING,
+    Sample,
+    SampleEngine,
+    calc_ranges,
+)
+from es_trading_dashboard.core.spec import ORDER_KEYS
+
+DAY = datetime.date(2026, 3, 10)
+SPREAD = 30.0
+
+
+def _sample(ts, i=0):
+    es = 6000.0 + 5 * math.sin(i / 20)
+    return Sample(
+        ts,
+        es_last=es,
+        es_vwap=5995.0,
+        iv_daily_pct=1.0,
+        spx_last=es - SPREAD,
+        spx_open=5960.0,
+        str_bid=40.0,
+        str_ask=41.0,
+        pcr=1.1,
+    )
+
+
+def samples_between(start="09:59:40", end="22:01:10", step=10, day=DAY):
+    t = datetime.datetime.combine(day, datetime.time.fromisoformat(start))
+    stop = datetime.datetime.combine(day, datetime.time.fromisoformat(end))
+    i = 0
+    while t <= stop:
+        yield _sample(t, i)
+        t += datetime.timedelta(seconds=step)
+        i += 1
+
+
+@pytest.fixture(scope="module")
+def steps():
+    engine = SampleEngine()
+    return [(s, engine.step(s)) for s in samples_between()]
+
+
+def _ranges(base, ask, spread=0.0):
+    levels = calc_ranges(base, 0.01, ask / base)
+    return [levels[k] + spread for k in ORDER_KEYS]
+
+
+def test_morning_snapshot_at_10(steps):
+    taken = [(s, st) for s, st in steps if st.snapshots]
+    s, st = taken[0]
+    assert s.timestamp.time() == datetime.time(10, 0)
+    (row,) = st.snapshots
+    assert row[1:5] == ["ES_10:00", "20260310", "VWAP", 5995.0]
+    assert row[9:] == pytest.approx(_ranges(5995.0, 41.0))
+    assert st.state["snap_1000"]["ranges"]["CENTER"] == 5995.0
+
+
+def test_afternoon_snapshots_use_the_official_spx_open(steps):
+    taken = [st for _, st in steps if st.snapshots][1:]
+    assert [[r[1] for r in st.snapshots] for st in taken] == [
+        ["SPX_15:30", "ES_15:30"],
+        ["SPX_15:45", "ES_15:45"],
+    ]
+    spx, es = taken[0].snapshots
+    spread = es[6]
+    assert spx[4] == 5960.0 and es[4] == pytest.approx(5960.0 + spread)
+    assert spx[9:] == pytest.approx(_ranges(5960.0, 41.0))
+    assert es[9:] == pytest.approx(_ranges(5960.0, 41.0, spread))
+
+
+def test_mode_switches_at_1530(steps):
+    published, modes = {}, {}
+    for s, st in steps:
+        published.update(st.state)
+        modes[s.timestamp.time()] = published["mode"]
+    assert modes[datetime.time(15, 29, 50)] == MODE_MORNING
+    assert modes[datetime.time(15, 30)] == MODE_AFTERNOON
+    assert published["base_label_live"] == "OPEN"
+
+
+def test_unchanged_inputs_only_publish_the_clock():
+    engine = SampleEngine()
+    t = datetime.datetime.combine(DAY, datetime.time(11, 0))
+    first = engine.step(_sample(t))
+    assert {"es_last", "mode", "live_panels"} <= set(first.state)
+
+    same = engine.step(_sample(t + datetime.timedelta(seconds=1)))
+    assert same.state == {"last_update": "2026-03-10 11:00:01"}
+
+    # A new ES price alone leaves the morning ranges untouched
+    moved = _sample(t + datetime.timedelta(seconds=2))
+    moved.es_last += 1.0
+    moved.spx_last += 1.0
+    state = engine.step(moved).state
+    assert state["es_last"] == moved.es_last
+    assert "live_panels" not in state
+
+
+def test_log_rows_every_interval(steps):
+    logged = [s.timestamp for s, st in steps if st.log_row is not None]
+    assert logged[0] == datetime.datetime(2026, 3, 10, 9, 59, 50)
+    assert all(
+        b - a == datetime.timedelta(seconds=10) for a, b in zip(logged, logged[1:])
+    )
+    assert len(logged) == len(steps) - 1
+
+
+def test_finalize_once_at_2201(steps):
+    final = [s.timestamp.time() for s, st in steps if st.finalize]
+    assert final == [datetime.time(22, 1)]
+
+
+def test_new_trade_date_clears_the_snapshots():
+    engine = SampleEngine()
+    for s in samples_between("09:59:50", "10:00:10"):
+        engine.step(s)
+    assert engine.snap_done["1000"]
+
+    # 02:20 of the next calendar day starts the next session
+    st = engine.step(_sample(datetime.datetime(2026, 3, 11, 2, 20)))
+    assert engine.trade_date == datetime.date(2026, 3, 11)
+    assert not engine.snap_done["1000"]
+    assert st.state["snap_1000"] is None
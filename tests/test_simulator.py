@@ -0,0 +1,67 @@
+"""Simulated TWS: connection behaviour, contracts and streaming tickers."""
+
+import time
+
+import pytest
+from ib_insync import Future, Index
+
+from es_trading_dashboard.collector.simulator import SimConfig, SimulatedIB
+from es_trading_dashboard.collector.tick_pipeline import TickPipeline
+from es_trading_dashboard.core.market_data import MarketDataSource
+
+
+def test_implements_the_market_data_interface():
+    assert isinstance(SimulatedIB(), MarketDataSource)
+
+
+def test_refused_connects_then_success():
+    ib = SimulatedIB(SimConfig(refuse_connects=2))
+    for _ in range(2):
+        with pytest.raises(ConnectionRefusedError):
+            ib.connect()
+    assert ib.connect().isConnected()
+
+
+def test_scheduled_disconnect():
+    ib = SimulatedIB(SimConfig(disconnect_after=0.05))
+    fired = []
+    ib.disconnectedEvent += lambda: fired.append(True)
+    ib.connect()
+    assert not ib.sleep(0.2)
+    assert not ib.isConnected()
+    assert fired == [True]
+
+
+def test_contracts_and_chains():
+    ib = SimulatedIB(SimConfig(es_price=5000.0, strike_step=5.0, n_strikes=10))
+    ib.connect()
+    front, _ = ib.reqContractDetails(Future("ES", exchange="CME"))
+    es = front.contract
+    assert es.conId and es.localSymbol.startswith("ES")
+
+    zero_dte, _ = ib.reqSecDefOptParams("ES", "CME", "FUT", es.conId)
+    assert zero_dte.tradingClass == "E2B"
+    assert zero_dte.strikes[0] == 4950.0 and zero_dte.strikes[-1] == 5050.0
+
+
+def test_tickers_stream_into_the_pipeline():
+    ib = SimulatedIB(SimConfig(tick_rates={"FUT": 200.0, "IND": 50.0}, seed=1))
+    ib.connect()
+    (es,) = ib.qualifyContracts(Future("ES", "20991218", "CME"))
+    spx = Index("SPX", "CBOE")
+    pipe = TickPipeline(ib, min_interval=0.0)
+    pipe.watch(ib.reqMktData(es), "es")
+    pipe.watch(ib.reqMktData(spx), "spx")
+    pipe.flush()
+
+    groups = set()
+    deadline = time.monotonic() + 2.0
+    while groups != {"es", "spx"} and time.monotonic() < deadline:
+        groups |= pipe.poll(0.1)
+
+    assert groups == {"es", "spx"}
+    assert ib.ticks_applied > 0
+    scheduled, applied = ib.tick_log[-1]
+    assert applied >= scheduled
+    ticker = ib.reqMktData(es)
+    assert ticker.last > 0 and ticker.bid == ticker.last - 0.25
@@ -0,0 +1,43 @@
+"""Render-once cache of the FOTO panels."""
+
+from es_trading_dashboard.collector.snapshot_cache import SnapshotCache
+
+
+def _cache():
+    calls = []
+
+    def render(slot, snapshot):
+        calls.append((slot, snapshot["date"] if snapshot else None))
+        return f"{slot}@{snapshot['date'] if snapshot else '-'}"
+
+    return SnapshotCache(render), calls
+
+
+def test_renders_once_per_slot_and_trade_date():
+    cache, calls = _cache()
+    snap = {"date": "2026-03-10", "CENTER": 1.0}
+    for _ in range(5):
+        assert cache.get("ES_10:00", snap) == "ES_10:00@2026-03-10"
+    assert cache.get("ES_10:00", None) == "ES_10:00@-"
+    assert cache.get("ES_10:00", None) == "ES_10:00@-"
+    assert calls == [("ES_10:00", "2026-03-10"), ("ES_10:00", None)]
+    assert (cache.hits, cache.misses) == (5, 2)
+
+
+def test_roll_keeps_the_current_day_and_placeholders():
+    cache, calls = _cache()
+    cache.get("ES_10:00", {"date": "2026-03-10"})
+    cache.get("ES_10:00", {"date": "2026-03-11"})
+    cache.get("ES_15:30", None)
+
+    cache.roll("2026-03-11")
+    calls.clear()
+    cache.get("ES_10:00", {"date": "2026-03-10"})
+    cache.get("ES_10:00", {"date": "2026-03-11"})
+    cache.get("ES_15:30", None)
+    assert calls == [("ES_10:00", "2026-03-10")]
+
+    cache.roll()
+    calls.clear()
+    cache.get("ES_10:00", {"date": "2026-03-11"})
+    assert calls == [("ES_10:00", "2026-03-11")]
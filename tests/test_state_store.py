@@ -0,0 +1,62 @@
+"""Versioned immutable state shared by the worker and the UI."""
+
+import threading
+
+import pytest
+
+from es_trading_dashboard.collector.state_store import StateStore
+
+
+def test_publish_bumps_version_and_keeps_old_snapshots_intact():
+    store = StateStore({"a": 1})
+    first = store.current
+    second = store.publish({"b": 2}, c=3)
+
+    assert (first.version, second.version, store.version) == (0, 1, 1)
+    assert dict(first) == {"a": 1}
+    assert dict(second) == {"a": 1, "b": 2, "c": 3}
+    assert store.current is second
+
+
+def test_snapshots_are_read_only():
+    snapshot = StateStore({"a": 1}).current
+    with pytest.raises(TypeError):
+        snapshot["a"] = 2
+    with pytest.raises(AttributeError):
+        snapshot.extra = 5
+
+
+def test_wait_returns_on_publish():
+    store = StateStore()
+    timer = threading.Timer(0.05, store.publish, kwargs={"changes": {"x": 1}})
+    timer.start()
+    snapshot = store.wait(0, timeout=5)
+    timer.join()
+    assert snapshot.version == 1
+    assert snapshot["x"] == 1
+
+
+def test_wait_times_out_with_the_current_snapshot():
+    store = StateStore({"x": 0})
+    assert store.wait(0, timeout=0.01).version == 0
+
+
+def test_changed_keys_since_a_rendered_version():
+    store = StateStore({"a": 1, "b": [1]}, history=3)
+    seen = store.version
+    store.publish(a=1, b=[1], c=2)  # equal values are not changes
+    store.publish(a=5)
+
+    assert store.changed(seen) == {"a", "c"}
+    assert store.changed(seen, keys=["b", "c"]) == {"c"}
+    assert store.changed(store.version) == set()
+    assert store.get(1)["a"] == 1
+
+
+def test_evicted_versions_report_everything_changed():
+    store = StateStore(history=2)
+    for i in range(3):
+        store.publish(x=i)
+    assert store.get(0) is None
+    assert store.changed(0) is None
+    assert store.changed(None) is None
@@ -0,0 +1,120 @@
+"""Reconnect supervisor: backoff, stop, stall detection and restore."""
+
+import threading
+import time
+
+from ib_insync import Future
+
+from es_trading_dashboard.collector.chain_manager import ChainManager
+from es_trading_dashboard.collector.simulator import SimConfig, SimulatedIB
+from es_trading_dashboard.core.connection import IBConnection, backoff_delay
+from es_trading_dashboard.core.supervisor import ConnectionSupervisor
+
+
+def _supervisor(**config):
+    sim = SimulatedIB(SimConfig(**config))
+    return ConnectionSupervisor(
+        IBConnection(ib=sim), client_id=7, backoff_initial=0.001, backoff_max=0.01
+    )
+
+
+def test_backoff_delay_grows_and_is_capped():
+    delays = [backoff_delay(n, 0.5, 30.0, jitter=0.0) for n in range(10)]
+    assert delays[:4] == [0.5, 1.0, 2.0, 4.0]
+    assert delays[-1] == 30.0
+    assert 0.75 <= backoff_delay(1, 0.5, 30.0, jitter=0.25) <= 1.25
+
+
+def test_refused_connects_are_retried():
+    sup = _supervisor(refuse_connects=3)
+    assert sup.connect()
+    assert sup.isConnected()
+    assert (sup.connects, sup.failures) == (1, 3)
+
+
+def test_stop_aborts_the_retries():
+    sup = _supervisor(refuse_connects=10**6)
+    stop = threading.Event()
+    threading.Timer(0.05, stop.set).start()
+    assert not sup.connect(stop)
+    assert not sup.isConnected()
+
+
+def test_short_lived_connections_grow_the_backoff():
+    sup = _supervisor()
+    sup.connect()
+    sup.drop("test")
+    assert sup.failures == 1
+
+    sup.stable_after = 0.0
+    sup.connect()
+    sup.drop("test")
+    assert sup.failures == 0
+
+
+def test_subscriptions_are_restored_on_reconnect():
+    sup = _supervisor(tick_rates={})
+    sup.connect()
+    (es,) = sup.qualifyContracts(Future("ES", "20991218", "CME"))
+    first = sup.reqMktData(es, "233")
+    assert sup.ticker(es) is first
+
+    sup.drop("test")
+    assert sup.ticker(es) is None
+    sup.connect()
+
+    restored = sup.ticker(es)
+    assert restored is not None and restored is not first
+    assert sup.subscriptions == 1
+
+    sup.cancelMktData(es)
+    assert sup.subscriptions == 0
+    sup.drop("test")
+    sup.connect()
+    assert sup.ticker(es) is None
+
+
+def test_stall_without_ticker_updates():
+    sup = _supervisor(tick_rates={})
+    sup.stall_timeout = 0.05
+    sup.connect()
+    assert not sup.stalled()  # nothing subscribed, nothing to expect
+    (es,) = sup.qualifyContracts(Future("ES", "20991218", "CME"))
+    sup.reqMktData(es)
+    time.sleep(0.1)
+    assert sup.stalled()
+
+    sup.pendingTickersEvent.emit(set())
+    assert not sup.stalled()
+
+
+def test_chain_tickers_are_rebound_after_a_reconnect():
+    sup = _supervisor(tick_rates={}, es_price=5000.0)
+    sup.connect()
+    chain = ChainManager(sup, "20260310", "E2B", sup.ib._strikes(), max_lines=4)
+    assert chain.set_atm(5000.0)
+    old_call = chain.call
+
+    sup.drop("test")
+    sup.connect()
+    chain.rebind(sup.ticker)
+
+    assert chain.call is sup.ticker(chain.call.contract)
+    assert chain.call is not old_call
+    assert sup.subscriptions == 4
+
+
+def test_connect_timeouts_count_as_failures():
+    sup = _supervisor()
+    real_connect = sup.ib.connect
+    attempts = []
+
+    def connect(*args, **kwargs):
+        attempts.append(True)
+        if len(attempts) <= 2:
+            raise TimeoutError()
+        return real_connect(*args, **kwargs)
+
+    sup.ib.connect = connect
+    assert sup.connect()
+    assert (len(attempts), sup.failures) == (3, 2)
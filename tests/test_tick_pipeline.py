@@ -0,0 +1,115 @@
+"""Dirty-group tracking and flush coalescing of the tick pipeline."""
+
+import time
+
+from eventkit import Event
+from ib_insync import Stock, Ticker
+
+from es_trading_dashboard.collector.tick_pipeline import TickPipeline
+
+
+class FakeIB:
+    """Emits scripted ticker batches from ``sleep`` / ``waitOnUpdate``."""
+
+    def __init__(self):
+        self.pendingTickersEvent = Event("pendingTickersEvent")
+        self.batches = []
+        self.sleeps = []
+        self.connected = True
+
+    def _emit(self):
+        if self.batches:
+            self.pendingTickersEvent.emit(set(self.batches.pop(0)))
+            return True
+        return False
+
+    def sleep(self, secs=0.02):
+        self.sleeps.append(secs)
+        if self.connected:
+            time.sleep(secs)
+        self._emit()
+        return True
+
+    def waitOnUpdate(self, timeout=0):  # noqa: N802
+        if not self._emit():
+            time.sleep(timeout)
+            return False
+        return True
+
+    def isConnected(self):  # noqa: N802
+        return self.connected
+
+
+def _ticker(symbol):
+    return Ticker(contract=Stock(symbol, "SMART", "USD"))
+
+
+def test_watch_marks_the_group_dirty_and_flush_clears_it():
+    pipe = TickPipeline(FakeIB())
+    pipe.watch(_ticker("ES"), "es")
+    pipe.watch(None, "spx")
+
+    assert pipe.dirty == {"es"}
+    assert pipe.flush() == {"es"}
+    assert pipe.dirty == set()
+    assert pipe.flush_count == 1
+    assert pipe.flush() == set()
+    assert pipe.flush_count == 1
+
+
+def test_updates_mark_only_watched_groups():
+    ib = FakeIB()
+    es, spx, other = _ticker("ES"), _ticker("SPX"), _ticker("X")
+    pipe = TickPipeline(ib, min_interval=0.0)
+    pipe.watch(es, "es")
+    pipe.watch(spx, "spx")
+    pipe.flush()
+
+    ib.batches = [[es, other]]
+    assert pipe.poll(1.0) == {"es"}
+
+    pipe.unwatch(spx)
+    ib.batches = [[spx]]
+    assert pipe.poll(0.05) == set()
+
+
+def test_bursts_are_coalesced_into_one_flush():
+    ib = FakeIB()
+    es, spx = _ticker("ES"), _ticker("SPX")
+    pipe = TickPipeline(ib, min_interval=0.05)
+    pipe.watch(es, "es")
+    pipe.watch(spx, "spx")
+    pipe.flush()
+
+    # The first update arrives right after a flush: the pipeline waits for
+    # min_interval and picks up the second update in the same flush
+    ib.batches = [[es], [spx]]
+    assert pipe.poll(1.0) == {"es", "spx"}
+    assert pipe.flush_count == 2
+    assert ib.sleeps and max(ib.sleeps) <= 0.05
+
+
+def test_poll_times_out_without_updates():
+    pipe = TickPipeline(FakeIB())
+    started = time.monotonic()
+    assert pipe.poll(0.05) == set()
+    assert time.monotonic() - started >= 0.04
+
+
+def test_disconnect_flushes_immediately():
+    ib = FakeIB()
+    pipe = TickPipeline(ib, min_interval=10.0)
+    pipe.mark("clock")
+    pipe.last_flush = time.monotonic()
+    ib.connected = False
+    assert pipe.poll(5.0) == {"clock"}
+
+
+def test_close_detaches_from_ib():
+    ib = FakeIB()
+    es = _ticker("ES")
+    pipe = TickPipeline(ib)
+    pipe.watch(es, "es")
+    pipe.close()
+    ib.pendingTickersEvent.emit({es})
+    assert pipe.dirty == set()